@@ -1,4 +1,9 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+# 명령어 모듈은 실행 시점에 import되므로(cli/lazy_commands.py) 분석기가 찾을 수 있도록 명시
+sys.path.insert(0, SPECPATH)
+from pyhub_office_automation.cli.command_manifest import iter_command_modules
 
 
 a = Analysis(
@@ -6,7 +11,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=iter_command_modules(),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,244 @@
+"""
+Block tree compiler for batch scripts
+
+parse_script() produces a flat list of BatchLine objects. compile_script() turns
+that list into a tree of nodes in a single pass, so the executor no longer
+rescans the line list for matching @endif/@endforeach/@endtry/@endbulk every
+time (and every loop iteration) it reaches a block.
+
+Node types:
+- CommandNode: shell command line
+- DirectiveNode: variable/output directive (@set, @unset, @echo, @export, ...)
+- IfNode: @if/@elif/@else/@endif with one IfBranch per condition
+- ForeachNode: @foreach/@endforeach
+- TryNode: @try/@catch/@finally/@endtry
+- BulkNode: @bulk/@endbulk
+- ParallelNode: @parallel/@endparallel
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Union
+
+from .control_flow import (
+    Condition,
+    compile_condition,
+    parse_elif_condition,
+    parse_foreach_loop,
+    parse_if_condition,
+    parse_parallel_directive,
+    split_parallel_option,
+)
+
+if TYPE_CHECKING:
+    from .executor import BatchLine
+
+# Directive keyword -> kind used by execute_directive
+DIRECTIVE_KINDS = {"@set": "set", "@unset": "unset", "@echo": "echo", "@export": "export"}
+
+
+@dataclass(slots=True)
+class CommandNode:
+    """Shell command line"""
+
+    line: "BatchLine"
+
+
+@dataclass(slots=True)
+class DirectiveNode:
+    """Non-block directive with its kind resolved at compile time (None for unknown directives)"""
+
+    line: "BatchLine"
+    kind: Optional[str] = None
+
+
+@dataclass(slots=True)
+class IfBranch:
+    """@if/@elif branch (condition) or @else branch (condition is None)"""
+
+    line: "BatchLine"
+    condition: Optional[str]
+    body: List["Node"] = field(default_factory=list)
+    test: Optional[Condition] = None  # condition compiled at compile time
+
+
+@dataclass(slots=True)
+class IfNode:
+    """@if ... @endif"""
+
+    line: "BatchLine"
+    branches: List[IfBranch] = field(default_factory=list)
+    end_line: Optional["BatchLine"] = None
+
+
+@dataclass(slots=True)
+class ForeachNode:
+    """@foreach var in list [parallel=N] ... @endforeach"""
+
+    line: "BatchLine"
+    var_name: str
+    list_expr: str
+    body: List["Node"] = field(default_factory=list)
+    end_line: Optional["BatchLine"] = None
+    parallel: int = 1
+
+
+@dataclass(slots=True)
+class TryNode:
+    """@try ... [@catch ...] [@finally ...] @endtry"""
+
+    line: "BatchLine"
+    body: List["Node"] = field(default_factory=list)
+    catch_body: Optional[List["Node"]] = None
+    finally_body: Optional[List["Node"]] = None
+    end_line: Optional["BatchLine"] = None
+
+
+@dataclass(slots=True)
+class BulkNode:
+    """@bulk ... @endbulk"""
+
+    line: "BatchLine"
+    body: List["Node"] = field(default_factory=list)
+    end_line: Optional["BatchLine"] = None
+
+
+@dataclass(slots=True)
+class ParallelNode:
+    """@parallel [N] ... @endparallel (each top-level statement of the body is one unit of work)"""
+
+    line: "BatchLine"
+    workers: Optional[int] = None
+    body: List["Node"] = field(default_factory=list)
+    end_line: Optional["BatchLine"] = None
+
+
+Node = Union[CommandNode, DirectiveNode, IfNode, ForeachNode, TryNode, BulkNode, ParallelNode]
+BlockNode = Union[IfNode, ForeachNode, TryNode, BulkNode, ParallelNode]
+
+# Block keyword -> closing keyword
+_CLOSERS = {
+    IfNode: "@endif",
+    ForeachNode: "@endforeach",
+    TryNode: "@endtry",
+    BulkNode: "@endbulk",
+    ParallelNode: "@endparallel",
+}
+_OPENERS = {"@endif": "@if", "@endforeach": "@foreach", "@endtry": "@try", "@endbulk": "@bulk", "@endparallel": "@parallel"}
+
+
+def directive_kind(content: str) -> Optional[str]:
+    """Kind of a non-block directive ("set", "unset", "echo", "export") or None if unknown"""
+    keyword, _, rest = content.partition(" ")
+    if not rest:
+        # "@set" without arguments is not a valid directive (matches the prefix checks with a trailing space)
+        return None
+    return DIRECTIVE_KINDS.get(keyword)
+
+
+def compile_script(lines: List["BatchLine"]) -> List[Node]:
+    """
+    Compile parsed batch lines into a block tree
+
+    Comments and empty lines are dropped. Stray block keywords outside of a
+    matching block (e.g. @endif at top level, @else outside @if) are ignored.
+
+    Args:
+        lines: Parsed batch lines (from parse_script)
+
+    Returns:
+        Top-level nodes
+
+    Raises:
+        ValueError: If a block is not closed, blocks are interleaved
+                    (e.g. @if ... @endforeach ... @endif), a block header is invalid
+                    or an @if/@elif condition does not parse
+    """
+    root: List[Node] = []
+    # (block node, body list that receives the next nodes)
+    stack: List[tuple] = []
+    body = root
+
+    for line in lines:
+        if line.is_comment or line.is_empty:
+            continue
+
+        if not line.is_directive:
+            body.append(CommandNode(line))
+            continue
+
+        content = line.content.strip()
+        top = stack[-1][0] if stack else None
+
+        if content.startswith("@if "):
+            condition = parse_if_condition(content)
+            node = IfNode(line, [IfBranch(line, condition, test=compile_condition(condition))])
+            body.append(node)
+            stack.append((node, node.branches[0].body))
+        elif content.startswith("@foreach "):
+            var_name, list_expr = parse_foreach_loop(content)
+            list_expr, parallel = split_parallel_option(list_expr)
+            node = ForeachNode(line, var_name, list_expr, parallel=parallel)
+            body.append(node)
+            stack.append((node, node.body))
+        elif content == "@try":
+            node = TryNode(line)
+            body.append(node)
+            stack.append((node, node.body))
+        elif content == "@bulk":
+            node = BulkNode(line)
+            body.append(node)
+            stack.append((node, node.body))
+        elif content == "@parallel" or content.startswith("@parallel "):
+            node = ParallelNode(line, parse_parallel_directive(content))
+            body.append(node)
+            stack.append((node, node.body))
+
+        elif content.startswith("@elif ") or content == "@else":
+            if not isinstance(top, IfNode):
+                continue
+            if top.branches[-1].condition is None:
+                raise ValueError(
+                    f"Line {line.line_number}: {content.split()[0]} after @else in @if at line {top.line.line_number}"
+                )
+            condition = parse_elif_condition(content) if content.startswith("@elif ") else None
+            test = compile_condition(condition) if condition is not None else None
+            top.branches.append(IfBranch(line, condition, test=test))
+            stack[-1] = (top, top.branches[-1].body)
+        elif content in ("@catch", "@finally"):
+            if not isinstance(top, TryNode):
+                continue
+            if content == "@catch" and top.catch_body is None and top.finally_body is None:
+                top.catch_body = []
+                stack[-1] = (top, top.catch_body)
+            elif content == "@finally" and top.finally_body is None:
+                top.finally_body = []
+                stack[-1] = (top, top.finally_body)
+            else:
+                raise ValueError(f"Line {line.line_number}: unexpected {content} in @try at line {top.line.line_number}")
+
+        elif content in _OPENERS:
+            open_frames = [frame for frame, _ in stack if _CLOSERS[type(frame)] == content]
+            if not open_frames:
+                # Stray closing keyword (ignored, as before)
+                continue
+            if _CLOSERS[type(top)] != content:
+                raise ValueError(
+                    f"Line {line.line_number}: {content} closes {_OPENERS[content]} at line "
+                    f"{open_frames[-1].line.line_number}, but {_CLOSERS[type(top)]} for line "
+                    f"{top.line.line_number} is still open"
+                )
+            top.end_line = line
+            stack.pop()
+
+        else:
+            body.append(DirectiveNode(line, directive_kind(content)))
+            continue
+
+        body = stack[-1][1] if stack else root
+
+    if stack:
+        node = stack[-1][0]
+        opener = _OPENERS[_CLOSERS[type(node)]]
+        raise ValueError(f"No matching {_CLOSERS[type(node)]} found for {opener} at line {node.line.line_number}")
+
+    return root
@@ -4,15 +4,18 @@ Control flow management for batch scripts
 Supports:
 - Conditional execution (@if/@elif/@else/@endif)
 - Loop execution (@foreach/@endforeach, @while/@endwhile)
-- Condition evaluation (file existence, comparisons, boolean logic)
+- Parallel execution (@parallel/@endparallel, @foreach ... parallel=N)
+- Condition evaluation (file existence, comparisons, boolean logic), compiled once per condition
 """
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import eq, ge, gt, le, lt, ne
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
-from .variables import VariableManager
+from .variables import Template, VariableManager, compile_template
 
 
 @dataclass
@@ -30,15 +33,231 @@ class ControlBlock:
     else_line: Optional[int] = None  # For if
 
 
+# Condition tokens: quoted string, comparison operator, parenthesis, bare word (may contain ${VAR}/$VAR).
+# Quotes inside a word and single "=" / "!" are part of the word.
+_CONDITION_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<string>"[^"]*"|'[^']*')
+    |(?P<op>==|!=|>=|<=|>|<)
+    |(?P<paren>[()])
+    |(?P<word>(?:[^\s()"'=!<>]|[=!](?!=))(?:[^\s()=!<>]|[=!](?!=))*)
+    )""",
+    re.VERBOSE,
+)
+
+_NUMERIC_COMPARISONS = {"==": eq, "!=": ne, ">": gt, "<": lt, ">=": ge, "<=": le}
+
+# Lookup function: variable name -> value (VariableManager.get)
+Lookup = Callable[[str], str]
+
+
+def _truthy(value: str) -> bool:
+    """Truth value of a resolved operand (true/1/yes, false/0/no/empty, otherwise non-blank)"""
+    lowered = value.lower()
+    if lowered in ("true", "1", "yes"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    return bool(value.strip())
+
+
+def _compare(left: str, right: str, operator: str) -> bool:
+    """Numeric comparison if both sides are numbers, otherwise string comparison (== and != only)"""
+    try:
+        left_num = float(left)
+        right_num = float(right)
+    except ValueError:
+        if operator == "==":
+            return left == right
+        if operator == "!=":
+            return left != right
+        raise ValueError(f"String comparison only supports == and !=, got: {operator}")
+    return _NUMERIC_COMPARISONS[operator](left_num, right_num)
+
+
+class Condition:
+    """Condition compiled into closures; variables are looked up on every evaluation"""
+
+    __slots__ = ("text", "_test")
+
+    def __init__(self, text: str, test: Callable[[Lookup], bool]):
+        self.text = text
+        self._test = test
+
+    def evaluate(self, lookup: Lookup) -> bool:
+        """
+        Evaluate with the current variable values
+
+        Args:
+            lookup: Variable name -> value (e.g. VariableManager.get)
+
+        Returns:
+            Boolean result
+        """
+        return self._test(lookup)
+
+
+class _ConditionParser:
+    """
+    Recursive descent parser for conditions
+
+    Grammar (lowest to highest precedence):
+        or_expr    := and_expr ("or" and_expr)*
+        and_expr   := not_expr ("and" not_expr)*
+        not_expr   := "not" not_expr | primary
+        primary    := "(" or_expr ")" | "exists" "(" value ")" | value [comparison value]
+        value      := (string | word)+
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[tuple] = []
+        self.pos = 0
+
+        position = 0
+        while position < len(text):
+            match = _CONDITION_TOKEN.match(text, position)
+            if match is None:
+                if not text[position:].strip():
+                    break
+                raise ValueError(f"Invalid condition: {text}. Unterminated string at position {position}")
+            position = match.end()
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup), match.start(match.lastgroup), position))
+
+    def parse(self) -> Callable[[Lookup], bool]:
+        if not self.tokens:
+            raise ValueError("Invalid condition: empty expression")
+        test = self._or_expr()
+        if self.pos < len(self.tokens):
+            raise ValueError(f"Invalid condition: {self.text}. Unexpected '{self.tokens[self.pos][1]}'")
+        return test
+
+    def _peek(self, offset: int = 0) -> Optional[tuple]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _is_keyword(self, token: Optional[tuple], keyword: str) -> bool:
+        return token is not None and token[0] == "word" and token[1] == keyword
+
+    def _expect(self, value: str):
+        token = self._peek()
+        if token is None or token[1] != value:
+            found = f"'{token[1]}'" if token else "end of condition"
+            raise ValueError(f"Invalid condition: {self.text}. Expected '{value}', found {found}")
+        self.pos += 1
+
+    def _or_expr(self) -> Callable[[Lookup], bool]:
+        parts = [self._and_expr()]
+        while self._is_keyword(self._peek(), "or"):
+            self.pos += 1
+            parts.append(self._and_expr())
+        if len(parts) == 1:
+            return parts[0]
+
+        def any_true(lookup: Lookup) -> bool:
+            for part in parts:
+                if part(lookup):
+                    return True
+            return False
+
+        return any_true
+
+    def _and_expr(self) -> Callable[[Lookup], bool]:
+        parts = [self._not_expr()]
+        while self._is_keyword(self._peek(), "and"):
+            self.pos += 1
+            parts.append(self._not_expr())
+        if len(parts) == 1:
+            return parts[0]
+
+        def all_true(lookup: Lookup) -> bool:
+            for part in parts:
+                if not part(lookup):
+                    return False
+            return True
+
+        return all_true
+
+    def _not_expr(self) -> Callable[[Lookup], bool]:
+        if self._is_keyword(self._peek(), "not"):
+            self.pos += 1
+            inner = self._not_expr()
+            return lambda lookup: not inner(lookup)
+        return self._primary()
+
+    def _primary(self) -> Callable[[Lookup], bool]:
+        token = self._peek()
+        if token is not None and token[1] == "(" and token[0] == "paren":
+            self.pos += 1
+            inner = self._or_expr()
+            self._expect(")")
+            return inner
+
+        if self._is_keyword(token, "exists") and self._peek(1) is not None and self._peek(1)[1] == "(":
+            self.pos += 2
+            path = self._value()
+            self._expect(")")
+            return lambda lookup: Path(path.render(lookup)).exists()
+
+        left = self._value()
+        token = self._peek()
+        if token is None or token[0] != "op":
+            return lambda lookup: _truthy(left.render(lookup))
+
+        self.pos += 1
+        operator = token[1]
+        right = self._value()
+        return lambda lookup: _compare(left.render(lookup), right.render(lookup), operator)
+
+    def _value(self) -> Template:
+        """Adjacent strings/words form one operand (a single quoted string loses its quotes)"""
+        first = self.pos
+        while True:
+            token = self._peek()
+            if token is None or token[0] not in ("string", "word") or (token[0] == "word" and token[1] in ("and", "or")):
+                break
+            self.pos += 1
+
+        if self.pos == first:
+            token = self._peek()
+            found = f"'{token[1]}'" if token else "end of condition"
+            raise ValueError(f"Invalid condition: {self.text}. Expected a value, found {found}")
+
+        tokens = self.tokens[first : self.pos]
+        if len(tokens) == 1 and tokens[0][0] == "string":
+            return compile_template(tokens[0][1][1:-1])
+        return compile_template(self.text[tokens[0][2] : tokens[-1][3]])
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Condition:
+    """
+    Compile a condition once (cached per distinct text)
+
+    Variable references stay unresolved in the compiled form, so values containing
+    operators or keywords (e.g. "a and b") are compared as plain values.
+
+    Args:
+        condition: Condition string
+
+    Returns:
+        Compiled condition
+
+    Raises:
+        ValueError: If the condition is not valid
+    """
+    return Condition(condition, _ConditionParser(condition.strip()).parse())
+
+
 class ConditionEvaluator:
     """Evaluate conditions in control flow statements"""
 
     def __init__(self, var_manager: VariableManager):
         self.var_manager = var_manager
 
-    def evaluate(self, condition: str) -> bool:
+    def evaluate(self, condition: Union[str, Condition]) -> bool:
         """
-        Evaluate a condition string and return boolean result
+        Evaluate a condition and return boolean result
 
         Supports:
         - exists("path") - File existence check
@@ -48,117 +267,23 @@ class ConditionEvaluator:
         - VAR < 10 - Numeric comparison
         - VAR >= 10 - Greater or equal
         - VAR <= 10 - Less or equal
-        - condition and condition - Logical AND
-        - condition or condition - Logical OR
+        - condition and condition - Logical AND (short-circuit)
+        - condition or condition - Logical OR (short-circuit)
         - not condition - Logical NOT
+        - (condition) - Grouping
         - true/false - Boolean literals
 
+        Precedence (lowest first): or, and, not, comparison.
+
         Args:
-            condition: Condition string to evaluate
+            condition: Condition string, or a condition compiled by compile_condition
 
         Returns:
             Boolean result
         """
-        # Resolve variables first
-        resolved = self.var_manager.resolve(condition.strip())
-
-        # Handle boolean literals
-        if resolved.lower() in ("true", "1", "yes"):
-            return True
-        if resolved.lower() in ("false", "0", "no", ""):
-            return False
-
-        # Handle exists() function
-        if "exists(" in resolved:
-            return self._evaluate_exists(resolved)
-
-        # Handle logical operators (and, or, not)
-        if " and " in resolved:
-            return self._evaluate_and(resolved)
-        if " or " in resolved:
-            return self._evaluate_or(resolved)
-        if resolved.startswith("not "):
-            return not self.evaluate(resolved[4:].strip())
-
-        # Handle comparison operators
-        for op in ("==", "!=", ">=", "<=", ">", "<"):
-            if op in resolved:
-                return self._evaluate_comparison(resolved, op)
-
-        # If no operator found, treat as variable existence check
-        # Non-empty string = true, empty = false
-        return bool(resolved and resolved.strip())
-
-    def _evaluate_exists(self, condition: str) -> bool:
-        """Evaluate exists("path") function"""
-        match = re.search(r'exists\s*\(\s*["\'](.+?)["\']\s*\)', condition)
-        if not match:
-            raise ValueError(f"Invalid exists() syntax: {condition}")
-
-        file_path = match.group(1)
-        # Resolve variables in path
-        resolved_path = self.var_manager.resolve(file_path)
-        return Path(resolved_path).exists()
-
-    def _evaluate_and(self, condition: str) -> bool:
-        """Evaluate logical AND"""
-        parts = condition.split(" and ")
-        return all(self.evaluate(part.strip()) for part in parts)
-
-    def _evaluate_or(self, condition: str) -> bool:
-        """Evaluate logical OR"""
-        parts = condition.split(" or ")
-        return any(self.evaluate(part.strip()) for part in parts)
-
-    def _evaluate_comparison(self, condition: str, operator: str) -> bool:
-        """Evaluate comparison operators"""
-        parts = condition.split(operator, 1)
-        if len(parts) != 2:
-            raise ValueError(f"Invalid comparison: {condition}")
-
-        left = parts[0].strip()
-        right = parts[1].strip()
-
-        # Remove quotes from string literals
-        if right.startswith('"') and right.endswith('"'):
-            right = right[1:-1]
-        elif right.startswith("'") and right.endswith("'"):
-            right = right[1:-1]
-
-        # Try numeric comparison first
-        try:
-            left_num = float(left)
-            right_num = float(right)
-            return self._compare_numeric(left_num, right_num, operator)
-        except ValueError:
-            # Fall back to string comparison
-            return self._compare_string(left, right, operator)
-
-    def _compare_numeric(self, left: float, right: float, operator: str) -> bool:
-        """Compare numeric values"""
-        if operator == "==":
-            return left == right
-        elif operator == "!=":
-            return left != right
-        elif operator == ">":
-            return left > right
-        elif operator == "<":
-            return left < right
-        elif operator == ">=":
-            return left >= right
-        elif operator == "<=":
-            return left <= right
-        else:
-            raise ValueError(f"Unknown operator: {operator}")
-
-    def _compare_string(self, left: str, right: str, operator: str) -> bool:
-        """Compare string values"""
-        if operator == "==":
-            return left == right
-        elif operator == "!=":
-            return left != right
-        else:
-            raise ValueError(f"String comparison only supports == and !=, got: {operator}")
+        if isinstance(condition, str):
+            condition = compile_condition(condition)
+        return condition.evaluate(self.var_manager.get)
 
 
 def parse_if_condition(line: str) -> str:
@@ -233,6 +358,55 @@ def parse_foreach_loop(line: str) -> tuple[str, str]:
     return var_name, list_expr
 
 
+def split_parallel_option(list_expr: str) -> tuple[str, int]:
+    """
+    Split a trailing parallel=N option off a @foreach list expression
+
+    Format: @foreach var in list parallel=N
+
+    Args:
+        list_expr: List expression from parse_foreach_loop
+
+    Returns:
+        Tuple of (list_expression, worker count); worker count is 1 without the option
+
+    Raises:
+        ValueError: If N is not a positive integer
+    """
+    match = re.match(r"(.+?)\s+parallel=(\S*)$", list_expr)
+    if not match:
+        return list_expr, 1
+    return match.group(1).strip(), _parse_worker_count(match.group(2), list_expr)
+
+
+def parse_parallel_directive(line: str) -> Optional[int]:
+    """
+    Parse @parallel directive and extract worker count
+
+    Format: @parallel
+            @parallel N
+
+    Args:
+        line: Line containing @parallel directive
+
+    Returns:
+        Worker count, or None if N is omitted (executor default)
+
+    Raises:
+        ValueError: If N is not a positive integer
+    """
+    content = line.strip().removeprefix("@parallel").strip()
+    if not content:
+        return None
+    return _parse_worker_count(content, line)
+
+
+def _parse_worker_count(value: str, line: str) -> int:
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"Invalid worker count in: {line}. Expected a positive integer")
+    return int(value)
+
+
 def parse_while_condition(line: str) -> str:
     """
     Parse @while directive and extract condition
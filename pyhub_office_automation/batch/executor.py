@@ -4,29 +4,43 @@ Batch script executor for Office Automation
 Executes sequences of shell commands from script files (.oas format).
 
 Phase 3: Control flow support (@if, @foreach, @while)
+Bulk blocks (@bulk ... @endbulk) suspend Excel recalculation while the block runs
+Parallel blocks (@parallel ... @endparallel, @foreach ... parallel=N) run units of work concurrently
 """
 
 import shlex
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from typer.testing import CliRunner
 
-from .control_flow import (
-    ConditionEvaluator,
-    parse_elif_condition,
-    parse_foreach_loop,
-    parse_if_condition,
-    parse_list_expression,
-    parse_onerror_directive,
-    parse_while_condition,
+from pyhub_office_automation.cli.dispatch import dispatch
+from pyhub_office_automation.utils.json_output import dumps
+from pyhub_office_automation.utils.records import SlotsRecord
+
+from .compiler import (
+    BulkNode,
+    CommandNode,
+    DirectiveNode,
+    ForeachNode,
+    IfNode,
+    Node,
+    ParallelNode,
+    TryNode,
+    compile_script,
+    directive_kind,
 )
+from .control_flow import ConditionEvaluator, parse_list_expression
+from .parallel import DEFAULT_WORKERS, WorkerPool, current_pool
 from .variables import (
+    Template,
     VariableManager,
     parse_echo_directive,
     parse_export_directive,
@@ -38,8 +52,8 @@ console = Console()
 runner = CliRunner()
 
 
-@dataclass
-class BatchLine:
+@dataclass(slots=True)
+class BatchLine(SlotsRecord):
     """Single line in batch script"""
 
     line_number: int
@@ -49,10 +63,24 @@ class BatchLine:
     is_comment: bool = False
     is_directive: bool = False
     is_empty: bool = False
+    # Command/argument templates, compiled on first execution (see command_templates)
+    templates: Optional[Tuple[Template, ...]] = field(default=None, repr=False, compare=False)
 
+    def command_templates(self) -> Tuple[Template, ...]:
+        """Templates of the command and arguments (compiled once per line, reused by every loop iteration)"""
+        if self.templates is None:
+            self.templates = tuple(Template(token) for token in [self.command, *self.args])
+        return self.templates
 
-@dataclass
-class LineResult:
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict without the compiled templates"""
+        data = SlotsRecord.to_dict(self)
+        del data["templates"]
+        return data
+
+
+@dataclass(slots=True)
+class LineResult(SlotsRecord):
     """Single line execution result"""
 
     line_number: int
@@ -61,10 +89,11 @@ class LineResult:
     output: str = ""
     error: Optional[str] = None
     duration_ms: int = 0
+    data: Any = None  # JSON response object of a directly dispatched command
 
 
-@dataclass
-class BatchResult:
+@dataclass(slots=True)
+class BatchResult(SlotsRecord):
     """Overall batch execution result"""
 
     success: bool
@@ -76,6 +105,14 @@ class BatchResult:
     start_time: datetime
     end_time: datetime
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict (line results as dicts, times as ISO 8601 strings)"""
+        data = SlotsRecord.to_dict(self)
+        data["log"] = [line_result.to_dict() for line_result in self.log]
+        data["start_time"] = self.start_time.isoformat()
+        data["end_time"] = self.end_time.isoformat()
+        return data
+
 
 def parse_script(script_path: str) -> List[BatchLine]:
     """
@@ -142,183 +179,26 @@ def parse_script(script_path: str) -> List[BatchLine]:
     return lines
 
 
-def find_matching_endif(lines: List[BatchLine], start_idx: int) -> int:
-    """
-    Find matching @endif for @if directive
-
-    Args:
-        lines: List of batch lines
-        start_idx: Index of @if line
-
-    Returns:
-        Index of matching @endif
-
-    Raises:
-        ValueError: If no matching @endif found
-    """
-    depth = 1
-    for i in range(start_idx + 1, len(lines)):
-        line = lines[i]
-        if line.is_directive:
-            content = line.content.strip()
-            if content.startswith("@if "):
-                depth += 1
-            elif content == "@endif":
-                depth -= 1
-                if depth == 0:
-                    return i
-
-    raise ValueError(f"No matching @endif found for @if at line {lines[start_idx].line_number}")
-
-
-def find_matching_endforeach(lines: List[BatchLine], start_idx: int) -> int:
-    """
-    Find matching @endforeach for @foreach directive
-
-    Args:
-        lines: List of batch lines
-        start_idx: Index of @foreach line
-
-    Returns:
-        Index of matching @endforeach
-
-    Raises:
-        ValueError: If no matching @endforeach found
-    """
-    depth = 1
-    for i in range(start_idx + 1, len(lines)):
-        line = lines[i]
-        if line.is_directive:
-            content = line.content.strip()
-            if content.startswith("@foreach "):
-                depth += 1
-            elif content == "@endforeach":
-                depth -= 1
-                if depth == 0:
-                    return i
-
-    raise ValueError(f"No matching @endforeach found for @foreach at line {lines[start_idx].line_number}")
-
-
-def find_elif_else_blocks(lines: List[BatchLine], if_idx: int, endif_idx: int) -> tuple[List[tuple[int, str]], Optional[int]]:
-    """
-    Find all @elif and @else blocks within @if...@endif
-
-    Args:
-        lines: List of batch lines
-        if_idx: Index of @if line
-        endif_idx: Index of @endif line
-
-    Returns:
-        Tuple of (elif_blocks, else_idx)
-        elif_blocks: List of (line_idx, condition)
-        else_idx: Index of @else line or None
-    """
-    elif_blocks = []
-    else_idx = None
-    depth = 0
-
-    for i in range(if_idx + 1, endif_idx):
-        line = lines[i]
-        if line.is_directive:
-            content = line.content.strip()
-
-            if content.startswith("@if "):
-                depth += 1
-            elif content == "@endif":
-                depth -= 1
-            elif depth == 0:  # Same level as our @if
-                if content.startswith("@elif "):
-                    condition = parse_elif_condition(content)
-                    elif_blocks.append((i, condition))
-                elif content == "@else":
-                    else_idx = i
-
-    return elif_blocks, else_idx
-
-
-def find_matching_endtry(lines: List[BatchLine], start_idx: int) -> int:
-    """
-    Find matching @endtry for @try directive
-
-    Args:
-        lines: List of batch lines
-        start_idx: Index of @try line
-
-    Returns:
-        Index of matching @endtry
-
-    Raises:
-        ValueError: If no matching @endtry found
-    """
-    depth = 1
-    for i in range(start_idx + 1, len(lines)):
-        line = lines[i]
-        if line.is_directive:
-            content = line.content.strip()
-            if content == "@try":
-                depth += 1
-            elif content == "@endtry":
-                depth -= 1
-                if depth == 0:
-                    return i
-
-    raise ValueError(f"No matching @endtry found for @try at line {lines[start_idx].line_number}")
-
-
-def find_catch_finally_blocks(lines: List[BatchLine], try_idx: int, endtry_idx: int) -> tuple[Optional[int], Optional[int]]:
-    """
-    Find @catch and @finally blocks within @try...@endtry
-
-    Args:
-        lines: List of batch lines
-        try_idx: Index of @try line
-        endtry_idx: Index of @endtry line
-
-    Returns:
-        Tuple of (catch_idx, finally_idx)
-        catch_idx: Index of @catch line or None
-        finally_idx: Index of @finally line or None
-    """
-    catch_idx = None
-    finally_idx = None
-    depth = 0
-
-    for i in range(try_idx + 1, endtry_idx):
-        line = lines[i]
-        if line.is_directive:
-            content = line.content.strip()
-
-            if content == "@try":
-                depth += 1
-            elif content == "@endtry":
-                depth -= 1
-            elif depth == 0:  # Same level as our @try
-                if content == "@catch":
-                    catch_idx = i
-                elif content == "@finally":
-                    finally_idx = i
-
-    return catch_idx, finally_idx
-
-
-def execute_directive(line: BatchLine, var_manager: VariableManager) -> LineResult:
+def execute_directive(line: BatchLine, var_manager: VariableManager, kind: Optional[str] = None) -> LineResult:
     """
     Execute a directive line (@set, @unset, @echo, @export)
 
     Args:
         line: Parsed batch line with directive
         var_manager: Variable manager instance
+        kind: Directive kind pre-classified by the compiler ("set", "unset", "echo", "export");
+              classified from the line content if None
 
     Returns:
         Execution result
     """
     start_time = datetime.now()
     content = line.content.strip()
+    kind = kind or directive_kind(content)
 
     try:
         # @set VAR = value
-        if content.startswith("@set "):
+        if kind == "set":
             name, value = parse_set_directive(content)
             # Resolve variables in value before setting
             resolved_value = var_manager.resolve(value)
@@ -326,20 +206,20 @@ def execute_directive(line: BatchLine, var_manager: VariableManager) -> LineResu
             output = f"Variable set: {name} = {resolved_value}"
 
         # @unset VAR
-        elif content.startswith("@unset "):
+        elif kind == "unset":
             name = parse_unset_directive(content)
             var_manager.unset(name)
             output = f"Variable unset: {name}"
 
         # @echo message
-        elif content.startswith("@echo "):
+        elif kind == "echo":
             message = parse_echo_directive(content)
             resolved_message = var_manager.resolve(message)
             console.print(f"[cyan]{resolved_message}[/cyan]")
             output = resolved_message
 
         # @export VAR = value
-        elif content.startswith("@export "):
+        elif kind == "export":
             name, value = parse_export_directive(content)
             resolved_value = var_manager.resolve(value)
             var_manager.export(name, resolved_value)
@@ -371,6 +251,28 @@ def execute_directive(line: BatchLine, var_manager: VariableManager) -> LineResu
         )
 
 
+def run_command(cmd_args: List[str]) -> Tuple[int, str, Any]:
+    """
+    Run a resolved command line in-process
+
+    Args:
+        cmd_args: Command line (e.g. ["excel", "range-read", "--file-path", "a.xlsx"])
+
+    Returns:
+        Tuple of (exit code, text output, JSON response object or None)
+    """
+    # Execute command in-process (JSON response returned as an object)
+    result = dispatch(cmd_args)
+    if result is not None:
+        return result.exit_code, result.stdout + result.stderr, result.data
+
+    # Commands/options the dispatcher does not handle (batch, version, --help, ...)
+    from pyhub_office_automation.cli.main import app as main_app
+
+    fallback = runner.invoke(main_app, cmd_args)
+    return fallback.exit_code, fallback.stdout, None
+
+
 def execute_shell_command(line: BatchLine, var_manager: VariableManager, mode: str = "unified") -> LineResult:
     """
     Execute a single shell command with variable substitution
@@ -383,45 +285,36 @@ def execute_shell_command(line: BatchLine, var_manager: VariableManager, mode: s
     Returns:
         Execution result
     """
-    from pyhub_office_automation.cli.main import app as main_app
-
     start_time = datetime.now()
 
     try:
-        # Resolve variables in command and arguments
-        resolved_command = var_manager.resolve(line.command)
-        resolved_args = [var_manager.resolve(arg) for arg in line.args]
+        # Resolve variables in command and arguments (pre-split templates)
+        lookup = var_manager.get
+        resolved = [template.render(lookup) for template in line.command_templates()]
 
         # Build command arguments
         if mode == "unified":
             # Unified shell commands
-            cmd_args = [resolved_command] + resolved_args
+            cmd_args = resolved
         else:
             # Mode-specific commands (future: route to excel/ppt)
-            cmd_args = [resolved_command] + resolved_args
+            cmd_args = resolved
 
-        # Execute command
-        result = runner.invoke(main_app, cmd_args)
+        # Inside a parallel block the worker pool decides where and when the command runs
+        pool = current_pool()
+        exit_code, output, data = pool.run(cmd_args, run_command) if pool is not None else run_command(cmd_args)
 
         duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
-        if result.exit_code == 0:
-            return LineResult(
-                line_number=line.line_number,
-                command=line.content,
-                success=True,
-                output=result.stdout,
-                duration_ms=duration_ms,
-            )
-        else:
-            return LineResult(
-                line_number=line.line_number,
-                command=line.content,
-                success=False,
-                output=result.stdout,
-                error=f"Exit code: {result.exit_code}",
-                duration_ms=duration_ms,
-            )
+        return LineResult(
+            line_number=line.line_number,
+            command=line.content,
+            success=exit_code == 0,
+            output=output,
+            error=None if exit_code == 0 else f"Exit code: {exit_code}",
+            duration_ms=duration_ms,
+            data=data,
+        )
 
     except Exception as e:
         duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
@@ -434,185 +327,218 @@ def execute_shell_command(line: BatchLine, var_manager: VariableManager, mode: s
         )
 
 
-def execute_lines(
-    lines: List[BatchLine],
+def execute_nodes(
+    nodes: List[Node],
     var_manager: VariableManager,
-    start_idx: int = 0,
-    end_idx: Optional[int] = None,
+    evaluator: ConditionEvaluator,
     verbose: bool = False,
     continue_on_error: bool = False,
-) -> tuple[List[LineResult], int]:
+) -> List[LineResult]:
     """
-    Execute a range of lines with control flow support
+    Execute compiled nodes (see compiler.compile_script)
+
+    A failure stops the remaining nodes of the current body unless continue_on_error is set;
+    a failure inside @bulk or @parallel also stops the body containing the block.
 
     Args:
-        lines: List of all batch lines
+        nodes: Compiled nodes
         var_manager: Variable manager
-        start_idx: Start index (inclusive)
-        end_idx: End index (exclusive), None means till end
+        evaluator: Condition evaluator bound to var_manager
         verbose: Show detailed output
         continue_on_error: Continue on errors
 
     Returns:
-        Tuple of (results, next_index_to_process)
+        Execution results
     """
-    if end_idx is None:
-        end_idx = len(lines)
-
     results = []
-    i = start_idx
-    evaluator = ConditionEvaluator(var_manager)
-
-    while i < end_idx:
-        line = lines[i]
-
-        # Skip comments and empty lines
-        if line.is_comment or line.is_empty:
-            i += 1
-            continue
-
-        # Handle control flow directives
-        if line.is_directive:
-            content = line.content.strip()
-
-            # @if statement
-            if content.startswith("@if "):
-                endif_idx = find_matching_endif(lines, i)
-                elif_blocks, else_idx = find_elif_else_blocks(lines, i, endif_idx)
-
-                # Evaluate @if condition
-                condition = parse_if_condition(content)
-                if evaluator.evaluate(condition):
-                    # Execute if block (until first elif/else or endif)
-                    block_end = elif_blocks[0][0] if elif_blocks else (else_idx if else_idx else endif_idx)
-                    block_results, _ = execute_lines(lines, var_manager, i + 1, block_end, verbose, continue_on_error)
-                    results.extend(block_results)
+
+    for node in nodes:
+        # Regular shell command
+        if isinstance(node, CommandNode):
+            result = execute_shell_command(node.line, var_manager)
+            results.append(result)
+
+            if verbose:
+                if result.success:
+                    console.print("[green]✓ Success[/green]")
                 else:
-                    # Try elif blocks
-                    executed = False
-                    for elif_idx, elif_cond in elif_blocks:
-                        if evaluator.evaluate(elif_cond):
-                            # Find next elif or else or endif
-                            next_elif_idx = None
-                            for next_idx, _ in elif_blocks:
-                                if next_idx > elif_idx:
-                                    next_elif_idx = next_idx
-                                    break
-                            block_end = next_elif_idx if next_elif_idx else (else_idx if else_idx else endif_idx)
-                            block_results, _ = execute_lines(
-                                lines, var_manager, elif_idx + 1, block_end, verbose, continue_on_error
-                            )
-                            results.extend(block_results)
-                            executed = True
-                            break
-
-                    # Execute else block if no condition was true
-                    if not executed and else_idx is not None:
-                        block_results, _ = execute_lines(
-                            lines, var_manager, else_idx + 1, endif_idx, verbose, continue_on_error
-                        )
-                        results.extend(block_results)
+                    console.print(f"[red]✗ Failed: {result.error}[/red]")
+                output = format_output(result)
+                if output:
+                    console.print(output)
 
-                # Skip to after @endif
-                i = endif_idx + 1
-                continue
+            if not result.success and not continue_on_error:
+                return results
 
-            # @foreach loop
-            elif content.startswith("@foreach "):
-                endforeach_idx = find_matching_endforeach(lines, i)
-                var_name, list_expr = parse_foreach_loop(content)
-                items = parse_list_expression(list_expr, var_manager)
+        # Other directives (variable management)
+        elif isinstance(node, DirectiveNode):
+            result = execute_directive(node.line, var_manager, node.kind)
+            results.append(result)
 
-                # Execute loop body for each item
+            if not result.success and not continue_on_error:
+                return results
+
+        # @if/@elif/@else: run the first branch whose condition holds
+        elif isinstance(node, IfNode):
+            for branch in node.branches:
+                if branch.test is None or evaluator.evaluate(branch.test):
+                    results.extend(execute_nodes(branch.body, var_manager, evaluator, verbose, continue_on_error))
+                    break
+
+        # @foreach loop
+        elif isinstance(node, ForeachNode):
+            items = parse_list_expression(node.list_expr, var_manager)
+
+            if node.parallel > 1:
+                units = []
+                for loop_idx, item in enumerate(items):
+                    unit_vars = var_manager.copy()
+                    unit_vars.set(node.var_name, item)
+                    unit_vars.set("__LOOP_INDEX__", str(loop_idx))
+                    units.append((node.body, unit_vars))
+                results.extend(execute_units(units, node.parallel, verbose, continue_on_error))
+            else:
                 for loop_idx, item in enumerate(items):
                     # Set loop variable
-                    var_manager.set(var_name, item)
+                    var_manager.set(node.var_name, item)
                     var_manager.set("__LOOP_INDEX__", str(loop_idx))
 
-                    # Execute loop body
-                    loop_results, _ = execute_lines(lines, var_manager, i + 1, endforeach_idx, verbose, continue_on_error)
-                    results.extend(loop_results)
+                    results.extend(execute_nodes(node.body, var_manager, evaluator, verbose, continue_on_error))
 
-                # Clean up loop variables
-                var_manager.unset(var_name)
-                var_manager.unset("__LOOP_INDEX__")
+            # Clean up loop variables
+            var_manager.unset(node.var_name)
+            var_manager.unset("__LOOP_INDEX__")
 
-                # Skip to after @endforeach
-                i = endforeach_idx + 1
-                continue
+        # @try/@catch/@finally block
+        elif isinstance(node, TryNode):
+            error_occurred = False
+            try:
+                try_results = execute_nodes(node.body, var_manager, evaluator, verbose, True)  # Force continue in try
+                # Check if any command failed
+                error_occurred = any(not r.success for r in try_results)
+                results.extend(try_results)
+            except Exception as e:
+                error_occurred = True
+                console.print(f"[red]Exception in try block: {e}[/red]")
+
+            # Execute catch block if error occurred
+            if error_occurred and node.catch_body is not None:
+                results.extend(execute_nodes(node.catch_body, var_manager, evaluator, verbose, continue_on_error))
+
+            # Always execute finally block
+            if node.finally_body is not None:
+                results.extend(execute_nodes(node.finally_body, var_manager, evaluator, verbose, continue_on_error))
+
+        # @bulk block (Excel recalculation/screen updating/events suspended until @endbulk)
+        elif isinstance(node, BulkNode):
+            pool = current_pool()
+            try:
+                from pyhub_office_automation.excel.engines import get_engine
 
-            # @try/@catch/@finally block
-            elif content == "@try":
-                endtry_idx = find_matching_endtry(lines, i)
-                catch_idx, finally_idx = find_catch_finally_blocks(lines, i, endtry_idx)
-
-                error_occurred = False
-                try_results = []
-
-                # Execute try block
-                try_end = catch_idx if catch_idx else (finally_idx if finally_idx else endtry_idx)
-                try:
-                    try_results, _ = execute_lines(lines, var_manager, i + 1, try_end, verbose, True)  # Force continue in try
-                    # Check if any command failed
-                    error_occurred = any(not r.success for r in try_results)
-                    results.extend(try_results)
-                except Exception as e:
-                    error_occurred = True
-                    console.print(f"[red]Exception in try block: {e}[/red]")
-
-                # Execute catch block if error occurred
-                if error_occurred and catch_idx is not None:
-                    catch_end = finally_idx if finally_idx else endtry_idx
-                    catch_results, _ = execute_lines(lines, var_manager, catch_idx + 1, catch_end, verbose, continue_on_error)
-                    results.extend(catch_results)
-
-                # Always execute finally block
-                if finally_idx is not None:
-                    finally_results, _ = execute_lines(
-                        lines, var_manager, finally_idx + 1, endtry_idx, verbose, continue_on_error
-                    )
-                    results.extend(finally_results)
+                if pool is None:
+                    session = get_engine().bulk_session()
+                else:
+                    # Inside a parallel unit: the engine belongs to the owner thread
+                    session = pool.on_owner(pool.call_on_owner(lambda: get_engine().bulk_session()))
+            except Exception as e:
+                # Excel not available - run the block without a bulk session
+                console.print(f"[yellow]Warning: @bulk session unavailable ({e}), running block normally[/yellow]")
+                session = nullcontext()
 
-                # Skip to after @endtry
-                i = endtry_idx + 1
-                continue
+            with session:
+                block_results = execute_nodes(node.body, var_manager, evaluator, verbose, continue_on_error)
+            results.extend(block_results)
 
-            # Skip @endif, @endforeach, @elif, @else, @catch, @finally, @endtry (handled by parent)
-            elif content in ("@endif", "@endforeach", "@else", "@catch", "@finally", "@endtry") or content.startswith(
-                "@elif "
-            ):
-                i += 1
-                continue
+            if any(not r.success for r in block_results) and not continue_on_error:
+                return results
 
-            # Other directives (variable management)
-            else:
-                result = execute_directive(line, var_manager)
-                results.append(result)
+        # @parallel block (each top-level statement is one unit of work)
+        elif isinstance(node, ParallelNode):
+            units = [([child], var_manager.copy()) for child in node.body]
+            block_results = execute_units(units, node.workers or DEFAULT_WORKERS, verbose, continue_on_error)
+            results.extend(block_results)
 
-                if not result.success and not continue_on_error:
-                    return results, i + 1
+            if any(not r.success for r in block_results) and not continue_on_error:
+                return results
 
-        # Regular shell command
-        else:
-            result = execute_shell_command(line, var_manager)
-            results.append(result)
+    return results
 
-            if verbose:
-                if result.success:
-                    console.print("[green]✓ Success[/green]")
-                    if result.output:
-                        console.print(result.output)
-                else:
-                    console.print(f"[red]✗ Failed: {result.error}[/red]")
-                    if result.output:
-                        console.print(result.output)
 
-            if not result.success and not continue_on_error:
-                return results, i + 1
+def execute_units(
+    units: List[Tuple[List[Node], VariableManager]],
+    workers: int,
+    verbose: bool = False,
+    continue_on_error: bool = False,
+) -> List[LineResult]:
+    """
+    Execute units of work concurrently (see parallel.WorkerPool)
 
-        i += 1
+    Each unit runs with its own variable manager; variable changes are not visible to
+    other units or after the block. Results are returned in unit order regardless of
+    completion order.
 
-    return results, i
+    Args:
+        units: (nodes, variable manager) per unit
+        workers: Maximum number of units running at the same time
+        verbose: Show detailed output
+        continue_on_error: Continue on errors
+
+    Returns:
+        Execution results
+    """
+    if not units:
+        return []
+
+    # Nested parallel blocks share the enclosing block's pool (one scheduler per script run)
+    outer = current_pool()
+    pool = outer or WorkerPool(workers)
+
+    def run_unit(nodes: List[Node], unit_vars: VariableManager) -> List[LineResult]:
+        pool.bind()
+        return execute_nodes(nodes, unit_vars, ConditionEvaluator(unit_vars), verbose, continue_on_error)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(workers, len(units)), thread_name_prefix="oa-batch") as threads:
+            futures = [threads.submit(run_unit, nodes, unit_vars) for nodes, unit_vars in units]
+            pool.wait(futures)
+    finally:
+        if outer is None:
+            pool.close()
+
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+
+def execute_lines(
+    lines: List[BatchLine],
+    var_manager: VariableManager,
+    start_idx: int = 0,
+    end_idx: Optional[int] = None,
+    verbose: bool = False,
+    continue_on_error: bool = False,
+) -> tuple[List[LineResult], int]:
+    """
+    Compile and execute a range of lines with control flow support
+
+    Args:
+        lines: List of all batch lines
+        var_manager: Variable manager
+        start_idx: Start index (inclusive)
+        end_idx: End index (exclusive), None means till end
+        verbose: Show detailed output
+        continue_on_error: Continue on errors
+
+    Returns:
+        Tuple of (results, end index)
+    """
+    if end_idx is None:
+        end_idx = len(lines)
+
+    nodes = compile_script(lines[start_idx:end_idx])
+    results = execute_nodes(nodes, var_manager, ConditionEvaluator(var_manager), verbose, continue_on_error)
+    return results, end_idx
 
 
 def batch_run(
@@ -641,9 +567,10 @@ def batch_run(
     # Initialize variable manager with CLI variables
     var_manager = VariableManager(initial_vars=variables or {})
 
-    # Parse script
+    # Parse script and compile control flow blocks
     try:
         lines = parse_script(script_path)
+        nodes = compile_script(lines)
     except Exception as e:
         console.print(f"[red]Failed to parse script: {e}[/red]")
         return
@@ -689,7 +616,7 @@ def batch_run(
         task = progress.add_task("[cyan]Executing commands...", total=len(executable_lines))
 
         # Execute all lines with control flow
-        results, _ = execute_lines(lines, var_manager, 0, None, verbose, continue_on_error)
+        results = execute_nodes(nodes, var_manager, ConditionEvaluator(var_manager), verbose, continue_on_error)
         failed_count = sum(1 for r in results if not r.success)
 
         progress.update(task, advance=len(executable_lines))
@@ -729,6 +656,14 @@ def batch_run(
         console.print(f"\nLog written to: {log_file}")
 
 
+def format_output(result: LineResult) -> str:
+    """Text output of a line (JSON response of a dispatched command followed by any other output)"""
+    if result.data is None:
+        return result.output
+    response = dumps(result.data, pretty=True, default=str)
+    return f"{response}\n{result.output}" if result.output else response
+
+
 def write_log_file(log_path: str, result: BatchResult, script_path: str):
     """Write execution log to file"""
     with open(log_path, "w", encoding="utf-8") as f:
@@ -751,8 +686,9 @@ def write_log_file(log_path: str, result: BatchResult, script_path: str):
             f.write(f"Command: {line_result.command}\n")
             f.write(f"Duration: {line_result.duration_ms}ms\n")
 
-            if line_result.output:
-                f.write(f"Output:\n{line_result.output}\n")
+            output = format_output(line_result)
+            if output:
+                f.write(f"Output:\n{output}\n")
 
             if line_result.error:
                 f.write(f"Error: {line_result.error}\n")
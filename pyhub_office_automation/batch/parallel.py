@@ -0,0 +1,246 @@
+"""
+Parallel execution for batch scripts (@parallel/@endparallel, @foreach ... parallel=N)
+
+Units of work (loop iterations, top-level statements of a @parallel block) run
+on threads, each with its own VariableManager copy. The threads only evaluate
+control flow; every command they reach is routed through a WorkerPool, which
+decides where and when it runs based on the resource it touches:
+
+- File-based commands (--file-path with an engine/backend that works on files
+  directly: headless Excel engine, python-pptx) run in a pool of worker
+  processes. Each file is pinned to one process for the lifetime of the pool so
+  cached workbook handles stay coherent, and commands on the same file run one
+  at a time. Within a unit they run in script order; across units the order is
+  whichever unit reaches the file first.
+- Commands bound to an open Office application (Excel/PowerPoint COM, macOS
+  AppleScript, --workbook-name, active workbook) run one at a time on the thread
+  that started the parallel block, which is the thread that owns the COM
+  connection in sequential execution. @bulk sessions are entered and exited
+  there as well.
+- Commands the pool cannot classify (non-Office commands, nested batch runs)
+  run on the owner thread while nothing else is running.
+"""
+
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pyhub_office_automation.cli.dispatch import get_spec
+from pyhub_office_automation.cli.pipe import TargetScheduler, _concurrency_supported, target_key
+
+# Worker count for @parallel without N
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+# (exit_code, output, data) - see executor.run_command
+CommandOutcome = Tuple[int, str, Any]
+
+_local = threading.local()
+
+
+def current_pool() -> Optional["WorkerPool"]:
+    """Worker pool of the parallel unit running on this thread (None outside parallel blocks)"""
+    return getattr(_local, "pool", None)
+
+
+def _option_value(argv: List[str], option: str) -> Optional[str]:
+    for i, arg in enumerate(argv):
+        if arg == option and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(option + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+@lru_cache(maxsize=None)
+def _default_ppt_backend() -> str:
+    from pyhub_office_automation.powerpoint.backend_selector import detect_backend
+
+    return detect_backend()
+
+
+def _run_in_worker(argv: List[str]) -> CommandOutcome:
+    """Entry point in worker processes"""
+    from .executor import run_command
+
+    return run_command(argv)
+
+
+class _OwnerCall:
+    """Function call queued for the owner thread"""
+
+    __slots__ = ("func", "args", "future")
+
+    def __init__(self, func: Callable, args: tuple):
+        self.func = func
+        self.args = args
+        self.future: Future = Future()
+
+    def run(self):
+        try:
+            self.future.set_result(self.func(*self.args))
+        except BaseException as e:
+            self.future.set_exception(e)
+
+
+class WorkerPool:
+    """
+    Resource-aware command scheduler shared by all units of a parallel block
+
+    Created on the thread that runs the parallel block (the owner thread), which
+    must call wait() while the units run.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self.scheduler = TargetScheduler()
+        self._owner_calls: "queue.Queue[Optional[_OwnerCall]]" = queue.Queue()
+        self._processes: List[Optional[ProcessPoolExecutor]] = [None] * self.workers
+        self._assigned: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._excel_concurrent: Optional[bool] = None
+        self._owner = threading.get_ident()
+
+    # ===========================================
+    # Resource classification
+    # ===========================================
+
+    def resource_key(self, argv: List[str]) -> Tuple[Optional[str], bool]:
+        """
+        Resource a command uses
+
+        Returns:
+            (key, file_based): key is the normalized target file for file-based commands,
+            "app:<group>" for commands bound to an Office application, None if unknown
+        """
+        if len(argv) < 2:
+            return None, False
+        try:
+            if get_spec(argv[0], argv[1]) is None:
+                return None, False
+        except Exception:
+            return None, False
+
+        if self._is_file_based(argv):
+            return target_key(argv), True
+        return f"app:{argv[0]}", False
+
+    def _is_file_based(self, argv: List[str]) -> bool:
+        if _option_value(argv, "--file-path") is None:
+            return False
+        group = argv[0]
+        if group == "excel":
+            with self._lock:
+                if self._excel_concurrent is None:
+                    # The engine is created on the owner thread (COM connections are thread-bound)
+                    self._excel_concurrent = self.call_on_owner(_concurrency_supported)
+                return self._excel_concurrent
+        if group == "ppt":
+            backend = (_option_value(argv, "--backend") or "auto").lower()
+            if backend == "auto":
+                try:
+                    backend = _default_ppt_backend()
+                except Exception:
+                    return False
+            return backend == "python-pptx"
+        return False
+
+    # ===========================================
+    # Execution
+    # ===========================================
+
+    def run(self, argv: List[str], run_local: Callable[[List[str]], CommandOutcome]) -> CommandOutcome:
+        """
+        Run a command from a unit thread
+
+        Args:
+            argv: Resolved command line
+            run_local: In-process runner (executor.run_command)
+        """
+        key, file_based = self.resource_key(argv)
+        self.scheduler.acquire(key)
+        try:
+            if file_based:
+                return self._process_for(key).submit(_run_in_worker, argv).result()
+            return self.call_on_owner(run_local, argv)
+        finally:
+            self.scheduler.release(key)
+
+    def call_on_owner(self, func: Callable, *args) -> Any:
+        """Run func on the owner thread and wait for its result"""
+        if threading.get_ident() == self._owner:
+            return func(*args)
+        call = _OwnerCall(func, args)
+        self._owner_calls.put(call)
+        return call.future.result()
+
+    @contextmanager
+    def on_owner(self, context: Any):
+        """Enter and exit a context manager on the owner thread (e.g. an engine bulk session)"""
+        self.call_on_owner(context.__enter__)
+        try:
+            yield
+        except BaseException:
+            if not self.call_on_owner(context.__exit__, *sys.exc_info()):
+                raise
+        else:
+            self.call_on_owner(context.__exit__, None, None, None)
+
+    def wait(self, futures: List[Future]):
+        """
+        Wait until all futures are done
+
+        On the owner thread, queued owner-thread calls run while waiting.
+        """
+        if threading.get_ident() != self._owner:
+            for future in futures:
+                future.exception()
+            return
+        pending = [future for future in futures if not future.done()]
+        for future in pending:
+            future.add_done_callback(lambda _: self._owner_calls.put(None))
+        while any(not future.done() for future in pending):
+            call = self._owner_calls.get()
+            if call is not None:
+                call.run()
+
+    def _process_for(self, key: str) -> ProcessPoolExecutor:
+        with self._lock:
+            index = self._assigned.setdefault(key, len(self._assigned) % self.workers)
+            process = self._processes[index]
+            if process is None:
+                process = self._processes[index] = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            return process
+
+    def close(self):
+        """Shut down worker processes"""
+        used = [process for process in self._processes if process is not None]
+        for process in used:
+            process.shutdown(wait=True)
+        self._processes = [None] * self.workers
+        if used:
+            # Workbooks changed by worker processes: drop handles cached in this process
+            from pyhub_office_automation.excel.engines import reset_engine
+
+            reset_engine()
+
+    # ===========================================
+    # Unit threads
+    # ===========================================
+
+    def bind(self):
+        """Make this pool the current pool of the calling (unit) thread"""
+        _local.pool = self
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
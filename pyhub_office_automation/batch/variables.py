@@ -10,7 +10,65 @@ Supports:
 
 import os
 import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+# ${VAR_NAME} or $VAR_NAME
+# VAR_NAME must start with letter or underscore, followed by alphanumerics/underscores
+VARIABLE_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+class Template:
+    """
+    Text pre-split into literal and variable segments
+
+    Literal segments are kept as a str.format pattern (braces escaped), so
+    rendering is a single format call with the looked-up values.
+    """
+
+    __slots__ = ("text", "pattern", "names")
+
+    def __init__(self, text: str):
+        self.text = text
+        literals = []
+        names = []
+        position = 0
+        for match in VARIABLE_PATTERN.finditer(text):
+            literals.append(text[position : match.start()].replace("{", "{{").replace("}", "}}"))
+            names.append(match.group(1) or match.group(2))
+            position = match.end()
+        literals.append(text[position:].replace("{", "{{").replace("}", "}}"))
+
+        self.pattern = "{}".join(literals)
+        self.names: Tuple[str, ...] = tuple(names)
+
+    def render(self, lookup: Callable[[str], str]) -> str:
+        """
+        Substitute variables
+
+        Args:
+            lookup: Variable name -> value (e.g. VariableManager.get)
+
+        Returns:
+            Text with variables resolved
+        """
+        if not self.names:
+            return self.text
+        return self.pattern.format(*[lookup(name) for name in self.names])
+
+
+@lru_cache(maxsize=4096)
+def compile_template(text: str) -> Template:
+    """
+    Compile text into a Template (cached per distinct text)
+
+    Args:
+        text: Text containing variable references
+
+    Returns:
+        Compiled template
+    """
+    return Template(text)
 
 
 class VariableManager:
@@ -95,17 +153,7 @@ class VariableManager:
         Returns:
             Text with variables resolved
         """
-
-        def replacer(match) -> str:
-            # Group 1: ${VAR} syntax
-            # Group 2: $VAR syntax
-            var_name = match.group(1) or match.group(2)
-            return self.get(var_name)
-
-        # Pattern: ${VAR_NAME} or $VAR_NAME
-        # VAR_NAME must start with letter or underscore, followed by alphanumerics/underscores
-        pattern = r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)"
-        return re.sub(pattern, replacer, text)
+        return compile_template(text).render(self.get)
 
     def has(self, name: str) -> bool:
         """
@@ -128,6 +176,17 @@ class VariableManager:
         """
         return self.variables.copy()
 
+    def copy(self) -> "VariableManager":
+        """
+        Create an independent copy (used for parallel units of work)
+
+        Returns:
+            Variable manager with copies of the script variables and environment
+        """
+        clone = VariableManager(initial_vars=self.variables)
+        clone.environment = self.environment.copy()
+        return clone
+
     def _is_valid_name(self, name: str) -> bool:
         """
         Validate variable name
@@ -3,7 +3,6 @@ AI 에이전트별 맞춤형 설정 파일 자동 생성 CLI 모듈
 GitHub Issue #56 구현
 """
 
-import json
 import os
 import re
 import sys
@@ -16,6 +15,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.utils.python_detector import PythonDetector, get_best_python
 from pyhub_office_automation.utils.resource_loader import get_resource_path, load_resource_text
 from pyhub_office_automation.version import get_version
@@ -316,7 +316,7 @@ def status(
         status_info = manager.get_status()
 
         if output_format == "json":
-            typer.echo(json.dumps(status_info, ensure_ascii=False, indent=2))
+            echo_json(status_info)
         else:
             _display_status(status_info)
 
@@ -337,7 +337,7 @@ def _display_results(results: List[Dict], output_format: str, dry_run: bool):
                 "dry_run": dry_run,
             },
         }
-        typer.echo(json.dumps(output_data, ensure_ascii=False, indent=2))
+        echo_json(output_data)
     else:
         _display_results_table(results, dry_run)
 
@@ -0,0 +1,357 @@
+"""
+CLI 명령어 매니페스트
+
+지연 로딩(cli/lazy_commands.py)을 위해 명령어 이름, 구현 위치("모듈:속성"), 도움말을 정적으로 보관합니다.
+`oa --help`/`oa excel --help`는 이 정보만으로 출력되며, 명령어 모듈은 해당 명령어를 실행할 때 import됩니다.
+
+도움말은 명령어 docstring의 첫 단락과 같아야 합니다 (tests/test_cli_lazy_loading.py에서 검증).
+새 명령어를 추가할 때는 여기에 한 줄을 추가합니다. 등록 순서가 `--help` 출력 순서입니다.
+"""
+
+from typing import List, Tuple
+
+# (명령어 이름, "모듈:속성", 도움말)
+CommandEntry = Tuple[str, str, str]
+
+# oa
+ROOT_COMMANDS: List[CommandEntry] = [
+    (
+        "shell",
+        "pyhub_office_automation.shell.unified_shell:unified_shell",
+        "Start unified shell mode for Excel and PowerPoint",
+    ),
+    ("ai-setup", "pyhub_office_automation.cli.ai_setup:ai_setup_app", "AI 에이전트별 맞춤형 설정 파일 자동 생성"),
+    ("serve", "pyhub_office_automation.daemon.server:serve", "명령어를 빠르게 실행하는 로컬 데몬을 시작합니다."),
+    ("pipe", "pyhub_office_automation.cli.pipe:pipe", "stdin의 NDJSON 명령어를 한 프로세스에서 연속 실행합니다."),
+]
+
+# oa excel
+EXCEL_COMMANDS: List[CommandEntry] = [
+    ("range-read", "pyhub_office_automation.excel.range_read:range_read", "Excel 셀 범위의 데이터를 읽습니다."),
+    ("range-write", "pyhub_office_automation.excel.range_write:range_write", "Excel 셀 범위에 데이터를 씁니다."),
+    (
+        "range-convert",
+        "pyhub_office_automation.excel.range_convert:range_convert",
+        "Excel 셀 범위의 문자열 데이터를 숫자로 변환합니다.",
+    ),
+    (
+        "data-analyze",
+        "pyhub_office_automation.excel.data_analyze:data_analyze",
+        "Excel 데이터 구조를 분석하여 피벗테이블 준비 상태를 평가합니다.",
+    ),
+    (
+        "data-transform",
+        "pyhub_office_automation.excel.data_transform:data_transform",
+        "Excel 데이터를 피벗테이블용 형식으로 변환합니다.",
+    ),
+    ("data-validate", "pyhub_office_automation.excel.data_validate:data_validate", "Validate Excel data quality"),
+    (
+        "map-location-guide",
+        "pyhub_office_automation.excel.map_location_guide:map_location_guide",
+        "Get location name format guidance for Excel Map Chart",
+    ),
+    (
+        "map-visualize",
+        "pyhub_office_automation.excel.map_visualize:map_visualize",
+        "Create interactive map visualization from Seoul district data",
+    ),
+    (
+        "workbook-list",
+        "pyhub_office_automation.excel.workbook_list:workbook_list",
+        "현재 열려있는 모든 Excel 워크북의 목록과 상세 정보를 조회합니다.",
+    ),
+    (
+        "workbook-open",
+        "pyhub_office_automation.excel.workbook_open:workbook_open",
+        "Excel 워크북을 열거나 기존 워크북의 정보를 가져옵니다.",
+    ),
+    ("workbook-create", "pyhub_office_automation.excel.workbook_create:workbook_create", "새로운 Excel 워크북을 생성합니다."),
+    (
+        "workbook-info",
+        "pyhub_office_automation.excel.workbook_info:workbook_info",
+        "특정 Excel 워크북의 상세 정보를 조회합니다. (기본적으로 모든 정보 포함)",
+    ),
+    (
+        "metadata-generate",
+        "pyhub_office_automation.excel.metadata_generate:metadata_generate",
+        "워크북의 모든 Excel Table에 대한 메타데이터를 자동으로 생성합니다.",
+    ),
+    (
+        "sheet-activate",
+        "pyhub_office_automation.excel.sheet_activate:sheet_activate",
+        "Excel 워크북의 특정 시트를 활성화합니다.",
+    ),
+    ("sheet-add", "pyhub_office_automation.excel.sheet_add:sheet_add", "Excel 워크북에 새 워크시트를 추가합니다."),
+    ("sheet-delete", "pyhub_office_automation.excel.sheet_delete:sheet_delete", "Excel 워크북에서 시트를 삭제합니다."),
+    ("sheet-rename", "pyhub_office_automation.excel.sheet_rename:sheet_rename", "Excel 워크북의 시트 이름을 변경합니다."),
+    (
+        "table-create",
+        "pyhub_office_automation.excel.table_create:table_create",
+        "기존 데이터 범위를 Excel Table(ListObject)로 변환합니다.",
+    ),
+    (
+        "table-list",
+        "pyhub_office_automation.excel.table_list:table_list",
+        "워크북의 모든 Excel Table(ListObject) 목록을 조회합니다.",
+    ),
+    (
+        "table-read",
+        "pyhub_office_automation.excel.table_read:table_read",
+        "Excel 테이블 데이터를 pandas DataFrame으로 읽습니다.",
+    ),
+    (
+        "table-sort",
+        "pyhub_office_automation.excel.table_sort:table_sort",
+        "Excel Table에 단일 또는 다중 컬럼 정렬을 적용합니다.",
+    ),
+    (
+        "table-sort-clear",
+        "pyhub_office_automation.excel.table_sort_clear:table_sort_clear",
+        "Excel Table의 정렬 상태를 해제하고 원래 순서로 복원합니다.",
+    ),
+    (
+        "table-sort-info",
+        "pyhub_office_automation.excel.table_sort_info:table_sort_info",
+        "Excel Table에 현재 적용된 정렬 상태를 조회합니다.",
+    ),
+    (
+        "table-write",
+        "pyhub_office_automation.excel.table_write:table_write",
+        "pandas DataFrame을 Excel에 쓰고 선택적으로 Excel Table로 변환합니다.",
+    ),
+    (
+        "table-analyze",
+        "pyhub_office_automation.excel.table_analyze:table_analyze",
+        "Excel Table을 분석하고 메타데이터를 자동으로 생성합니다.",
+    ),
+    ("chart-add", "pyhub_office_automation.excel.chart_add:chart_add", "지정된 데이터 범위에서 Excel 차트를 생성합니다."),
+    (
+        "chart-configure",
+        "pyhub_office_automation.excel.chart_configure:chart_configure",
+        "기존 차트의 스타일과 속성을 설정합니다.",
+    ),
+    ("chart-delete", "pyhub_office_automation.excel.chart_delete:chart_delete", "워크시트에서 특정 차트를 삭제합니다."),
+    ("chart-export", "pyhub_office_automation.excel.chart_export:chart_export", "Excel 차트를 이미지 파일로 내보냅니다."),
+    (
+        "chart-list",
+        "pyhub_office_automation.excel.chart_list:chart_list",
+        "워크시트의 모든 차트 정보를 조회합니다. (기본적으로 상세 정보 포함)",
+    ),
+    (
+        "chart-pivot-create",
+        "pyhub_office_automation.excel.chart_pivot_create:chart_pivot_create",
+        "피벗테이블을 기반으로 동적 피벗차트를 생성합니다. (Windows 전용)",
+    ),
+    (
+        "chart-position",
+        "pyhub_office_automation.excel.chart_position:chart_position",
+        "차트의 위치와 크기를 정밀하게 조정합니다.",
+    ),
+    (
+        "pivot-configure",
+        "pyhub_office_automation.excel.pivot_configure:pivot_configure",
+        "피벗테이블의 필드 배치와 집계 함수를 구성합니다.",
+    ),
+    ("pivot-create", "pyhub_office_automation.excel.pivot_create:pivot_create", "소스 데이터에서 피벗테이블을 생성합니다."),
+    ("pivot-delete", "pyhub_office_automation.excel.pivot_delete:pivot_delete", "지정된 피벗테이블을 삭제합니다."),
+    (
+        "pivot-list",
+        "pyhub_office_automation.excel.pivot_list:pivot_list",
+        "워크북 내 모든 피벗테이블의 목록과 정보를 조회합니다.",
+    ),
+    ("pivot-refresh", "pyhub_office_automation.excel.pivot_refresh:pivot_refresh", "피벗테이블의 데이터를 새로고침합니다."),
+    ("shape-add", "pyhub_office_automation.excel.shape_add:shape_add", "Excel 시트에 도형을 추가합니다."),
+    ("shape-delete", "pyhub_office_automation.excel.shape_delete:shape_delete", "Excel 시트에서 도형을 삭제합니다."),
+    ("shape-format", "pyhub_office_automation.excel.shape_format:shape_format", "Excel 도형의 스타일과 포맷을 설정합니다."),
+    ("shape-group", "pyhub_office_automation.excel.shape_group:shape_group", "Excel 도형을 그룹화하거나 그룹을 해제합니다."),
+    ("shape-list", "pyhub_office_automation.excel.shape_list:shape_list", "Excel 시트의 모든 도형 정보를 조회합니다."),
+    ("textbox-add", "pyhub_office_automation.excel.textbox_add:textbox_add", "Excel 시트에 텍스트 박스를 추가합니다."),
+    ("slicer-add", "pyhub_office_automation.excel.slicer_add:slicer_add", "📊 Excel 피벗테이블 기반 슬라이서를 생성합니다."),
+    (
+        "slicer-connect",
+        "pyhub_office_automation.excel.slicer_connect:slicer_connect",
+        "Excel 슬라이서와 피벗테이블의 연결을 관리합니다.",
+    ),
+    (
+        "slicer-list",
+        "pyhub_office_automation.excel.slicer_list:slicer_list",
+        "🔍 Excel 워크북의 모든 슬라이서 정보를 조회합니다.",
+    ),
+    (
+        "slicer-position",
+        "pyhub_office_automation.excel.slicer_position:slicer_position",
+        "Excel 슬라이서의 위치와 크기를 조정합니다.",
+    ),
+    ("shell", "pyhub_office_automation.shell.excel_shell:excel_shell", "Start interactive Excel shell mode"),
+    ("session", "pyhub_office_automation.excel.session:session_app", "대량 작업 세션 (화면 갱신/자동 계산/이벤트 일시 중지)"),
+]
+
+# oa ppt
+PPT_COMMANDS: List[CommandEntry] = [
+    (
+        "presentation-create",
+        "pyhub_office_automation.powerpoint.presentation_create:presentation_create",
+        "새로운 PowerPoint 프레젠테이션을 생성합니다.",
+    ),
+    (
+        "presentation-open",
+        "pyhub_office_automation.powerpoint.presentation_open:presentation_open",
+        "기존 PowerPoint 프레젠테이션 파일을 엽니다.",
+    ),
+    (
+        "presentation-save",
+        "pyhub_office_automation.powerpoint.presentation_save:presentation_save",
+        "PowerPoint 프레젠테이션을 파일로 저장합니다.",
+    ),
+    (
+        "presentation-list",
+        "pyhub_office_automation.powerpoint.presentation_list:presentation_list",
+        "열려있는 PowerPoint 프레젠테이션 목록을 조회합니다.",
+    ),
+    (
+        "presentation-info",
+        "pyhub_office_automation.powerpoint.presentation_info:presentation_info",
+        "PowerPoint 프레젠테이션의 상세 정보를 조회합니다.",
+    ),
+    (
+        "slide-list",
+        "pyhub_office_automation.powerpoint.slide_list:slide_list",
+        "PowerPoint 프레젠테이션의 모든 슬라이드 목록을 조회합니다.",
+    ),
+    (
+        "slide-add",
+        "pyhub_office_automation.powerpoint.slide_add:slide_add",
+        "PowerPoint 프레젠테이션에 새 슬라이드를 추가합니다.",
+    ),
+    (
+        "slide-delete",
+        "pyhub_office_automation.powerpoint.slide_delete:slide_delete",
+        "PowerPoint 프레젠테이션에서 슬라이드를 삭제합니다.",
+    ),
+    (
+        "slide-duplicate",
+        "pyhub_office_automation.powerpoint.slide_duplicate:slide_duplicate",
+        "PowerPoint 슬라이드를 복제합니다 (바로 뒤에 추가).",
+    ),
+    (
+        "slide-copy",
+        "pyhub_office_automation.powerpoint.slide_copy:slide_copy",
+        "PowerPoint 슬라이드를 지정된 위치로 복사합니다.",
+    ),
+    (
+        "slide-reorder",
+        "pyhub_office_automation.powerpoint.slide_reorder:slide_reorder",
+        "PowerPoint 슬라이드의 순서를 변경합니다 (이동).",
+    ),
+    (
+        "content-add-text",
+        "pyhub_office_automation.powerpoint.content_add_text:content_add_text",
+        "PowerPoint 슬라이드에 텍스트를 추가합니다.",
+    ),
+    (
+        "content-add-image",
+        "pyhub_office_automation.powerpoint.content_add_image:content_add_image",
+        "PowerPoint 슬라이드에 이미지를 추가합니다.",
+    ),
+    (
+        "content-add-shape",
+        "pyhub_office_automation.powerpoint.content_add_shape:content_add_shape",
+        "PowerPoint 슬라이드에 도형을 추가합니다.",
+    ),
+    (
+        "content-add-table",
+        "pyhub_office_automation.powerpoint.content_add_table:content_add_table",
+        "PowerPoint 슬라이드에 표를 추가하고 데이터를 채웁니다.",
+    ),
+    (
+        "content-add-chart",
+        "pyhub_office_automation.powerpoint.content_add_chart:content_add_chart",
+        "PowerPoint 슬라이드에 데이터 기반 차트를 추가합니다.",
+    ),
+    (
+        "content-add-video",
+        "pyhub_office_automation.powerpoint.content_add_video:content_add_video",
+        "PowerPoint 슬라이드에 비디오를 추가합니다.",
+    ),
+    (
+        "content-add-smartart",
+        "pyhub_office_automation.powerpoint.content_add_smartart:content_add_smartart",
+        "PowerPoint 슬라이드에 SmartArt 스타일 다이어그램을 추가합니다.",
+    ),
+    (
+        "content-update",
+        "pyhub_office_automation.powerpoint.content_update:content_update",
+        "PowerPoint 슬라이드의 기존 콘텐츠를 업데이트합니다.",
+    ),
+    (
+        "content-add-excel-chart",
+        "pyhub_office_automation.powerpoint.content_add_excel_chart:content_add_excel_chart",
+        "Excel 워크북의 기존 차트를 PowerPoint 슬라이드에 추가합니다.",
+    ),
+    (
+        "content-add-audio",
+        "pyhub_office_automation.powerpoint.content_add_audio:content_add_audio",
+        "PowerPoint 슬라이드에 오디오를 추가합니다.",
+    ),
+    (
+        "content-add-equation",
+        "pyhub_office_automation.powerpoint.content_add_equation:content_add_equation",
+        "PowerPoint 슬라이드에 수학 수식을 추가합니다.",
+    ),
+    (
+        "layout-list",
+        "pyhub_office_automation.powerpoint.layout_list:layout_list",
+        "PowerPoint 프레젠테이션의 사용 가능한 레이아웃 목록을 조회합니다.",
+    ),
+    (
+        "layout-apply",
+        "pyhub_office_automation.powerpoint.layout_apply:layout_apply",
+        "PowerPoint 슬라이드에 특정 레이아웃을 적용합니다.",
+    ),
+    ("template-apply", "pyhub_office_automation.powerpoint.template_apply:template_apply", "PowerPoint 템플릿을 적용합니다."),
+    (
+        "theme-apply",
+        "pyhub_office_automation.powerpoint.theme_apply:theme_apply",
+        "PowerPoint 프레젠테이션에 테마를 적용합니다.",
+    ),
+    ("export-pdf", "pyhub_office_automation.powerpoint.export_pdf:export_pdf", "PowerPoint 프레젠테이션을 PDF로 내보냅니다."),
+    (
+        "export-images",
+        "pyhub_office_automation.powerpoint.export_images:export_images",
+        "PowerPoint 슬라이드를 이미지로 내보냅니다.",
+    ),
+    ("export-notes", "pyhub_office_automation.powerpoint.export_notes:export_notes", "PowerPoint 슬라이드 노트를 추출합니다."),
+    (
+        "slideshow-start",
+        "pyhub_office_automation.powerpoint.slideshow_start:slideshow_start",
+        "PowerPoint 슬라이드쇼를 시작합니다.",
+    ),
+    (
+        "slideshow-control",
+        "pyhub_office_automation.powerpoint.slideshow_control:slideshow_control",
+        "실행 중인 PowerPoint 슬라이드쇼를 제어합니다.",
+    ),
+    (
+        "run-macro",
+        "pyhub_office_automation.powerpoint.run_macro:run_macro",
+        "PowerPoint 프레젠테이션의 VBA 매크로를 실행합니다.",
+    ),
+    (
+        "animation-add",
+        "pyhub_office_automation.powerpoint.animation_add:animation_add",
+        "PowerPoint 슬라이드의 객체에 애니메이션 효과를 추가합니다.",
+    ),
+    ("shell", "pyhub_office_automation.shell.ppt_shell:ppt_shell", "Interactive PowerPoint Shell Mode"),
+]
+
+# oa email
+EMAIL_COMMANDS: List[CommandEntry] = [
+    ("send", "pyhub_office_automation.email.email_send:email_send", "AI 기반 이메일 생성 및 발송"),
+    ("accounts", "pyhub_office_automation.email.email_accounts:accounts_app", "이메일 계정 관리"),
+]
+
+
+def iter_command_modules() -> List[str]:
+    """매니페스트에 등록된 모든 명령어 모듈 (PyInstaller hiddenimports 등)"""
+    entries = ROOT_COMMANDS + EXCEL_COMMANDS + PPT_COMMANDS + EMAIL_COMMANDS
+    return sorted({target.partition(":")[0] for _, target, _ in entries})
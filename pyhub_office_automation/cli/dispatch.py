@@ -0,0 +1,210 @@
+"""
+배치 명령어 직접 호출
+
+`oa batch run`은 스크립트 한 줄마다 명령어를 실행합니다. CliRunner.invoke로 실행하면 줄마다
+click이 전체 argv를 다시 파싱하고 stdout/stderr를 교체하며, 출력된 JSON 텍스트를 다시 읽어야 합니다.
+
+여기서는 command_manifest로 (그룹, 명령어) → 구현 위치 표를 만들고, 명령어별 옵션 표(CommandSpec)를
+처음 호출할 때 한 번만 만들어 둡니다. 이후 호출은 옵션 표로 argv를 나눈 뒤 click 매개변수 처리
+(타입 변환, 기본값, 필수 검사)만 거쳐 명령어 함수를 바로 실행하고, echo_json 응답을 객체 그대로 돌려줍니다.
+
+옵션 표로 처리할 수 없는 argv(--help, 알 수 없는 옵션, multiple/nargs 옵션, 하위 그룹, 표에 없는 명령어)는
+None을 반환하므로 호출자가 CliRunner 등 기존 경로로 실행합니다.
+"""
+
+import json
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyhub_office_automation.utils.json_output import capture_json
+from pyhub_office_automation.utils.records import SlotsRecord
+
+from .command_manifest import EMAIL_COMMANDS, EXCEL_COMMANDS, PPT_COMMANDS
+from .inprocess import thread_local_output
+from .lazy_commands import load_command
+
+# (그룹, 명령어) → "모듈:속성"
+DISPATCH_TABLE: Dict[Tuple[str, str], str] = {
+    **{("excel", name): target for name, target, _ in EXCEL_COMMANDS},
+    **{("ppt", name): target for name, target, _ in PPT_COMMANDS},
+    **{("email", name): target for name, target, _ in EMAIL_COMMANDS},
+}
+
+
+@dataclass(slots=True)
+class DispatchResult(SlotsRecord):
+    """직접 호출 결과 (data는 echo_json 응답 객체, 응답이 여러 개면 목록)"""
+
+    exit_code: int
+    data: Any = None
+    stdout: str = ""
+    stderr: str = ""
+    elapsed_ms: float = 0.0
+
+
+class CommandSpec:
+    """명령어 하나의 옵션 표 (옵션 문자열 → (매개변수, 플래그 값))"""
+
+    def __init__(self, name: str, command: Any):
+        self.name = name
+        self.command = command
+        self.options: Dict[str, Tuple[Any, Any]] = {}
+        self.arguments: List[Any] = []
+        self.supported = not hasattr(command, "commands")
+
+        for param in command.params:
+            if param.nargs != 1 or getattr(param, "multiple", False) or getattr(param, "count", False):
+                self.supported = False
+            elif param.param_type_name == "argument":
+                self.arguments.append(param)
+            elif param.is_flag:
+                # typer가 포함한 click에는 flag_value가 없음 (불리언 플래그만 지원)
+                for opt in param.opts:
+                    self.options[opt] = (param, getattr(param, "flag_value", True))
+                for opt in param.secondary_opts:
+                    self.options[opt] = (param, False)
+            else:
+                for opt in param.opts:
+                    self.options[opt] = (param, None)
+
+        # 즉시 처리(eager) 매개변수 먼저, 나머지는 선언 순서
+        self.params = sorted(command.params, key=lambda param: not param.is_eager)
+
+    def parse(self, args: List[str]) -> Optional[Dict[str, Any]]:
+        """argv를 {매개변수 이름: 문자열 값/플래그 값}으로 나눔 (처리할 수 없으면 None)"""
+        opts: Dict[str, Any] = {}
+        positional = 0
+        i = 0
+        while i < len(args):
+            token = args[i]
+            i += 1
+            if token == "--":
+                remaining = args[i:]
+                if positional + len(remaining) > len(self.arguments):
+                    return None
+                for value in remaining:
+                    opts[self.arguments[positional].name] = value
+                    positional += 1
+                break
+
+            if token.startswith("-") and len(token) > 1:
+                name, has_value, inline = token.partition("=")
+                entry = self.options.get(name)
+                if entry is None:
+                    return None
+                param, flag_value = entry
+                if param.is_flag:
+                    if has_value:
+                        return None
+                    opts[param.name] = flag_value
+                elif has_value:
+                    opts[param.name] = inline
+                elif i < len(args):
+                    opts[param.name] = args[i]
+                    i += 1
+                else:
+                    return None
+                continue
+
+            if positional >= len(self.arguments):
+                return None
+            opts[self.arguments[positional].name] = token
+            positional += 1
+
+        return opts
+
+
+_specs: Dict[Tuple[str, str], CommandSpec] = {}
+_specs_lock = threading.Lock()
+
+
+def get_spec(group: str, name: str) -> Optional[CommandSpec]:
+    """(그룹, 명령어)의 옵션 표 (처음 호출할 때 명령어 모듈을 import해 생성, 표에 없으면 None)"""
+    key = (group, name)
+    spec = _specs.get(key)
+    if spec is None:
+        target = DISPATCH_TABLE.get(key)
+        if target is None:
+            return None
+        with _specs_lock:
+            spec = _specs.get(key)
+            if spec is None:
+                spec = _specs[key] = CommandSpec(name, load_command(name, target))
+    return spec
+
+
+def _exit_code(error: BaseException) -> Optional[int]:
+    """typer.Exit/click 예외의 종료 코드 (해당 예외가 아니면 None)"""
+    if isinstance(error, SystemExit):
+        return error.code if isinstance(error.code, int) else (0 if error.code is None else 1)
+    code = getattr(error, "exit_code", None)
+    return code if isinstance(code, int) else None
+
+
+def dispatch(argv: List[str]) -> Optional[DispatchResult]:
+    """
+    oa 명령어를 현재 스레드에서 직접 실행
+
+    명령어 안의 예외는 종료 코드 1과 stderr의 traceback으로 반환되며 호출자에게 전파되지 않습니다.
+
+    Returns:
+        실행 결과, 직접 호출할 수 없는 argv면 None
+    """
+    if len(argv) < 2:
+        return None
+    spec = get_spec(argv[0], argv[1])
+    if spec is None or not spec.supported:
+        return None
+    args = list(argv[2:])
+    opts = spec.parse(args)
+    if opts is None:
+        return None
+
+    # 쓰기 명령어면 대상 파일의 조회 결과 캐시를 실행 전에 무효화 (LazyTyperGroup과 같음)
+    from pyhub_office_automation.utils.result_cache import invalidate_for_command
+
+    invalidate_for_command(spec.name, args)
+
+    command = spec.command
+    start = time.perf_counter()
+    with thread_local_output(), sys.stdout.capture() as out, sys.stderr.capture() as err, capture_json() as responses:
+        try:
+            with command.context_class(command, info_name=spec.name) as ctx:
+                for param in spec.params:
+                    param.handle_parse_result(ctx, opts, [])
+                result = command.invoke(ctx)
+            exit_code = result if isinstance(result, int) else 0
+        except Exception as e:
+            exit_code = _exit_code(e)
+            if exit_code is None:
+                err.write(traceback.format_exc())
+                exit_code = 1
+            elif hasattr(e, "format_message"):
+                err.write(f"Error: {e.format_message()}\n")
+        except SystemExit as e:
+            exit_code = _exit_code(e)
+
+    stdout = out.getvalue()
+    if responses:
+        data = responses[0] if len(responses) == 1 else responses
+    else:
+        # echo_json을 거치지 않은 JSON 출력 (결과 캐시 적중 등)
+        data = None
+        text = stdout.strip()
+        if text[:1] in ("{", "["):
+            try:
+                data, stdout = json.loads(text), ""
+            except ValueError:
+                pass
+
+    return DispatchResult(
+        exit_code=exit_code,
+        data=data,
+        stdout=stdout,
+        stderr=err.getvalue(),
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 3),
+    )
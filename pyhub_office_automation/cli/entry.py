@@ -0,0 +1,24 @@
+"""
+`oa` 콘솔 스크립트 엔트리포인트
+
+데몬(`oa serve`)이 실행 중이면 typer/rich와 명령어 모듈을 import하기 전에 argv를 전달하고 끝냅니다.
+데몬이 없을 때만 cli/main.py를 import하여 현재 프로세스에서 실행합니다.
+"""
+
+import sys
+
+
+def main():
+    from pyhub_office_automation.daemon.client import forward_to_daemon
+
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from pyhub_office_automation.cli.main import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+현재 프로세스에서 oa 명령어 실행
+
+`oa pipe`와 `oa serve` 데몬이 명령어마다 새 프로세스를 띄우지 않고 같은 프로세스에서 실행할 때 사용합니다.
+click의 CliRunner는 sys.stdout 자체를 바꿔 끼우므로 여러 스레드에서 동시에 쓸 수 없습니다.
+여기서는 sys.stdout/sys.stderr를 스레드별로 출력 버퍼를 고르는 스트림으로 한 번만 교체하고,
+각 명령어는 자기 스레드의 버퍼에만 출력하도록 합니다.
+"""
+
+import io
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+import click
+import typer
+
+
+@dataclass
+class InvocationResult:
+    """명령어 한 번의 실행 결과"""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+    elapsed_ms: float
+
+
+class ThreadLocalOutput(io.TextIOBase):
+    """
+    스레드별 캡처 버퍼로 쓰기를 보내는 텍스트 스트림
+
+    캡처 중이 아닌 스레드의 출력은 원래 스트림(fallback)으로 갑니다.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def _target(self):
+        return getattr(self._local, "buffer", None) or self._fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        buffer = io.StringIO()
+        previous = getattr(self._local, "buffer", None)
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = previous
+
+
+_install_lock = threading.Lock()
+_install_depth = 0
+
+
+@contextmanager
+def thread_local_output():
+    """블록 동안 sys.stdout/sys.stderr를 ThreadLocalOutput으로 교체 (중첩 가능)"""
+    global _install_depth
+
+    with _install_lock:
+        if _install_depth == 0:
+            sys.stdout = ThreadLocalOutput(sys.stdout)
+            sys.stderr = ThreadLocalOutput(sys.stderr)
+        _install_depth += 1
+    try:
+        yield
+    finally:
+        with _install_lock:
+            _install_depth -= 1
+            if _install_depth == 0:
+                sys.stdout = sys.stdout._fallback
+                sys.stderr = sys.stderr._fallback
+
+
+_command: Optional[click.Command] = None
+
+
+def _root_command() -> click.Command:
+    global _command
+    if _command is None:
+        from pyhub_office_automation.cli.main import app
+
+        _command = typer.main.get_command(app)
+    return _command
+
+
+def invoke(argv: List[str]) -> InvocationResult:
+    """
+    oa 명령어를 현재 스레드에서 실행하고 출력을 캡처
+
+    thread_local_output() 블록 안에서 호출해야 합니다. 명령어 안의 예외는 종료 코드 1과
+    stderr의 traceback으로 반환되며 호출자에게 전파되지 않습니다.
+    """
+    command = _root_command()
+    stdout_stream, stderr_stream = sys.stdout, sys.stderr
+    if not isinstance(stdout_stream, ThreadLocalOutput) or not isinstance(stderr_stream, ThreadLocalOutput):
+        raise RuntimeError("invoke()는 thread_local_output() 블록 안에서 호출해야 합니다")
+
+    start = time.perf_counter()
+    with stdout_stream.capture() as out, stderr_stream.capture() as err:
+        try:
+            result = command.main(args=list(argv), prog_name="oa", standalone_mode=False)
+            exit_code = result if isinstance(result, int) else 0
+        except click.exceptions.Exit as e:
+            exit_code = e.exit_code
+        except click.ClickException as e:
+            e.show()
+            exit_code = e.exit_code
+        except click.exceptions.Abort:
+            err.write("Aborted!\n")
+            exit_code = 1
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            err.write(traceback.format_exc())
+            exit_code = 1
+
+    return InvocationResult(
+        exit_code=exit_code,
+        stdout=out.getvalue(),
+        stderr=err.getvalue(),
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 3),
+    )
@@ -0,0 +1,87 @@
+"""
+명령어 지연 로딩
+
+명령어 모듈은 pandas, xlwings, folium, keyring, python-pptx 등 무거운 의존성을 import하므로
+cli/main.py에서 모두 import하면 `oa --version`도 수 초가 걸립니다.
+여기서는 command_manifest의 이름/도움말만으로 자리표시 명령어를 등록하고,
+명령어가 실제로 호출될 때(해당 명령어의 --help 포함) 모듈을 import해 진짜 명령어로 교체합니다.
+
+그룹 도움말(`oa excel --help`)은 자리표시 명령어만 사용하므로 명령어 모듈을 import하지 않습니다.
+명령어를 실행할 때는 쓰기 명령어의 대상 파일에 대한 조회 결과 캐시도 무효화합니다 (utils/result_cache 참고).
+"""
+
+import importlib
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import click
+import typer
+from typer.core import TyperGroup
+
+from .command_manifest import CommandEntry
+
+# 자리표시 콜백에 실제 구현 위치("모듈:속성")를 기록하는 속성 이름
+_LAZY_TARGET_ATTR = "__oa_lazy_target__"
+
+
+def _placeholder(target: str, help_text: str) -> Callable[[], None]:
+    def placeholder():
+        raise RuntimeError(f"지연 로딩 명령어가 로드되지 않았습니다: {target}")
+
+    placeholder.__doc__ = help_text
+    setattr(placeholder, _LAZY_TARGET_ATTR, target)
+    return placeholder
+
+
+def register_lazy_commands(app: typer.Typer, entries: Iterable[CommandEntry]):
+    """매니페스트 항목을 자리표시 명령어로 등록 (app은 cls=LazyTyperGroup으로 생성)"""
+    for name, target, help_text in entries:
+        app.command(name)(_placeholder(target, help_text))
+
+
+def load_command(name: str, target: str) -> click.Command:
+    """
+    "모듈:속성"을 import하여 click 명령어로 변환
+
+    속성이 typer.Typer면 하위 그룹, 함수면 단일 명령어가 됩니다.
+    """
+    module_name, _, attr = target.partition(":")
+    obj: Any = getattr(importlib.import_module(module_name), attr)
+
+    if isinstance(obj, typer.Typer):
+        command = typer.main.get_group(obj)
+    else:
+        single = typer.Typer(add_completion=False)
+        single.command(name)(obj)
+        command = typer.main.get_command(single)
+
+    command.name = name
+    return command
+
+
+def lazy_target(command: Optional[click.Command]) -> Optional[str]:
+    """자리표시 명령어면 실제 구현 위치를, 아니면 None을 반환"""
+    return getattr(getattr(command, "callback", None), _LAZY_TARGET_ATTR, None)
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    자리표시 명령어를 호출 시점에 실제 명령어로 교체하는 그룹
+
+    get_command()는 도움말 목록/자동 완성에도 쓰이므로 자리표시 그대로 반환하고,
+    실행 경로인 resolve_command()에서만 모듈을 import합니다.
+    """
+
+    def resolve_command(self, ctx: click.Context, args: List[str]) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        cmd_name, command, rest = super().resolve_command(ctx, args)
+
+        target = lazy_target(command)
+        if target is not None:
+            command = self.commands[command.name] = load_command(command.name, target)
+
+        if command is not None and not isinstance(command, click.Group):
+            # 쓰기 명령어면 대상 파일의 조회 결과 캐시를 실행 전에 무효화
+            from pyhub_office_automation.utils.result_cache import invalidate_for_command
+
+            invalidate_for_command(command.name, rest)
+
+        return cmd_name, command, rest
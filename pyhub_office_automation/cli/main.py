@@ -1,6 +1,6 @@
 """
 pyhub-office-automation Typer 기반 CLI 명령어
-PyInstaller 호환성을 위한 정적 명령어 등록
+명령어 모듈은 command_manifest에 정적으로 등록하고 실행 시점에 import (lazy_commands 참고)
 """
 
 import json
@@ -26,123 +26,13 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from pyhub_office_automation.cli.ai_setup import ai_setup_app
-from pyhub_office_automation.email.email_accounts import accounts_app
-
-# Email 명령어 import
-from pyhub_office_automation.email.email_send import email_send
-
-# Chart 명령어 import
-from pyhub_office_automation.excel.chart_add import chart_add
-from pyhub_office_automation.excel.chart_configure import chart_configure
-from pyhub_office_automation.excel.chart_delete import chart_delete
-from pyhub_office_automation.excel.chart_export import chart_export
-from pyhub_office_automation.excel.chart_list import chart_list
-from pyhub_office_automation.excel.chart_pivot_create import chart_pivot_create
-from pyhub_office_automation.excel.chart_position import chart_position
-
-# Data 명령어 import (Issue #39)
-from pyhub_office_automation.excel.data_analyze import data_analyze
-from pyhub_office_automation.excel.data_transform import data_transform
-from pyhub_office_automation.excel.data_validate import data_validate  # Issue #90
-from pyhub_office_automation.excel.map_location_guide import map_location_guide
-from pyhub_office_automation.excel.map_visualize import map_visualize
-from pyhub_office_automation.excel.metadata_generate import metadata_generate
-
-# Pivot 명령어 import
-from pyhub_office_automation.excel.pivot_configure import pivot_configure
-from pyhub_office_automation.excel.pivot_create import pivot_create
-from pyhub_office_automation.excel.pivot_delete import pivot_delete
-from pyhub_office_automation.excel.pivot_list import pivot_list
-from pyhub_office_automation.excel.pivot_refresh import pivot_refresh
-
-# Excel 명령어 import
-from pyhub_office_automation.excel.range_convert import range_convert
-from pyhub_office_automation.excel.range_read import range_read
-from pyhub_office_automation.excel.range_write import range_write
-
-# Shape 명령어 import
-from pyhub_office_automation.excel.shape_add import shape_add
-from pyhub_office_automation.excel.shape_delete import shape_delete
-from pyhub_office_automation.excel.shape_format import shape_format
-from pyhub_office_automation.excel.shape_group import shape_group
-from pyhub_office_automation.excel.shape_list import shape_list
-from pyhub_office_automation.excel.sheet_activate import sheet_activate
-from pyhub_office_automation.excel.sheet_add import sheet_add
-from pyhub_office_automation.excel.sheet_delete import sheet_delete
-from pyhub_office_automation.excel.sheet_rename import sheet_rename
-
-# Slicer 명령어 import
-from pyhub_office_automation.excel.slicer_add import slicer_add
-from pyhub_office_automation.excel.slicer_connect import slicer_connect
-from pyhub_office_automation.excel.slicer_list import slicer_list
-from pyhub_office_automation.excel.slicer_position import slicer_position
-from pyhub_office_automation.excel.table_analyze import table_analyze
-from pyhub_office_automation.excel.table_create import table_create
-from pyhub_office_automation.excel.table_list import table_list
-from pyhub_office_automation.excel.table_read import table_read
-from pyhub_office_automation.excel.table_sort import table_sort
-from pyhub_office_automation.excel.table_sort_clear import table_sort_clear
-from pyhub_office_automation.excel.table_sort_info import table_sort_info
-from pyhub_office_automation.excel.table_write import table_write
-from pyhub_office_automation.excel.textbox_add import textbox_add
-from pyhub_office_automation.excel.workbook_create import workbook_create
-from pyhub_office_automation.excel.workbook_info import workbook_info
-from pyhub_office_automation.excel.workbook_list import workbook_list
-from pyhub_office_automation.excel.workbook_open import workbook_open
-
-# HWP 명령어 import
-from pyhub_office_automation.hwp.hwp_export import hwp_export
-
-# PowerPoint Phase 3 (Windows Advanced) 명령어 import (Issue #84 Phase 3)
-from pyhub_office_automation.powerpoint.animation_add import animation_add
-
-# PowerPoint Advanced Content 명령어 import (Issue #78)
-from pyhub_office_automation.powerpoint.content_add_audio import content_add_audio
-from pyhub_office_automation.powerpoint.content_add_chart import content_add_chart
-from pyhub_office_automation.powerpoint.content_add_equation import content_add_equation
-from pyhub_office_automation.powerpoint.content_add_excel_chart import content_add_excel_chart
-from pyhub_office_automation.powerpoint.content_add_image import content_add_image
-from pyhub_office_automation.powerpoint.content_add_shape import content_add_shape
-from pyhub_office_automation.powerpoint.content_add_smartart import content_add_smartart
-from pyhub_office_automation.powerpoint.content_add_table import content_add_table
-
-# PowerPoint Content 명령어 import (Issue #77)
-from pyhub_office_automation.powerpoint.content_add_text import content_add_text
-from pyhub_office_automation.powerpoint.content_add_video import content_add_video
-from pyhub_office_automation.powerpoint.content_update import content_update
-
-# PowerPoint Export 명령어 import (Issue #80)
-from pyhub_office_automation.powerpoint.export_images import export_images
-from pyhub_office_automation.powerpoint.export_notes import export_notes
-from pyhub_office_automation.powerpoint.export_pdf import export_pdf
-from pyhub_office_automation.powerpoint.layout_apply import layout_apply
-
-# PowerPoint Layout & Theme 명령어 import (Issue #79)
-from pyhub_office_automation.powerpoint.layout_list import layout_list
-
-# PowerPoint 명령어 import
-from pyhub_office_automation.powerpoint.presentation_create import presentation_create
-from pyhub_office_automation.powerpoint.presentation_info import presentation_info
-from pyhub_office_automation.powerpoint.presentation_list import presentation_list
-from pyhub_office_automation.powerpoint.presentation_open import presentation_open
-from pyhub_office_automation.powerpoint.presentation_save import presentation_save
-from pyhub_office_automation.powerpoint.run_macro import run_macro
-from pyhub_office_automation.powerpoint.slide_add import slide_add
-from pyhub_office_automation.powerpoint.slide_copy import slide_copy
-from pyhub_office_automation.powerpoint.slide_delete import slide_delete
-from pyhub_office_automation.powerpoint.slide_duplicate import slide_duplicate
-from pyhub_office_automation.powerpoint.slide_list import slide_list
-from pyhub_office_automation.powerpoint.slide_reorder import slide_reorder
-from pyhub_office_automation.powerpoint.slideshow_control import slideshow_control
-from pyhub_office_automation.powerpoint.slideshow_start import slideshow_start
-from pyhub_office_automation.powerpoint.template_apply import template_apply
-from pyhub_office_automation.powerpoint.theme_apply import theme_apply
+from pyhub_office_automation.cli.command_manifest import EMAIL_COMMANDS, EXCEL_COMMANDS, PPT_COMMANDS, ROOT_COMMANDS
+from pyhub_office_automation.cli.lazy_commands import LazyTyperGroup, register_lazy_commands
 from pyhub_office_automation.utils.resource_loader import load_llm_guide, load_welcome_message
 from pyhub_office_automation.version import get_version, get_version_info
 
 # Typer 앱 생성
-app = typer.Typer(help="pyhub-office-automation: AI 에이전트를 위한 Office 자동화 도구")
+app = typer.Typer(help="pyhub-office-automation: AI 에이전트를 위한 Office 자동화 도구", cls=LazyTyperGroup)
 
 
 def version_callback(value: bool):
@@ -158,10 +48,16 @@ def version_callback(value: bool):
 def main_callback(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", callback=version_callback, help="버전 정보 출력"),
+    profile: bool = typer.Option(False, "--profile", help="COM 호출 계측 결과를 응답 JSON의 profile 항목에 포함"),
 ):
     """
     pyhub-office-automation: AI 에이전트를 위한 Office 자동화 도구
     """
+    if profile:
+        from pyhub_office_automation.excel.engines.instrumentation import enable_profiling
+
+        enable_profiling()
+
     # 서브커맨드가 없고 버전 옵션도 아닌 경우 welcome 메시지 표시
     if ctx.invoked_subcommand is None:
         show_welcome_message()
@@ -303,10 +199,10 @@ def llm_guide(
         raise typer.Exit(1)
 
 
-excel_app = typer.Typer(help="Excel 자동화 명령어들", no_args_is_help=True)
-hwp_app = typer.Typer(help="HWP 자동화 명령어들 (Windows 전용)", no_args_is_help=True)
-ppt_app = typer.Typer(help="PowerPoint 자동화 명령어들", no_args_is_help=True)
-email_app = typer.Typer(help="AI 기반 이메일 자동화 명령어들", no_args_is_help=True)
+excel_app = typer.Typer(help="Excel 자동화 명령어들", no_args_is_help=True, cls=LazyTyperGroup)
+hwp_app = typer.Typer(help="HWP 자동화 명령어들 (Windows 전용)", no_args_is_help=True, cls=LazyTyperGroup)
+ppt_app = typer.Typer(help="PowerPoint 자동화 명령어들", no_args_is_help=True, cls=LazyTyperGroup)
+email_app = typer.Typer(help="AI 기반 이메일 자동화 명령어들", no_args_is_help=True, cls=LazyTyperGroup)
 
 # Rich 콘솔 - UTF-8 인코딩 안전성 확보
 try:
@@ -316,78 +212,8 @@ except Exception:
     # fallback to basic console
     console = Console(legacy_windows=True)
 
-# Excel 명령어 등록 (단계적 테스트)
-# Range Commands
-excel_app.command("range-read")(range_read)
-excel_app.command("range-write")(range_write)
-excel_app.command("range-convert")(range_convert)
-
-# Data Commands (Issue #39)
-excel_app.command("data-analyze")(data_analyze)
-excel_app.command("data-transform")(data_transform)
-excel_app.command("data-validate")(data_validate)  # Issue #90
-
-# Map Chart Commands (Issue #72)
-excel_app.command("map-location-guide")(map_location_guide)
-excel_app.command("map-visualize")(map_visualize)  # Issue #72 Phase 3
-
-# Workbook Commands
-excel_app.command("workbook-list")(workbook_list)
-excel_app.command("workbook-open")(workbook_open)
-excel_app.command("workbook-create")(workbook_create)
-excel_app.command("workbook-info")(workbook_info)
-excel_app.command("metadata-generate")(metadata_generate)
-
-# Sheet Commands
-excel_app.command("sheet-activate")(sheet_activate)
-excel_app.command("sheet-add")(sheet_add)
-excel_app.command("sheet-delete")(sheet_delete)
-excel_app.command("sheet-rename")(sheet_rename)
-
-# Table Commands
-excel_app.command("table-create")(table_create)
-excel_app.command("table-list")(table_list)
-excel_app.command("table-read")(table_read)
-excel_app.command("table-sort")(table_sort)
-excel_app.command("table-sort-clear")(table_sort_clear)
-excel_app.command("table-sort-info")(table_sort_info)
-excel_app.command("table-write")(table_write)
-excel_app.command("table-analyze")(table_analyze)
-
-# Chart Commands
-excel_app.command("chart-add")(chart_add)
-excel_app.command("chart-configure")(chart_configure)
-excel_app.command("chart-delete")(chart_delete)
-excel_app.command("chart-export")(chart_export)
-excel_app.command("chart-list")(chart_list)
-excel_app.command("chart-pivot-create")(chart_pivot_create)
-excel_app.command("chart-position")(chart_position)
-
-# Pivot Commands
-excel_app.command("pivot-configure")(pivot_configure)
-excel_app.command("pivot-create")(pivot_create)
-excel_app.command("pivot-delete")(pivot_delete)
-excel_app.command("pivot-list")(pivot_list)
-excel_app.command("pivot-refresh")(pivot_refresh)
-
-# Shape Commands (이제 Typer로 전환 완료)
-excel_app.command("shape-add")(shape_add)
-excel_app.command("shape-delete")(shape_delete)
-excel_app.command("shape-format")(shape_format)
-excel_app.command("shape-group")(shape_group)
-excel_app.command("shape-list")(shape_list)
-excel_app.command("textbox-add")(textbox_add)
-
-# Slicer Commands (이제 Typer로 전환 완료)
-excel_app.command("slicer-add")(slicer_add)
-excel_app.command("slicer-connect")(slicer_connect)
-excel_app.command("slicer-list")(slicer_list)
-excel_app.command("slicer-position")(slicer_position)
-
-# Shell Command (Issue #85)
-from pyhub_office_automation.shell.excel_shell import excel_shell
-
-excel_app.command("shell")(excel_shell)
+# Excel 명령어 등록 (command_manifest.EXCEL_COMMANDS, 실행 시 import)
+register_lazy_commands(excel_app, EXCEL_COMMANDS)
 
 
 # Excel list command
@@ -450,6 +276,9 @@ def excel_list_temp(
         {"name": "slicer-connect", "description": "슬라이서 연결", "category": "slicer"},
         {"name": "slicer-list", "description": "슬라이서 목록 조회", "category": "slicer"},
         {"name": "slicer-position", "description": "슬라이서 위치 설정", "category": "slicer"},
+        # Session Commands
+        {"name": "session begin", "description": "대량 작업 세션 시작 (자동 계산/화면 갱신 일시 중지)", "category": "session"},
+        {"name": "session end", "description": "대량 작업 세션 종료 (설정 복원 및 1회 재계산)", "category": "session"},
     ]
 
     excel_data = {
@@ -494,9 +323,8 @@ def excel_list_temp(
         console.print()
 
 
-# Email 명령어 등록
-email_app.command("send")(email_send)
-email_app.add_typer(accounts_app, name="accounts")
+# Email 명령어 등록 (command_manifest.EMAIL_COMMANDS)
+register_lazy_commands(email_app, EMAIL_COMMANDS)
 
 
 # Email list command
@@ -548,7 +376,6 @@ app.add_typer(excel_app, name="excel")
 app.add_typer(hwp_app, name="hwp")
 app.add_typer(ppt_app, name="ppt")
 app.add_typer(email_app, name="email")
-app.add_typer(ai_setup_app, name="ai-setup")
 
 
 @app.command()
@@ -710,63 +537,11 @@ def hwp_list(
             console.print(f"     {cmd['description']} (v{cmd['version']})")
 
 
-# PowerPoint 명령어 등록
-# Presentation 관리
-ppt_app.command("presentation-create")(presentation_create)
-ppt_app.command("presentation-open")(presentation_open)
-ppt_app.command("presentation-save")(presentation_save)
-ppt_app.command("presentation-list")(presentation_list)
-ppt_app.command("presentation-info")(presentation_info)
-
-# Slide 관리 (Issue #76)
-ppt_app.command("slide-list")(slide_list)
-ppt_app.command("slide-add")(slide_add)
-ppt_app.command("slide-delete")(slide_delete)
-ppt_app.command("slide-duplicate")(slide_duplicate)
-ppt_app.command("slide-copy")(slide_copy)
-ppt_app.command("slide-reorder")(slide_reorder)
-
-# Content 추가 (Issue #77)
-ppt_app.command("content-add-text")(content_add_text)
-ppt_app.command("content-add-image")(content_add_image)
-ppt_app.command("content-add-shape")(content_add_shape)
-ppt_app.command("content-add-table")(content_add_table)
-
-# Advanced Content 추가 및 업데이트 (Issue #78)
-ppt_app.command("content-add-chart")(content_add_chart)
-ppt_app.command("content-add-video")(content_add_video)
-ppt_app.command("content-add-smartart")(content_add_smartart)
-ppt_app.command("content-update")(content_update)
-ppt_app.command("content-add-excel-chart")(content_add_excel_chart)
-ppt_app.command("content-add-audio")(content_add_audio)
-ppt_app.command("content-add-equation")(content_add_equation)
-
-# Layout & Theme 관리 (Issue #79)
-ppt_app.command("layout-list")(layout_list)
-ppt_app.command("layout-apply")(layout_apply)
-ppt_app.command("template-apply")(template_apply)
-ppt_app.command("theme-apply")(theme_apply)
-
-# Export 기능 (Issue #80)
-ppt_app.command("export-pdf")(export_pdf)
-ppt_app.command("export-images")(export_images)
-ppt_app.command("export-notes")(export_notes)
-
-# Windows Advanced Features (Issue #84 Phase 3)
-ppt_app.command("slideshow-start")(slideshow_start)
-ppt_app.command("slideshow-control")(slideshow_control)
-ppt_app.command("run-macro")(run_macro)
-ppt_app.command("animation-add")(animation_add)
-
-# Shell Command (Issue #85 Phase 5)
-from pyhub_office_automation.shell.ppt_shell import ppt_shell
-
-ppt_app.command("shell")(ppt_shell)
-
-# Unified Shell Command (Issue #87)
-from pyhub_office_automation.shell.unified_shell import unified_shell
-
-app.command("shell")(unified_shell)
+# PowerPoint 명령어 등록 (command_manifest.PPT_COMMANDS)
+register_lazy_commands(ppt_app, PPT_COMMANDS)
+
+# Unified Shell (Issue #87), AI 설정 명령어 (command_manifest.ROOT_COMMANDS)
+register_lazy_commands(app, ROOT_COMMANDS)
 
 # Batch Execution Commands (Issue #88)
 batch_app = typer.Typer(help="Batch script execution")
@@ -815,15 +590,18 @@ def batch_validate_cmd(
     """Validate batch script syntax without executing"""
     from rich.console import Console
 
+    from pyhub_office_automation.batch.compiler import compile_script
     from pyhub_office_automation.batch.executor import parse_script
 
     console = Console()
+    err_console = Console(stderr=True)
 
     try:
         console.print(f"\n[bold cyan]Validating script:[/bold cyan] {script_path}\n")
 
-        # Parse script
+        # Parse script and check block structure (@if/@foreach/@try/@bulk/@parallel)
         lines = parse_script(script_path)
+        compile_script(lines)
 
         # Count line types
         total_lines = len(lines)
@@ -850,10 +628,10 @@ def batch_validate_cmd(
         console.print("\n[bold green]✓ Script validation passed![/bold green]\n")
 
     except FileNotFoundError:
-        console.print(f"[bold red]Error:[/bold red] Script file not found: {script_path}\n", err=True)
+        err_console.print(f"[bold red]Error:[/bold red] Script file not found: {script_path}\n")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[bold red]Validation failed:[/bold red] {e}\n", err=True)
+        err_console.print(f"[bold red]Validation failed:[/bold red] {e}\n")
         raise typer.Exit(1)
 
 
@@ -870,12 +648,13 @@ def batch_info_cmd(
     from pyhub_office_automation.batch.executor import parse_script
 
     console = Console()
+    err_console = Console(stderr=True)
 
     try:
         script_file = Path(script_path)
 
         if not script_file.exists():
-            console.print(f"[bold red]Error:[/bold red] Script file not found: {script_path}\n", err=True)
+            err_console.print(f"[bold red]Error:[/bold red] Script file not found: {script_path}\n")
             raise typer.Exit(1)
 
         console.print(f"\n[bold cyan]Batch Script Information[/bold cyan]\n")
@@ -929,7 +708,7 @@ def batch_info_cmd(
         console.print()
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}\n", err=True)
+        err_console.print(f"[bold red]Error:[/bold red] {e}\n")
         raise typer.Exit(1)
 
 
@@ -1028,6 +807,8 @@ def hwp_export_command(
     output_format: str = typer.Option("json", "--output-format", help="응답 출력 형식 (json)"),
 ):
     """HWP 파일을 HTML 형식으로 변환"""
+    from pyhub_office_automation.hwp.hwp_export import hwp_export
+
     hwp_export(
         file_path=file_path,
         format_type=format_type,
@@ -1111,9 +892,18 @@ def check_dependencies():
 
 
 def main():
-    """메인 엔트리포인트"""
+    """메인 엔트리포인트 (실행 중인 `oa serve` 데몬이 있으면 데몬에서 실행)"""
+    from pyhub_office_automation.daemon.client import forward_to_daemon
+
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
     app()
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 배치 병렬 실행(@parallel)의 작업 프로세스 시작 지원
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
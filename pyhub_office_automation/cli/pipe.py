@@ -0,0 +1,255 @@
+"""
+NDJSON 파이프 모드 (`oa pipe`)
+
+stdin에서 한 줄에 하나씩 JSON 명령어 객체를 읽어 한 프로세스에서 실행하고,
+결과를 한 줄에 하나씩 JSON으로 stdout에 바로 씁니다.
+명령어 모듈 import와 엔진(Excel 연결)은 첫 명령어에서 한 번만 준비됩니다.
+
+입력:
+    {"id": 1, "command": "excel range-read", "args": {"file-path": "a.xlsx", "range": "A1:C10"}}
+    {"id": 2, "command": ["excel", "table-list"], "args": ["--file-path", "b.xlsx"]}
+
+출력:
+    {"id": 1, "exit_code": 0, "success": true, "elapsed_ms": 12.3, "output": {...}}
+"""
+
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+import typer
+
+from .inprocess import invoke, thread_local_output
+
+# 같은 파일을 다루는 명령어를 구분하는 옵션 (입력 순서대로 직렬 실행)
+TARGET_OPTIONS = ("--file-path", "--workbook-name")
+
+
+def build_argv(request: Dict[str, Any]) -> List[str]:
+    """
+    명령어 객체를 argv로 변환
+
+    command는 "excel range-read" 문자열 또는 목록, args는 argv 목록 또는 {옵션: 값} 객체입니다.
+    객체 형식에서 True는 플래그, False/None은 생략, 목록은 옵션 반복입니다.
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    command = request.get("command")
+    if isinstance(command, str):
+        argv = command.split()
+    elif isinstance(command, list) and command:
+        argv = [str(part) for part in command]
+    else:
+        raise ValueError("command는 문자열 또는 목록이어야 합니다")
+
+    args = request.get("args") or []
+    if isinstance(args, list):
+        argv.extend(str(arg) for arg in args)
+    elif isinstance(args, dict):
+        for name, value in args.items():
+            option = name if name.startswith("-") else f"--{name}"
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                if item is True:
+                    argv.append(option)
+                elif item is not None and item is not False:
+                    argv.extend([option, str(item)])
+    else:
+        raise ValueError("args는 목록 또는 객체여야 합니다")
+
+    return argv
+
+
+def target_key(argv: List[str]) -> Optional[str]:
+    """명령어가 다루는 파일/워크북 (없으면 None - 다른 모든 명령어와 직렬 실행)"""
+    for i, arg in enumerate(argv):
+        for option in TARGET_OPTIONS:
+            if arg == option and i + 1 < len(argv):
+                value = argv[i + 1]
+            elif arg.startswith(option + "="):
+                value = arg.split("=", 1)[1]
+            else:
+                continue
+            return os.path.normcase(os.path.abspath(value)) if option == "--file-path" else value.lower()
+    return None
+
+
+class TargetScheduler:
+    """
+    같은 대상 파일의 명령어는 입력 순서대로 하나씩, 다른 파일은 동시에 실행되도록 조정
+
+    대상이 없는 명령어(활성 워크북 사용 등)는 진행 중인 명령어가 모두 끝난 뒤 단독으로 실행됩니다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._busy = set()
+        self._exclusive = False
+
+    def acquire(self, key: Optional[str]):
+        with self._condition:
+            while self._exclusive or (key is None and self._busy) or key in self._busy:
+                self._condition.wait()
+            if key is None:
+                self._exclusive = True
+            else:
+                self._busy.add(key)
+
+    def release(self, key: Optional[str]):
+        with self._condition:
+            if key is None:
+                self._exclusive = False
+            else:
+                self._busy.discard(key)
+            self._condition.notify_all()
+
+
+def parse_request(line: str) -> Tuple[Any, List[str]]:
+    """입력 한 줄을 (id, argv)로 변환 (형식 오류는 ValueError)"""
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("명령어 객체는 JSON 객체여야 합니다")
+    return request.get("id"), build_argv(request)
+
+
+def _invalid(error: ValueError) -> Dict[str, Any]:
+    return {"id": None, "exit_code": 2, "success": False, "elapsed_ms": 0.0, "error": f"잘못된 입력: {error}"}
+
+
+def _run(request_id: Any, argv: List[str]) -> Dict[str, Any]:
+    from pyhub_office_automation.excel.engines import stop_profiling
+
+    try:
+        result = invoke(argv)
+    finally:
+        # --profile은 명령어 단위 옵션
+        stop_profiling()
+
+    response: Dict[str, Any] = {
+        "id": request_id,
+        "exit_code": result.exit_code,
+        "success": result.exit_code == 0,
+        "elapsed_ms": result.elapsed_ms,
+    }
+    # 명령어의 JSON 출력은 객체로 포함하고, 텍스트 출력은 문자열 그대로 포함
+    stdout = result.stdout.strip()
+    try:
+        response["output"] = json.loads(stdout) if stdout else None
+    except ValueError:
+        response["output"] = result.stdout
+    if result.stderr:
+        response["stderr"] = result.stderr
+    return response
+
+
+def _concurrency_supported() -> bool:
+    """엔진이 서로 다른 워크북을 동시에 다룰 수 있는지 여부"""
+    try:
+        from pyhub_office_automation.excel.engines import get_engine
+
+        return get_engine().supports_concurrent_workbooks
+    except Exception:
+        return False
+
+
+def run_pipe(input_stream: TextIO, output_stream: TextIO, jobs: int = 1, stop_on_error: bool = False) -> int:
+    """
+    NDJSON 명령어 스트림 실행
+
+    Returns:
+        실패한 명령어 수
+    """
+    write_lock = threading.Lock()
+    failures = 0
+
+    def emit(response: Dict[str, Any]):
+        nonlocal failures
+        with write_lock:
+            if not response["success"]:
+                failures += 1
+            output_stream.write(json.dumps(response, ensure_ascii=False, default=str) + "\n")
+            output_stream.flush()
+
+    with thread_local_output():
+        if jobs <= 1:
+            for line in input_stream:
+                if not line.strip():
+                    continue
+                try:
+                    request_id, argv = parse_request(line)
+                except ValueError as e:
+                    emit(_invalid(e))
+                else:
+                    emit(_run(request_id, argv))
+                if stop_on_error and failures:
+                    break
+            return failures
+
+        scheduler = TargetScheduler()
+        slots = threading.Semaphore(jobs)
+
+        def run_one(request_id: Any, argv: List[str], key: Optional[str]):
+            try:
+                emit(_run(request_id, argv))
+            finally:
+                scheduler.release(key)
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="oa-pipe") as executor:
+            for line in input_stream:
+                if not line.strip():
+                    continue
+                if stop_on_error and failures:
+                    break
+                try:
+                    request_id, argv = parse_request(line)
+                except ValueError as e:
+                    emit(_invalid(e))
+                    continue
+
+                # 프로파일러는 프로세스에 하나뿐이라 동시에 실행 중인 명령어의 호출이 섞임
+                if "--profile" in argv:
+                    response = _invalid(ValueError("--profile은 --jobs 1에서만 사용할 수 있습니다"))
+                    response["id"] = request_id
+                    emit(response)
+                    continue
+
+                key = target_key(argv)
+                slots.acquire()
+                scheduler.acquire(key)
+                executor.submit(run_one, request_id, argv, key)
+
+    return failures
+
+
+def pipe(
+    jobs: int = typer.Option(
+        1, "--jobs", "-j", min=1, help="동시에 실행할 명령어 수 (서로 다른 파일을 다루는 명령어만 동시 실행)"
+    ),
+    stop_on_error: bool = typer.Option(False, "--stop-on-error", help="명령어가 실패하면 이후 입력을 실행하지 않음"),
+):
+    """
+    stdin의 NDJSON 명령어를 한 프로세스에서 연속 실행합니다.
+
+    한 줄에 하나의 JSON 객체({"id", "command", "args"})를 읽어 실행하고,
+    결과를 한 줄에 하나씩 JSON(id, exit_code, success, elapsed_ms, output)으로 바로 출력합니다.
+    --jobs를 2 이상으로 주면 서로 다른 파일을 다루는 명령어를 동시에 실행합니다
+    (파일 기반 headless 엔진에서만 가능하며, Excel 애플리케이션 엔진에서는 순차 실행).
+
+    \b
+    사용 예제:
+      oa pipe < commands.ndjson
+      echo '{"id": 1, "command": "excel workbook-info", "args": {"file-path": "a.xlsx"}}' | oa pipe
+      oa pipe --jobs 4 < commands.ndjson
+    """
+    if jobs > 1 and not _concurrency_supported():
+        typer.echo("⚠️ 현재 엔진은 동시 실행을 지원하지 않아 순차 실행합니다", err=True)
+        jobs = 1
+
+    failures = run_pipe(sys.stdin, sys.stdout, jobs=jobs, stop_on_error=stop_on_error)
+    if failures:
+        raise typer.Exit(1)
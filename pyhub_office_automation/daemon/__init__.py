@@ -0,0 +1,11 @@
+"""
+oa 데몬 (`oa serve`)
+
+명령어마다 새 프로세스를 띄우는 대신, 상주 프로세스가 import된 모듈과 Excel 연결을 유지하고
+`oa`는 argv를 전달만 하는 thin client로 동작합니다.
+"""
+
+from .client import DaemonClient, DaemonError, forward_to_daemon
+from .state import DaemonState, read_state
+
+__all__ = ["DaemonClient", "DaemonError", "DaemonState", "forward_to_daemon", "read_state"]
@@ -0,0 +1,179 @@
+"""
+데몬 클라이언트 (thin client)
+
+`oa`는 실행될 때 먼저 forward_to_daemon()으로 실행 중인 데몬을 찾습니다.
+데몬이 있으면 argv/작업 디렉토리/OA_* 환경 변수를 넘겨 실행하고 출력과 종료 코드만 그대로 재현하므로,
+typer/pandas import, Excel 재연결(GetObject), 워크북 재탐색 비용이 들지 않습니다.
+데몬이 없거나 연결할 수 없으면 None을 반환하고 기존처럼 현재 프로세스에서 실행합니다.
+데몬의 버전이 설치된 패키지와 다르면(업그레이드 후) 데몬에 종료를 요청하고 현재 프로세스에서 실행합니다.
+
+이 모듈은 `oa` 시작 경로에 있으므로 표준 라이브러리(와 같은 제약을 지키는 utils.json_output)만 import합니다.
+"""
+
+import json
+import os
+import sys
+from multiprocessing.connection import Client
+from typing import Any, Dict, List, Optional
+
+from .. import __version__
+from ..utils.json_output import JSON_FORMAT_ENV, is_pretty
+from .state import DaemonState, read_state
+
+# 데몬으로 전달하지 않는 명령어 (stdin/대화형 입력이 필요하거나 데몬 자체를 다루는 명령어)
+LOCAL_ONLY_COMMANDS = {"serve", "pipe", "shell", "email"}
+LOCAL_ONLY_SUBCOMMANDS = {"shell"}
+
+# OA_DAEMON=0이면 데몬을 사용하지 않음
+DAEMON_DISABLE_ENV = "OA_DAEMON"
+
+
+class DaemonError(Exception):
+    """데몬이 JSON-RPC 오류를 반환한 경우"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class DaemonClient:
+    """
+    데몬 JSON-RPC 클라이언트
+
+    한 연결로 여러 요청을 순서대로 보낼 수 있습니다.
+
+    Example:
+        >>> with DaemonClient.connect() as client:
+        ...     client.call("health")
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._next_id = 1
+
+    @classmethod
+    def connect(cls, state: Optional[DaemonState] = None) -> "DaemonClient":
+        """
+        상태 파일의 주소로 연결 (인증 포함)
+
+        Raises:
+            ConnectionError: 데몬이 실행 중이 아니거나 연결/인증에 실패한 경우
+        """
+        state = state or read_state()
+        if state is None:
+            raise ConnectionError("실행 중인 oa 데몬이 없습니다")
+        try:
+            connection = Client(state.address, family=state.family, authkey=state.authkey_bytes)
+        except Exception as e:
+            raise ConnectionError(f"oa 데몬에 연결할 수 없습니다: {e}") from e
+        return cls(connection)
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """JSON-RPC 요청을 보내고 result를 반환 (오류 응답은 DaemonError)"""
+        request = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params or {}}
+        self._next_id += 1
+
+        self._connection.send_bytes(json.dumps(request, ensure_ascii=False).encode("utf-8"))
+        response = json.loads(self._connection.recv_bytes().decode("utf-8"))
+
+        if "error" in response:
+            error = response["error"]
+            raise DaemonError(error.get("code", -32603), error.get("message", ""))
+        return response.get("result")
+
+    def run(self, argv: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """명령어 실행 결과 {"exit_code", "stdout", "stderr"}"""
+        return self.call(
+            "run", {"argv": list(argv), "cwd": cwd or os.getcwd(), "env": env if env is not None else oa_environ()}
+        )
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def oa_environ() -> Dict[str, str]:
+    """데몬에 전달할 환경 변수 (OA_ 접두사만)"""
+    return {key: value for key, value in os.environ.items() if key.startswith("OA_")}
+
+
+def should_forward(argv: List[str]) -> bool:
+    """이 argv를 데몬으로 전달할지 여부"""
+    if os.environ.get(DAEMON_DISABLE_ENV, "").lower() in ("0", "false", "off", "no"):
+        return False
+    positional = [arg for arg in argv if not arg.startswith("-")]
+    if not positional:
+        # `oa`, `oa --version`, `oa --help`는 데몬 없이도 충분히 빠름
+        return False
+    if positional[0] in LOCAL_ONLY_COMMANDS:
+        return False
+    if len(positional) > 1 and positional[1] in LOCAL_ONLY_SUBCOMMANDS:
+        return False
+    return True
+
+
+def _write(stream, text: str):
+    if not text:
+        return
+    if sys.platform == "win32" and hasattr(stream, "reconfigure"):
+        try:
+            stream.reconfigure(encoding="utf-8")
+        except Exception:
+            pass
+    stream.write(text)
+    stream.flush()
+
+
+def _stop_stale_daemon(state: DaemonState):
+    """다른 버전의 데몬에 종료를 요청 (실패해도 무시 - 유휴 타임아웃으로 종료됨)"""
+    try:
+        with DaemonClient.connect(state) as client:
+            client.call("shutdown")
+    except (ConnectionError, EOFError, OSError, DaemonError):
+        pass
+
+
+def forward_to_daemon(argv: List[str]) -> Optional[int]:
+    """
+    argv를 데몬에서 실행하고 종료 코드를 반환
+
+    데몬을 사용할 수 없으면 None을 반환하며, 호출자는 현재 프로세스에서 실행합니다.
+    명령어가 데몬에서 실행된 뒤의 오류(명령어 자체의 실패)는 종료 코드로 그대로 전달됩니다.
+    """
+    if not should_forward(argv):
+        return None
+
+    state = read_state()
+    if state is None:
+        return None
+
+    # 패키지를 업그레이드한 뒤에는 이전 코드를 실행 중인 데몬을 쓰지 않음
+    if state.version != __version__:
+        _stop_stale_daemon(state)
+        return None
+
+    try:
+        client = DaemonClient.connect(state)
+    except ConnectionError:
+        return None
+
+    # 요청을 보낸 뒤의 실패는 명령어가 이미 실행됐을 수 있으므로 로컬에서 다시 실행하지 않음
+    # 데몬의 출력 스트림은 터미널이 아니므로 JSON 형식은 클라이언트의 stdout 기준으로 정함
+    env = oa_environ()
+    env.setdefault(JSON_FORMAT_ENV, "pretty" if is_pretty(sys.stdout) else "compact")
+
+    try:
+        with client:
+            result = client.run(argv, env=env)
+    except (EOFError, OSError, DaemonError) as e:
+        _write(sys.stderr, f"oa 데몬 실행 오류: {e}\n")
+        return 1
+
+    _write(sys.stdout, result.get("stdout", ""))
+    _write(sys.stderr, result.get("stderr", ""))
+    return int(result.get("exit_code", 0))
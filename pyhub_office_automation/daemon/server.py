@@ -0,0 +1,352 @@
+"""
+oa 데몬 서버 (`oa serve`)
+
+인터프리터, import된 명령어 모듈, 엔진 싱글톤(Excel 연결)과 열린 워크북 핸들을 유지한 채
+thin client가 보낸 argv를 실행합니다.
+
+- 전송: Unix 소켓(Linux/macOS) 또는 named pipe(Windows), multiprocessing.connection 인증 키 사용
+- 프로토콜: JSON-RPC 2.0 (메서드: run, health, shutdown)
+- 격리: 명령어는 단일 작업 스레드에서 한 번에 하나씩 실행되며(COM 아파트 고정),
+  요청마다 클라이언트의 작업 디렉토리/OA_* 환경 변수를 적용하고 출력을 따로 캡처한 뒤 원래대로 되돌립니다.
+- 유휴 종료: idle_timeout 동안 요청이 없으면 상태 파일을 지우고 종료합니다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import typer
+
+from ..version import get_version
+from .state import DaemonState, default_address, new_authkey, read_state, remove_state, state_file_path, write_state
+
+# JSON-RPC 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+DEFAULT_IDLE_TIMEOUT = 1800.0
+
+
+def _init_worker():
+    """작업 스레드 초기화 (Windows: COM 아파트 초기화)"""
+    if sys.platform == "win32":
+        try:
+            import pythoncom
+
+            pythoncom.CoInitialize()
+        except ImportError:
+            pass
+
+
+def run_cli(argv: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    현재 프로세스에서 oa 명령어를 실행하고 출력을 캡처
+
+    cwd와 env(OA_* 변수)는 실행 동안만 적용되며, 클라이언트가 보내지 않은 OA_* 변수는 실행 동안 제거됩니다.
+    """
+    from pyhub_office_automation.cli.inprocess import invoke, thread_local_output
+    from pyhub_office_automation.excel.engines import release_stale_engine, stop_profiling
+
+    previous_env = {key: value for key, value in os.environ.items() if key.startswith("OA_")}
+    previous_cwd = os.getcwd()
+    try:
+        for key in previous_env:
+            del os.environ[key]
+        os.environ.update(env or {})
+        if cwd:
+            os.chdir(cwd)
+        # Excel이 재시작됐거나 요청의 OA_EXCEL_ENGINE이 다르면 엔진을 새로 만듦
+        release_stale_engine()
+        with thread_local_output():
+            result = invoke(argv)
+    finally:
+        os.chdir(previous_cwd)
+        for key in [key for key in os.environ if key.startswith("OA_")]:
+            del os.environ[key]
+        os.environ.update(previous_env)
+        # --profile은 요청 단위 옵션
+        stop_profiling()
+
+    return {"exit_code": result.exit_code, "stdout": result.stdout, "stderr": result.stderr}
+
+
+class DaemonServer:
+    """
+    oa 데몬 서버
+
+    Example:
+        >>> server = DaemonServer(idle_timeout=600)
+        >>> server.start()
+        >>> server.wait()
+    """
+
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        runner: Callable[..., Dict[str, Any]] = run_cli,
+    ):
+        self.state_file = Path(state_file) if state_file else state_file_path()
+        self.idle_timeout = idle_timeout
+        self._runner = runner
+
+        self.state: Optional[DaemonState] = None
+        self._listener: Optional[Listener] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oa-daemon-worker", initializer=_init_worker)
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._started_at = 0.0
+        self._last_activity = 0.0
+        self._active_requests = 0
+        self._requests_served = 0
+
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "run": self._method_run,
+            "health": self._method_health,
+            "shutdown": self._method_shutdown,
+        }
+
+    # ===========================================
+    # 수명 주기
+    # ===========================================
+
+    def start(self):
+        """리스너를 열고 상태 파일을 기록한 뒤 accept/유휴 감시 스레드를 시작 (블로킹하지 않음)"""
+        existing = read_state(self.state_file)
+        if existing is not None and _is_alive(existing):
+            raise RuntimeError(f"oa 데몬이 이미 실행 중입니다 (pid {existing.pid})")
+
+        address, family = default_address(self.state_file)
+        if family == "AF_UNIX" and os.path.exists(address):
+            os.unlink(address)
+
+        authkey = new_authkey()
+        self._listener = Listener(address, family=family, authkey=bytes.fromhex(authkey))
+        if family == "AF_UNIX":
+            os.chmod(address, 0o600)
+
+        self._started_at = self._last_activity = time.monotonic()
+        self.state = DaemonState(
+            address=address, family=family, authkey=authkey, pid=os.getpid(), started_at=time.time(), version=get_version()
+        )
+        write_state(self.state, self.state_file)
+
+        threading.Thread(target=self._accept_loop, name="oa-daemon-accept", daemon=True).start()
+        if self.idle_timeout and self.idle_timeout > 0:
+            threading.Thread(target=self._idle_watchdog, name="oa-daemon-idle", daemon=True).start()
+
+        # 명령어 모듈을 미리 import해 첫 요청도 빠르게
+        self._executor.submit(_preload)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """종료될 때까지 대기 (종료되었으면 True)"""
+        return self._stopped.wait(timeout)
+
+    def shutdown(self):
+        """리스너를 닫고 상태 파일을 삭제"""
+        with self._lock:
+            if self._stopped.is_set():
+                return
+            self._stopped.set()
+
+        if self.state is not None:
+            remove_state(self.state, self.state_file)
+            # accept()에서 대기 중인 스레드를 깨우기 위해 자기 자신에게 한 번 연결
+            try:
+                Client(self.state.address, family=self.state.family, authkey=self.state.authkey_bytes).close()
+            except Exception:
+                pass
+
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except Exception:
+                pass
+
+        self._executor.shutdown(wait=False)
+
+    # ===========================================
+    # 연결 처리
+    # ===========================================
+
+    def _accept_loop(self):
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except Exception:
+                # 인증 실패, 중간에 끊긴 연결 등은 무시하고 계속 대기
+                continue
+            if self._stopped.is_set():
+                connection.close()
+                break
+            threading.Thread(target=self._serve_connection, args=(connection,), name="oa-daemon-client", daemon=True).start()
+
+    def _serve_connection(self, connection):
+        """한 클라이언트 연결의 요청을 순서대로 처리"""
+        with connection:
+            while not self._stopped.is_set():
+                try:
+                    payload = connection.recv_bytes()
+                except (EOFError, OSError):
+                    break
+
+                response = self.handle_message(payload)
+                try:
+                    connection.send_bytes(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+                except (EOFError, OSError):
+                    break
+
+    def handle_message(self, payload: bytes) -> Dict[str, Any]:
+        """JSON-RPC 요청 하나를 처리하여 응답 메시지를 반환"""
+        try:
+            request = json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            return _error_response(None, PARSE_ERROR, f"잘못된 JSON: {e}")
+
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error_response(None, INVALID_REQUEST, "method가 없는 요청입니다")
+
+        request_id = request.get("id")
+        method = self._methods.get(request["method"])
+        if method is None:
+            return _error_response(request_id, METHOD_NOT_FOUND, f"지원하지 않는 메서드: {request['method']}")
+
+        params = request.get("params") or {}
+        with self._lock:
+            self._active_requests += 1
+            self._last_activity = time.monotonic()
+        try:
+            result = method(**params)
+        except Exception as e:
+            return _error_response(request_id, INTERNAL_ERROR, str(e))
+        finally:
+            with self._lock:
+                self._active_requests -= 1
+                self._requests_served += 1
+                self._last_activity = time.monotonic()
+
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _idle_watchdog(self):
+        interval = min(1.0, self.idle_timeout / 4)
+        while not self._stopped.wait(interval):
+            with self._lock:
+                idle = self._active_requests == 0 and time.monotonic() - self._last_activity >= self.idle_timeout
+            if idle:
+                self.shutdown()
+
+    # ===========================================
+    # JSON-RPC 메서드
+    # ===========================================
+
+    def _method_run(self, argv: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None):
+        return self._executor.submit(self._runner, list(argv), cwd, env).result()
+
+    def _method_health(self):
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "status": "ok",
+                "pid": os.getpid(),
+                "version": get_version(),
+                "address": self.state.address if self.state else None,
+                "uptime_seconds": round(now - self._started_at, 3),
+                "idle_seconds": round(now - self._last_activity, 3),
+                "idle_timeout": self.idle_timeout,
+                "requests_served": self._requests_served,
+                "active_requests": self._active_requests - 1,  # health 요청 자신 제외
+                "engine": _engine_name(),
+            }
+
+    def _method_shutdown(self):
+        # 응답을 보낸 뒤 종료되도록 별도 스레드에서 실행
+        threading.Timer(0.05, self.shutdown).start()
+        return {"status": "stopping"}
+
+
+def _preload():
+    import pyhub_office_automation.cli.main  # noqa: F401
+
+
+def _engine_name() -> Optional[str]:
+    """생성된 엔진 싱글톤의 클래스 이름 (아직 없으면 None)"""
+    engines = sys.modules.get("pyhub_office_automation.excel.engines")
+    instance = getattr(engines, "_engine_instance", None)
+    return type(instance).__name__ if instance is not None else None
+
+
+def _error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _is_alive(state: DaemonState) -> bool:
+    """상태 파일의 데몬이 실제로 응답하는지 확인"""
+    try:
+        Client(state.address, family=state.family, authkey=state.authkey_bytes).close()
+        return True
+    except Exception:
+        return False
+
+
+def serve(
+    idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT, "--idle-timeout", help="요청이 없을 때 자동 종료까지의 시간(초), 0이면 종료하지 않음"
+    ),
+    status: bool = typer.Option(False, "--status", help="실행 중인 데몬 상태(health) 출력"),
+    stop: bool = typer.Option(False, "--stop", help="실행 중인 데몬 종료"),
+):
+    """
+    명령어를 빠르게 실행하는 로컬 데몬을 시작합니다.
+
+    데몬은 Python 인터프리터, 명령어 모듈, Excel 연결과 열린 워크북 핸들을 유지합니다.
+    데몬이 실행 중이면 `oa` 명령어는 자동으로 데몬에 전달되어 실행됩니다
+    (OA_DAEMON=0으로 끌 수 있음). 데몬은 포그라운드에서 실행되며 Ctrl+C로 종료합니다.
+
+    \b
+    사용 예제:
+      oa serve --idle-timeout 600
+      oa serve --status
+      oa serve --stop
+    """
+    from .client import DaemonClient
+
+    if status or stop:
+        try:
+            with DaemonClient.connect() as client:
+                result = client.call("shutdown" if stop else "health")
+        except ConnectionError as e:
+            typer.echo(json.dumps({"status": "not_running", "message": str(e)}, ensure_ascii=False, indent=2))
+            raise typer.Exit(1)
+        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    server = DaemonServer(idle_timeout=idle_timeout)
+    try:
+        server.start()
+    except RuntimeError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(
+        json.dumps(
+            {"status": "serving", "pid": server.state.pid, "address": server.state.address, "idle_timeout": idle_timeout},
+            ensure_ascii=False,
+            indent=2,
+        )
+    )
+    try:
+        while not server.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
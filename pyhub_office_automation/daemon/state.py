@@ -0,0 +1,93 @@
+"""
+데몬 상태 파일
+
+`oa serve`가 시작되면 접속 주소, 인증 키, PID를 홈 디렉토리의 상태 파일에 기록하고,
+thin client(`oa`)는 이 파일을 읽어 데몬에 연결합니다.
+인증 키가 들어 있으므로 파일은 소유자만 읽을 수 있게(0600) 만듭니다.
+
+OA_DAEMON_STATE 환경 변수로 상태 파일 위치를 바꿀 수 있습니다 (테스트/다중 데몬용).
+"""
+
+import json
+import os
+import secrets
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+# 기본 상태 파일 위치
+DAEMON_STATE_FILE = Path.home() / ".oa_daemon.json"
+
+
+@dataclass
+class DaemonState:
+    """실행 중인 데몬의 접속 정보"""
+
+    address: str
+    family: str  # "AF_UNIX" 또는 "AF_PIPE"
+    authkey: str  # hex 문자열
+    pid: int
+    started_at: float
+    version: str = ""
+
+    @property
+    def authkey_bytes(self) -> bytes:
+        return bytes.fromhex(self.authkey)
+
+
+def state_file_path() -> Path:
+    """현재 사용할 상태 파일 경로"""
+    override = os.environ.get("OA_DAEMON_STATE")
+    return Path(override) if override else DAEMON_STATE_FILE
+
+
+def default_address(state_file: Path) -> tuple:
+    """
+    플랫폼별 기본 접속 주소 (주소, 주소 family)
+
+    Windows는 사용자별 named pipe, 그 외는 상태 파일 옆의 Unix 소켓을 사용합니다.
+    """
+    if sys.platform == "win32":
+        user = os.environ.get("USERNAME", "user")
+        return rf"\\.\pipe\oa-daemon-{user}-{secrets.token_hex(4)}", "AF_PIPE"
+
+    socket_path = state_file.with_suffix(".sock")
+    # AF_UNIX 주소 길이 제한(약 104~108바이트)을 넘으면 임시 디렉토리 사용
+    if len(str(socket_path)) > 100:
+        socket_path = Path(tempfile.gettempdir()) / f"oa-daemon-{os.getuid()}.sock"
+    return str(socket_path), "AF_UNIX"
+
+
+def new_authkey() -> str:
+    return secrets.token_hex(32)
+
+
+def write_state(state: DaemonState, state_file: Optional[Path] = None):
+    """상태 파일을 소유자 전용 권한(0600)으로 기록"""
+    path = state_file or state_file_path()
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(asdict(state), f, ensure_ascii=False, indent=2)
+
+
+def read_state(state_file: Optional[Path] = None) -> Optional[DaemonState]:
+    """상태 파일 읽기 (없거나 손상된 경우 None)"""
+    path = state_file or state_file_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return DaemonState(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def remove_state(state: DaemonState, state_file: Optional[Path] = None):
+    """상태 파일이 이 데몬의 것일 때만 삭제 (새 데몬의 파일을 지우지 않도록)"""
+    path = state_file or state_file_path()
+    current = read_state(path)
+    if current is not None and current.pid == state.pid and current.address == state.address:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,264 @@
+"""
+Excel 셀 주소/범위 변환
+
+A1 형식 주소와 (row, col) 좌표 사이의 변환은 자동 배치, 겹침 검사, 피벗/테이블 범위 계산에서
+반복 호출됩니다. 스칼라 함수는 미리 컴파일한 정규식, 열 문자 조회 테이블, LRU 캐시를 사용하고,
+*_batch 함수는 주소/좌표 배열 전체를 NumPy로 한 번에 변환합니다.
+
+좌표는 모두 1-based이며 주소의 $(절대 참조)는 무시합니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+# Excel 워크시트 최대 열 수 (XFD)
+MAX_COLUMNS = 16_384
+
+_CELL_PATTERN = re.compile(r"^\$?([A-Z]+)\$?(\d+)$")
+
+# 캐시 크기 (주소 문자열 기준)
+_CACHE_SIZE = 65_536
+
+_column_letters: List[str] = []
+
+
+def _letters_table() -> List[str]:
+    """열 번호 → 열 문자 테이블 (인덱스 0은 빈 문자열, 처음 사용할 때 생성)"""
+    if not _column_letters:
+        letters = [""]
+        for col in range(1, MAX_COLUMNS + 1):
+            name, n = "", col
+            while n > 0:
+                n, remainder = divmod(n - 1, 26)
+                name = chr(65 + remainder) + name
+            letters.append(name)
+        _column_letters[:] = letters
+    return _column_letters
+
+
+def column_letter(col: int) -> str:
+    """열 번호를 열 문자로 변환 (1 → "A", 27 → "AA")"""
+    if 1 <= col <= MAX_COLUMNS:
+        return _letters_table()[col]
+    if col < 1:
+        raise ValueError("행과 열 번호는 1 이상이어야 합니다")
+    name = ""
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def excel_address_to_coords(address: str) -> Tuple[int, int]:
+    """
+    Excel 주소(A1)를 좌표(row, col)로 변환합니다.
+
+    Args:
+        address: Excel 주소 (예: "A1", "BC123", "$B$2")
+
+    Returns:
+        (row, col) 튜플 (1-based index)
+
+    Raises:
+        ValueError: 잘못된 주소 형식
+    """
+    match = _CELL_PATTERN.match(address.upper())
+    if not match:
+        raise ValueError(f"잘못된 Excel 주소 형식: {address}")
+
+    col_letters, row_str = match.groups()
+    col = 0
+    for letter in col_letters:
+        col = col * 26 + ord(letter) - 64
+    return int(row_str), col
+
+
+def coords_to_excel_address(row: int, col: int) -> str:
+    """
+    좌표(row, col)를 Excel 주소로 변환합니다.
+
+    Args:
+        row: 행 번호 (1-based)
+        col: 열 번호 (1-based)
+
+    Returns:
+        Excel 주소 (예: "A1", "BC123")
+    """
+    if row < 1 or col < 1:
+        raise ValueError("행과 열 번호는 1 이상이어야 합니다")
+    return f"{column_letter(col)}{row}"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_excel_range(range_str: str) -> Tuple[int, int, int, int]:
+    """
+    Excel 범위(A1:C10)를 좌표로 파싱합니다.
+
+    Args:
+        range_str: Excel 범위 (예: "A1:C10", "A1" 단일 셀도 가능)
+
+    Returns:
+        (start_row, start_col, end_row, end_col) 튜플 (1-based)
+
+    Raises:
+        ValueError: 잘못된 범위 형식
+    """
+    start_addr, _, end_addr = range_str.strip().partition(":")
+    start_row, start_col = excel_address_to_coords(start_addr.strip())
+    if not end_addr:
+        return start_row, start_col, start_row, start_col
+    end_row, end_col = excel_address_to_coords(end_addr.strip())
+    return start_row, start_col, end_row, end_col
+
+
+def check_range_overlap(range1: str, range2: str) -> bool:
+    """
+    두 Excel 범위가 겹치는지 검사합니다.
+
+    Args:
+        range1: 첫 번째 범위 (예: "A1:C10")
+        range2: 두 번째 범위 (예: "B5:D15")
+
+    Returns:
+        겹치면 True, 겹치지 않으면 False (파싱 실패 시에도 안전하게 True)
+    """
+    try:
+        r1_start_row, r1_start_col, r1_end_row, r1_end_col = parse_excel_range(range1)
+        r2_start_row, r2_start_col, r2_end_row, r2_end_col = parse_excel_range(range2)
+    except Exception:
+        return True
+
+    return not (
+        r1_end_row < r2_start_row or r1_start_row > r2_end_row or r1_end_col < r2_start_col or r1_start_col > r2_end_col
+    )
+
+
+# =============================================================================
+# 배열 변환
+# =============================================================================
+
+
+# addresses_to_coords_batch 상태 기계
+# 문자 종류: 0=열 문자, 1=숫자, 2=$, 3=빈 칸(문자열 끝), 4=그 외
+_CHAR_CLASS = np.full(129, 4, dtype=np.intp)
+_CHAR_CLASS[65:91] = 0
+_CHAR_CLASS[97:123] = 0
+_CHAR_CLASS[48:58] = 1
+_CHAR_CLASS[36] = 2
+_CHAR_CLASS[0] = 3
+
+# 상태: 0=시작, 1=앞 $ 뒤, 2=열 문자, 3=열 문자 뒤 $, 4=행 숫자, 5=끝, 6=오류
+_TRANSITIONS = np.array(
+    [
+        # 열 문자, 숫자, $, 빈 칸, 그 외
+        [2, 6, 1, 6, 6],
+        [2, 6, 6, 6, 6],
+        [2, 4, 3, 6, 6],
+        [6, 4, 6, 6, 6],
+        [6, 4, 6, 5, 6],
+        [6, 6, 6, 5, 6],
+        [6, 6, 6, 6, 6],
+    ],
+    dtype=np.int8,
+)
+
+
+def addresses_to_coords_batch(addresses: Union[Iterable[str], np.ndarray]) -> np.ndarray:
+    """
+    주소 배열을 (N, 2) int64 배열 [[row, col], ...]로 변환합니다.
+
+    문자열 배열을 (N, 글자 수) 코드 포인트 행렬로 보고 글자 위치마다 N개 주소를 한 번에 처리합니다.
+    int64 범위를 넘지 않도록 열 문자는 13자, 행 숫자는 18자까지 허용합니다.
+
+    Raises:
+        ValueError: 잘못된 주소가 있는 경우 (첫 번째 잘못된 주소를 메시지에 포함)
+    """
+    strings = np.asarray(addresses if isinstance(addresses, np.ndarray) else list(addresses), dtype=str)
+    if strings.size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    strings = np.ascontiguousarray(strings.ravel())
+
+    count = len(strings)
+    chars = strings.view(np.uint32).reshape(count, strings.dtype.itemsize // 4)
+    state = np.zeros(count, dtype=np.int8)
+    rows = np.zeros(count, dtype=np.int64)
+    cols = np.zeros(count, dtype=np.int64)
+    letters = np.zeros(count, dtype=np.int64)
+    digits = np.zeros(count, dtype=np.int64)
+
+    for position in range(chars.shape[1]):
+        codes = chars[:, position]
+        if position and not codes.any():
+            # 가장 긴 주소보다 뒤쪽은 모두 빈 칸
+            break
+        kind = _CHAR_CLASS[np.minimum(codes, 128)]
+        state = _TRANSITIONS[state, kind]
+        is_letter = kind == 0
+        is_digit = kind == 1
+        # (code & 0xDF)는 소문자를 대문자로 바꿈
+        cols = np.where(is_letter, cols * 26 + (codes & 0xDF).astype(np.int64) - 64, cols)
+        rows = np.where(is_digit, rows * 10 + codes.astype(np.int64) - 48, rows)
+        letters += is_letter
+        digits += is_digit
+
+    valid = ((state == 4) | (state == 5)) & (letters <= 13) & (digits <= 18)
+    if not valid.all():
+        raise ValueError(f"잘못된 Excel 주소 형식: {strings[np.argmin(valid)]}")
+    return np.stack([rows, cols], axis=1)
+
+
+def coords_to_addresses_batch(rows: Union[Iterable[int], np.ndarray], cols: Union[Iterable[int], np.ndarray]) -> np.ndarray:
+    """
+    행/열 번호 배열을 주소 문자열 배열로 변환합니다 (열 문자는 조회 테이블 사용).
+
+    Raises:
+        ValueError: 1 미만이거나 최대 열(XFD)을 넘는 좌표가 있는 경우
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    if rows.size and (rows.min() < 1 or cols.min() < 1):
+        raise ValueError("행과 열 번호는 1 이상이어야 합니다")
+    if cols.size and cols.max() > MAX_COLUMNS:
+        raise ValueError(f"열 번호는 {MAX_COLUMNS} 이하여야 합니다")
+    return np.strings.add(_letters_array()[cols], rows.astype(str))
+
+
+@lru_cache(maxsize=1)
+def _letters_array() -> np.ndarray:
+    return np.array(_letters_table())
+
+
+def parse_ranges_batch(ranges: Union[Iterable[str], np.ndarray]) -> np.ndarray:
+    """
+    범위 문자열 배열을 (N, 4) int64 배열 [[start_row, start_col, end_row, end_col], ...]로 변환합니다.
+
+    단일 셀 범위("A1")는 시작과 끝이 같습니다.
+    """
+    strings = np.strings.strip(np.asarray(ranges if isinstance(ranges, np.ndarray) else list(ranges), dtype=str).ravel())
+    if strings.size == 0:
+        return np.empty((0, 4), dtype=np.int64)
+    start, separator, end = np.strings.partition(strings, ":")
+    end = np.where(separator == "", start, end)
+    return np.concatenate(
+        [addresses_to_coords_batch(np.strings.strip(start)), addresses_to_coords_batch(np.strings.strip(end))], axis=1
+    )
+
+
+def ranges_overlap_batch(ranges1: np.ndarray, ranges2: np.ndarray) -> np.ndarray:
+    """
+    (…, 4) 좌표 배열끼리 겹침 여부 (NumPy 브로드캐스팅 규칙 적용)
+
+    예: ranges_overlap_batch(a[:, None, :], b[None, :, :]) → (len(a), len(b)) 겹침 행렬
+    """
+    ranges1 = np.asarray(ranges1)
+    ranges2 = np.asarray(ranges2)
+    return ~(
+        (ranges1[..., 2] < ranges2[..., 0])
+        | (ranges1[..., 0] > ranges2[..., 2])
+        | (ranges1[..., 3] < ranges2[..., 1])
+        | (ranges1[..., 1] > ranges2[..., 3])
+    )
@@ -3,13 +3,13 @@
 xlwings를 활용한 Excel 차트 생성 기능
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -581,7 +581,7 @@ def chart_add(
 
         # JSON 출력 시 자동 배치/겹침 정보도 포함하여 출력
         if output_format == OutputFormat.JSON:
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # text 출력 형식에서도 자동 배치 정보 표시
             print(f"✅ 차트 생성 성공")
@@ -615,7 +615,7 @@ def chart_add(
 
     except Exception as e:
         error_response = create_error_response(e, "chart-add")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
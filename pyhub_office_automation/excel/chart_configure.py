@@ -3,13 +3,13 @@
 기존 차트의 스타일과 속성을 설정하는 기능
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -444,7 +444,7 @@ def chart_configure(
 
         fmt = str(output_format) if output_format else "json"
         if fmt == "json":
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # 텍스트 형식 출력
             print(f"=== 차트 설정 결과 ===")
@@ -472,7 +472,7 @@ def chart_configure(
         error_response = create_error_response(e, "chart-configure")
         fmt = str(output_format) if output_format else "json"
         if fmt == "json":
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             print(f"오류: {str(e)}")
         return 1
@@ -3,13 +3,13 @@
 워크시트에서 특정 차트를 삭제하는 기능
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -319,7 +319,7 @@ def chart_delete(
         response = create_success_response(data=deletion_summary, command="chart-delete", message=message)
 
         if fmt == "json":
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # 텍스트 형식 출력
             print(f"=== 차트 삭제 결과 ===")
@@ -353,7 +353,7 @@ def chart_delete(
         error_response = create_error_response(e, "chart-delete")
         fmt = str(output_format) if output_format else "json"
         if fmt == "json":
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             print(f"오류: {str(e)}")
         return 1
@@ -3,7 +3,6 @@
 차트를 이미지 파일로 내보내는 기능
 """
 
-import json
 import os
 import platform
 from pathlib import Path
@@ -11,6 +10,7 @@ from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -438,7 +438,7 @@ def chart_export(
         response = create_success_response(data=response_data, command="chart-export", message=message)
 
         if output_format == "json":
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # 텍스트 형식 출력
             print(f"=== 차트 내보내기 결과 ===")
@@ -472,7 +472,7 @@ def chart_export(
     except Exception as e:
         error_response = create_error_response(e, "chart-export")
         if output_format == "json":
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             print(f"오류: {str(e)}")
         return 1
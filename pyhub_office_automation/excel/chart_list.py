@@ -3,13 +3,14 @@
 워크시트의 모든 차트 정보를 조회하는 기능
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -32,6 +33,7 @@ def get_chart_legend_info(chart_obj):
         return {"has_legend": False, "position": None}
 
 
+@cached_result("chart-list")
 def chart_list(
     file_path: Optional[str] = typer.Option(None, "--file-path", help="차트를 조회할 Excel 파일의 절대 경로"),
     workbook_name: Optional[str] = typer.Option(None, "--workbook-name", help='열린 워크북 이름으로 접근 (예: "Sales.xlsx")'),
@@ -193,7 +195,7 @@ def chart_list(
         )
 
         if output_format == "json":
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # 텍스트 형식 출력
             print(f"=== 차트 목록 ===")
@@ -231,7 +233,7 @@ def chart_list(
     except Exception as e:
         error_response = create_error_response(e, "chart-list")
         if output_format == "json":
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             print(f"오류: {str(e)}")
         return 1
@@ -3,13 +3,13 @@
 피벗테이블 기반 동적 차트 생성 기능
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -476,7 +476,7 @@ def chart_pivot_create(
                     )
 
                     if output_format == "json":
-                        print(json.dumps(success_response, ensure_ascii=False, indent=2))
+                        echo_json(success_response)
                     else:
                         print(f"=== 피벗차트 생성 결과 ===")
                         print(f"피벗차트: {chart_name} (복구됨)")
@@ -583,7 +583,7 @@ def chart_pivot_create(
         )
 
         if output_format == "json":
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # 텍스트 형식 출력
             print(f"=== 피벗차트 생성 결과 ===")
@@ -625,7 +625,7 @@ def chart_pivot_create(
     except Exception as e:
         error_response = create_error_response(e, "chart-pivot-create")
         if output_format == "json":
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             print(f"오류: {str(e)}")
         return 1
@@ -3,13 +3,13 @@
 차트의 위치와 크기를 정밀하게 조정하는 기능
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -419,7 +419,7 @@ def chart_position(
         response = create_success_response(data=response_data, command="chart-position", message=message)
 
         if fmt == "json":
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # 텍스트 형식 출력
             print(f"=== 차트 위치 조정 결과 ===")
@@ -458,7 +458,7 @@ def chart_position(
         error_response = create_error_response(e, "chart-position")
         fmt = str(output_format) if output_format else "json"
         if fmt == "json":
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             print(f"오류: {str(e)}")
         return 1
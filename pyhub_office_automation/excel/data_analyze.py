@@ -3,13 +3,13 @@ Excel 데이터 구조 분석 명령어 (Issue #39)
 피벗테이블용 데이터 준비 상태를 평가하고 권장사항 제공
 """
 
-import json
 import sys
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -176,7 +176,7 @@ def data_analyze(
 
             # 출력 형식에 따른 결과 반환
             if output_format == OutputFormat.JSON:
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"📊 Excel 데이터 구조 분석 결과")
                 typer.echo(f"📄 파일: {analysis_result['source_info']['workbook']}")
@@ -240,7 +240,7 @@ def data_analyze(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "data-analyze")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다: {file_path}", err=True)
         raise typer.Exit(1)
@@ -248,7 +248,7 @@ def data_analyze(
     except ValueError as e:
         error_response = create_error_response(e, "data-analyze")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -256,7 +256,7 @@ def data_analyze(
     except RuntimeError as e:
         error_response = create_error_response(e, "data-analyze")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             typer.echo(
@@ -267,7 +267,7 @@ def data_analyze(
     except Exception as e:
         error_response = create_error_response(e, "data-analyze")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -3,16 +3,16 @@ Excel 데이터 변환 명령어 (Issue #39)
 피벗테이블용 형식으로 데이터를 변환하는 기능 제공
 """
 
-import json
 import sys
 from typing import Optional
 
-import pandas as pd
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
+from .engines.columnar import ColumnarData
 from .utils import (
     DataTransformType,
     ExecutionTimer,
@@ -112,9 +112,9 @@ def data_transform(
                 values = [values]
 
             # DataFrame 생성 (첫 번째 행을 헤더로 사용)
-            df = pd.DataFrame(
-                values[1:], columns=values[0] if len(values) > 1 else [f"Column_{i+1}" for i in range(len(values[0]))]
-            )
+            df = ColumnarData.from_rows(
+                values[1:], names=values[0] if len(values) > 1 else [f"Column_{i+1}" for i in range(len(values[0]))]
+            ).to_pandas()
             original_shape = df.shape
 
             # 변환 실행
@@ -236,7 +236,7 @@ def data_transform(
 
             # 출력 형식에 따른 결과 반환
             if output_format == OutputFormat.JSON:
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"🔄 Excel 데이터 변환 완료")
                 typer.echo(f"📄 파일: {transform_result['source_info']['workbook']}")
@@ -290,7 +290,7 @@ def data_transform(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "data-transform")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다: {file_path}", err=True)
         raise typer.Exit(1)
@@ -298,7 +298,7 @@ def data_transform(
     except ValueError as e:
         error_response = create_error_response(e, "data-transform")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -306,7 +306,7 @@ def data_transform(
     except RuntimeError as e:
         error_response = create_error_response(e, "data-transform")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             typer.echo(
@@ -317,7 +317,7 @@ def data_transform(
     except Exception as e:
         error_response = create_error_response(e, "data-transform")
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -4,18 +4,18 @@ Data validation CLI command (Issue #90)
 Comprehensive data quality validation for Excel ranges.
 """
 
-import json
 from enum import Enum
 from typing import List, Optional
 
-import pandas as pd
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from pyhub_office_automation.excel.utils import get_or_open_workbook, get_sheet
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
+from .engines.columnar import ColumnarData
 from .validators import DuplicateValidator, NullValidator, TypeValidator
 
 console = Console()
@@ -95,9 +95,9 @@ def data_validate(
             raise ValueError(f"No data found in range {range_addr}")
 
         if isinstance(values[0], list):
-            df = pd.DataFrame(values[1:], columns=values[0])
+            df = ColumnarData.from_rows(values[1:], names=values[0]).to_pandas()
         else:
-            df = pd.DataFrame([values])
+            df = ColumnarData.from_rows([values], names=list(range(len(values)))).to_pandas()
 
         # Parse checks
         check_list = [c.strip().lower() for c in checks.split(",")]
@@ -156,7 +156,7 @@ def data_validate(
                 "message": f"Validated {len(df)} rows × {len(df.columns)} columns",
                 "version": get_version(),
             }
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # Rich text output
             console.print(f"\n[bold cyan]Data Validation Report[/bold cyan]")
@@ -231,7 +231,7 @@ def data_validate(
                 "error": str(e),
                 "version": get_version(),
             }
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -4,6 +4,7 @@ Excel 엔진 팩토리 및 공통 모듈
 플랫폼에 맞는 Excel 엔진을 자동으로 선택하고 제공합니다.
 """
 
+import os
 import platform
 from typing import Optional
 
@@ -16,15 +17,31 @@ from .exceptions import (
     EngineInitializationError,
     ExcelEngineError,
     ExcelNotRunningError,
+    PivotTableNotFoundError,
     PlatformNotSupportedError,
     RangeError,
     SheetNotFoundError,
     TableNotFoundError,
     WorkbookNotFoundError,
 )
+from .instrumentation import disable_profiling, get_active_profiler
 
 # 전역 엔진 인스턴스 (싱글톤)
 _engine_instance: Optional[ExcelEngineBase] = None
+# _engine_instance를 만들 때 선택된 플랫폼 (release_stale_engine 참고)
+_engine_platform: Optional[str] = None
+
+# 엔진 강제 지정 환경 변수 (예: OA_EXCEL_ENGINE=headless)
+ENGINE_ENV_VAR = "OA_EXCEL_ENGINE"
+_ENGINE_ALIASES = {
+    "windows": "Windows",
+    "com": "Windows",
+    "macos": "Darwin",
+    "darwin": "Darwin",
+    "applescript": "Darwin",
+    "headless": "Headless",
+    "openpyxl": "Headless",
+}
 
 
 def get_engine(force_platform: Optional[str] = None) -> ExcelEngineBase:
@@ -32,8 +49,12 @@ def get_engine(force_platform: Optional[str] = None) -> ExcelEngineBase:
     플랫폼에 맞는 Excel 엔진을 반환합니다 (싱글톤).
 
     Args:
-        force_platform: 테스트용 플랫폼 강제 지정 ('windows', 'darwin')
-                       None이면 자동 감지
+        force_platform: 플랫폼 강제 지정 ('Windows', 'Darwin', 'Headless')
+                       None이면 OA_EXCEL_ENGINE 환경 변수 → 자동 감지 순으로 결정
+
+    Note:
+        Windows/macOS 외의 플랫폼(Linux 등)에서는 Excel 없이 파일을 직접 처리하는
+        HeadlessEngine(openpyxl)을 사용합니다.
 
     Returns:
         ExcelEngineBase: 플랫폼별 엔진 인스턴스
@@ -46,29 +67,48 @@ def get_engine(force_platform: Optional[str] = None) -> ExcelEngineBase:
         >>> engine = get_engine()
         >>> workbooks = engine.get_workbooks()
     """
-    global _engine_instance
+    global _engine_instance, _engine_platform
+
+    if _engine_instance is None:
+        _engine_platform = _selected_platform(force_platform)
+        _engine_instance = _create_engine(_engine_platform)
+
+    # --profile: COM 호출 계측 프로파일러 연결
+    profiler = get_active_profiler()
+    if profiler is not None:
+        _engine_instance.attach_profiler(profiler)
+
+    return _engine_instance
 
-    if _engine_instance is not None:
-        return _engine_instance
 
-    # 플랫폼 감지
-    current_platform = force_platform or platform.system()
+def _selected_platform(force_platform: Optional[str] = None) -> str:
+    """엔진을 고를 플랫폼 (force_platform > OA_EXCEL_ENGINE > 현재 OS)"""
+    env_engine = os.environ.get(ENGINE_ENV_VAR, "").strip().lower()
+    return force_platform or _ENGINE_ALIASES.get(env_engine) or platform.system()
+
+
+def _create_engine(force_platform: Optional[str] = None) -> ExcelEngineBase:
+    """플랫폼에 맞는 엔진 인스턴스 생성"""
+    current_platform = _selected_platform(force_platform)
 
     try:
         if current_platform == "Windows":
             # Windows: pywin32 COM 엔진
             from .windows import WindowsEngine
 
-            _engine_instance = WindowsEngine()
+            return WindowsEngine()
 
         elif current_platform == "Darwin":  # macOS
             # macOS: AppleScript 엔진
             from .macos import MacOSEngine
 
-            _engine_instance = MacOSEngine()
+            return MacOSEngine()
 
         else:
-            raise PlatformNotSupportedError(current_platform)
+            # Linux, CI 등: Excel 없이 파일 직접 처리
+            from .headless import HeadlessEngine
+
+            return HeadlessEngine()
 
     except ImportError as e:
         raise EngineInitializationError(current_platform, f"필요한 모듈을 가져올 수 없습니다: {str(e)}")
@@ -76,8 +116,6 @@ def get_engine(force_platform: Optional[str] = None) -> ExcelEngineBase:
     except Exception as e:
         raise EngineInitializationError(current_platform, str(e))
 
-    return _engine_instance
-
 
 def reset_engine():
     """
@@ -89,8 +127,39 @@ def reset_engine():
         >>> reset_engine()
         >>> engine = get_engine(force_platform='Darwin')
     """
-    global _engine_instance
+    global _engine_instance, _engine_platform
     _engine_instance = None
+    _engine_platform = None
+
+
+def stop_profiling():
+    """
+    --profile 프로파일링을 끄고 엔진에서 프로파일러를 뗍니다.
+
+    한 프로세스에서 여러 명령어를 실행할 때(oa pipe, oa serve) 명령어마다 호출하여
+    --profile이 다음 명령어로 이어지지 않게 합니다.
+    """
+    disable_profiling()
+    if _engine_instance is not None:
+        _engine_instance.detach_profiler()
+
+
+def release_stale_engine() -> bool:
+    """
+    더 이상 쓸 수 없는 엔진 인스턴스를 버립니다 (oa serve 등 오래 실행되는 프로세스용).
+
+    Excel이 종료/재시작되어 COM 연결이 끊겼거나(is_alive),
+    OA_EXCEL_ENGINE이 바뀌어 다른 엔진이 선택되는 경우 다음 get_engine()에서 새로 만듭니다.
+
+    Returns:
+        bool: 엔진을 버렸으면 True
+    """
+    if _engine_instance is None:
+        return False
+    if _engine_platform == _selected_platform() and _engine_instance.is_alive():
+        return False
+    reset_engine()
+    return True
 
 
 def get_platform_name() -> str:
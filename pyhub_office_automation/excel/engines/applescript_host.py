@@ -0,0 +1,344 @@
+"""
+상주 AppleScript 호스트 (macOS)
+
+MacOSEngine이 작업마다 `osascript -e`를 새로 띄우면 프로세스 생성과 스크립트 컴파일에
+호출당 150~300ms가 걸립니다. 이 모듈은 osascript(JXA) 프로세스 하나를 계속 띄워 두고
+파이프로 스크립트를 보내 실행합니다. 호스트는 컴파일된 NSAppleScript를 소스별로 캐시하므로
+같은 스크립트를 반복 실행할 때 컴파일 비용도 들지 않습니다.
+
+프로토콜 (한 줄에 JSON 하나):
+    요청: {"id": 1, "scripts": ["tell application ...", ...]}
+    응답: {"id": 1, "results": [{"ok": true, "result": "..."}, {"ok": false, "error": "..."}]}
+
+스크립트는 순서대로 실행되며 실패한 스크립트 이후는 실행하지 않습니다.
+호스트 명령은 바꿀 수 있으므로 같은 프로토콜을 말하는 가짜 호스트로 Linux에서도 테스트할 수 있습니다.
+
+OA_APPLESCRIPT_HOST=0 환경 변수를 설정하면 MacOSEngine은 기존처럼 호출마다 osascript를 실행합니다.
+"""
+
+import atexit
+import json
+import queue
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional
+
+from .exceptions import AppleScriptError
+
+# 호스트 프로세스가 캐시할 컴파일된 스크립트 수
+COMPILED_SCRIPT_CACHE_SIZE = 64
+
+# combine_scripts 결과 구분자 (ASCII ETX) 및 오류 표식 (ASCII NAK)
+# (출력의 앞뒤 공백 제거에 지워지지 않도록 공백으로 취급되지 않는 제어 문자를 사용)
+RESULT_SEPARATOR = chr(3)
+ERROR_MARKER = chr(21)
+
+# osascript -l JavaScript로 실행되는 호스트 프로그램
+HOST_SCRIPT = """
+ObjC.import('Foundation');
+
+function run() {
+    var input = $.NSFileHandle.fileHandleWithStandardInput;
+    var output = $.NSFileHandle.fileHandleWithStandardOutput;
+    var cache = {};
+    var cacheOrder = [];
+    var buffer = '';
+
+    function reply(message) {
+        output.writeData($(JSON.stringify(message) + '\\n').dataUsingEncoding($.NSUTF8StringEncoding));
+    }
+
+    function errorText(error, kind) {
+        var info = error[0];
+        var message = info ? ObjC.unwrap(info.objectForKey('NSAppleScriptErrorMessage')) : 'unknown error';
+        var number = info ? ObjC.unwrap(info.objectForKey('NSAppleScriptErrorNumber')) : '';
+        return kind + ': ' + message + ' (' + number + ')';
+    }
+
+    function descriptorText(descriptor) {
+        if (!descriptor || descriptor.isNil()) return '';
+        var text = descriptor.stringValue;
+        if (!text.isNil()) return text.js;
+        var count = descriptor.numberOfItems;
+        if (count > 0) {
+            var items = [];
+            for (var i = 1; i <= count; i++) items.push(descriptorText(descriptor.descriptorAtIndex(i)));
+            return items.join(', ');
+        }
+        var coerced = descriptor.coerceToDescriptorType(0x75747874);
+        return coerced.isNil() ? '' : coerced.stringValue.js;
+    }
+
+    function execute(source) {
+        var script = cache[source];
+        if (!script) {
+            script = $.NSAppleScript.alloc.initWithSource($(source));
+            var compileError = Ref();
+            if (!script.compileAndReturnError(compileError)) {
+                return {ok: false, error: errorText(compileError, 'syntax error')};
+            }
+            cache[source] = script;
+            cacheOrder.push(source);
+            if (cacheOrder.length > %(cache_size)d) delete cache[cacheOrder.shift()];
+        }
+        var executeError = Ref();
+        var result = script.executeAndReturnError(executeError);
+        if (!result || result.isNil()) {
+            return {ok: false, error: errorText(executeError, 'execution error')};
+        }
+        return {ok: true, result: descriptorText(result)};
+    }
+
+    while (true) {
+        var newline = buffer.indexOf('\\n');
+        if (newline < 0) {
+            var data = input.availableData;
+            if (data.length == 0) return;
+            buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+            continue;
+        }
+
+        var line = buffer.slice(0, newline);
+        buffer = buffer.slice(newline + 1);
+        if (!line) continue;
+
+        var request = JSON.parse(line);
+        var results = [];
+        for (var i = 0; i < request.scripts.length; i++) {
+            var outcome = execute(request.scripts[i]);
+            results.push(outcome);
+            if (!outcome.ok) break;
+        }
+        reply({id: request.id, results: results});
+    }
+}
+""" % {"cache_size": COMPILED_SCRIPT_CACHE_SIZE}
+
+DEFAULT_HOST_COMMAND = ["osascript", "-l", "JavaScript", "-e", HOST_SCRIPT]
+
+
+class AppleScriptHost:
+    """
+    상주 osascript 프로세스와 통신하는 클라이언트
+
+    첫 호출 시 프로세스를 시작하고, 프로세스가 종료되었으면 다음 호출에서 다시 시작합니다.
+    타임아웃이 나면 멈춘 스크립트를 중단할 방법이 없으므로 프로세스를 종료합니다.
+    """
+
+    def __init__(self, command: Optional[List[str]] = None):
+        """
+        Args:
+            command: 호스트 실행 명령 (기본값: osascript JXA 호스트)
+        """
+        self.command = command or DEFAULT_HOST_COMMAND
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.starts = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """호스트 프로세스 시작 (실행 중이면 아무것도 하지 않음)"""
+        if self.is_running:
+            return
+
+        self.close()
+        self._responses = queue.Queue()
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self.starts += 1
+
+        reader = threading.Thread(target=self._read_responses, args=(self._process, self._responses), daemon=True)
+        reader.start()
+
+    @staticmethod
+    def _read_responses(process: subprocess.Popen, responses: "queue.Queue"):
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        responses.put(None)
+
+    def close(self, force: bool = False):
+        """호스트 프로세스 종료 (force=True면 실행 중인 스크립트를 기다리지 않고 종료)"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if force:
+            process.kill()
+            process.wait()
+            return
+
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def run(self, script: str, timeout: int = 30) -> str:
+        """스크립트 1개 실행 후 결과 문자열 반환"""
+        return self.run_batch([script], timeout=timeout)[0]
+
+    def run_batch(self, scripts: List[str], timeout: int = 30) -> List[str]:
+        """
+        여러 스크립트를 요청 한 번으로 순서대로 실행합니다.
+
+        Args:
+            scripts: 실행할 AppleScript 목록
+            timeout: 전체 실행 타임아웃 (초)
+
+        Returns:
+            List[str]: 스크립트별 결과 (앞뒤 공백 제거)
+
+        Raises:
+            AppleScriptError: 스크립트 실패, 타임아웃, 호스트 종료 시
+        """
+        if not scripts:
+            return []
+
+        with self._lock:
+            self.start()
+            self._next_id += 1
+            request_id = self._next_id
+
+            try:
+                self._process.stdin.write(json.dumps({"id": request_id, "scripts": scripts}) + "\n")
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self.close()
+                raise AppleScriptError(scripts[0], f"스크립트 호스트에 요청을 보낼 수 없습니다: {e}")
+
+            while True:
+                try:
+                    response = self._responses.get(timeout=timeout)
+                except queue.Empty:
+                    self.close(force=True)
+                    raise AppleScriptError(scripts[0], f"Timeout after {timeout} seconds")
+
+                if response is None:
+                    stderr = self._read_stderr()
+                    self.close()
+                    raise AppleScriptError(scripts[0], f"스크립트 호스트가 종료되었습니다: {stderr}")
+
+                if response.get("id") == request_id:
+                    break
+
+        results = []
+        for script, outcome in zip(scripts, response.get("results", [])):
+            if not outcome.get("ok"):
+                raise AppleScriptError(script, outcome.get("error", ""))
+            results.append(str(outcome.get("result", "")).strip())
+
+        if len(results) != len(scripts):
+            raise AppleScriptError(scripts[len(results)], "스크립트 호스트 응답에 결과가 부족합니다")
+
+        return results
+
+    def _read_stderr(self) -> str:
+        try:
+            return self._process.stderr.read().strip()
+        except Exception:
+            return ""
+
+
+_shared_host: Optional[AppleScriptHost] = None
+
+
+def get_shared_host() -> AppleScriptHost:
+    """프로세스 전체에서 공유하는 호스트 (종료 시 자동 정리)"""
+    global _shared_host
+    if _shared_host is None:
+        _shared_host = AppleScriptHost()
+        atexit.register(_shared_host.close)
+    return _shared_host
+
+
+# ===========================================
+# 여러 작업을 한 스크립트로 합치기
+# ===========================================
+
+
+def combine_scripts(scripts: List[str]) -> str:
+    """
+    여러 AppleScript를 핸들러로 감싸 한 번에 컴파일/실행되는 스크립트로 합칩니다.
+
+    각 스크립트의 결과는 텍스트로 변환되어 RESULT_SEPARATOR로 이어집니다.
+    실패한 스크립트는 ERROR_MARKER로 시작하는 오류 메시지를 남기고 이후 스크립트는 실행하지 않습니다.
+    split_combined_output()으로 결과를 나눕니다.
+    """
+    handlers = []
+    calls = []
+    for index, script in enumerate(scripts, start=1):
+        handlers.append(f"on oa_step_{index}()\n{script}\nend oa_step_{index}")
+        calls.append(f"""
+set AppleScript's text item delimiters to ""
+set oaValue to ""
+try
+    set oaValue to oa_step_{index}()
+on error errMsg number errNum
+    -- -2763: 결과를 반환하지 않는 작업
+    if errNum is not -2763 then
+        set end of oaResults to (character id 21) & errMsg & " (" & errNum & ")"
+        return oaJoin(oaResults)
+    end if
+end try
+try
+    -- 리스트 결과는 osascript 출력과 같이 ", "로 연결
+    set AppleScript's text item delimiters to ", "
+    set end of oaResults to (oaValue as text)
+on error
+    set end of oaResults to ""
+end try
+""")
+
+    return "\n\n".join(handlers) + f"""
+
+on oaJoin(oaItems)
+    set AppleScript's text item delimiters to (character id 3)
+    set oaText to oaItems as text
+    set AppleScript's text item delimiters to ""
+    return oaText
+end oaJoin
+
+set oaResults to {{}}
+{"".join(calls)}
+return oaJoin(oaResults)
+"""
+
+
+def split_combined_output(output: str, scripts: List[str]) -> List[str]:
+    """
+    combine_scripts로 만든 스크립트의 출력을 스크립트별 결과로 나눕니다.
+
+    Raises:
+        AppleScriptError: 실패한 스크립트가 있을 때 (해당 스크립트와 오류 메시지 포함)
+    """
+    results = output.split(RESULT_SEPARATOR) if scripts else []
+    for index, result in enumerate(results):
+        if result.startswith(ERROR_MARKER):
+            raise AppleScriptError(scripts[index], f"execution error: {result[1:]}")
+
+    if len(results) != len(scripts):
+        raise AppleScriptError(scripts[-1], f"결과 수가 맞지 않습니다 ({len(results)}/{len(scripts)})")
+
+    return [result.strip() for result in results]
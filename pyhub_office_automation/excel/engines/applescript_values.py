@@ -0,0 +1,154 @@
+"""
+AppleScript 셀 값 전송 형식 (macOS)
+
+MacOSEngine.read_range가 AppleScript 리스트를 문자열로 그대로 받으면
+값에 들어 있는 쉼표/중괄호와 구분할 수 없고 타입 정보도 사라집니다.
+이 모듈은 AppleScript 쪽에서 셀마다 타입 태그를 붙여 제어 문자로 구분한 텍스트를 만들고,
+Python 쪽에서 split 기반으로 한 번에(O(n)) 2차원 값으로 복원합니다.
+
+형식:
+    그리드 = 행 (RS로 구분), 행 = 셀 (US로 구분), 셀 = 태그 1글자 + 내용
+    태그: e(빈 셀), s(텍스트), i(정수), n(실수), b(불리언 1/0), d(날짜 "Y-M-DTseconds")
+    텍스트 안의 DLE/GS/RS/US는 DLE + P/G/R/U로 이스케이프
+"""
+
+import datetime
+import re
+from typing import Any, List
+
+ESCAPE = chr(16)  # DLE
+SECTION_SEPARATOR = chr(29)  # GS - 주소/행 수/열 수/값/공식 구분
+ROW_SEPARATOR = chr(30)  # RS
+CELL_SEPARATOR = chr(31)  # US
+
+_UNESCAPE = {"P": ESCAPE, "G": SECTION_SEPARATOR, "R": ROW_SEPARATOR, "U": CELL_SEPARATOR}
+_ESCAPE = {value: ESCAPE + key for key, value in _UNESCAPE.items()}
+_UNESCAPE_PATTERN = re.compile(ESCAPE + "(.)", re.DOTALL)
+_ESCAPE_PATTERN = re.compile("[" + "".join(_ESCAPE) + "]")
+
+# 스크립트 최상위에 넣는 인코딩 핸들러 (tell 블록 안에서는 "my oaEncodeGrid(...)"로 호출)
+ENCODE_HANDLERS = """
+on oaEscape(s)
+    if s does not contain (character id 16) and s does not contain (character id 29) and ¬
+        s does not contain (character id 30) and s does not contain (character id 31) then return s
+    repeat with pair in {{character id 16, (character id 16) & "P"}, {character id 29, (character id 16) & "G"}, ¬
+        {character id 30, (character id 16) & "R"}, {character id 31, (character id 16) & "U"}}
+        set AppleScript's text item delimiters to item 1 of pair
+        set parts to text items of s
+        set AppleScript's text item delimiters to item 2 of pair
+        set s to parts as text
+    end repeat
+    set AppleScript's text item delimiters to ""
+    return s
+end oaEscape
+
+on oaEncodeCell(v)
+    if v is missing value then return "e"
+    set c to class of v
+    if c is text or c is string or c is Unicode text then
+        if v is "" then return "e"
+        return "s" & my oaEscape(v)
+    else if c is integer then
+        return "i" & (v as text)
+    else if c is real then
+        return "n" & (v as text)
+    else if c is boolean then
+        if v then return "b1"
+        return "b0"
+    else if c is date then
+        return "d" & (year of v) & "-" & ((month of v) as integer) & "-" & (day of v) & "T" & (time of v)
+    end if
+    return "s" & my oaEscape(v as text)
+end oaEncodeCell
+
+on oaEncodeGrid(vals)
+    if class of vals is not list then set vals to {{vals}}
+    set rowTexts to {}
+    repeat with r in vals
+        set rowValues to contents of r
+        if class of rowValues is not list then set rowValues to {rowValues}
+        set cellTexts to {}
+        repeat with v in rowValues
+            set end of cellTexts to my oaEncodeCell(contents of v)
+        end repeat
+        set AppleScript's text item delimiters to (character id 31)
+        set end of rowTexts to cellTexts as text
+    end repeat
+    set AppleScript's text item delimiters to (character id 30)
+    set gridText to rowTexts as text
+    set AppleScript's text item delimiters to ""
+    return gridText
+end oaEncodeGrid
+"""
+
+
+def decode_cell(token: str) -> Any:
+    """태그가 붙은 셀 텍스트 하나를 Python 값으로 변환"""
+    if not token:
+        return None
+
+    tag, payload = token[0], token[1:]
+    if tag == "s":
+        if ESCAPE in payload:
+            return _UNESCAPE_PATTERN.sub(lambda m: _UNESCAPE.get(m.group(1), m.group(1)), payload)
+        return payload
+    if tag == "e":
+        return None
+    if tag == "i":
+        return int(payload)
+    if tag == "n":
+        # 시스템 로캘에 따라 소수점이 쉼표로 올 수 있음
+        return float(payload.replace(",", "."))
+    if tag == "b":
+        return payload == "1"
+    if tag == "d":
+        date_part, _, seconds = payload.partition("T")
+        year, month, day = (int(part) for part in date_part.split("-"))
+        return datetime.datetime(year, month, day) + datetime.timedelta(seconds=int(seconds or 0))
+    raise ValueError(f"알 수 없는 셀 태그: {tag!r}")
+
+
+def decode_grid(text: str, row_count: int = 0, column_count: int = 0) -> List[List[Any]]:
+    """
+    oaEncodeGrid 출력을 2차원 리스트로 복원합니다.
+
+    Args:
+        text: 인코딩된 그리드 텍스트
+        row_count: 범위의 행 수 (AppleScript가 1차원 리스트를 반환한 경우 모양 복원용)
+        column_count: 범위의 열 수
+
+    Returns:
+        List[List[Any]]: 행 리스트
+    """
+    if not text:
+        return []
+
+    rows = [[decode_cell(token) for token in row.split(CELL_SEPARATOR)] for row in text.split(ROW_SEPARATOR)]
+
+    # 한 행짜리 범위가 셀마다 한 행으로 온 경우 (1차원 리스트) 원래 모양으로 되돌림
+    if row_count and column_count and len(rows) != row_count and len(rows) * len(rows[0]) == row_count * column_count:
+        flat = [value for row in rows for value in row]
+        rows = [flat[start : start + column_count] for start in range(0, len(flat), column_count)]
+
+    return rows
+
+
+def encode_cell(value: Any) -> str:
+    """Python 값을 oaEncodeCell과 같은 형식으로 인코딩 (테스트/가짜 호스트용)"""
+    if value is None or value == "":
+        return "e"
+    if isinstance(value, bool):
+        return "b1" if value else "b0"
+    if isinstance(value, int):
+        return f"i{value}"
+    if isinstance(value, float):
+        return f"n{value}"
+    if isinstance(value, datetime.datetime):
+        seconds = value.hour * 3600 + value.minute * 60 + value.second
+        return f"d{value.year}-{value.month}-{value.day}T{seconds}"
+    return "s" + _ESCAPE_PATTERN.sub(lambda m: _ESCAPE[m.group(0)], str(value))
+
+
+def encode_grid(rows: List[List[Any]]) -> str:
+    """2차원 값을 oaEncodeGrid와 같은 형식으로 인코딩 (테스트/가짜 호스트용)"""
+    return ROW_SEPARATOR.join(CELL_SEPARATOR.join(encode_cell(value) for value in row) for row in rows)
@@ -5,13 +5,95 @@ Excel 자동화 엔진 추상 인터페이스
 Windows(pywin32 COM)와 macOS(AppleScript) 구현체가 이 인터페이스를 따릅니다.
 """
 
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from pyhub_office_automation.utils.records import SlotsRecord
 
-@dataclass
-class WorkbookInfo:
+from .chunking import AdaptiveChunkSizer, offset_cell, pad_rows
+from .exceptions import PivotTableNotFoundError, TableNotFoundError
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarData
+
+# read_range_iter 기본 청크 크기 (행 수)
+DEFAULT_CHUNK_ROWS = 1000
+
+
+def to_2d_list(values: Any) -> List[List[Any]]:
+    """
+    엔진이 반환한 범위 값을 2차원 리스트로 정규화합니다.
+
+    COM은 단일 셀을 스칼라, 다중 셀을 tuple of tuple로 반환하므로
+    단일값/1차원/2차원 입력을 모두 List[List[Any]]로 변환합니다.
+
+    Args:
+        values: 스칼라, 1차원 시퀀스 또는 2차원 시퀀스
+
+    Returns:
+        List[List[Any]]: 2차원 리스트 (빈 시퀀스는 빈 리스트)
+    """
+    if isinstance(values, (list, tuple)):
+        if not values:
+            return []
+        if isinstance(values[0], (list, tuple)):
+            return [list(row) for row in values]
+        return [list(values)]
+    return [[values]]
+
+
+def sample_row_indices(total_rows: int, limit: int) -> List[int]:
+    """
+    지능형 샘플링(--sample-mode)으로 가져올 행 인덱스를 계산합니다.
+
+    첫 20%, 중간 60%(균등 간격), 마지막 20% 비율로 limit개 안팎의 행을 고릅니다.
+    total_rows가 limit 이하이면 모든 행을 반환합니다.
+
+    Args:
+        total_rows: 전체 행 수
+        limit: 가져올 행 수
+
+    Returns:
+        List[int]: 0부터 시작하는 행 인덱스 (오름차순)
+    """
+    if total_rows <= limit:
+        return list(range(total_rows))
+
+    first_count = max(1, int(limit * 0.2))
+    last_count = max(1, int(limit * 0.2))
+    middle_count = limit - first_count - last_count
+
+    indices = list(range(first_count))
+
+    if middle_count > 0 and total_rows > first_count + last_count:
+        middle_start = first_count
+        middle_end = total_rows - last_count
+        step = max(1, (middle_end - middle_start) // middle_count)
+        indices.extend(list(range(middle_start, middle_end, step))[:middle_count])
+
+    if last_count > 0 and total_rows > last_count:
+        indices.extend(range(total_rows - last_count, total_rows))
+
+    return indices
+
+
+def contiguous_windows(indices: List[int]) -> List[Tuple[int, int]]:
+    """오름차순 행 인덱스를 연속 구간 (시작, 행 수) 목록으로 묶음 (예: [0,1,2,7] → [(0,3),(7,1)])"""
+    windows: List[Tuple[int, int]] = []
+    for index in indices:
+        if windows and index == windows[-1][0] + windows[-1][1]:
+            windows[-1] = (windows[-1][0], windows[-1][1] + 1)
+        else:
+            windows.append((index, 1))
+    return windows
+
+
+@dataclass(slots=True)
+class WorkbookInfo(SlotsRecord):
     """워크북 정보 데이터 클래스"""
 
     name: str
@@ -23,8 +105,8 @@ class WorkbookInfo:
     last_modified: Optional[str] = None
 
 
-@dataclass
-class RangeData:
+@dataclass(slots=True)
+class RangeData(SlotsRecord):
     """셀 범위 데이터 클래스"""
 
     values: Any
@@ -35,9 +117,23 @@ class RangeData:
     column_count: int = 1
     cells_count: int = 1
 
+    def to_columnar(self, header: bool = False) -> "ColumnarData":
+        """
+        값을 열 단위 타입 배열로 변환합니다 (columnar.ColumnarData 참고).
+
+        Args:
+            header: 첫 행을 열 이름으로 사용할지 여부
+        """
+        from .columnar import ColumnarData
+
+        rows = to_2d_list(self.values)
+        if header and rows:
+            return ColumnarData.from_rows(rows[1:], names=rows[0])
+        return ColumnarData.from_rows(rows)
 
-@dataclass
-class TableInfo:
+
+@dataclass(slots=True)
+class TableInfo(SlotsRecord):
     """테이블 정보 데이터 클래스"""
 
     name: str
@@ -49,8 +145,8 @@ class TableInfo:
     sample_data: Optional[List[List[Any]]] = None
 
 
-@dataclass
-class ChartInfo:
+@dataclass(slots=True)
+class ChartInfo(SlotsRecord):
     """차트 정보 데이터 클래스"""
 
     name: str
@@ -65,8 +161,8 @@ class ChartInfo:
     title: Optional[str] = None
 
 
-@dataclass
-class PivotTableInfo:
+@dataclass(slots=True)
+class PivotTableInfo(SlotsRecord):
     """피벗테이블 정보 데이터 클래스"""
 
     name: str
@@ -78,8 +174,8 @@ class PivotTableInfo:
     filter_fields: List[str]
 
 
-@dataclass
-class SlicerInfo:
+@dataclass(slots=True)
+class SlicerInfo(SlotsRecord):
     """슬라이서 정보 데이터 클래스"""
 
     name: str
@@ -92,8 +188,8 @@ class SlicerInfo:
     height: float
 
 
-@dataclass
-class ShapeInfo:
+@dataclass(slots=True)
+class ShapeInfo(SlotsRecord):
     """도형 정보 데이터 클래스"""
 
     name: str
@@ -107,6 +203,18 @@ class ShapeInfo:
     text: Optional[str] = None
 
 
+@dataclass(slots=True)
+class ChunkWriteProgress(SlotsRecord):
+    """청크 쓰기 진행 상황 데이터 클래스"""
+
+    offset: int  # 지금까지 기록된 행 수 (재개 시작 행 포함) = 다음 재개 위치
+    chunk_rows: int  # 마지막 청크의 행 수
+    chunk_count: int  # 이번 실행에서 기록한 청크 수
+    column_count: int
+    elapsed_seconds: float
+    rows_per_second: float
+
+
 class ExcelEngineBase(ABC):
     """
     Excel 자동화 엔진 추상 기반 클래스
@@ -118,6 +226,97 @@ class ExcelEngineBase(ABC):
     Issue #88: 추가 21개 명령어 (진행 중)
     """
 
+    # Excel 테이블(ListObject) 조회/읽기 지원 여부 (명령어 레이어의 플랫폼 확인용)
+    supports_tables: bool = False
+
+    # 서로 다른 워크북에 대한 명령어를 여러 스레드에서 동시에 실행해도 되는지 여부 (oa pipe --jobs)
+    # COM/AppleScript 엔진은 애플리케이션 연결이 스레드에 묶여 있으므로 False
+    supports_concurrent_workbooks: bool = False
+
+    # 중첩된 bulk_session 깊이 (가장 바깥 세션만 상태를 저장/복원)
+    _bulk_depth: int = 0
+
+    def attach_profiler(self, profiler: Any):
+        """
+        COM 호출 계측용 프로파일러를 연결합니다 (--profile).
+
+        기본 구현은 아무것도 하지 않으며, COM을 사용하는 엔진에서 재정의합니다.
+
+        Args:
+            profiler: instrumentation.ComProfiler 인스턴스
+        """
+        pass
+
+    def detach_profiler(self):
+        """attach_profiler()로 연결한 프로파일러를 떼어 계측 전 상태로 되돌립니다."""
+        pass
+
+    def is_alive(self) -> bool:
+        """
+        Excel 애플리케이션 연결을 계속 사용할 수 있는지 확인합니다.
+
+        기본 구현은 항상 True이며, 연결이 끊길 수 있는 엔진(COM)에서 재정의합니다.
+        """
+        return True
+
+    # ===========================================
+    # 대량 작업 세션 (session begin/end, 배치 @bulk)
+    # ===========================================
+
+    def begin_bulk(self) -> Dict[str, Any]:
+        """
+        대량 작업을 위해 화면 갱신, 자동 계산, 이벤트, 경고 대화상자를 끕니다.
+
+        기본 구현은 아무것도 하지 않습니다 (Excel 애플리케이션이 없는 엔진).
+
+        Returns:
+            Dict[str, Any]: end_bulk()에 넘겨 복원할 이전 설정 (JSON 직렬화 가능)
+
+        CLI 명령어: session begin
+        """
+        return {}
+
+    def end_bulk(self, state: Dict[str, Any], recalculate: bool = True):
+        """
+        begin_bulk()로 저장한 설정을 복원하고, 필요하면 한 번만 재계산합니다.
+
+        Args:
+            state: begin_bulk()가 반환한 이전 설정
+            recalculate: 복원 전 전체 재계산 실행 여부
+
+        CLI 명령어: session end
+        """
+        pass
+
+    @contextmanager
+    def bulk_session(self, recalculate: bool = True):
+        """
+        begin_bulk/end_bulk를 감싸는 컨텍스트 매니저
+
+        중첩해서 사용해도 가장 바깥 세션이 끝날 때 한 번만 복원/재계산합니다.
+        블록 안에서 예외가 발생해도 설정은 항상 복원됩니다.
+
+        사용 예:
+            with engine.bulk_session():
+                for row in rows:
+                    engine.write_range(book, "Sheet1", row.cell, row.values)
+        """
+        if self._bulk_depth > 0:
+            self._bulk_depth += 1
+            try:
+                yield
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        state = self.begin_bulk()
+        self._bulk_depth = 1
+        try:
+            yield
+        finally:
+            self._bulk_depth = 0
+            self.end_bulk(state, recalculate=recalculate)
+
     # ===========================================
     # 워크북 관리 (4개 명령어)
     # ===========================================
@@ -287,6 +486,41 @@ class ExcelEngineBase(ABC):
         """
         pass
 
+    def read_range_iter(
+        self,
+        workbook: Any,
+        sheet: str,
+        range_str: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        expand: Optional[str] = None,
+    ) -> Iterator[List[List[Any]]]:
+        """
+        셀 범위 값을 고정 크기 행 단위(청크)로 나누어 지연 반환합니다.
+
+        대용량 범위를 한 번에 메모리에 올리지 않고 스트리밍할 때 사용합니다.
+        기본 구현은 read_range로 전체를 읽은 뒤 나누어 반환하므로,
+        플랫폼별 엔진에서 창(window) 단위 읽기로 재정의하는 것을 권장합니다.
+
+        Args:
+            workbook: 워크북 객체
+            sheet: 시트 이름
+            range_str: 범위 문자열 (예: "A1:C500000")
+            chunk_rows: 청크당 행 수
+            expand: 범위 확장 모드 ("table", "down", "right", None)
+
+        Yields:
+            List[List[Any]]: 최대 chunk_rows개 행의 2차원 리스트 (값만, 공식 제외)
+
+        CLI 명령어: range-read --format csv, table-read --output-file
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows는 1 이상이어야 합니다")
+
+        range_data = self.read_range(workbook, sheet, range_str, expand=expand, include_formulas=False)
+        rows = to_2d_list(range_data.values)
+        for start in range(0, len(rows), chunk_rows):
+            yield rows[start : start + chunk_rows]
+
     @abstractmethod
     def write_range(self, workbook: Any, sheet: str, range_str: str, data: Any, include_formulas: bool = False):
         """
@@ -303,6 +537,70 @@ class ExcelEngineBase(ABC):
         """
         pass
 
+    def write_range_chunked(
+        self,
+        workbook: Any,
+        sheet: str,
+        start_cell: str,
+        rows: Iterable[List[Any]],
+        chunk_rows: Optional[int] = None,
+        start_offset: int = 0,
+        progress_callback: Optional[Callable[[ChunkWriteProgress], None]] = None,
+    ) -> ChunkWriteProgress:
+        """
+        2차원 데이터를 행 블록 단위로 나누어 씁니다.
+
+        chunk_rows를 지정하지 않으면 청크마다 쓰기 시간을 측정해 블록 크기를 자동 조정합니다.
+        rows에 이터레이터(예: csv.reader)를 넘기면 한 번에 한 청크만 메모리에 올립니다.
+
+        Args:
+            workbook: 워크북 객체
+            sheet: 시트 이름
+            start_cell: 데이터 첫 행의 시작 셀 주소 (예: "A1")
+            rows: 쓸 행들 (리스트 또는 이터레이터)
+            chunk_rows: 고정 청크 크기 (None이면 자동 조정)
+            start_offset: 재개할 행 위치 (rows의 앞쪽 start_offset개 행은 이미 기록된 것으로 보고 건너뜀)
+            progress_callback: 청크마다 호출되는 진행 상황 콜백
+
+        Returns:
+            ChunkWriteProgress: 최종 진행 상황 (offset = 기록된 전체 행 수)
+
+        CLI 명령어: range-write, table-write
+        """
+        sizer = AdaptiveChunkSizer(chunk_rows)
+        iterator = islice(rows, start_offset, None)
+
+        progress = ChunkWriteProgress(
+            offset=start_offset, chunk_rows=0, chunk_count=0, column_count=0, elapsed_seconds=0.0, rows_per_second=0.0
+        )
+        started = time.perf_counter()
+
+        for chunk in sizer.split(iterator):
+            chunk_started = time.perf_counter()
+            self._write_chunk(workbook, sheet, start_cell, progress.offset, chunk)
+            sizer.record(len(chunk), time.perf_counter() - chunk_started)
+
+            progress.offset += len(chunk)
+            progress.chunk_rows = len(chunk)
+            progress.chunk_count += 1
+            progress.column_count = max(progress.column_count, max(len(row) for row in chunk))
+            progress.elapsed_seconds = time.perf_counter() - started
+            written = progress.offset - start_offset
+            progress.rows_per_second = written / progress.elapsed_seconds if progress.elapsed_seconds > 0 else 0.0
+
+            if progress_callback:
+                progress_callback(progress)
+
+        return progress
+
+    def _write_chunk(self, workbook: Any, sheet: str, start_cell: str, row_offset: int, chunk: List[List[Any]]):
+        """
+        write_range_chunked의 청크 1개 쓰기 (start_cell에서 row_offset행 아래에 기록)
+
+        기본 구현은 write_range를 호출하며, 플랫폼별 엔진에서 더 직접적인 방식으로 재정의할 수 있습니다.
+        """
+        self.write_range(workbook, sheet, offset_cell(start_cell, row_offset), pad_rows(chunk))
+
     # ===========================================
     # 테이블 (5개 명령어)
     # ===========================================
@@ -323,6 +621,30 @@ class ExcelEngineBase(ABC):
         """
         pass
 
+    def get_table_sheet_name(self, workbook: Any, table_name: str) -> str:
+        """
+        테이블이 있는 시트 이름을 조회합니다.
+
+        기본 구현은 list_tables 결과에서 찾으므로,
+        이름으로 바로 찾을 수 있는 엔진은 재정의해도 됩니다.
+
+        Args:
+            workbook: 워크북 객체
+            table_name: 테이블 이름
+
+        Returns:
+            str: 시트 이름
+
+        Raises:
+            TableNotFoundError: 테이블이 없는 경우
+
+        CLI 명령어: table-read
+        """
+        for table in self.list_tables(workbook):
+            if table.name.lower() == table_name.lower():
+                return table.sheet_name
+        raise TableNotFoundError(table_name)
+
     @abstractmethod
     def read_table(
         self,
@@ -349,6 +671,75 @@ class ExcelEngineBase(ABC):
         """
         pass
 
+    def read_table_columnar(
+        self,
+        workbook: Any,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> "ColumnarData":
+        """
+        테이블 데이터를 열 단위 타입 배열로 읽습니다.
+
+        기본 구현은 read_table 결과를 한 번만 훑어 변환하므로,
+        열 단위로 직접 읽을 수 있는 엔진은 재정의해도 됩니다.
+
+        Args:
+            workbook: 워크북 객체
+            table_name: 테이블 이름
+            columns: 읽을 컬럼 리스트 (None이면 전체)
+            limit: 읽을 행 개수 제한
+            offset: 시작 행 오프셋
+
+        Returns:
+            ColumnarData: 헤더를 열 이름으로 사용한 열 단위 데이터
+
+        CLI 명령어: table-read --format arrow/parquet/npy
+        """
+        from .columnar import ColumnarData
+
+        result = self.read_table(workbook, table_name, columns=columns, limit=limit, offset=offset)
+        return ColumnarData.from_rows(result["data"], names=result["headers"])
+
+    def read_table_sample(
+        self,
+        workbook: Any,
+        table_name: str,
+        limit: int,
+        columns: Optional[List[str]] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        테이블에서 처음/중간/마지막 구간만 샘플링해 읽습니다 (sample_row_indices 참고).
+
+        기본 구현은 offset 이후 전체를 read_table로 읽은 뒤 고르므로,
+        플랫폼별 엔진에서 필요한 구간만 읽도록 재정의하는 것을 권장합니다.
+
+        Args:
+            workbook: 워크북 객체
+            table_name: 테이블 이름
+            limit: 샘플 행 수
+            columns: 읽을 컬럼 리스트 (None이면 전체)
+            offset: 샘플링을 시작할 행 오프셋
+
+        Returns:
+            Dict[str, Any]: read_table과 같은 형식 (+ total_rows: offset 이후 전체 행 수)
+
+        CLI 명령어: table-read --sample-mode
+        """
+        result = self.read_table(workbook, table_name, columns=columns, offset=offset)
+        data = result["data"]
+        sampled = [data[i] for i in sample_row_indices(len(data), limit)]
+
+        return {
+            "table_name": table_name,
+            "headers": result["headers"],
+            "data": sampled,
+            "row_count": len(sampled),
+            "total_rows": len(data),
+        }
+
     @abstractmethod
     def write_table(self, workbook: Any, sheet: str, table_name: str, data: List[List[Any]], start_cell: str = "A1"):
         """
@@ -651,6 +1042,46 @@ class ExcelEngineBase(ABC):
         """
         pass
 
+    def get_pivot_sheet_name(self, workbook: Any, pivot_name: str) -> str:
+        """
+        피벗 테이블이 있는 시트 이름을 조회합니다 (이름이 같으면 시트 순서상 첫 번째).
+
+        기본 구현은 list_pivot_tables 결과에서 찾으므로,
+        이름으로 바로 찾을 수 있는 엔진은 재정의해도 됩니다.
+
+        Args:
+            workbook: 워크북 객체
+            pivot_name: 피벗 테이블 이름
+
+        Returns:
+            str: 시트 이름
+
+        Raises:
+            PivotTableNotFoundError: 피벗 테이블이 없는 경우
+
+        CLI 명령어: pivot-configure, pivot-refresh, pivot-delete
+        """
+        for pivot in self.list_pivot_tables(workbook):
+            if pivot.name.lower() == pivot_name.lower():
+                return pivot.sheet_name
+        raise PivotTableNotFoundError(pivot_name)
+
+    def list_pivot_table_names(self, workbook: Any) -> List[Tuple[str, str]]:
+        """
+        워크북의 모든 피벗 테이블을 (시트 이름, 피벗 테이블 이름) 목록으로 조회합니다.
+
+        필드 정보까지 읽는 list_pivot_tables와 달리 이름만 필요할 때 사용합니다.
+
+        Args:
+            workbook: 워크북 객체
+
+        Returns:
+            List[Tuple[str, str]]: (시트 이름, 피벗 테이블 이름) 목록 (시트 순서)
+
+        CLI 명령어: pivot-refresh --all, pivot-delete --delete-cache
+        """
+        return [(pivot.sheet_name, pivot.name) for pivot in self.list_pivot_tables(workbook)]
+
     @abstractmethod
     def refresh_pivot_table(self, workbook: Any, sheet: str, pivot_name: str):
         """
@@ -0,0 +1,121 @@
+"""
+대용량 쓰기용 청크 분할 유틸리티
+
+range-write / table-write가 수백만 셀을 한 번의 Range.Value 대입으로 보내면
+COM SAFEARRAY 마샬링 한도에 걸리거나 Excel이 오랫동안 응답하지 않습니다.
+이 모듈은 데이터를 행 블록으로 나누고, 호출당 측정된 지연 시간으로 블록 크기를 조정합니다.
+"""
+
+import re
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
+
+# 자동 조정 시 첫 청크 크기 (행 수)
+DEFAULT_WRITE_CHUNK_ROWS = 500
+
+# 청크 1회 쓰기 목표 시간 (초) - Excel이 멈춘 것처럼 보이지 않는 수준
+TARGET_CHUNK_SECONDS = 0.5
+
+# 청크 1회에 보낼 최대 셀 수 (COM SAFEARRAY 메모리 한도 회피)
+MAX_CHUNK_CELLS = 200_000
+
+MIN_CHUNK_ROWS = 50
+MAX_CHUNK_ROWS = 50_000
+
+_CELL_PATTERN = re.compile(r"^\$?([A-Za-z]+)\$?(\d+)$")
+
+
+class AdaptiveChunkSizer:
+    """
+    측정된 쓰기 지연 시간으로 다음 청크의 행 수를 결정합니다.
+
+    매 청크 후 record()로 (행 수, 소요 시간)을 알려주면 TARGET_CHUNK_SECONDS에
+    맞도록 다음 크기를 계산합니다. 급격한 변동을 막기 위해 한 번에 2배 이상
+    늘리거나 절반 이하로 줄이지 않습니다.
+    """
+
+    def __init__(
+        self,
+        chunk_rows: Optional[int] = None,
+        target_seconds: float = TARGET_CHUNK_SECONDS,
+        min_rows: int = MIN_CHUNK_ROWS,
+        max_rows: int = MAX_CHUNK_ROWS,
+        max_cells: int = MAX_CHUNK_CELLS,
+    ):
+        """
+        Args:
+            chunk_rows: 고정 청크 크기 (None이면 자동 조정)
+            target_seconds: 청크 1회 쓰기 목표 시간 (초)
+            min_rows: 자동 조정 하한
+            max_rows: 자동 조정 상한
+            max_cells: 청크 1회 최대 셀 수
+        """
+        if chunk_rows is not None and chunk_rows < 1:
+            raise ValueError(f"chunk_rows는 1 이상이어야 합니다: {chunk_rows}")
+
+        self.fixed = chunk_rows is not None
+        self.chunk_rows = chunk_rows if self.fixed else DEFAULT_WRITE_CHUNK_ROWS
+        self.target_seconds = target_seconds
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.max_cells = max_cells
+
+    def rows_for(self, column_count: int) -> int:
+        """열 수를 고려한 이번 청크의 행 수"""
+        if self.fixed or column_count < 1:
+            return self.chunk_rows
+        return max(1, min(self.chunk_rows, self.max_cells // column_count))
+
+    def record(self, rows: int, seconds: float):
+        """청크 쓰기 결과를 반영해 다음 청크 크기 조정"""
+        if self.fixed or rows < 1:
+            return
+
+        if seconds <= 0:
+            next_rows = rows * 2
+        else:
+            next_rows = int(rows * self.target_seconds / seconds)
+
+        next_rows = max(rows // 2, min(rows * 2, next_rows))
+        self.chunk_rows = max(self.min_rows, min(self.max_rows, next_rows))
+
+    def split(self, rows: Iterable[Any], column_count: int = 0) -> Iterator[List[Any]]:
+        """
+        행 시퀀스(리스트 또는 이터레이터)를 현재 청크 크기대로 잘라 반환합니다.
+
+        이터레이터는 필요한 만큼만 소비하므로 CSV 리더 등을 그대로 넘기면
+        메모리에는 한 청크만 올라갑니다.
+        """
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, self.rows_for(column_count)))
+            if not chunk:
+                return
+            yield chunk
+            if not column_count:
+                column_count = max(len(row) for row in chunk)
+
+
+def pad_rows(chunk: List[List[Any]]) -> List[List[Any]]:
+    """길이가 다른 행을 가장 긴 행에 맞춰 None으로 채웁니다 (CSV 행 길이 불일치 대비)"""
+    width = max((len(row) for row in chunk), default=0)
+    return [list(row) + [None] * (width - len(row)) for row in chunk]
+
+
+def offset_cell(cell: str, row_offset: int) -> str:
+    """
+    셀 주소를 행 방향으로 이동합니다.
+
+    Args:
+        cell: 시작 셀 주소 (예: "B2", "$B$2")
+        row_offset: 이동할 행 수
+
+    Returns:
+        str: 이동한 셀 주소 (예: offset_cell("B2", 3) → "B5")
+    """
+    match = _CELL_PATTERN.match(cell.strip())
+    if not match:
+        raise ValueError(f"잘못된 셀 주소 형식: {cell}")
+
+    column, row = match.groups()
+    return f"{column.upper()}{int(row) + row_offset}"
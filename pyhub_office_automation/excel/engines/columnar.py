@@ -0,0 +1,288 @@
+"""
+열(column) 단위 범위 데이터
+
+엔진이 반환하는 범위 값은 행 단위 중첩 리스트라서, 분석 명령어가 pandas DataFrame으로 바꿀 때마다
+셀마다 Python 객체를 다시 만들고 열마다 타입을 다시 추론합니다.
+이 모듈은 행 데이터를 한 번만 훑어 열마다 타입이 정해진 NumPy 배열과 null 마스크로 바꾸고,
+그 결과를 DataFrame / Arrow / Parquet / npy로 복사 없이(또는 한 번만) 내보냅니다.
+
+열 타입은 null(None)이 아닌 값으로 정합니다:
+bool → bool, int → int64, int/float 혼합 → float64, date/datetime → datetime64[us], 그 외 → object.
+값이 모두 None인 열은 object입니다.
+
+pyarrow는 arrow/parquet 출력에만 필요하며 없으면 ImportError를 발생시킵니다.
+"""
+
+import datetime
+import os
+import sys
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import Any, BinaryIO, List, Optional, Sequence, Union
+
+import numpy as np
+
+# --format으로 선택할 수 있는 열 단위 바이너리 형식
+COLUMNAR_FORMATS = ("arrow", "parquet", "npy")
+
+_BOOL = "bool"
+_INT = "int"
+_FLOAT = "float"
+_DATETIME = "datetime"
+_OBJECT = "object"
+
+
+def _column_kind(types: set) -> str:
+    """열에 나타난 값 타입 집합으로 열 타입 결정"""
+    if not types:
+        return _OBJECT
+    if all(issubclass(t, (bool, np.bool_)) for t in types):
+        return _BOOL
+    if any(issubclass(t, (bool, np.bool_)) for t in types):
+        return _OBJECT
+    if all(issubclass(t, (int, np.integer)) for t in types):
+        return _INT
+    if all(issubclass(t, (int, float, np.integer, np.floating)) for t in types):
+        return _FLOAT
+    if all(issubclass(t, datetime.date) for t in types):
+        return _DATETIME
+    return _OBJECT
+
+
+@dataclass
+class Column:
+    """타입이 정해진 값 배열과 null 마스크 (mask가 True인 위치가 null)"""
+
+    name: Any
+    values: np.ndarray
+    mask: np.ndarray
+    kind: str
+
+    @property
+    def null_count(self) -> int:
+        return int(self.mask.sum())
+
+    @classmethod
+    def from_cells(cls, name: Any, cells: Sequence[Any]) -> "Column":
+        count = len(cells)
+        mask = np.fromiter((cell is None for cell in cells), dtype=bool, count=count)
+        kind = _column_kind({type(cell) for cell in cells if cell is not None})
+
+        if kind == _BOOL:
+            values = np.fromiter((bool(cell) for cell in cells), dtype=bool, count=count)
+        elif kind == _INT:
+            try:
+                values = np.fromiter((0 if cell is None else cell for cell in cells), dtype=np.int64, count=count)
+            except OverflowError:
+                kind = _OBJECT
+        elif kind == _FLOAT:
+            values = np.fromiter((np.nan if cell is None else cell for cell in cells), dtype=np.float64, count=count)
+        elif kind == _DATETIME:
+            if any(getattr(cell, "tzinfo", None) is not None for cell in cells):
+                kind = _OBJECT
+            else:
+                values = np.array(cells, dtype="datetime64[us]")
+
+        if kind == _OBJECT:
+            values = np.empty(count, dtype=object)
+            values[:] = cells
+
+        return cls(name=name, values=values, mask=mask, kind=kind)
+
+    def to_numpy(self) -> np.ndarray:
+        """null을 NaN/NaT/None으로 표현한 배열 (int/bool 열에 null이 있으면 float64/object로 바뀜)"""
+        if not self.mask.any():
+            return self.values
+        if self.kind == _INT:
+            values = self.values.astype(np.float64)
+            values[self.mask] = np.nan
+            return values
+        if self.kind == _BOOL:
+            values = self.values.astype(object)
+            values[self.mask] = None
+            return values
+        # float(NaN), datetime(NaT), object(None)은 이미 null이 채워져 있음
+        return self.values
+
+
+def _field_names(names: Sequence[Any]) -> List[str]:
+    """Arrow/Parquet/npy용 열 이름 (빈 이름은 Column_N, 중복 이름은 _2, _3 … 접미사)"""
+    fields = []
+    seen = set()
+    for i, name in enumerate(names):
+        field = f"Column_{i + 1}" if name is None or name == "" else str(name)
+        candidate, suffix = field, 2
+        while candidate in seen:
+            candidate, suffix = f"{field}_{suffix}", suffix + 1
+        seen.add(candidate)
+        fields.append(candidate)
+    return fields
+
+
+@dataclass
+class ColumnarData:
+    """열 단위 표 데이터"""
+
+    columns: List[Column]
+    row_count: int
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]], names: Optional[Sequence[Any]] = None) -> "ColumnarData":
+        """
+        행 리스트를 열 단위로 변환
+
+        Args:
+            rows: 2차원 행 데이터 (행 길이가 다르면 None으로 채움)
+            names: 열 이름 (None이면 Column_1, Column_2 …)
+        """
+        rows = list(rows)
+        width = max((len(row) for row in rows), default=0)
+        if names is not None:
+            width = max(width, len(names))
+        else:
+            names = [f"Column_{i + 1}" for i in range(width)]
+        names = list(names) + [None] * (width - len(names))
+
+        cells_by_column = list(zip_longest(*rows, fillvalue=None))
+        cells_by_column += [(None,) * len(rows)] * (width - len(cells_by_column))
+        columns = [Column.from_cells(name, cells) for name, cells in zip(names, cells_by_column)]
+        return cls(columns=columns, row_count=len(rows))
+
+    @property
+    def names(self) -> List[Any]:
+        return [column.name for column in self.columns]
+
+    @property
+    def column_count(self) -> int:
+        return len(self.columns)
+
+    def to_pandas(self):
+        """pandas DataFrame (열 배열을 그대로 사용하고, 열 이름은 원래 헤더 값을 유지)"""
+        import pandas as pd
+
+        df = pd.DataFrame({i: column.to_numpy() for i, column in enumerate(self.columns)}, copy=False)
+        df.columns = self.names
+        return df
+
+    def to_arrow(self):
+        """pyarrow.Table (null 마스크를 Arrow validity bitmap으로 사용)"""
+        pa = _import_pyarrow()
+
+        arrays = []
+        for column in self.columns:
+            if column.kind == _OBJECT:
+                # 문자열 외의 값이 섞인 열은 문자열로 저장
+                cells = [
+                    None if masked else (value if isinstance(value, str) else str(value))
+                    for value, masked in zip(column.values, column.mask)
+                ]
+                arrays.append(pa.array(cells, type=pa.string()))
+            else:
+                arrays.append(pa.array(column.values, mask=column.mask))
+        return pa.Table.from_arrays(arrays, names=_field_names(self.names))
+
+    def to_structured(self) -> np.ndarray:
+        """
+        NumPy 구조화 배열 (npy 출력용, 열 이름이 필드 이름)
+
+        null은 float 열에서 NaN, datetime 열에서 NaT, 문자열 열에서 ""로 저장하며,
+        null이 있는 int/bool 열은 NaN을 담기 위해 float64로 저장합니다.
+        """
+        fields = []
+        arrays = []
+        for name, column in zip(_field_names(self.names), self.columns):
+            if column.kind == _OBJECT:
+                array = np.array(["" if masked else str(value) for value, masked in zip(column.values, column.mask)])
+                if array.dtype.kind != "U":
+                    array = array.astype("U1")
+            elif column.kind in (_INT, _BOOL) and column.mask.any():
+                array = column.values.astype(np.float64)
+                array[column.mask] = np.nan
+            else:
+                array = column.values
+            fields.append((name, array.dtype))
+            arrays.append(array)
+
+        structured = np.empty(self.row_count, dtype=fields)
+        for (name, _), array in zip(fields, arrays):
+            structured[name] = array
+        return structured
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("arrow/parquet 형식에는 pyarrow가 필요합니다. 'pip install pyarrow'로 설치하세요.")
+    return pyarrow
+
+
+def stdout_binary() -> BinaryIO:
+    """바이너리 출력용 stdout (oa pipe/데몬처럼 텍스트만 받는 스트림이면 ValueError)"""
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        raise ValueError("현재 출력 스트림에는 바이너리를 쓸 수 없습니다. --output-file을 지정하세요.")
+    sys.stdout.flush()
+    return stream
+
+
+def write_columnar(data: ColumnarData, output_format: str, target: Union[str, os.PathLike, BinaryIO]) -> int:
+    """
+    열 단위 데이터를 바이너리 형식으로 저장
+
+    Args:
+        data: 저장할 데이터
+        output_format: "arrow"(Arrow IPC 스트림), "parquet", "npy"
+        target: 파일 경로 또는 바이너리 스트림
+
+    Returns:
+        int: 기록한 바이트 수
+    """
+    if output_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"지원하지 않는 열 단위 형식입니다: {output_format} (지원: {', '.join(COLUMNAR_FORMATS)})")
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            write_columnar(data, output_format, f)
+        return os.path.getsize(target)
+
+    counter = _CountingWriter(target)
+    if output_format == "npy":
+        np.save(counter, data.to_structured(), allow_pickle=False)
+    elif output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(data.to_arrow(), counter)
+    else:
+        pa = _import_pyarrow()
+        table = data.to_arrow()
+        with pa.ipc.new_stream(counter, table.schema) as writer:
+            writer.write_table(table)
+    target.flush()
+    return counter.written
+
+
+class _CountingWriter:
+    """쓰기 바이트 수를 세는 바이너리 스트림 래퍼 (stdout처럼 tell()이 없는 스트림에도 사용)"""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self.written = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._stream.write(data)
+        self.written += len(data)
+        return len(data)
+
+    def flush(self):
+        self._stream.flush()
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self.written
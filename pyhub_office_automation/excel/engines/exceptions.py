@@ -51,6 +51,14 @@ class ChartNotFoundError(ExcelEngineError):
         super().__init__(f"차트 '{chart_name}'을 찾을 수 없습니다")
 
 
+class PivotTableNotFoundError(ExcelEngineError):
+    """피벗 테이블을 찾을 수 없는 경우"""
+
+    def __init__(self, pivot_name: str):
+        self.pivot_name = pivot_name
+        super().__init__(f"피벗 테이블 '{pivot_name}'을 찾을 수 없습니다")
+
+
 class PlatformNotSupportedError(ExcelEngineError):
     """플랫폼이 지원되지 않는 경우"""
 
@@ -0,0 +1,1382 @@
+"""
+가짜 Excel 객체 모델 (COM 없이 WindowsEngine 실행)
+
+Excel.Application COM 객체 모델의 일부(Workbooks, Sheets, Range, ListObjects,
+ChartObjects, PivotTables)를 순수 Python으로 흉내 냅니다.
+Linux CI처럼 Excel이 없는 환경에서 WindowsEngine의 COM 호출 수와 오버헤드를 측정하는 데 사용합니다.
+
+    from pyhub_office_automation.excel.engines.fake_excel import FakeApplication
+    from pyhub_office_automation.excel.engines.windows import WindowsEngine
+
+    xl = FakeApplication(latency=0.0005)  # COM 멤버 접근마다 0.5ms 지연
+    engine = WindowsEngine(application=xl)
+    book = engine.open_workbook("data.xlsx")  # openpyxl로 값/테이블을 읽어 옴
+
+실제 Excel 세션의 호출 흐름은 CallTrace로 녹화해 두었다가 ReplayApplication으로 재생할 수 있습니다.
+
+    trace = CallTrace()
+    engine = WindowsEngine(application=trace.wrap(real_xl), constants=win32com.client.constants)
+    engine.list_tables(engine.get_active_workbook())
+    trace.save("list_tables.trace.json")
+
+    engine = WindowsEngine(application=ReplayApplication(CallTrace.load("list_tables.trace.json")))
+
+제한 사항:
+    - 수식은 계산하지 않습니다 (문자열로만 보관)
+    - SaveAs/Save는 파일에 쓰지 않고 이름/저장 상태만 갱신합니다
+    - 피벗테이블은 필드 구성만 보관하며 집계 결과를 만들지 않습니다
+"""
+
+import datetime
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Excel 시트 한계
+MAX_ROWS = 1048576
+MAX_COLUMNS = 16384
+
+# 셀 크기 기본값 (포인트) - Left/Top 계산용
+DEFAULT_COLUMN_WIDTH = 48.0
+DEFAULT_ROW_HEIGHT = 15.0
+
+_ADDRESS_PATTERN = re.compile(r"^\$?([A-Za-z]{1,3})?\$?(\d+)?$")
+
+
+class FakeComError(Exception):
+    """가짜 COM 호출 실패 (pywintypes.com_error 대용)"""
+
+
+class FakeConstants:
+    """win32com.client.constants 대용 (WindowsEngine이 사용하는 Excel 상수)"""
+
+    xlDown = -4121
+    xlUp = -4162
+    xlToRight = -4161
+    xlToLeft = -4159
+    xlSrcRange = 1
+    xlYes = 1
+    xlNo = 2
+    xlDatabase = 1
+    xlHidden = 0
+    xlRowField = 1
+    xlColumnField = 2
+    xlPageField = 3
+    xlDataField = 4
+    xlSum = -4157
+    xlCount = -4112
+    xlAverage = -4106
+    xlMax = -4136
+    xlMin = -4139
+    xlAscending = 1
+    xlDescending = 2
+    xlSortOnValues = 0
+    xlCalculationAutomatic = -4105
+    xlCalculationManual = -4135
+    xlCalculationSemiautomatic = 2
+
+
+# ===========================================
+# 주소 유틸리티
+# ===========================================
+
+
+def column_letter(col: int) -> str:
+    """열 번호(1-based)를 열 문자로 변환"""
+    letters = ""
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def column_index(letters: str) -> int:
+    """열 문자를 열 번호(1-based)로 변환"""
+    col = 0
+    for letter in letters.upper():
+        col = col * 26 + ord(letter) - ord("A") + 1
+    return col
+
+
+def parse_address(address: str) -> Tuple[int, int, int, int]:
+    """
+    A1 형식 주소를 (row1, col1, row2, col2)로 변환합니다.
+
+    "A1", "$A$1:$C$3", "A:C"(전체 열), "2:5"(전체 행)를 지원합니다.
+    """
+    if "!" in address:
+        address = address.split("!", 1)[1]
+
+    parts = address.split(":")
+    if len(parts) > 2:
+        raise FakeComError(f"잘못된 범위 주소: {address}")
+
+    corners = []
+    for part in parts:
+        match = _ADDRESS_PATTERN.match(part.strip())
+        if not match or not any(match.groups()):
+            raise FakeComError(f"잘못된 범위 주소: {address}")
+        letters, digits = match.groups()
+        corners.append((int(digits) if digits else None, column_index(letters) if letters else None))
+
+    (row1, col1), (row2, col2) = corners[0], corners[-1]
+    if row1 is None or row2 is None:
+        row1, row2 = 1, MAX_ROWS
+    if col1 is None or col2 is None:
+        col1, col2 = 1, MAX_COLUMNS
+
+    return min(row1, row2), min(col1, col2), max(row1, row2), max(col1, col2)
+
+
+def format_address(row1: int, col1: int, row2: int, col2: int) -> str:
+    """(row1, col1, row2, col2)를 절대 주소로 변환 (예: "$A$1:$C$3")"""
+    first = f"${column_letter(col1)}${row1}"
+    if (row1, col1) == (row2, col2):
+        return first
+    return f"{first}:${column_letter(col2)}${row2}"
+
+
+# ===========================================
+# 객체 모델 기반 클래스
+# ===========================================
+
+
+class _FakeDispatch:
+    """
+    가짜 COM 객체 기반 클래스
+
+    대문자로 시작하는 멤버(COM 멤버) 접근마다 애플리케이션의 호출 수를 세고 지연을 적용합니다.
+    내부 구현은 소문자/밑줄 속성만 사용하므로 호출 수에 포함되지 않습니다.
+    """
+
+    # pywin32 디스패치 객체 표식 (instrumentation.is_com_object가 확인)
+    _oleobj_ = None
+
+    def __init__(self, app: "FakeApplication"):
+        object.__setattr__(self, "_app", app)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name[:1].isupper():
+            object.__getattribute__(self, "_app")._tick()
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        if name[:1].isupper():
+            object.__getattribute__(self, "_app")._tick()
+        object.__setattr__(self, name, value)
+
+    def _set(self, **attributes: Any):
+        """호출 수에 포함하지 않고 COM 속성 설정 (객체 내부 상태 갱신용)"""
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+
+class _FakeCollection(_FakeDispatch):
+    """COM 컬렉션 (1부터 시작하는 인덱스 또는 Name으로 항목 조회)"""
+
+    def __init__(self, app: "FakeApplication", items: Optional[List[Any]] = None):
+        super().__init__(app)
+        self._items = items if items is not None else []
+
+    @property
+    def Count(self) -> int:
+        return len(self._items)
+
+    def Item(self, index: Any) -> Any:
+        return self._find(index)
+
+    def __call__(self, index: Any) -> Any:
+        self._app._tick()
+        return self._find(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _find(self, index: Any) -> Any:
+        if isinstance(index, int):
+            if 1 <= index <= len(self._items):
+                return self._items[index - 1]
+        else:
+            key = str(index).lower()
+            for item in self._items:
+                if item._name.lower() == key:
+                    return item
+        raise FakeComError(f"Subscript out of range: {index}")
+
+
+# ===========================================
+# Application / Workbooks
+# ===========================================
+
+
+class FakeApplication(_FakeDispatch):
+    """
+    가짜 Excel.Application
+
+    Args:
+        latency: COM 멤버 접근 1회당 지연 시간 (초)
+    """
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(self)
+        self.latency = latency
+        self.com_calls = 0
+        self.constants = FakeConstants
+        self.recalculations = 0
+        self._workbooks = FakeWorkbooks(self)
+        self._active_workbook: Optional[FakeWorkbook] = None
+        self._set(
+            Visible=False,
+            ScreenUpdating=True,
+            EnableEvents=True,
+            DisplayAlerts=True,
+            Calculation=FakeConstants.xlCalculationAutomatic,
+        )
+
+    def _tick(self):
+        object.__setattr__(self, "com_calls", object.__getattribute__(self, "com_calls") + 1)
+        latency = object.__getattribute__(self, "latency")
+        if latency:
+            time.sleep(latency)
+
+    @property
+    def Workbooks(self) -> "FakeWorkbooks":
+        return self._workbooks
+
+    @property
+    def ActiveWorkbook(self) -> Optional["FakeWorkbook"]:
+        return self._active_workbook
+
+    @property
+    def ActiveSheet(self) -> Optional["FakeWorksheet"]:
+        return self._active_workbook._active_sheet if self._active_workbook else None
+
+    def Calculate(self):
+        self.recalculations += 1
+
+    def Quit(self):
+        for workbook in list(self._workbooks._items):
+            workbook._close()
+
+
+class FakeWorkbooks(_FakeCollection):
+    """Workbooks 컬렉션"""
+
+    def Add(self, Template: Any = None) -> "FakeWorkbook":
+        number = len(self._items) + 1
+        workbook = FakeWorkbook(self._app, f"Book{number}", full_name=f"Book{number}")
+        workbook._add_sheet("Sheet1")
+        self._register(workbook)
+        return workbook
+
+    def Open(self, Filename: str, *args, **kwargs) -> "FakeWorkbook":
+        full_name = str(Path(Filename).resolve())
+        for workbook in self._items:
+            if workbook._full_name == full_name:
+                return workbook
+
+        if not os.path.exists(full_name):
+            raise FakeComError(f"'{Filename}' 파일을 찾을 수 없습니다")
+
+        workbook = FakeWorkbook(self._app, Path(full_name).name, full_name=full_name)
+        workbook._load(full_name)
+        self._register(workbook)
+        return workbook
+
+    def _register(self, workbook: "FakeWorkbook"):
+        self._items.append(workbook)
+        self._app._active_workbook = workbook
+
+
+class FakeWorkbook(_FakeDispatch):
+    """Workbook"""
+
+    def __init__(self, app: FakeApplication, name: str, full_name: str):
+        super().__init__(app)
+        self._name = name
+        self._full_name = full_name
+        self._sheets = FakeSheets(app, self)
+        self._active_sheet: Optional[FakeWorksheet] = None
+        self._pivot_caches = FakePivotCaches(app, self)
+        self._set(Saved=True)
+
+    def _add_sheet(self, name: str, index: Optional[int] = None) -> "FakeWorksheet":
+        sheet = FakeWorksheet(self._app, self, name)
+        if index is None:
+            self._sheets._items.append(sheet)
+        else:
+            self._sheets._items.insert(index, sheet)
+        if self._active_sheet is None:
+            self._active_sheet = sheet
+        return sheet
+
+    def _load(self, path: str):
+        """openpyxl로 셀 값과 테이블 정의를 읽어 옴"""
+        try:
+            import openpyxl
+        except ImportError:
+            self._add_sheet("Sheet1")
+            return
+
+        wb = openpyxl.load_workbook(path, data_only=True)
+        for ws in wb.worksheets:
+            sheet = self._add_sheet(ws.title)
+            for row in ws.iter_rows():
+                for cell in row:
+                    if cell.value is not None:
+                        sheet._cells[(cell.row, cell.column)] = cell.value
+            for table in ws.tables.values():
+                row1, col1, row2, col2 = parse_address(table.ref)
+                sheet._list_objects._items.append(FakeListObject(self._app, sheet, table.displayName, row1, col1, row2, col2))
+        self._active_sheet = self._sheets._items[wb.index(wb.active)] if self._sheets._items else None
+
+    def _close(self):
+        items = self._app._workbooks._items
+        if self in items:
+            items.remove(self)
+        if self._app._active_workbook is self:
+            self._app._active_workbook = items[-1] if items else None
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @property
+    def FullName(self) -> str:
+        return self._full_name
+
+    @property
+    def Path(self) -> str:
+        return str(Path(self._full_name).parent) if os.path.isabs(self._full_name) else ""
+
+    @property
+    def Sheets(self) -> "FakeSheets":
+        return self._sheets
+
+    @property
+    def Worksheets(self) -> "FakeSheets":
+        return self._sheets
+
+    @property
+    def ActiveSheet(self) -> Optional["FakeWorksheet"]:
+        return self._active_sheet
+
+    @property
+    def Application(self) -> FakeApplication:
+        return self._app
+
+    def PivotCaches(self) -> "FakePivotCaches":
+        return self._pivot_caches
+
+    def Activate(self):
+        self._app._active_workbook = self
+
+    def Save(self):
+        self._set(Saved=True)
+
+    def SaveAs(self, Filename: str, *args, **kwargs):
+        self._full_name = str(Path(Filename).resolve())
+        self._name = Path(self._full_name).name
+        self._set(Saved=True)
+
+    def Close(self, SaveChanges: Any = None, *args, **kwargs):
+        self._close()
+
+
+# ===========================================
+# Sheets / Worksheet
+# ===========================================
+
+
+class FakeSheets(_FakeCollection):
+    """Sheets 컬렉션"""
+
+    def __init__(self, app: FakeApplication, workbook: FakeWorkbook):
+        super().__init__(app)
+        self._workbook = workbook
+
+    def Add(self, Before: Any = None, After: Any = None, Count: int = 1, Type: Any = None) -> "FakeWorksheet":
+        existing = {sheet._name.lower() for sheet in self._items}
+        number = len(self._items) + 1
+        while f"sheet{number}" in existing:
+            number += 1
+
+        if Before is not None:
+            index = self._items.index(Before)
+        elif After is not None:
+            index = self._items.index(After) + 1
+        else:
+            index = self._items.index(self._workbook._active_sheet) if self._workbook._active_sheet else 0
+
+        sheet = self._workbook._add_sheet(f"Sheet{number}", index)
+        self._workbook._active_sheet = sheet
+        self._workbook._set(Saved=False)
+        return sheet
+
+
+class FakeWorksheet(_FakeDispatch):
+    """Worksheet (셀 값은 {(row, col): value} 딕셔너리에 보관)"""
+
+    def __init__(self, app: FakeApplication, workbook: FakeWorkbook, name: str):
+        super().__init__(app)
+        self._workbook = workbook
+        self._name = name
+        self._cells: Dict[Tuple[int, int], Any] = {}
+        self._formulas: Dict[Tuple[int, int], str] = {}
+        self._list_objects = FakeListObjects(app, self)
+        self._chart_objects = FakeChartObjects(app, self)
+        self._pivot_tables = FakePivotTables(app, self)
+        self._set(Visible=True)
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @Name.setter
+    def Name(self, value: str):
+        for sheet in self._workbook._sheets._items:
+            if sheet is not self and sheet._name.lower() == str(value).lower():
+                raise FakeComError(f"시트 이름 '{value}'이(가) 이미 사용 중입니다")
+        self._name = str(value)
+        self._workbook._set(Saved=False)
+
+    @property
+    def Index(self) -> int:
+        return self._workbook._sheets._items.index(self) + 1
+
+    @property
+    def Parent(self) -> FakeWorkbook:
+        return self._workbook
+
+    @property
+    def UsedRange(self) -> "FakeRange":
+        keys = [key for key, value in self._cells.items() if value is not None]
+        if not keys:
+            return FakeRange(self._app, self, 1, 1, 1, 1)
+        rows = [row for row, _ in keys]
+        cols = [col for _, col in keys]
+        return FakeRange(self._app, self, min(rows), min(cols), max(rows), max(cols))
+
+    @property
+    def ListObjects(self) -> "FakeListObjects":
+        return self._list_objects
+
+    def Range(self, Cell1: Any, Cell2: Any = None) -> "FakeRange":
+        first = self._resolve(Cell1)
+        last = self._resolve(Cell2) if Cell2 is not None else first
+        return FakeRange(
+            self._app,
+            self,
+            min(first[0], last[0]),
+            min(first[1], last[1]),
+            max(first[2], last[2]),
+            max(first[3], last[3]),
+        )
+
+    def Cells(self, RowIndex: int, ColumnIndex: int) -> "FakeRange":
+        return FakeRange(self._app, self, RowIndex, ColumnIndex, RowIndex, ColumnIndex)
+
+    def ChartObjects(self, Index: Any = None) -> Any:
+        return self._chart_objects if Index is None else self._chart_objects._find(Index)
+
+    def PivotTables(self, Index: Any = None) -> Any:
+        return self._pivot_tables if Index is None else self._pivot_tables._find(Index)
+
+    def Activate(self):
+        self._workbook._active_sheet = self
+
+    def Delete(self):
+        items = self._workbook._sheets._items
+        if len(items) <= 1:
+            raise FakeComError("마지막 시트는 삭제할 수 없습니다")
+        items.remove(self)
+        if self._workbook._active_sheet is self:
+            self._workbook._active_sheet = items[0]
+        self._workbook._set(Saved=False)
+
+    def _resolve(self, cell: Any) -> Tuple[int, int, int, int]:
+        if isinstance(cell, FakeRange):
+            return cell._bounds
+        return parse_address(str(cell))
+
+    def _clear(self, row1: int, col1: int, row2: int, col2: int):
+        for key in [key for key in self._cells if row1 <= key[0] <= row2 and col1 <= key[1] <= col2]:
+            del self._cells[key]
+        for key in [key for key in self._formulas if row1 <= key[0] <= row2 and col1 <= key[1] <= col2]:
+            del self._formulas[key]
+        self._workbook._set(Saved=False)
+
+    def _is_empty(self, row: int, col: int) -> bool:
+        return self._cells.get((row, col)) in (None, "")
+
+
+# ===========================================
+# Range
+# ===========================================
+
+
+class _FakeCount(_FakeDispatch):
+    """Range.Rows / Range.Columns (Count만 지원)"""
+
+    def __init__(self, app: FakeApplication, count: int):
+        super().__init__(app)
+        self._count = count
+
+    @property
+    def Count(self) -> int:
+        return self._count
+
+
+class FakeRange(_FakeDispatch):
+    """Range (시트의 직사각형 영역)"""
+
+    def __init__(self, app: FakeApplication, sheet: FakeWorksheet, row1: int, col1: int, row2: int, col2: int):
+        super().__init__(app)
+        if not (1 <= row1 <= row2 <= MAX_ROWS and 1 <= col1 <= col2 <= MAX_COLUMNS):
+            raise FakeComError("범위가 시트 경계를 벗어났습니다")
+        self._sheet = sheet
+        self._bounds = (row1, col1, row2, col2)
+
+    # --- 위치/크기 ---
+
+    @property
+    def Address(self) -> str:
+        return format_address(*self._bounds)
+
+    @property
+    def Row(self) -> int:
+        return self._bounds[0]
+
+    @property
+    def Column(self) -> int:
+        return self._bounds[1]
+
+    @property
+    def Rows(self) -> _FakeCount:
+        row1, _, row2, _ = self._bounds
+        return _FakeCount(self._app, row2 - row1 + 1)
+
+    @property
+    def Columns(self) -> _FakeCount:
+        _, col1, _, col2 = self._bounds
+        return _FakeCount(self._app, col2 - col1 + 1)
+
+    @property
+    def Count(self) -> int:
+        row1, col1, row2, col2 = self._bounds
+        return (row2 - row1 + 1) * (col2 - col1 + 1)
+
+    @property
+    def Left(self) -> float:
+        return (self._bounds[1] - 1) * DEFAULT_COLUMN_WIDTH
+
+    @property
+    def Top(self) -> float:
+        return (self._bounds[0] - 1) * DEFAULT_ROW_HEIGHT
+
+    @property
+    def Width(self) -> float:
+        return (self._bounds[3] - self._bounds[1] + 1) * DEFAULT_COLUMN_WIDTH
+
+    @property
+    def Height(self) -> float:
+        return (self._bounds[2] - self._bounds[0] + 1) * DEFAULT_ROW_HEIGHT
+
+    @property
+    def Worksheet(self) -> FakeWorksheet:
+        return self._sheet
+
+    @property
+    def Parent(self) -> FakeWorksheet:
+        return self._sheet
+
+    # --- 값 ---
+
+    @property
+    def Value(self) -> Any:
+        return self._read(self._sheet._cells)
+
+    @Value.setter
+    def Value(self, data: Any):
+        self._write(data)
+
+    @property
+    def Value2(self) -> Any:
+        return self._read(self._sheet._cells)
+
+    @Value2.setter
+    def Value2(self, data: Any):
+        self._write(data)
+
+    @property
+    def Formula(self) -> Any:
+        merged = dict(self._sheet._cells)
+        merged.update(self._sheet._formulas)
+        return self._read(merged)
+
+    @Formula.setter
+    def Formula(self, data: Any):
+        self._write(data)
+
+    @property
+    def Text(self) -> str:
+        value = self._sheet._cells.get(self._bounds[:2])
+        return "" if value is None else str(value)
+
+    @property
+    def NumberFormat(self) -> str:
+        return "General"
+
+    @NumberFormat.setter
+    def NumberFormat(self, value: str):
+        self._sheet._workbook._set(Saved=False)
+
+    def _read(self, cells: Dict[Tuple[int, int], Any]) -> Any:
+        row1, col1, row2, col2 = self._bounds
+        if (row1, col1) == (row2, col2):
+            return cells.get((row1, col1))
+        return tuple(tuple(cells.get((row, col)) for col in range(col1, col2 + 1)) for row in range(row1, row2 + 1))
+
+    def _write(self, data: Any):
+        """COM 대입 규칙: 스칼라는 전체 채움, 배열은 범위 크기에 맞춰 자르고 부족한 칸은 #N/A"""
+        row1, col1, row2, col2 = self._bounds
+        cells = self._sheet._cells
+        formulas = self._sheet._formulas
+
+        if isinstance(data, (list, tuple)):
+            rows = [list(row) if isinstance(row, (list, tuple)) else None for row in data]
+            if not data or any(row is None for row in rows):
+                rows = [list(data)]  # 1차원 배열은 한 행으로 취급하고 모든 행에 반복
+                repeat = True
+            else:
+                repeat = False
+        else:
+            rows, repeat = None, False
+
+        for row in range(row1, row2 + 1):
+            for col in range(col1, col2 + 1):
+                if rows is None:
+                    value = data
+                else:
+                    source = rows[0] if repeat else (rows[row - row1] if row - row1 < len(rows) else None)
+                    if source is None or col - col1 >= len(source):
+                        value = "#N/A"
+                    else:
+                        value = source[col - col1]
+
+                if isinstance(value, str) and value.startswith("="):
+                    formulas[(row, col)] = value
+                else:
+                    formulas.pop((row, col), None)
+
+                if value is None:
+                    cells.pop((row, col), None)
+                else:
+                    cells[(row, col)] = value
+
+        self._sheet._workbook._set(Saved=False)
+
+    # --- 파생 범위 ---
+
+    def Offset(self, RowOffset: int = 0, ColumnOffset: int = 0) -> "FakeRange":
+        row1, col1, row2, col2 = self._bounds
+        return FakeRange(self._app, self._sheet, row1 + RowOffset, col1 + ColumnOffset, row2 + RowOffset, col2 + ColumnOffset)
+
+    def Resize(self, RowSize: Optional[int] = None, ColumnSize: Optional[int] = None) -> "FakeRange":
+        row1, col1, row2, col2 = self._bounds
+        rows = RowSize if RowSize is not None else row2 - row1 + 1
+        cols = ColumnSize if ColumnSize is not None else col2 - col1 + 1
+        return FakeRange(self._app, self._sheet, row1, col1, row1 + rows - 1, col1 + cols - 1)
+
+    def Cells(self, RowIndex: int, ColumnIndex: int) -> "FakeRange":
+        row = self._bounds[0] + RowIndex - 1
+        col = self._bounds[1] + ColumnIndex - 1
+        return FakeRange(self._app, self._sheet, row, col, row, col)
+
+    def End(self, Direction: int) -> "FakeRange":
+        """Ctrl+방향키 이동 규칙 (연속된 값의 끝 또는 다음 값이 있는 셀, 없으면 시트 끝)"""
+        steps = {
+            FakeConstants.xlDown: (1, 0),
+            FakeConstants.xlUp: (-1, 0),
+            FakeConstants.xlToRight: (0, 1),
+            FakeConstants.xlToLeft: (0, -1),
+        }
+        if Direction not in steps:
+            raise FakeComError(f"잘못된 방향: {Direction}")
+
+        d_row, d_col = steps[Direction]
+        sheet = self._sheet
+        row, col = self._bounds[:2]
+        keys = [key for key, value in sheet._cells.items() if value not in (None, "")]
+        limit_row = max([r for r, _ in keys], default=1) + 1
+        limit_col = max([c for _, c in keys], default=1) + 1
+
+        def inside(r: int, c: int) -> bool:
+            return 1 <= r <= min(limit_row, MAX_ROWS) and 1 <= c <= min(limit_col, MAX_COLUMNS)
+
+        next_row, next_col = row + d_row, col + d_col
+        if not sheet._is_empty(row, col) and inside(next_row, next_col) and not sheet._is_empty(next_row, next_col):
+            # 연속된 값의 마지막 셀까지 이동
+            while inside(row + d_row, col + d_col) and not sheet._is_empty(row + d_row, col + d_col):
+                row, col = row + d_row, col + d_col
+        else:
+            # 다음 값이 있는 셀로 이동
+            row, col = next_row, next_col
+            while inside(row, col) and sheet._is_empty(row, col):
+                row, col = row + d_row, col + d_col
+            if not inside(row, col):
+                row = MAX_ROWS if d_row > 0 else (1 if d_row < 0 else self._bounds[0])
+                col = MAX_COLUMNS if d_col > 0 else (1 if d_col < 0 else self._bounds[1])
+
+        return FakeRange(self._app, sheet, row, col, row, col)
+
+    @property
+    def CurrentRegion(self) -> "FakeRange":
+        """빈 행/열로 둘러싸인 연속 영역"""
+        sheet = self._sheet
+        row1, col1, row2, col2 = self._bounds
+
+        def any_value(rows: range, cols: range) -> bool:
+            return any(not sheet._is_empty(r, c) for r in rows for c in cols)
+
+        changed = True
+        while changed:
+            changed = False
+            # 행 방향 확장은 좁은 폭만 검사하므로 한 번에 끝까지 진행
+            left, right = max(1, col1 - 1), min(MAX_COLUMNS, col2 + 1)
+            while row1 > 1 and any_value(range(row1 - 1, row1), range(left, right + 1)):
+                row1 -= 1
+                changed = True
+            while row2 < MAX_ROWS and any_value(range(row2 + 1, row2 + 2), range(left, right + 1)):
+                row2 += 1
+                changed = True
+            top, bottom = max(1, row1 - 1), min(MAX_ROWS, row2 + 1)
+            if col1 > 1 and any_value(range(top, bottom + 1), range(col1 - 1, col1)):
+                col1 -= 1
+                changed = True
+            if col2 < MAX_COLUMNS and any_value(range(top, bottom + 1), range(col2 + 1, col2 + 2)):
+                col2 += 1
+                changed = True
+
+        return FakeRange(self._app, sheet, row1, col1, row2, col2)
+
+    def Clear(self):
+        self._sheet._clear(*self._bounds)
+        # 피벗테이블 영역을 지우면 피벗테이블도 삭제됨
+        row1, col1, row2, col2 = self._bounds
+        pivots = self._sheet._pivot_tables._items
+        for pivot in list(pivots):
+            if row1 <= pivot._row <= row2 and col1 <= pivot._col <= col2:
+                pivots.remove(pivot)
+
+    def ClearContents(self):
+        self._sheet._clear(*self._bounds)
+
+    def Select(self):
+        pass
+
+
+# ===========================================
+# ListObjects (Excel 테이블)
+# ===========================================
+
+
+class FakeListObjects(_FakeCollection):
+    """ListObjects 컬렉션"""
+
+    def __init__(self, app: FakeApplication, sheet: FakeWorksheet):
+        super().__init__(app)
+        self._sheet = sheet
+
+    def Add(
+        self,
+        SourceType: int = FakeConstants.xlSrcRange,
+        Source: Any = None,
+        LinkSource: Any = None,
+        XlListObjectHasHeaders: int = FakeConstants.xlYes,
+        Destination: Any = None,
+        TableStyleName: Any = None,
+    ) -> "FakeListObject":
+        if Source is None:
+            raise FakeComError("Source 범위가 필요합니다")
+        row1, col1, row2, col2 = Source._bounds if isinstance(Source, FakeRange) else parse_address(str(Source))
+
+        for existing in self._items:
+            e_row1, e_col1, e_row2, e_col2 = existing._bounds
+            if not (row2 < e_row1 or e_row2 < row1 or col2 < e_col1 or e_col2 < col1):
+                raise FakeComError("테이블은 다른 테이블과 겹칠 수 없습니다")
+
+        if XlListObjectHasHeaders == FakeConstants.xlNo:
+            # 헤더가 없으면 Excel이 한 행을 밀어 넣고 Column1.. 헤더를 만듦
+            for col in range(col1, col2 + 1):
+                self._sheet._cells[(row1 - 1 if row1 > 1 else row1, col)] = f"Column{col - col1 + 1}"
+
+        names = {lo._name.lower() for sheet in self._sheet._workbook._sheets._items for lo in sheet._list_objects._items}
+        number = 1
+        while f"table{number}" in names:
+            number += 1
+
+        table = FakeListObject(self._app, self._sheet, f"Table{number}", row1, col1, row2, col2)
+        self._items.append(table)
+        self._sheet._workbook._set(Saved=False)
+        return table
+
+
+class FakeListObject(_FakeDispatch):
+    """ListObject (첫 행은 헤더)"""
+
+    def __init__(self, app: FakeApplication, sheet: FakeWorksheet, name: str, row1: int, col1: int, row2: int, col2: int):
+        super().__init__(app)
+        self._sheet = sheet
+        self._name = name
+        self._bounds = (row1, col1, row2, col2)
+        self._set(ShowTotals=False, TableStyle="TableStyleMedium2")
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @Name.setter
+    def Name(self, value: str):
+        self._name = str(value)
+
+    @property
+    def Parent(self) -> FakeWorksheet:
+        return self._sheet
+
+    @property
+    def Range(self) -> FakeRange:
+        return FakeRange(self._app, self._sheet, *self._bounds)
+
+    @property
+    def HeaderRowRange(self) -> FakeRange:
+        row1, col1, _, col2 = self._bounds
+        return FakeRange(self._app, self._sheet, row1, col1, row1, col2)
+
+    @property
+    def DataBodyRange(self) -> Optional[FakeRange]:
+        row1, col1, row2, col2 = self._bounds
+        if row2 <= row1:
+            return None
+        return FakeRange(self._app, self._sheet, row1 + 1, col1, row2, col2)
+
+    @property
+    def ListColumns(self) -> _FakeCollection:
+        row1, col1, _, col2 = self._bounds
+        columns = [FakeListColumn(self._app, self, index, col) for index, col in enumerate(range(col1, col2 + 1), start=1)]
+        return _FakeCollection(self._app, columns)
+
+    @property
+    def ListRows(self) -> _FakeCount:
+        row1, _, row2, _ = self._bounds
+        return _FakeCount(self._app, row2 - row1)
+
+    def Resize(self, Range: FakeRange):
+        self._bounds = Range._bounds
+
+    def Unlist(self):
+        self._sheet._list_objects._items.remove(self)
+
+    def Delete(self):
+        self._sheet._clear(*self._bounds)
+        self._sheet._list_objects._items.remove(self)
+
+
+class FakeListColumn(_FakeDispatch):
+    """ListColumn"""
+
+    def __init__(self, app: FakeApplication, table: FakeListObject, index: int, col: int):
+        super().__init__(app)
+        self._table = table
+        self._index = index
+        self._col = col
+        self._name = str(table._sheet._cells.get((table._bounds[0], col), f"Column{index}"))
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @property
+    def Index(self) -> int:
+        return self._index
+
+    @property
+    def Range(self) -> FakeRange:
+        row1, _, row2, _ = self._table._bounds
+        return FakeRange(self._app, self._table._sheet, row1, self._col, row2, self._col)
+
+    @property
+    def DataBodyRange(self) -> Optional[FakeRange]:
+        row1, _, row2, _ = self._table._bounds
+        if row2 <= row1:
+            return None
+        return FakeRange(self._app, self._table._sheet, row1 + 1, self._col, row2, self._col)
+
+
+# ===========================================
+# ChartObjects
+# ===========================================
+
+
+class FakeChartObjects(_FakeCollection):
+    """ChartObjects 컬렉션"""
+
+    def __init__(self, app: FakeApplication, sheet: FakeWorksheet):
+        super().__init__(app)
+        self._sheet = sheet
+        self._counter = 0
+
+    def Add(self, Left: float, Top: float, Width: float, Height: float) -> "FakeChartObject":
+        self._counter += 1
+        chart_obj = FakeChartObject(self._app, self._sheet, f"Chart {self._counter}", Left, Top, Width, Height)
+        self._items.append(chart_obj)
+        self._sheet._workbook._set(Saved=False)
+        return chart_obj
+
+
+class FakeChartObject(_FakeDispatch):
+    """ChartObject (차트 컨테이너)"""
+
+    def __init__(
+        self, app: FakeApplication, sheet: FakeWorksheet, name: str, left: float, top: float, width: float, height: float
+    ):
+        super().__init__(app)
+        self._sheet = sheet
+        self._name = name
+        self._chart = FakeChart(app, self)
+        self._set(Left=left, Top=top, Width=width, Height=height)
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @Name.setter
+    def Name(self, value: str):
+        self._name = str(value)
+
+    @property
+    def Chart(self) -> "FakeChart":
+        return self._chart
+
+    @property
+    def Parent(self) -> FakeWorksheet:
+        return self._sheet
+
+    def Delete(self):
+        self._sheet._chart_objects._items.remove(self)
+
+
+class _FakeTextHolder(_FakeDispatch):
+    """ChartTitle / Legend 처럼 속성만 가진 하위 객체"""
+
+    def __init__(self, app: FakeApplication, **attributes: Any):
+        super().__init__(app)
+        self._set(**attributes)
+
+
+class FakeSeries(_FakeDispatch):
+    """Series"""
+
+    def __init__(self, app: FakeApplication, formula: str):
+        super().__init__(app)
+        self._set(Formula=formula, HasDataLabels=False)
+
+
+class FakeChart(_FakeDispatch):
+    """Chart"""
+
+    def __init__(self, app: FakeApplication, chart_obj: FakeChartObject):
+        super().__init__(app)
+        self._chart_obj = chart_obj
+        self._series: List[FakeSeries] = []
+        self._set(ChartType=51, HasTitle=False, HasLegend=True, ChartStyle=201)
+        self._set(ChartTitle=_FakeTextHolder(app, Text=""), Legend=_FakeTextHolder(app, Position=-4152))
+
+    @property
+    def Parent(self) -> FakeChartObject:
+        return self._chart_obj
+
+    def SetSourceData(self, Source: Any, PlotBy: Any = None):
+        sheet = self._chart_obj._sheet
+        row1, col1, row2, col2 = Source._bounds if isinstance(Source, FakeRange) else parse_address(str(Source))
+        # 첫 열은 항목, 나머지 열은 계열 (첫 행은 계열 이름)
+        categories = f"'{sheet._name}'!{format_address(row1 + 1, col1, row2, col1)}"
+        self._series = [
+            FakeSeries(
+                self._app,
+                f"=SERIES('{sheet._name}'!{format_address(row1, col, row1, col)},{categories},"
+                f"'{sheet._name}'!{format_address(row1 + 1, col, row2, col)},{index})",
+            )
+            for index, col in enumerate(range(col1 + 1, col2 + 1), start=1)
+        ]
+
+    def SeriesCollection(self, Index: Any = None) -> Any:
+        collection = _FakeCollection(self._app, list(self._series))
+        if Index is None:
+            return collection
+        if isinstance(Index, int) and 1 <= Index <= len(self._series):
+            return self._series[Index - 1]
+        raise FakeComError(f"Subscript out of range: {Index}")
+
+    def Export(self, Filename: str, FilterName: Any = None) -> bool:
+        Path(Filename).write_bytes(b"")
+        return True
+
+
+# ===========================================
+# PivotCaches / PivotTables
+# ===========================================
+
+
+class FakePivotCaches(_FakeCollection):
+    """PivotCaches 컬렉션"""
+
+    def __init__(self, app: FakeApplication, workbook: FakeWorkbook):
+        super().__init__(app)
+        self._workbook = workbook
+
+    def Create(self, SourceType: int, SourceData: Any = None, Version: Any = None) -> "FakePivotCache":
+        if not isinstance(SourceData, FakeRange):
+            raise FakeComError("SourceData는 Range여야 합니다")
+        cache = FakePivotCache(self._app, SourceData)
+        self._items.append(cache)
+        return cache
+
+
+class FakePivotCache(_FakeDispatch):
+    """PivotCache"""
+
+    def __init__(self, app: FakeApplication, source: FakeRange):
+        super().__init__(app)
+        self._source = source
+
+    def CreatePivotTable(self, TableDestination: Any, TableName: str = "", *args, **kwargs) -> "FakePivotTable":
+        if not isinstance(TableDestination, FakeRange):
+            raise FakeComError("TableDestination은 Range여야 합니다")
+        sheet = TableDestination._sheet
+        pivots = sheet._pivot_tables._items
+        name = TableName or f"PivotTable{len(pivots) + 1}"
+        if any(pivot._name.lower() == name.lower() for pivot in pivots):
+            raise FakeComError(f"피벗테이블 이름 '{name}'이(가) 이미 사용 중입니다")
+
+        row, col = TableDestination._bounds[:2]
+        pivot = FakePivotTable(self._app, sheet, name, self._source, row, col)
+        pivots.append(pivot)
+        sheet._workbook._set(Saved=False)
+        return pivot
+
+
+class FakePivotTables(_FakeCollection):
+    """PivotTables 컬렉션"""
+
+    def __init__(self, app: FakeApplication, sheet: FakeWorksheet):
+        super().__init__(app)
+        self._sheet = sheet
+
+
+class FakePivotField(_FakeDispatch):
+    """PivotField"""
+
+    def __init__(self, app: FakeApplication, name: str, position: int):
+        super().__init__(app)
+        self._name = name
+        self._set(Orientation=FakeConstants.xlHidden, Function=FakeConstants.xlSum, Position=position)
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+
+class FakePivotTable(_FakeDispatch):
+    """PivotTable (필드 구성만 보관, 집계하지 않음)"""
+
+    def __init__(self, app: FakeApplication, sheet: FakeWorksheet, name: str, source: FakeRange, row: int, col: int):
+        super().__init__(app)
+        self._sheet = sheet
+        self._name = name
+        self._source = source
+        self._row = row
+        self._col = col
+        row1, col1, _, col2 = source._bounds
+        self._fields = [
+            FakePivotField(app, str(source._sheet._cells.get((row1, c), f"Column{c - col1 + 1}")), c - col1 + 1)
+            for c in range(col1, col2 + 1)
+        ]
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @Name.setter
+    def Name(self, value: str):
+        self._name = str(value)
+
+    @property
+    def SourceData(self) -> str:
+        return f"{self._source._sheet._name}!{self._source.Address}"
+
+    @property
+    def Parent(self) -> FakeWorksheet:
+        return self._sheet
+
+    def PivotFields(self, Index: Any = None) -> Any:
+        collection = _FakeCollection(self._app, list(self._fields))
+        return collection if Index is None else collection._find(Index)
+
+    @property
+    def TableRange1(self) -> FakeRange:
+        return self._table_range()
+
+    @property
+    def TableRange2(self) -> FakeRange:
+        return self._table_range()
+
+    def _table_range(self) -> FakeRange:
+        rows = 1 + sum(1 for field in self._fields if field.__dict__["Orientation"] == FakeConstants.xlRowField) + 1
+        cols = 1 + max(1, sum(1 for field in self._fields if field.__dict__["Orientation"] == FakeConstants.xlDataField))
+        return FakeRange(self._app, self._sheet, self._row, self._col, self._row + rows, self._col + cols - 1)
+
+    def RefreshTable(self) -> bool:
+        return True
+
+
+# ===========================================
+# 녹화 / 재생
+# ===========================================
+
+
+def _encode(value: Any, trace: "CallTrace") -> Any:
+    """COM 값을 JSON으로 변환 (COM 배열은 tuple이므로 list로 저장하고 재생 시 tuple로 복원)"""
+    if isinstance(value, _RecordingProxy):
+        return {"ref": object.__getattribute__(value, "_obj_id")}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, trace) for item in value]
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _decode(value: Any, player: "ReplayApplication") -> Any:
+    if isinstance(value, list):
+        return tuple(_decode(item, player) for item in value)
+    if isinstance(value, dict):
+        if "ref" in value:
+            return _ReplayObject(player, value["ref"])
+        if "datetime" in value:
+            return datetime.datetime.fromisoformat(value["datetime"])
+    return value
+
+
+class CallTrace:
+    """
+    실제 Excel 세션의 COM 호출 기록
+
+    wrap()으로 감싼 애플리케이션에서 일어난 속성 읽기/쓰기, 메서드 호출, 컬렉션 순회를
+    순서대로 기록합니다. 반환된 COM 객체는 번호(ref)로 기록되어 재생 시 같은 객체로 연결됩니다.
+    """
+
+    def __init__(self, events: Optional[List[Dict[str, Any]]] = None):
+        self.events: List[Dict[str, Any]] = events if events is not None else []
+        self._next_id = 1
+
+    def wrap(self, application: Any) -> Any:
+        """녹화용 프록시로 감싼 애플리케이션 (WindowsEngine(application=...)에 전달)"""
+        return _RecordingProxy(application, self, 0)
+
+    def _new_id(self) -> int:
+        obj_id = self._next_id
+        self._next_id += 1
+        return obj_id
+
+    def _result(self, value: Any) -> Any:
+        if hasattr(value, "_oleobj_") and not isinstance(value, _RecordingProxy):
+            return _RecordingProxy(value, self, self._new_id())
+        return value
+
+    def _record(self, event: Dict[str, Any], started: float):
+        event["ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self.events.append(event)
+
+    def save(self, path: str):
+        """녹화 결과를 JSON 파일로 저장"""
+        Path(path).write_text(json.dumps({"version": 1, "events": self.events}, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str) -> "CallTrace":
+        """저장된 녹화 파일 읽기"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data["events"])
+
+
+class _RecordingProxy:
+    """녹화용 COM 프록시"""
+
+    __slots__ = ("_target", "_trace", "_obj_id")
+    _oleobj_ = None
+
+    def __init__(self, target: Any, trace: CallTrace, obj_id: int):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_trace", trace)
+        object.__setattr__(self, "_obj_id", obj_id)
+
+    def _invoke(self, op: str, member: Optional[str], func: Any, args: tuple = (), kwargs: Optional[dict] = None):
+        trace = object.__getattribute__(self, "_trace")
+        kwargs = kwargs or {}
+        event = {"op": op, "obj": object.__getattribute__(self, "_obj_id")}
+        if member is not None:
+            event["member"] = member
+        if args or kwargs:
+            event["args"] = _encode(list(args), trace)
+            event["kwargs"] = {key: _encode(value, trace) for key, value in kwargs.items()}
+
+        raw_args = [object.__getattribute__(a, "_target") if isinstance(a, _RecordingProxy) else a for a in args]
+        raw_kwargs = {
+            key: object.__getattribute__(v, "_target") if isinstance(v, _RecordingProxy) else v for key, v in kwargs.items()
+        }
+
+        started = time.perf_counter()
+        try:
+            value = func(*raw_args, **raw_kwargs)
+        except Exception as e:
+            event["error"] = str(e)
+            trace._record(event, started)
+            raise
+
+        result = trace._result(value)
+        event["result"] = _encode(result, trace)
+        trace._record(event, started)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, "_target")
+        value = getattr(target, name)
+        if name.startswith("_"):
+            return value
+        if callable(value) and not hasattr(value, "_oleobj_"):
+            proxy = self
+
+            def method(*args, **kwargs):
+                return proxy._invoke("call", name, value, args, kwargs)
+
+            return method
+        return self._invoke("get", name, lambda: value)
+
+    def __setattr__(self, name: str, value: Any):
+        target = object.__getattribute__(self, "_target")
+        self._invoke("set", name, lambda v: setattr(target, name, v), (value,))
+
+    def __call__(self, *args, **kwargs):
+        return self._invoke("item", None, object.__getattribute__(self, "_target"), args, kwargs)
+
+    def __iter__(self):
+        trace = object.__getattribute__(self, "_trace")
+        target = object.__getattribute__(self, "_target")
+        items = self._invoke("iter", None, lambda: [trace._result(item) for item in target])
+        return iter(items)
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class ReplayApplication:
+    """
+    CallTrace를 순서대로 재생하는 가짜 Excel.Application
+
+    엔진이 녹화 당시와 다른 멤버를 요청하면 FakeComError를 발생시킵니다.
+
+    Args:
+        trace: 재생할 녹화
+        realtime: True면 녹화된 호출 시간만큼 대기 (실제 지연 재현)
+    """
+
+    constants = FakeConstants
+
+    def __init__(self, trace: CallTrace, realtime: bool = False):
+        self._events = trace.events
+        self._cursor = 0
+        self._realtime = realtime
+        self._root = _ReplayObject(self, 0)
+
+    @property
+    def remaining(self) -> int:
+        """아직 재생되지 않은 이벤트 수"""
+        return len(self._events) - self._cursor
+
+    def _next(self, op: str, obj_id: int, member: Optional[str] = None) -> Any:
+        if self._cursor >= len(self._events):
+            raise FakeComError(f"재생할 호출이 남아 있지 않습니다: {op} {member}")
+
+        event = self._events[self._cursor]
+        if event["op"] != op or event["obj"] != obj_id or event.get("member") != member:
+            raise FakeComError(f"재생 불일치 (#{self._cursor}): 녹화={event['op']} {event.get('member')}, 요청={op} {member}")
+
+        self._cursor += 1
+        if self._realtime:
+            time.sleep(event.get("ms", 0) / 1000)
+        if "error" in event:
+            raise FakeComError(event["error"])
+        return _decode(event.get("result"), self)
+
+    def _has_call(self, obj_id: int, member: str) -> bool:
+        """남은 이벤트에 해당 메서드 호출이 있는지 확인"""
+        return any(
+            event["op"] == "call" and event["obj"] == obj_id and event.get("member") == member
+            for event in self._events[self._cursor :]
+        )
+
+    def _peek(self) -> Optional[Dict[str, Any]]:
+        return self._events[self._cursor] if self._cursor < len(self._events) else None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._root, name)
+
+    def __setattr__(self, name: str, value: Any):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._root, name, value)
+
+
+class _ReplayObject:
+    """재생 중인 COM 객체"""
+
+    __slots__ = ("_player", "_obj_id")
+    _oleobj_ = None
+
+    def __init__(self, player: ReplayApplication, obj_id: int):
+        object.__setattr__(self, "_player", player)
+        object.__setattr__(self, "_obj_id", obj_id)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        player = object.__getattribute__(self, "_player")
+        obj_id = object.__getattribute__(self, "_obj_id")
+        event = player._peek()
+        if event and event["op"] == "get" and event["obj"] == obj_id and event.get("member") == name:
+            return player._next("get", obj_id, name)
+        if not player._has_call(obj_id, name):
+            return player._next("get", obj_id, name)
+        # 메서드 조회는 녹화되지 않음 (인자 평가 중 다른 호출이 끼어들 수 있으므로 호출 시점에 확인)
+        return lambda *args, **kwargs: player._next("call", obj_id, name)
+
+    def __setattr__(self, name: str, value: Any):
+        object.__getattribute__(self, "_player")._next("set", object.__getattribute__(self, "_obj_id"), name)
+
+    def __call__(self, *args, **kwargs):
+        return object.__getattribute__(self, "_player")._next("item", object.__getattribute__(self, "_obj_id"))
+
+    def __iter__(self):
+        items = object.__getattribute__(self, "_player")._next("iter", object.__getattribute__(self, "_obj_id"))
+        return iter(items or ())
+
+    def __bool__(self) -> bool:
+        return True
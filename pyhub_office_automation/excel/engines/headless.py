@@ -0,0 +1,1083 @@
+"""
+헤드리스 Excel 엔진 (openpyxl 기반, 파일 직접 처리)
+
+Excel 애플리케이션 없이 OOXML(.xlsx/.xlsm) 파일을 직접 읽고 씁니다.
+Linux 서버, CI 등 Office가 설치되지 않은 환경에서 사용합니다.
+
+- 읽기: openpyxl read-only 모드로 요청된 범위까지만 스트리밍 파싱
+- 쓰기: 첫 쓰기 시점에 편집 모드로 전환하고, 변경 사항은 파일에 저장
+- 새 워크북: write-only 모드로 생성
+- 테이블 메타데이터: 워크북 전체를 로드하지 않고 zip 내부 table XML에서 직접 수집
+"""
+
+import datetime
+import os
+import posixpath
+import statistics
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+from .base import (
+    DEFAULT_CHUNK_ROWS,
+    ChartInfo,
+    ChunkWriteProgress,
+    ExcelEngineBase,
+    PivotTableInfo,
+    RangeData,
+    ShapeInfo,
+    SlicerInfo,
+    TableInfo,
+    WorkbookInfo,
+    to_2d_list,
+)
+from .exceptions import (
+    EngineInitializationError,
+    PlatformNotSupportedError,
+    RangeError,
+    SheetNotFoundError,
+    TableNotFoundError,
+    WorkbookNotFoundError,
+)
+
+# OOXML 네임스페이스
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_REL_TYPE_TABLE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/table"
+
+# 엔진 이름 (PlatformNotSupportedError 메시지용)
+ENGINE_NAME = "Headless"
+
+
+class HeadlessWorkbook:
+    """
+    헤드리스 엔진의 워크북 핸들
+
+    파일 경로와 openpyxl 워크북 객체를 관리합니다.
+    읽기 전용 워크북(값/공식)과 편집용 워크북을 필요할 때만 로드합니다.
+    """
+
+    def __init__(self, path: Optional[str], name: str):
+        self.path = path
+        self.name = name
+        self.active_sheet: Optional[str] = None
+        self.dirty = False
+        self._readers: Dict[bool, Any] = {}
+        self._writer = None
+
+    # 명령어 레이어 호환 속성 (COM Workbook과 동일한 이름)
+    @property
+    def Name(self) -> str:
+        return self.name
+
+    @property
+    def FullName(self) -> str:
+        return self.path or self.name
+
+    def Save(self):
+        """변경 사항을 파일에 저장 (COM Workbook.Save() 호환)"""
+        self.save()
+
+    @property
+    def is_editing(self) -> bool:
+        """편집 모드 워크북이 로드되어 있는지 여부"""
+        return self._writer is not None
+
+    def reader(self, data_only: bool = True):
+        """
+        읽기용 워크북을 반환합니다.
+
+        편집 중인 워크북이 있으면 저장되지 않은 변경 사항을 반영하기 위해 편집용 워크북을 반환합니다.
+
+        Args:
+            data_only: True면 계산된 값, False면 공식 문자열
+        """
+        if self._writer is not None:
+            return self._writer
+
+        if data_only not in self._readers:
+            from openpyxl import load_workbook
+
+            self._readers[data_only] = load_workbook(self.path, read_only=True, data_only=data_only, keep_links=False)
+        return self._readers[data_only]
+
+    def writer(self):
+        """편집용 워크북을 반환합니다 (최초 호출 시 전체 로드)"""
+        if self._writer is None:
+            from openpyxl import Workbook, load_workbook
+
+            self._close_readers()
+            if self.path and os.path.exists(self.path):
+                keep_vba = self.path.lower().endswith(".xlsm")
+                self._writer = load_workbook(self.path, keep_vba=keep_vba)
+            else:
+                self._writer = Workbook()
+            if self.active_sheet and self.active_sheet in self._writer.sheetnames:
+                self._writer.active = self._writer.sheetnames.index(self.active_sheet)
+        return self._writer
+
+    def save(self):
+        """편집 중인 변경 사항을 파일에 저장합니다"""
+        if self._writer is None or not self.dirty:
+            return
+        if not self.path:
+            raise RuntimeError(f"워크북 '{self.name}'의 저장 경로가 지정되지 않았습니다")
+        self._writer.save(self.path)
+        self.dirty = False
+
+    def close(self):
+        """로드된 모든 워크북 객체를 해제합니다 (저장하지 않음)"""
+        self._close_readers()
+        self._writer = None
+
+    def _close_readers(self):
+        for wb in self._readers.values():
+            try:
+                wb.close()
+            except Exception:
+                pass
+        self._readers.clear()
+
+
+class HeadlessEngine(ExcelEngineBase):
+    """
+    openpyxl 기반 헤드리스 Excel 엔진
+
+    Excel 애플리케이션 없이 파일을 직접 처리합니다.
+    워크북 객체로 HeadlessWorkbook 핸들을 사용합니다.
+
+    Note:
+        - 공식은 재계산되지 않습니다. 값 읽기는 파일에 저장된 마지막 계산 결과를 사용합니다.
+        - 변경 작업은 autosave가 True이면 즉시 파일에 저장됩니다 (프로세스 간 상태 유지).
+        - 차트, 피벗, 슬라이서, 도형 등 Excel 애플리케이션이 필요한 기능은 지원하지 않습니다.
+    """
+
+    supports_tables = True
+    supports_concurrent_workbooks = True
+
+    def __init__(self, autosave: bool = True):
+        """헤드리스 엔진 초기화"""
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            raise EngineInitializationError("HeadlessEngine", "openpyxl 패키지가 설치되지 않았습니다")
+
+        self.autosave = autosave
+        self._workbooks: Dict[str, HeadlessWorkbook] = {}
+        self._active_name: Optional[str] = None
+
+    # ===========================================
+    # 내부 헬퍼
+    # ===========================================
+
+    def _book(self, workbook: Any) -> HeadlessWorkbook:
+        """워크북 인자를 HeadlessWorkbook 핸들로 변환"""
+        if isinstance(workbook, HeadlessWorkbook):
+            return workbook
+        name = workbook if isinstance(workbook, str) else str(workbook)
+        return self.get_workbook_by_name(name)
+
+    def _register(self, book: HeadlessWorkbook) -> HeadlessWorkbook:
+        self._workbooks[book.name] = book
+        self._active_name = book.name
+        return book
+
+    def _commit(self, book: HeadlessWorkbook):
+        """변경 작업 후 호출 - autosave면 파일에 저장"""
+        book.dirty = True
+        if self.autosave and book.path:
+            book.save()
+
+    def _sheet(self, wb: Any, sheet: str):
+        if sheet not in wb.sheetnames:
+            raise SheetNotFoundError(sheet)
+        return wb[sheet]
+
+    def _active_sheet_name(self, book: HeadlessWorkbook, wb: Any) -> str:
+        if book.active_sheet and book.active_sheet in wb.sheetnames:
+            return book.active_sheet
+        try:
+            return wb.active.title
+        except Exception:
+            return wb.sheetnames[0]
+
+    def _unsupported(self, feature: str):
+        raise PlatformNotSupportedError(ENGINE_NAME, feature)
+
+    @staticmethod
+    def _address(min_col: int, min_row: int, max_col: int, max_row: int) -> str:
+        """좌표를 COM 스타일 절대 주소로 변환 (예: $A$1:$C$10)"""
+        from openpyxl.utils import get_column_letter
+
+        start = f"${get_column_letter(min_col)}${min_row}"
+        if min_col == max_col and min_row == max_row:
+            return start
+        return f"{start}:${get_column_letter(max_col)}${max_row}"
+
+    @staticmethod
+    def _bounds(ws: Any, range_str: str) -> Tuple[int, int, int, int]:
+        """범위 문자열을 (min_col, min_row, max_col, max_row)로 변환 (열/행 전체 참조 지원)"""
+        from openpyxl.utils import range_boundaries
+
+        min_col, min_row, max_col, max_row = range_boundaries(range_str.replace("$", "").upper())
+        if min_row is None or max_row is None or min_col is None or max_col is None:
+            if getattr(ws, "max_row", None) is None and hasattr(ws, "calculate_dimension"):
+                ws.reset_dimensions()
+                ws.calculate_dimension(force=True)
+            min_row = min_row or 1
+            min_col = min_col or 1
+            max_row = max_row or max(ws.max_row or 1, min_row)
+            max_col = max_col or max(ws.max_column or 1, min_col)
+        return min_col, min_row, max_col, max_row
+
+    @staticmethod
+    def _iter_rows(ws: Any, min_col: int, min_row: int, max_col: int, max_row: int):
+        """지정 범위의 행을 값 튜플로 순회"""
+        return ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+
+    def _expand(self, ws: Any, bounds: Tuple[int, int, int, int], mode: str) -> Tuple[int, int, int, int]:
+        """
+        범위 확장 (xlwings expand와 동일한 규칙)
+
+        - down: 시작 열 기준 아래로 연속된 값이 있는 곳까지
+        - right: 시작 행 기준 오른쪽으로 연속된 값이 있는 곳까지
+        - table: down 후 right
+        """
+        min_col, min_row, max_col, max_row = bounds
+        mode = mode.lower()
+
+        if mode in ("down", "table"):
+            last = max_row
+            for (value,) in self._iter_rows(ws, min_col, max_row + 1, min_col, ws.max_row or max_row):
+                if value is None:
+                    break
+                last += 1
+            max_row = last
+
+        if mode in ("right", "table"):
+            last = max_col
+            for row in self._iter_rows(ws, max_col + 1, min_row, ws.max_column or max_col, min_row):
+                for value in row:
+                    if value is None:
+                        break
+                    last += 1
+                break
+            max_col = last
+
+        return min_col, min_row, max_col, max_row
+
+    def _table_entries(self, book: HeadlessWorkbook) -> List[Dict[str, Any]]:
+        """
+        워크북의 모든 테이블 정의를 수집합니다.
+
+        편집 중이면 openpyxl 객체에서, 아니면 zip 내부 table XML에서 직접 읽습니다.
+        (read-only 워크시트는 테이블 정보를 제공하지 않기 때문)
+
+        Returns:
+            [{"name", "sheet", "ref", "headers", "header_rows", "totals_rows"}, ...]
+        """
+        if book.is_editing:
+            entries = []
+            wb = book.writer()
+            for ws in wb.worksheets:
+                for table in ws.tables.values():
+                    entries.append(
+                        {
+                            "name": table.displayName or table.name,
+                            "sheet": ws.title,
+                            "ref": table.ref,
+                            "headers": [col.name for col in table.tableColumns],
+                            "header_rows": 1 if table.headerRowCount is None else int(table.headerRowCount),
+                            "totals_rows": int(table.totalsRowCount or 0),
+                        }
+                    )
+            return entries
+
+        return _read_table_parts(book.path) if book.path else []
+
+    def _find_table(self, book: HeadlessWorkbook, table_name: str) -> Dict[str, Any]:
+        for entry in self._table_entries(book):
+            if entry["name"] == table_name:
+                return entry
+        raise TableNotFoundError(table_name)
+
+    # ===========================================
+    # 워크북 관리 (4개 명령어)
+    # ===========================================
+
+    def get_workbooks(self) -> List[WorkbookInfo]:
+        """엔진에서 연 워크북 목록 조회"""
+        workbooks = []
+        for book in self._workbooks.values():
+            try:
+                info = self.get_workbook_info(book)
+            except Exception:
+                continue
+            workbooks.append(
+                WorkbookInfo(
+                    name=info["name"],
+                    saved=info["saved"],
+                    full_name=info["full_name"],
+                    sheet_count=info["sheet_count"],
+                    active_sheet=info["active_sheet"],
+                    file_size_bytes=info.get("file_size_bytes"),
+                    last_modified=info.get("last_modified"),
+                )
+            )
+        return workbooks
+
+    def get_workbook_info(self, workbook: Any) -> Dict[str, Any]:
+        """워크북 상세 정보 조회"""
+        book = self._book(workbook)
+        wb = book.reader()
+
+        info = {
+            "name": book.name,
+            "full_name": book.FullName,
+            "saved": not book.dirty,
+            "sheet_count": len(wb.sheetnames),
+            "active_sheet": self._active_sheet_name(book, wb),
+            "sheets": list(wb.sheetnames),
+        }
+
+        if book.path and os.path.exists(book.path):
+            file_stat = os.stat(book.path)
+            info["file_size_bytes"] = file_stat.st_size
+            info["last_modified"] = datetime.datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+
+        return info
+
+    def open_workbook(self, file_path: str, visible: bool = False) -> Any:
+        """워크북 열기 (실제 파싱은 첫 접근 시 수행)"""
+        abs_path = str(Path(file_path).resolve())
+
+        if not os.path.exists(abs_path):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {abs_path}")
+
+        name = os.path.basename(abs_path)
+        existing = self._workbooks.get(name)
+        if existing is not None and existing.path == abs_path:
+            self._active_name = name
+            return existing
+
+        return self._register(HeadlessWorkbook(abs_path, name))
+
+    def create_workbook(self, save_path: Optional[str] = None, visible: bool = False) -> Any:
+        """새 워크북 생성 (저장 경로가 있으면 write-only 모드로 즉시 저장)"""
+        from openpyxl import Workbook
+
+        if save_path:
+            abs_path = str(Path(save_path).resolve())
+            wb = Workbook(write_only=True)
+            wb.create_sheet("Sheet1")
+            wb.save(abs_path)
+            book = HeadlessWorkbook(abs_path, os.path.basename(abs_path))
+        else:
+            index = 1
+            while f"Book{index}" in self._workbooks:
+                index += 1
+            book = HeadlessWorkbook(None, f"Book{index}")
+            book.writer()
+            book.dirty = True
+
+        return self._register(book)
+
+    # ===========================================
+    # 시트 관리 (4개 명령어)
+    # ===========================================
+
+    def activate_sheet(self, workbook: Any, sheet_name: str):
+        """시트 활성화"""
+        book = self._book(workbook)
+        wb = book.writer()
+        self._sheet(wb, sheet_name)
+        wb.active = wb.sheetnames.index(sheet_name)
+        book.active_sheet = sheet_name
+        self._commit(book)
+
+    def add_sheet(self, workbook: Any, name: str, before: Optional[str] = None) -> str:
+        """시트 추가"""
+        book = self._book(workbook)
+        wb = book.writer()
+
+        if name in wb.sheetnames:
+            raise ValueError(f"시트 '{name}'이 이미 존재합니다")
+
+        if before:
+            if before not in wb.sheetnames:
+                raise SheetNotFoundError(before)
+            new_sheet = wb.create_sheet(name, wb.sheetnames.index(before))
+        else:
+            new_sheet = wb.create_sheet(name)
+
+        self._commit(book)
+        return new_sheet.title
+
+    def delete_sheet(self, workbook: Any, sheet_name: str):
+        """시트 삭제"""
+        book = self._book(workbook)
+        wb = book.writer()
+
+        ws = self._sheet(wb, sheet_name)
+        if len(wb.sheetnames) <= 1:
+            raise RuntimeError("마지막 시트는 삭제할 수 없습니다")
+
+        wb.remove(ws)
+        if book.active_sheet == sheet_name:
+            book.active_sheet = None
+        self._commit(book)
+
+    def rename_sheet(self, workbook: Any, old_name: str, new_name: str):
+        """시트 이름 변경"""
+        book = self._book(workbook)
+        wb = book.writer()
+
+        if new_name in wb.sheetnames:
+            raise ValueError(f"시트 '{new_name}'이 이미 존재합니다")
+
+        ws = self._sheet(wb, old_name)
+        ws.title = new_name
+        if book.active_sheet == old_name:
+            book.active_sheet = new_name
+        self._commit(book)
+
+    # ===========================================
+    # 데이터 읽기/쓰기 (2개 명령어)
+    # ===========================================
+
+    def read_range(
+        self, workbook: Any, sheet: str, range_str: str, expand: Optional[str] = None, include_formulas: bool = True
+    ) -> RangeData:
+        """셀 범위 데이터 읽기 (요청된 범위까지만 스트리밍 파싱)"""
+        book = self._book(workbook)
+        ws = self._sheet(book.reader(), sheet)
+
+        try:
+            bounds = self._bounds(ws, range_str)
+            if expand:
+                bounds = self._expand(ws, bounds, expand)
+            min_col, min_row, max_col, max_row = bounds
+
+            values = [list(row) for row in self._iter_rows(ws, *bounds)]
+
+            formulas = None
+            if include_formulas:
+                formula_ws = self._sheet(book.reader(data_only=False), sheet)
+                formulas = [list(row) for row in self._iter_rows(formula_ws, *bounds)]
+
+        except (SheetNotFoundError, RangeError):
+            raise
+        except Exception as e:
+            raise RangeError(range_str, str(e))
+
+        row_count = max_row - min_row + 1
+        column_count = max_col - min_col + 1
+
+        # COM과 동일하게 단일 셀은 스칼라로 반환
+        if row_count == 1 and column_count == 1:
+            values = values[0][0] if values and values[0] else None
+            if formulas is not None:
+                formulas = formulas[0][0] if formulas and formulas[0] else None
+
+        return RangeData(
+            values=values,
+            formulas=formulas,
+            address=self._address(min_col, min_row, max_col, max_row),
+            sheet_name=sheet,
+            row_count=row_count,
+            column_count=column_count,
+            cells_count=row_count * column_count,
+        )
+
+    def read_range_iter(
+        self,
+        workbook: Any,
+        sheet: str,
+        range_str: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        expand: Optional[str] = None,
+    ) -> Iterator[List[List[Any]]]:
+        """셀 범위를 행 스트림으로 읽어 chunk_rows행씩 반환"""
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows는 1 이상이어야 합니다")
+
+        book = self._book(workbook)
+        ws = self._sheet(book.reader(), sheet)
+
+        try:
+            bounds = self._bounds(ws, range_str)
+            if expand:
+                bounds = self._expand(ws, bounds, expand)
+        except Exception as e:
+            raise RangeError(range_str, str(e))
+
+        chunk = []
+        for row in self._iter_rows(ws, *bounds):
+            chunk.append(list(row))
+            if len(chunk) >= chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def write_range(self, workbook: Any, sheet: str, range_str: str, data: Any, include_formulas: bool = False):
+        """셀 범위에 데이터 쓰기 (range_str의 시작 셀 기준)"""
+        book = self._book(workbook)
+        ws = self._sheet(book.writer(), sheet)
+
+        try:
+            min_col, min_row, _, _ = self._bounds(ws, range_str.split(":")[0])
+            for r, row in enumerate(to_2d_list(data)):
+                for c, value in enumerate(row):
+                    ws.cell(row=min_row + r, column=min_col + c, value=value)
+        except (SheetNotFoundError, RangeError):
+            raise
+        except Exception as e:
+            raise RangeError(range_str, str(e))
+
+        self._commit(book)
+
+    def write_range_chunked(
+        self,
+        workbook: Any,
+        sheet: str,
+        start_cell: str,
+        rows: Iterable[List[Any]],
+        chunk_rows: Optional[int] = None,
+        start_offset: int = 0,
+        progress_callback: Optional[Callable[[ChunkWriteProgress], None]] = None,
+    ) -> ChunkWriteProgress:
+        """청크 단위 쓰기 (파일 저장은 청크마다가 아니라 마지막에 한 번)"""
+        book = self._book(workbook)
+        progress = super().write_range_chunked(workbook, sheet, start_cell, rows, chunk_rows, start_offset, progress_callback)
+        self._commit(book)
+        return progress
+
+    def _write_chunk(self, workbook: Any, sheet: str, start_cell: str, row_offset: int, chunk: List[List[Any]]):
+        """청크 1개를 편집 중인 워크북에 기록 (저장하지 않음)"""
+        ws = self._sheet(self._book(workbook).writer(), sheet)
+
+        try:
+            min_col, min_row, _, _ = self._bounds(ws, start_cell)
+        except Exception as e:
+            raise RangeError(start_cell, str(e))
+
+        for r, row in enumerate(chunk, start=min_row + row_offset):
+            for c, value in enumerate(row, start=min_col):
+                ws.cell(row=r, column=c, value=value)
+
+    # ===========================================
+    # 테이블 (5개 명령어)
+    # ===========================================
+
+    def list_tables(self, workbook: Any, sheet: Optional[str] = None) -> List[TableInfo]:
+        """테이블 목록 조회"""
+        book = self._book(workbook)
+        wb = book.reader()
+
+        if sheet and sheet not in wb.sheetnames:
+            raise SheetNotFoundError(sheet)
+
+        tables = []
+        for entry in self._table_entries(book):
+            if sheet and entry["sheet"] != sheet:
+                continue
+
+            ws = wb[entry["sheet"]]
+            min_col, min_row, max_col, max_row = self._bounds(ws, entry["ref"])
+            body_start = min_row + entry["header_rows"]
+            body_end = max_row - entry["totals_rows"]
+            row_count = max(0, body_end - body_start + 1)
+
+            # 샘플 데이터 (최대 5행)
+            sample_data = None
+            if row_count > 0:
+                sample_end = min(body_end, body_start + 4)
+                sample_data = [list(row) for row in self._iter_rows(ws, min_col, body_start, max_col, sample_end)]
+
+            tables.append(
+                TableInfo(
+                    name=entry["name"],
+                    sheet_name=entry["sheet"],
+                    address=self._address(min_col, min_row, max_col, max_row),
+                    row_count=row_count,
+                    column_count=max_col - min_col + 1,
+                    headers=entry["headers"],
+                    sample_data=sample_data,
+                )
+            )
+
+        return tables
+
+    def get_table_sheet_name(self, workbook: Any, table_name: str) -> str:
+        """테이블이 있는 시트 이름 (테이블 파트 정의에서 조회)"""
+        return self._find_table(self._book(workbook), table_name)["sheet"]
+
+    def read_table(
+        self,
+        workbook: Any,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """테이블 데이터 읽기 (offset/limit 구간만 파싱)"""
+        book = self._book(workbook)
+        entry = self._find_table(book, table_name)
+        ws = book.reader()[entry["sheet"]]
+
+        min_col, min_row, max_col, max_row = self._bounds(ws, entry["ref"])
+        headers = list(entry["headers"])
+
+        body_start = min_row + entry["header_rows"] + max(0, offset or 0)
+        body_end = max_row - entry["totals_rows"]
+        if limit:
+            body_end = min(body_end, body_start + limit - 1)
+
+        data = []
+        if body_end >= body_start:
+            data = [list(row) for row in self._iter_rows(ws, min_col, body_start, max_col, body_end)]
+
+        # 컬럼 필터링
+        if columns:
+            col_indices = [headers.index(col) for col in columns if col in headers]
+            data = [[row[i] for i in col_indices] for row in data]
+            headers = [headers[i] for i in col_indices]
+
+        return {"table_name": table_name, "headers": headers, "data": data, "row_count": len(data)}
+
+    def write_table(self, workbook: Any, sheet: str, table_name: str, data: List[List[Any]], start_cell: str = "A1"):
+        """테이블에 데이터 쓰기 (헤더 포함 데이터를 쓰고 Excel 테이블로 변환)"""
+        book = self._book(workbook)
+        wb = book.writer()
+        ws = self._sheet(wb, sheet)
+
+        rows = to_2d_list(data)
+        if not rows or not rows[0]:
+            return
+
+        min_col, min_row, _, _ = self._bounds(ws, start_cell)
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                ws.cell(row=min_row + r, column=min_col + c, value=value)
+
+        # 테이블로 변환 (실패는 경고 없이 무시 - WindowsEngine과 동일)
+        try:
+            from openpyxl.worksheet.table import Table, TableStyleInfo
+
+            if table_name in ws.tables:
+                del ws.tables[table_name]
+
+            ref = self._address(min_col, min_row, min_col + len(rows[0]) - 1, min_row + len(rows) - 1).replace("$", "")
+            table = Table(displayName=table_name, ref=ref)
+            table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium2", showRowStripes=True)
+            ws.add_table(table)
+        except Exception:
+            pass
+
+        self._commit(book)
+
+    def analyze_table(self, workbook: Any, table_name: str) -> Dict[str, Any]:
+        """테이블 데이터 분석"""
+        table_data = self.read_table(workbook, table_name)
+
+        return {
+            "table_name": table_name,
+            "row_count": table_data["row_count"],
+            "column_count": len(table_data["headers"]),
+            "headers": table_data["headers"],
+            "sample_data": table_data["data"][:5] if table_data["data"] else [],
+        }
+
+    def generate_metadata(self, workbook: Any) -> Dict[str, Any]:
+        """워크북 메타데이터 생성"""
+        book = self._book(workbook)
+        wb = book.reader()
+
+        tables_by_sheet: Dict[str, List[Dict[str, str]]] = {}
+        for entry in self._table_entries(book):
+            tables_by_sheet.setdefault(entry["sheet"], []).append({"name": entry["name"], "address": entry["ref"]})
+
+        metadata = {
+            "workbook_name": book.name,
+            "sheet_count": len(wb.sheetnames),
+            "sheets": [],
+        }
+
+        for ws in wb.worksheets:
+            used_range = None
+            try:
+                used_range = self._address(*self._bounds(ws, ws.calculate_dimension()))
+            except Exception:
+                pass
+
+            metadata["sheets"].append(
+                {"name": ws.title, "tables": tables_by_sheet.get(ws.title, []), "used_range": used_range}
+            )
+
+        return metadata
+
+    # ===========================================
+    # 차트 (7개 명령어) - 미지원
+    # ===========================================
+
+    def add_chart(
+        self,
+        workbook: Any,
+        sheet: str,
+        data_range: str,
+        chart_type: str,
+        position: str,
+        width: int = 400,
+        height: int = 300,
+        title: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """차트 생성 (미지원)"""
+        self._unsupported("차트 생성")
+
+    def list_charts(self, workbook: Any, sheet: Optional[str] = None) -> List[ChartInfo]:
+        """차트 목록 조회 (미지원)"""
+        self._unsupported("차트 목록 조회")
+
+    def configure_chart(self, workbook: Any, chart_name: str, **kwargs):
+        """차트 설정 (미지원)"""
+        self._unsupported("차트 설정")
+
+    def position_chart(self, workbook: Any, sheet: str, chart_name: str, left: int, top: int, width: int, height: int):
+        """차트 위치 조정 (미지원)"""
+        self._unsupported("차트 위치 조정")
+
+    def export_chart(self, workbook: Any, sheet: str, chart_name: str, output_path: str, image_format: str = "png"):
+        """차트 내보내기 (미지원)"""
+        self._unsupported("차트 내보내기")
+
+    def delete_chart(self, workbook: Any, sheet: str, chart_name: str):
+        """차트 삭제 (미지원)"""
+        self._unsupported("차트 삭제")
+
+    def create_pivot_chart(
+        self,
+        workbook: Any,
+        source_sheet: str,
+        source_range: str,
+        dest_sheet: str,
+        dest_range: str,
+        chart_type: str = "column",
+        **kwargs,
+    ) -> str:
+        """피벗 차트 생성 (미지원)"""
+        self._unsupported("피벗 차트 생성")
+
+    # ===========================================
+    # 헬퍼 메서드 (워크북 객체 접근)
+    # ===========================================
+
+    def get_active_workbook(self) -> Any:
+        """엔진에서 마지막으로 연 워크북 반환"""
+        if self._active_name is None or self._active_name not in self._workbooks:
+            raise WorkbookNotFoundError("활성 워크북 (헤드리스 엔진에서는 --file-path로 파일을 지정하세요)")
+        return self._workbooks[self._active_name]
+
+    def get_workbook_by_name(self, name: str) -> Any:
+        """이름으로 워크북 핸들 찾기"""
+        book = self._workbooks.get(name)
+        if book is None:
+            raise WorkbookNotFoundError(name)
+        return book
+
+    # ===========================================
+    # 피벗 테이블 (5개 명령어) - 미지원
+    # ===========================================
+
+    def create_pivot_table(
+        self,
+        workbook: Any,
+        source_sheet: str,
+        source_range: str,
+        dest_sheet: str,
+        dest_cell: str,
+        pivot_name: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """피벗 테이블 생성 (미지원)"""
+        self._unsupported("피벗 테이블 생성")
+
+    def configure_pivot_table(
+        self,
+        workbook: Any,
+        sheet: str,
+        pivot_name: str,
+        row_fields: Optional[List[str]] = None,
+        column_fields: Optional[List[str]] = None,
+        value_fields: Optional[List[Tuple[str, str]]] = None,
+        filter_fields: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        """피벗 테이블 설정 (미지원)"""
+        self._unsupported("피벗 테이블 설정")
+
+    def refresh_pivot_table(self, workbook: Any, sheet: str, pivot_name: str):
+        """피벗 테이블 새로고침 (미지원)"""
+        self._unsupported("피벗 테이블 새로고침")
+
+    def delete_pivot_table(self, workbook: Any, sheet: str, pivot_name: str):
+        """피벗 테이블 삭제 (미지원)"""
+        self._unsupported("피벗 테이블 삭제")
+
+    def list_pivot_tables(self, workbook: Any, sheet: Optional[str] = None) -> List[PivotTableInfo]:
+        """피벗 테이블 목록 조회 (미지원)"""
+        self._unsupported("피벗 테이블 목록 조회")
+
+    # ===========================================
+    # 슬라이서 (4개 명령어) - 미지원
+    # ===========================================
+
+    def add_slicer(
+        self,
+        workbook: Any,
+        sheet: str,
+        pivot_name: str,
+        field_name: str,
+        left: int,
+        top: int,
+        width: int = 200,
+        height: int = 150,
+        slicer_name: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """슬라이서 추가 (미지원)"""
+        self._unsupported("슬라이서 추가")
+
+    def list_slicers(self, workbook: Any, sheet: Optional[str] = None) -> List[SlicerInfo]:
+        """슬라이서 목록 조회 (미지원)"""
+        self._unsupported("슬라이서 목록 조회")
+
+    def position_slicer(
+        self,
+        workbook: Any,
+        sheet: str,
+        slicer_name: str,
+        left: int,
+        top: int,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ):
+        """슬라이서 위치 조정 (미지원)"""
+        self._unsupported("슬라이서 위치 조정")
+
+    def connect_slicer(self, workbook: Any, slicer_name: str, pivot_names: List[str]):
+        """슬라이서 연결 (미지원)"""
+        self._unsupported("슬라이서 연결")
+
+    # ===========================================
+    # 도형 (5개 명령어) - 미지원
+    # ===========================================
+
+    def add_shape(
+        self,
+        workbook: Any,
+        sheet: str,
+        shape_type: str,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        shape_name: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """도형 추가 (미지원)"""
+        self._unsupported("도형 추가")
+
+    def delete_shape(self, workbook: Any, sheet: str, shape_name: str):
+        """도형 삭제 (미지원)"""
+        self._unsupported("도형 삭제")
+
+    def list_shapes(self, workbook: Any, sheet: str) -> List[ShapeInfo]:
+        """도형 목록 조회 (미지원)"""
+        self._unsupported("도형 목록 조회")
+
+    def format_shape(self, workbook: Any, sheet: str, shape_name: str, **kwargs):
+        """도형 서식 설정 (미지원)"""
+        self._unsupported("도형 서식 설정")
+
+    def group_shapes(self, workbook: Any, sheet: str, shape_names: List[str], group_name: Optional[str] = None) -> str:
+        """도형 그룹화 (미지원)"""
+        self._unsupported("도형 그룹화")
+
+    # ===========================================
+    # 테이블 추가 기능 (4개 명령어)
+    # ===========================================
+
+    def create_table(
+        self, workbook: Any, sheet: str, range_str: str, table_name: Optional[str] = None, has_headers: bool = True, **kwargs
+    ) -> Dict[str, Any]:
+        """Excel 테이블 생성"""
+        from openpyxl.worksheet.table import Table, TableStyleInfo
+
+        book = self._book(workbook)
+        wb = book.writer()
+        ws = self._sheet(wb, sheet)
+
+        existing = {entry["name"] for entry in self._table_entries(book)}
+        if not table_name:
+            index = 1
+            while f"Table{index}" in existing:
+                index += 1
+            table_name = f"Table{index}"
+        elif table_name in existing:
+            raise ValueError(f"테이블 '{table_name}'이 이미 존재합니다")
+
+        min_col, min_row, max_col, max_row = self._bounds(ws, range_str)
+        ref = self._address(min_col, min_row, max_col, max_row).replace("$", "")
+
+        if not has_headers:
+            # 헤더가 없으면 한 행 위에 기본 헤더(Column1...) 삽입 - Excel 동작과 동일
+            ws.insert_rows(min_row)
+            for i in range(max_col - min_col + 1):
+                ws.cell(row=min_row, column=min_col + i, value=f"Column{i + 1}")
+            ref = self._address(min_col, min_row, max_col, max_row + 1).replace("$", "")
+
+        table = Table(displayName=table_name, ref=ref)
+        table.tableStyleInfo = TableStyleInfo(name=kwargs.get("table_style") or "TableStyleMedium2", showRowStripes=True)
+        ws.add_table(table)
+
+        self._commit(book)
+
+        return {"name": table_name, "sheet": sheet, "range": self._address(*self._bounds(ws, ref))}
+
+    def sort_table(self, workbook: Any, sheet: str, table_name: str, sort_fields: List[Tuple[str, str]]):
+        """테이블 정렬 (미지원)"""
+        self._unsupported("테이블 정렬")
+
+    def clear_table_sort(self, workbook: Any, sheet: str, table_name: str):
+        """테이블 정렬 해제 (미지원)"""
+        self._unsupported("테이블 정렬 해제")
+
+    def get_table_sort_info(self, workbook: Any, sheet: str, table_name: str) -> Dict[str, Any]:
+        """테이블 정렬 정보 조회 (미지원)"""
+        self._unsupported("테이블 정렬 정보 조회")
+
+    # ===========================================
+    # 데이터 변환 (3개 명령어)
+    # ===========================================
+
+    def analyze_data(self, workbook: Any, sheet: str, range_str: str, **kwargs) -> Dict[str, Any]:
+        """데이터 분석 (기본 통계)"""
+        values = to_2d_list(self.read_range(workbook, sheet, range_str, include_formulas=False).values)
+
+        result = {"columns": []}
+        for col_idx in range(len(values[0]) if values else 0):
+            col_values = [row[col_idx] for row in values if row[col_idx] is not None]
+            numeric_values = [v for v in col_values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+
+            col_stats = {"column_index": col_idx + 1, "count": len(col_values), "numeric_count": len(numeric_values)}
+            if numeric_values:
+                col_stats.update(
+                    {
+                        "mean": statistics.mean(numeric_values),
+                        "median": statistics.median(numeric_values),
+                        "min": min(numeric_values),
+                        "max": max(numeric_values),
+                    }
+                )
+            result["columns"].append(col_stats)
+
+        return result
+
+    def transform_data(self, workbook: Any, sheet: str, range_str: str, transform_type: str, **kwargs):
+        """데이터 변환 (transpose)"""
+        if transform_type.lower() != "transpose":
+            raise ValueError(f"지원하지 않는 변환 유형: {transform_type}")
+
+        values = to_2d_list(self.read_range(workbook, sheet, range_str, include_formulas=False).values)
+        transposed = [list(row) for row in zip(*values)]
+        self.write_range(workbook, sheet, range_str, transposed)
+
+    def convert_range(self, workbook: Any, sheet: str, range_str: str, target_type: str, **kwargs):
+        """셀 범위 표시 형식 변환"""
+        formats = {"number": "0.00", "text": "@", "date": "yyyy-mm-dd"}
+        number_format = formats.get(target_type.lower())
+        if number_format is None:
+            raise ValueError(f"지원하지 않는 데이터 타입: {target_type}")
+
+        book = self._book(workbook)
+        ws = self._sheet(book.writer(), sheet)
+        min_col, min_row, max_col, max_row = self._bounds(ws, range_str)
+        for row in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+            for cell in row:
+                cell.number_format = number_format
+
+        self._commit(book)
+
+
+# ===========================================
+# OOXML 테이블 파트 파서
+# ===========================================
+
+
+def _read_table_parts(path: str) -> List[Dict[str, Any]]:
+    """
+    xlsx zip 내부의 table XML을 직접 읽어 테이블 정의를 수집합니다.
+
+    workbook.xml → 시트별 rels → tableN.xml 순으로 따라가며,
+    셀 데이터는 전혀 파싱하지 않습니다.
+    """
+    entries = []
+
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+
+        workbook_xml = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+        workbook_rels = _read_rels(archive, "xl/_rels/workbook.xml.rels", names)
+
+        for sheet_el in workbook_xml.iter(f"{{{_NS_MAIN}}}sheet"):
+            sheet_name = sheet_el.get("name")
+            target = workbook_rels.get(sheet_el.get(f"{{{_NS_REL}}}id"))
+            if not target:
+                continue
+
+            sheet_path = _resolve_part("xl/workbook.xml", target)
+            sheet_rels_path = posixpath.join(posixpath.dirname(sheet_path), "_rels", posixpath.basename(sheet_path) + ".rels")
+            sheet_rels = _read_rels(archive, sheet_rels_path, names, rel_type=_REL_TYPE_TABLE)
+
+            for table_target in sheet_rels.values():
+                table_path = _resolve_part(sheet_path, table_target)
+                if table_path not in names:
+                    continue
+
+                table_el = ElementTree.fromstring(archive.read(table_path))
+                entries.append(
+                    {
+                        "name": table_el.get("displayName") or table_el.get("name"),
+                        "sheet": sheet_name,
+                        "ref": table_el.get("ref"),
+                        "headers": [col.get("name") for col in table_el.iter(f"{{{_NS_MAIN}}}tableColumn")],
+                        "header_rows": int(table_el.get("headerRowCount", "1")),
+                        "totals_rows": int(table_el.get("totalsRowCount", "0")),
+                    }
+                )
+
+    return entries
+
+
+def _read_rels(archive: zipfile.ZipFile, rels_path: str, names: set, rel_type: Optional[str] = None) -> Dict[str, str]:
+    """rels 파일을 {Id: Target} 딕셔너리로 읽기"""
+    if rels_path not in names:
+        return {}
+
+    rels = {}
+    for rel in ElementTree.fromstring(archive.read(rels_path)).iter(f"{{{_NS_PKG_REL}}}Relationship"):
+        if rel_type and rel.get("Type") != rel_type:
+            continue
+        rels[rel.get("Id")] = rel.get("Target")
+    return rels
+
+
+def _resolve_part(source_part: str, target: str) -> str:
+    """rels Target을 zip 내부 절대 경로로 변환"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
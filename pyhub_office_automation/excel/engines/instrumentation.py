@@ -0,0 +1,233 @@
+"""
+COM 호출 계측 (--profile)
+
+WindowsEngine의 Excel.Application 디스패치 객체를 ComProxy로 감싸서
+모든 속성 읽기/쓰기와 메서드 호출을 멤버 이름별로 세고 소요 시간을 기록합니다.
+명령어가 느린 원인, 특히 시트마다 ListObjects를 조회하는 식의 N+1 COM 접근 패턴을 찾는 데 사용합니다.
+
+사용 예:
+    oa --profile excel table-read --table-name "Sales"
+
+응답 JSON의 "profile" 항목에 호출 수, 가장 느린/가장 많이 호출된 멤버,
+COM 시간과 Python 시간이 포함됩니다.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+# 요약에 포함할 멤버 수 기본값
+DEFAULT_TOP_N = 10
+
+# 현재 프로세스에서 활성화된 프로파일러 (--profile)
+_active_profiler: Optional["ComProfiler"] = None
+
+
+class ComProfiler:
+    """멤버별 COM 호출 통계 수집기"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        # member → [kind, count, total_seconds, max_seconds]
+        self.stats: Dict[str, List[Any]] = {}
+
+    def record(self, member: str, kind: str, seconds: float):
+        """COM 호출 1건 기록 (kind: get, set, call)"""
+        entry = self.stats.get(member)
+        if entry is None:
+            self.stats[member] = [kind, 1, seconds, seconds]
+        else:
+            entry[1] += 1
+            entry[2] += seconds
+            if seconds > entry[3]:
+                entry[3] = seconds
+
+    def summary(self, top_n: int = DEFAULT_TOP_N) -> Dict[str, Any]:
+        """
+        수집한 통계를 응답에 넣을 수 있는 딕셔너리로 요약합니다.
+
+        Returns:
+            Dict[str, Any]: 전체 호출 수, COM/Python 시간, 느린 멤버 및 자주 호출된 멤버 상위 N개
+        """
+        wall_seconds = time.perf_counter() - self.started
+        com_seconds = sum(entry[2] for entry in self.stats.values())
+
+        members = [
+            {
+                "member": member,
+                "kind": kind,
+                "count": count,
+                "total_ms": round(total * 1000, 3),
+                "max_ms": round(max_seconds * 1000, 3),
+            }
+            for member, (kind, count, total, max_seconds) in self.stats.items()
+        ]
+
+        return {
+            "com_calls": sum(entry[1] for entry in self.stats.values()),
+            "distinct_members": len(members),
+            "com_time_ms": round(com_seconds * 1000, 3),
+            "python_time_ms": round(max(0.0, wall_seconds - com_seconds) * 1000, 3),
+            "wall_time_ms": round(wall_seconds * 1000, 3),
+            "slowest_members": sorted(members, key=lambda m: m["total_ms"], reverse=True)[:top_n],
+            "most_called_members": sorted(members, key=lambda m: m["count"], reverse=True)[:top_n],
+        }
+
+
+def enable_profiling() -> ComProfiler:
+    """프로파일링을 켜고 새 프로파일러를 반환합니다 (이전 통계는 버림)"""
+    global _active_profiler
+    _active_profiler = ComProfiler()
+    return _active_profiler
+
+
+def disable_profiling():
+    """프로파일링을 끕니다"""
+    global _active_profiler
+    _active_profiler = None
+
+
+def get_active_profiler() -> Optional[ComProfiler]:
+    """활성화된 프로파일러 (없으면 None)"""
+    return _active_profiler
+
+
+def is_com_object(value: Any) -> bool:
+    """pywin32 디스패치 객체 여부 (CDispatch와 gencache 래퍼 모두 _oleobj_를 가짐)"""
+    return hasattr(value, "_oleobj_")
+
+
+def _unwrap(value: Any) -> Any:
+    """COM 메서드 인자로 넘기기 전에 프록시를 원래 객체로 되돌림"""
+    if isinstance(value, ComProxy):
+        return object.__getattribute__(value, "_target")
+    return value
+
+
+def _wrap(value: Any, profiler: ComProfiler, label: str) -> Any:
+    if is_com_object(value) and not isinstance(value, ComProxy):
+        return ComProxy(value, profiler, label)
+    return value
+
+
+class _ComMethod:
+    """COM 메서드 호출을 계측하는 래퍼 (예: Workbooks.Open)"""
+
+    __slots__ = ("_method", "_profiler", "_member", "_label")
+
+    def __init__(self, method: Any, profiler: ComProfiler, member: str, label: str):
+        self._method = method
+        self._profiler = profiler
+        self._member = member
+        self._label = label
+
+    def __call__(self, *args, **kwargs):
+        args = [_unwrap(arg) for arg in args]
+        kwargs = {key: _unwrap(value) for key, value in kwargs.items()}
+
+        started = time.perf_counter()
+        try:
+            result = self._method(*args, **kwargs)
+        finally:
+            self._profiler.record(self._member, "call", time.perf_counter() - started)
+
+        return _wrap(result, self._profiler, self._label)
+
+
+class ComProxy:
+    """
+    COM 디스패치 객체 계측 프록시
+
+    속성 읽기는 "부모.멤버"(get), 속성 쓰기는 "부모.멤버"(set),
+    메서드 호출은 "부모.멤버"(call), 컬렉션 항목 접근은 "컬렉션()"(call)으로 기록합니다.
+    반환된 COM 객체도 다시 프록시로 감싸므로 체인 접근(wb.Sheets("A").Range("A1").Value)이 모두 기록됩니다.
+    컬렉션 항목의 레이블은 "컬렉션[]" 형태입니다 (예: Sheets[].ListObjects).
+    """
+
+    __slots__ = ("_target", "_profiler", "_label")
+
+    def __init__(self, target: Any, profiler: ComProfiler, label: str = "Application"):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_profiler", profiler)
+        object.__setattr__(self, "_label", label)
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, "_target")
+        profiler = object.__getattribute__(self, "_profiler")
+        member = f"{object.__getattribute__(self, '_label')}.{name}"
+
+        started = time.perf_counter()
+        value = getattr(target, name)
+        elapsed = time.perf_counter() - started
+
+        if is_com_object(value):
+            profiler.record(member, "get", elapsed)
+            return ComProxy(value, profiler, name)
+
+        if callable(value):
+            # 메서드 조회 비용은 호출 시점 기록에 포함되지 않으므로 get으로 따로 남기지 않음
+            return _ComMethod(value, profiler, member, name)
+
+        profiler.record(member, "get", elapsed)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        target = object.__getattribute__(self, "_target")
+        profiler = object.__getattribute__(self, "_profiler")
+        member = f"{object.__getattribute__(self, '_label')}.{name}"
+
+        started = time.perf_counter()
+        try:
+            setattr(target, name, _unwrap(value))
+        finally:
+            profiler.record(member, "set", time.perf_counter() - started)
+
+    def __call__(self, *args, **kwargs):
+        # 컬렉션 기본 멤버 호출 (예: workbook.Sheets("Data") → Sheets.Item)
+        target = object.__getattribute__(self, "_target")
+        profiler = object.__getattribute__(self, "_profiler")
+        label = object.__getattribute__(self, "_label")
+
+        args = [_unwrap(arg) for arg in args]
+        kwargs = {key: _unwrap(value) for key, value in kwargs.items()}
+
+        started = time.perf_counter()
+        try:
+            result = target(*args, **kwargs)
+        finally:
+            profiler.record(f"{label}()", "call", time.perf_counter() - started)
+
+        return _wrap(result, profiler, f"{label}[]")
+
+    def __iter__(self):
+        target = object.__getattribute__(self, "_target")
+        profiler = object.__getattribute__(self, "_profiler")
+        label = object.__getattribute__(self, "_label")
+
+        iterator = iter(target)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                profiler.record(f"{label}.__iter__", "call", time.perf_counter() - started)
+            yield _wrap(item, profiler, f"{label}[]")
+
+    def __bool__(self) -> bool:
+        return bool(object.__getattribute__(self, "_target"))
+
+    def __len__(self) -> int:
+        return len(object.__getattribute__(self, "_target"))
+
+    def __eq__(self, other: Any) -> bool:
+        return object.__getattribute__(self, "_target") == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(object.__getattribute__(self, "_target"))
+
+    def __str__(self) -> str:
+        return str(object.__getattribute__(self, "_target"))
+
+    def __repr__(self) -> str:
+        return f"<ComProxy {object.__getattribute__(self, '_label')}: {object.__getattribute__(self, '_target')!r}>"
@@ -6,12 +6,15 @@ AppleScript를 통해 Excel의 네이티브 기능에 접근합니다.
 """
 
 import json
+import os
 import platform
 import re
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .applescript_host import AppleScriptHost, combine_scripts, get_shared_host, split_combined_output
+from .applescript_values import ENCODE_HANDLERS, SECTION_SEPARATOR, decode_grid
 from .base import ChartInfo, ExcelEngineBase, RangeData, TableInfo, WorkbookInfo
 from .exceptions import (
     AppleScriptError,
@@ -33,11 +36,21 @@ class MacOSEngine(ExcelEngineBase):
     AppleScript의 Excel Object Model을 사용합니다.
     """
 
-    def __init__(self):
-        """macOS AppleScript 엔진 초기화"""
+    def __init__(self, script_host: Optional[AppleScriptHost] = None):
+        """
+        macOS AppleScript 엔진 초기화
+
+        Args:
+            script_host: 스크립트를 실행할 상주 호스트 (None이면 공유 호스트 사용,
+                         OA_APPLESCRIPT_HOST=0이면 호출마다 osascript 실행)
+        """
         if platform.system() != "Darwin":
             raise EngineInitializationError("MacOSEngine", "macOS 플랫폼에서만 사용 가능합니다")
 
+        if script_host is None and os.environ.get("OA_APPLESCRIPT_HOST", "1") != "0":
+            script_host = get_shared_host()
+        self._script_host = script_host
+
         # Excel for Mac 설치 확인
         self._verify_excel_installed()
 
@@ -54,6 +67,9 @@ class MacOSEngine(ExcelEngineBase):
         """
         AppleScript 실행 및 결과 반환
 
+        상주 호스트가 있으면 호스트에서 실행하고, 호스트를 시작할 수 없으면
+        이후 호출부터 osascript 프로세스를 매번 실행하는 방식으로 전환합니다.
+
         Args:
             script: 실행할 AppleScript 코드
             timeout: 타임아웃 (초)
@@ -64,6 +80,13 @@ class MacOSEngine(ExcelEngineBase):
         Raises:
             AppleScriptError: 실행 실패 시
         """
+        if self._script_host is not None:
+            try:
+                return self._script_host.run(script, timeout=timeout)
+            except OSError:
+                # osascript를 실행할 수 없는 환경 - 프로세스 방식으로 전환
+                self._script_host = None
+
         try:
             result = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=timeout, check=False)
 
@@ -78,6 +101,28 @@ class MacOSEngine(ExcelEngineBase):
         except Exception as e:
             raise AppleScriptError(script, str(e))
 
+    def run_applescript_batch(self, scripts: List[str], timeout: int = 30) -> List[str]:
+        """
+        여러 엔진 작업의 스크립트를 하나로 합쳐 한 번에 컴파일/실행합니다.
+
+        Args:
+            scripts: 각 작업의 AppleScript (tell 블록과 return 포함)
+            timeout: 전체 실행 타임아웃 (초)
+
+        Returns:
+            List[str]: 스크립트별 결과 문자열
+
+        Raises:
+            AppleScriptError: 실패한 스크립트가 있을 때 (이후 스크립트는 실행되지 않음)
+        """
+        if not scripts:
+            return []
+        if len(scripts) == 1:
+            return [self._run_applescript(scripts[0], timeout)]
+
+        output = self._run_applescript(combine_scripts(scripts), timeout)
+        return split_combined_output(output, scripts)
+
     def _parse_applescript_list(self, output: str) -> List:
         """AppleScript list 출력을 Python list로 변환"""
         if not output:
@@ -92,24 +137,22 @@ class MacOSEngine(ExcelEngineBase):
         if not output:
             return []
 
-        # 콤마로 분할 (중첩 괄호 고려)
+        # 콤마로 분할 (중첩 괄호 고려) - 문자열 누적 대신 구간을 잘라 선형 시간에 처리
         items = []
-        current = ""
         depth = 0
+        start = 0
 
-        for char in output:
+        for index, char in enumerate(output):
             if char == "{":
                 depth += 1
             elif char == "}":
                 depth -= 1
             elif char == "," and depth == 0:
-                items.append(current.strip())
-                current = ""
-                continue
-            current += char
+                items.append(output[start:index].strip())
+                start = index + 1
 
-        if current:
-            items.append(current.strip())
+        if start < len(output):
+            items.append(output[start:].strip())
 
         return items
 
@@ -134,6 +177,58 @@ class MacOSEngine(ExcelEngineBase):
         text = text.replace('"', '\\"')
         return text
 
+    # ===========================================
+    # 대량 작업 세션
+    # ===========================================
+
+    # AppleScript calculation 상수 (복원 시 스크립트에 그대로 삽입하므로 허용 목록으로 제한)
+    _CALCULATION_MODES = ("calculation automatic", "calculation manual", "calculation semiautomatic")
+
+    def begin_bulk(self) -> Dict[str, Any]:
+        """화면 갱신/자동 계산/이벤트/경고를 끄고 이전 설정 반환"""
+        script = """
+        tell application "Microsoft Excel"
+            set prevState to (screen updating as text) & "|" & (enable events as text) & "|" & ¬
+                (display alerts as text) & "|" & (calculation as text)
+            set screen updating to false
+            set enable events to false
+            set display alerts to false
+            try
+                set calculation to calculation manual
+            end try
+            return prevState
+        end tell
+        """
+
+        parts = self._run_applescript(script).split("|")
+        return {
+            "screen_updating": parts[0].lower() == "true",
+            "enable_events": parts[1].lower() == "true" if len(parts) > 1 else True,
+            "display_alerts": parts[2].lower() == "true" if len(parts) > 2 else True,
+            "calculation": parts[3] if len(parts) > 3 and parts[3] in self._CALCULATION_MODES else None,
+        }
+
+    def end_bulk(self, state: Dict[str, Any], recalculate: bool = True):
+        """이전 설정 복원 후 한 번만 재계산"""
+        calculation = state.get("calculation")
+        restore_calculation = ""
+        if calculation in self._CALCULATION_MODES:
+            restore_calculation = f"""
+            try
+                set calculation to {calculation}
+            end try"""
+
+        script = f"""
+        tell application "Microsoft Excel"
+            {"if (count of workbooks) > 0 then calculate" if recalculate else ""}{restore_calculation}
+            set display alerts to {str(state.get("display_alerts", True)).lower()}
+            set enable events to {str(state.get("enable_events", True)).lower()}
+            set screen updating to {str(state.get("screen_updating", True)).lower()}
+        end tell
+        """
+
+        self._run_applescript(script)
+
     # ===========================================
     # 워크북 관리 (4개 명령어)
     # ===========================================
@@ -388,76 +483,89 @@ class MacOSEngine(ExcelEngineBase):
     # 데이터 읽기/쓰기 (2개 명령어)
     # ===========================================
 
+    # 범위 확장 모드별 AppleScript (rangeObj를 확장된 범위로 바꿈)
+    _EXPAND_SCRIPTS = {
+        "table": "set rangeObj to current region of rangeObj",
+        "down": (
+            "set endCell to get end rangeObj direction toward the bottom\n"
+            "set rangeObj to get resize rangeObj row size ((first row index of endCell) - (first row index of rangeObj) + 1)"
+        ),
+        "right": (
+            "set endCell to get end rangeObj direction toward the right\n"
+            "set rangeObj to get resize rangeObj column size "
+            "((first column index of endCell) - (first column index of rangeObj) + 1)"
+        ),
+    }
+
     def read_range(
         self, workbook: Any, sheet: str, range_str: str, expand: Optional[str] = None, include_formulas: bool = True
     ) -> RangeData:
-        """셀 범위 데이터 읽기"""
+        """
+        셀 범위 데이터 읽기
+
+        값과 공식은 스크립트 한 번으로 읽으며, 셀마다 타입 태그를 붙인 형식(applescript_values)으로 받아
+        숫자/날짜/불리언/빈 셀을 구분한 2차원 리스트로 복원합니다.
+        """
         workbook_name = workbook if isinstance(workbook, str) else str(workbook)
+        expand_script = self._EXPAND_SCRIPTS.get(expand.lower(), "") if expand else ""
 
-        # 범위 확장 처리 (간단한 구현)
-        if expand:
-            # AppleScript에서 CurrentRegion 등을 사용
-            if expand.lower() == "table":
-                range_str = f"{range_str}"  # TODO: CurrentRegion 구현
+        formula_script = ""
+        if include_formulas:
+            formula_script = """
+                    try
+                        set formulaText to my oaEncodeGrid(formula of rangeObj)
+                    end try"""
+
+        script = f"""
+        {ENCODE_HANDLERS}
 
-        # 값 읽기
-        value_script = f"""
         tell application "Microsoft Excel"
             tell workbook "{self._escape_applescript_string(workbook_name)}"
                 tell sheet "{self._escape_applescript_string(sheet)}"
-                    set rangeObj to range "{range_str}"
-                    set cellValues to value of rangeObj
+                    set rangeObj to range "{self._escape_applescript_string(range_str)}"
+                    {expand_script}
                     set cellAddress to address of rangeObj
                     set rowCnt to count of rows of rangeObj
                     set colCnt to count of columns of rangeObj
-
-                    return cellAddress & "|" & rowCnt & "|" & colCnt & "|" & cellValues
+                    set valueText to my oaEncodeGrid(value of rangeObj)
+                    set formulaText to ""{formula_script}
                 end tell
             end tell
         end tell
+
+        set sep to character id 29
+        return cellAddress & sep & rowCnt & sep & colCnt & sep & valueText & sep & formulaText & sep & "."
         """
 
         try:
-            result = self._run_applescript(value_script)
-            parts = result.split("|", 3)
-
-            address = parts[0]
-            row_count = int(parts[1])
-            column_count = int(parts[2])
-            values_str = parts[3] if len(parts) > 3 else ""
+            sections = self._run_applescript(script).split(SECTION_SEPARATOR)
+            address = sections[0]
+            row_count = int(sections[1])
+            column_count = int(sections[2])
 
-            # 값 파싱 (간단한 구현)
-            values = values_str
-
-            # 공식 읽기
-            formulas = None
-            if include_formulas:
-                formula_script = f"""
-                tell application "Microsoft Excel"
-                    tell workbook "{self._escape_applescript_string(workbook_name)}"
-                        tell sheet "{self._escape_applescript_string(sheet)}"
-                            return formula of range "{range_str}"
-                        end tell
-                    end tell
-                end tell
-                """
-                try:
-                    formulas = self._run_applescript(formula_script)
-                except:
-                    pass
-
-            return RangeData(
-                values=values,
-                formulas=formulas,
-                address=address,
-                sheet_name=sheet,
-                row_count=row_count,
-                column_count=column_count,
-                cells_count=row_count * column_count,
-            )
+            values = decode_grid(sections[3], row_count, column_count)
+            formulas = decode_grid(sections[4], row_count, column_count) if include_formulas and sections[4] else None
 
         except AppleScriptError:
             raise RangeError(range_str, "범위를 읽을 수 없습니다")
+        except (IndexError, ValueError) as e:
+            raise RangeError(range_str, f"범위 데이터를 해석할 수 없습니다: {e}")
+
+        # COM과 동일하게 단일 셀은 스칼라로 반환
+        if row_count == 1 and column_count == 1:
+            values = values[0][0] if values and values[0] else None
+            if formulas is not None:
+                formulas = formulas[0][0] if formulas[0] else None
+
+        return RangeData(
+            values=values,
+            formulas=formulas,
+            address=address,
+            sheet_name=sheet,
+            row_count=row_count,
+            column_count=column_count,
+            cells_count=row_count * column_count,
+        )
 
     def write_range(self, workbook: Any, sheet: str, range_str: str, data: Any, include_formulas: bool = False):
         """셀 범위에 데이터 쓰기"""
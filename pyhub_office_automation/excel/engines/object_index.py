@@ -0,0 +1,70 @@
+"""
+워크북 개체 이름 → 시트 인덱스
+
+테이블/차트/피벗 테이블/슬라이서를 이름으로 찾을 때 모든 시트에서
+`ws.ListObjects(name)`을 시도하면 시트 수만큼 실패하는 COM 호출(예외 포함)이 생깁니다.
+WorkbookObjectIndex는 시트를 한 번 순회해 이름 → 시트 이름 매핑을 만들고,
+이후 조회는 딕셔너리 조회 한 번으로 끝냅니다.
+
+Excel과 같이 이름은 대소문자를 구분하지 않습니다.
+구조 변경(시트 추가/삭제/이름 변경, 테이블·차트·피벗 생성/삭제) 시 엔진이 인덱스를 무효화하며,
+Excel UI 등 외부에서 바뀐 경우에는 조회 실패 시 한 번 다시 만들어 복구합니다.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 인덱스가 관리하는 개체 종류
+TABLE = "table"
+CHART = "chart"
+PIVOT = "pivot"
+SLICER = "slicer"
+
+OBJECT_KINDS = (TABLE, CHART, PIVOT, SLICER)
+
+
+def _names(collection_getter: Callable[[], Iterable[Any]]) -> Iterable[str]:
+    """컬렉션 항목 이름 목록 (지원하지 않는 컬렉션은 빈 목록)"""
+    try:
+        return [item.Name for item in collection_getter()]
+    except Exception:
+        return []
+
+
+class WorkbookObjectIndex:
+    """워크북 하나의 개체 이름 → 시트 이름 인덱스"""
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, str]]] = None):
+        self._entries: Dict[str, Dict[str, str]] = {kind: {} for kind in OBJECT_KINDS}
+        self._objects: Dict[str, List[Tuple[str, str]]] = {kind: [] for kind in OBJECT_KINDS}
+        for kind, names in (entries or {}).items():
+            for name, sheet_name in names.items():
+                self.add(kind, name, sheet_name)
+
+    @classmethod
+    def build(cls, workbook: Any) -> "WorkbookObjectIndex":
+        """시트를 한 번 순회하여 인덱스 생성 (COM 워크북)"""
+        index = cls()
+        for ws in workbook.Sheets:
+            sheet_name = ws.Name
+            for name in _names(lambda: ws.ListObjects):
+                index.add(TABLE, name, sheet_name)
+            for name in _names(lambda: ws.ChartObjects()):
+                index.add(CHART, name, sheet_name)
+            for name in _names(lambda: ws.PivotTables()):
+                index.add(PIVOT, name, sheet_name)
+            for name in _names(lambda: ws.Slicers()):
+                index.add(SLICER, name, sheet_name)
+        return index
+
+    def add(self, kind: str, name: str, sheet_name: str):
+        # 같은 이름이 여러 시트에 있으면 시트 순서상 첫 번째를 사용 (기존 시트별 탐색과 같은 결과)
+        self._entries[kind].setdefault(name.lower(), sheet_name)
+        self._objects[kind].append((sheet_name, name))
+
+    def sheet_of(self, kind: str, name: str) -> Optional[str]:
+        """개체가 있는 시트 이름 (없으면 None)"""
+        return self._entries[kind].get(name.lower())
+
+    def objects(self, kind: str) -> List[Tuple[str, str]]:
+        """모든 개체의 (시트 이름, 개체 이름) 목록 (시트 순서, 이름이 같은 개체도 모두 포함)"""
+        return list(self._objects[kind])
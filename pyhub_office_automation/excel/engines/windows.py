@@ -10,22 +10,48 @@ import gc
 import os
 import platform
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import pythoncom
-
-from .base import ChartInfo, ExcelEngineBase, PivotTableInfo, RangeData, ShapeInfo, SlicerInfo, TableInfo, WorkbookInfo
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import pythoncom
+except ImportError:
+    # Windows 외 환경: 가짜 Excel 객체 모델(fake_excel)로 엔진을 실행할 때는 COM 초기화가 필요 없음
+    pythoncom = None
+
+from .base import (
+    DEFAULT_CHUNK_ROWS,
+    ChartInfo,
+    ExcelEngineBase,
+    PivotTableInfo,
+    RangeData,
+    ShapeInfo,
+    SlicerInfo,
+    TableInfo,
+    WorkbookInfo,
+    contiguous_windows,
+    sample_row_indices,
+    to_2d_list,
+)
+from .chunking import pad_rows
 from .exceptions import (
     ChartNotFoundError,
     COMError,
     EngineInitializationError,
     ExcelNotRunningError,
+    PivotTableNotFoundError,
     PlatformNotSupportedError,
     RangeError,
     SheetNotFoundError,
     TableNotFoundError,
     WorkbookNotFoundError,
 )
+from .object_index import CHART, PIVOT, SLICER, TABLE, WorkbookObjectIndex
+
+# XlCalculation.xlCalculationManual (Late Binding에서는 constants를 쓸 수 없으므로 값 직접 사용)
+XL_CALCULATION_MANUAL = -4135
+
+# COM 서버(Excel) 연결이 끊긴 경우의 HRESULT: RPC_E_DISCONNECTED, RPC_S_SERVER_UNAVAILABLE
+DISCONNECTED_HRESULTS = (-2147417848, -2147023174)
 
 
 class WindowsEngine(ExcelEngineBase):
@@ -36,8 +62,26 @@ class WindowsEngine(ExcelEngineBase):
     VBA의 모든 기능을 Python에서 사용할 수 있습니다.
     """
 
-    def __init__(self):
-        """Windows COM 엔진 초기화"""
+    supports_tables = True
+
+    def __init__(self, application: Any = None, constants: Any = None):
+        """
+        Windows COM 엔진 초기화
+
+        Args:
+            application: 사용할 Excel.Application 객체 (None이면 COM으로 연결).
+                         fake_excel.FakeApplication을 넘기면 Excel 없이 엔진을 실행할 수 있습니다.
+            constants: Excel 상수 네임스페이스 (application 지정 시 사용, 기본값은 application.constants)
+        """
+        # 워크북(FullName)별 개체 이름 → 시트 인덱스 (_locate_object 참고)
+        self._object_indexes: Dict[str, WorkbookObjectIndex] = {}
+
+        if application is not None:
+            self.xl = application
+            self._win32com = None
+            self._constants = constants if constants is not None else application.constants
+            return
+
         if platform.system() != "Windows":
             raise EngineInitializationError("WindowsEngine", "Windows 플랫폼에서만 사용 가능합니다")
 
@@ -70,13 +114,141 @@ class WindowsEngine(ExcelEngineBase):
         except Exception as e:
             raise EngineInitializationError("WindowsEngine", f"COM 초기화 실패: {str(e)}")
 
+    def is_alive(self) -> bool:
+        """Excel이 종료/재시작되어 COM 서버 연결이 끊겼으면 False"""
+        try:
+            self.xl.Name
+        except Exception as e:
+            hresult = getattr(e, "hresult", e.args[0] if e.args else None)
+            return hresult not in DISCONNECTED_HRESULTS
+        return True
+
+    def attach_profiler(self, profiler: Any):
+        """Excel.Application을 계측 프록시로 감싸 이후 모든 COM 호출을 기록"""
+        from .instrumentation import ComProxy
+
+        if isinstance(self.xl, ComProxy):
+            object.__setattr__(self.xl, "_profiler", profiler)
+        else:
+            self.xl = ComProxy(self.xl, profiler)
+
+    def detach_profiler(self):
+        """계측 프록시를 벗겨 원래 Excel.Application으로 되돌림"""
+        from .instrumentation import ComProxy
+
+        if isinstance(self.xl, ComProxy):
+            self.xl = object.__getattribute__(self.xl, "_target")
+
     def __del__(self):
         """COM 정리"""
+        if getattr(self, "_win32com", None) is None:
+            return
         try:
             pythoncom.CoUninitialize()
         except:
             pass
 
+    # ===========================================
+    # 대량 작업 세션
+    # ===========================================
+
+    def begin_bulk(self) -> Dict[str, Any]:
+        """화면 갱신/자동 계산/이벤트/경고를 끄고 이전 설정 반환"""
+        try:
+            state = {
+                "screen_updating": bool(self.xl.ScreenUpdating),
+                "enable_events": bool(self.xl.EnableEvents),
+                "display_alerts": bool(self.xl.DisplayAlerts),
+                "calculation": None,
+            }
+
+            self.xl.ScreenUpdating = False
+            self.xl.EnableEvents = False
+            self.xl.DisplayAlerts = False
+
+            # Calculation은 열린 워크북이 없으면 읽기/쓰기가 실패하므로 가능한 경우에만 전환
+            try:
+                state["calculation"] = int(self.xl.Calculation)
+                self.xl.Calculation = XL_CALCULATION_MANUAL
+            except Exception:
+                pass
+
+            return state
+
+        except Exception as e:
+            raise COMError(f"대량 작업 세션 시작 실패: {str(e)}")
+
+    def end_bulk(self, state: Dict[str, Any], recalculate: bool = True):
+        """이전 설정 복원 후 한 번만 재계산"""
+        try:
+            if recalculate and self.xl.Workbooks.Count > 0:
+                self.xl.Calculate()
+
+            # 수동 계산 중 변경된 셀은 위에서 재계산했으므로 자동 계산 복원 시 추가 계산이 없음
+            if state.get("calculation") is not None:
+                try:
+                    self.xl.Calculation = state["calculation"]
+                except Exception:
+                    pass
+
+            self.xl.DisplayAlerts = state.get("display_alerts", True)
+            self.xl.EnableEvents = state.get("enable_events", True)
+            self.xl.ScreenUpdating = state.get("screen_updating", True)
+
+        except Exception as e:
+            raise COMError(f"대량 작업 세션 종료 실패: {str(e)}")
+
+    # ===========================================
+    # 개체 이름 인덱스 (테이블/차트/피벗/슬라이서)
+    # ===========================================
+
+    def invalidate_object_index(self, workbook: Any = None):
+        """
+        개체 이름 인덱스 무효화 (workbook=None이면 전체)
+
+        시트 추가/삭제/이름 변경, 테이블·차트·피벗 생성/삭제 후 호출합니다.
+        """
+        if workbook is None:
+            self._object_indexes.clear()
+            return
+        try:
+            self._object_indexes.pop(workbook.FullName, None)
+        except Exception:
+            self._object_indexes.clear()
+
+    def _rebuild_object_index(self, workbook: Any) -> WorkbookObjectIndex:
+        """인덱스를 다시 만들어 저장 (전체 목록이 필요할 때 - 목록은 조회 실패로 오래된 항목을 알 수 없음)"""
+        index = self._object_indexes[workbook.FullName] = WorkbookObjectIndex.build(workbook)
+        return index
+
+    def _locate_object(self, workbook: Any, kind: str, name: str, getter: Callable[[Any], Any]) -> Any:
+        """
+        인덱스로 개체가 있는 시트를 찾아 getter(시트)로 개체를 가져옵니다.
+
+        인덱스는 워크북마다 처음 조회할 때 한 번 만들며, 인덱스에 없거나 가리키는 시트에서
+        개체를 가져오지 못하면(외부에서 변경됨) 한 번 다시 만들어 재시도합니다.
+
+        Returns:
+            Any: 개체 (찾지 못하면 None)
+        """
+        key = workbook.FullName
+        while True:
+            index = self._object_indexes.get(key)
+            fresh = index is None
+            if fresh:
+                index = self._object_indexes[key] = WorkbookObjectIndex.build(workbook)
+
+            sheet_name = index.sheet_of(kind, name)
+            if sheet_name is not None:
+                try:
+                    return getter(workbook.Sheets(sheet_name))
+                except Exception:
+                    pass
+
+            if fresh:
+                return None
+            self._object_indexes.pop(key, None)
+
     # ===========================================
     # 워크북 관리 (4개 명령어)
     # ===========================================
@@ -233,6 +405,7 @@ class WindowsEngine(ExcelEngineBase):
                 new_sheet = workbook.Sheets.Add(After=workbook.Sheets(workbook.Sheets.Count))
 
             new_sheet.Name = name
+            self.invalidate_object_index(workbook)
 
             return new_sheet.Name
 
@@ -252,16 +425,19 @@ class WindowsEngine(ExcelEngineBase):
 
             sheet = workbook.Sheets(sheet_name)
 
-            # 경고 메시지 비활성화
+            # 경고 메시지 비활성화 (bulk 세션 중일 수 있으므로 이전 값으로 복원)
+            display_alerts = self.xl.DisplayAlerts
             self.xl.DisplayAlerts = False
-            sheet.Delete()
-            self.xl.DisplayAlerts = True
+            try:
+                sheet.Delete()
+            finally:
+                self.xl.DisplayAlerts = display_alerts
+            self.invalidate_object_index(workbook)
 
         except RuntimeError:
             raise
 
         except Exception as e:
-            self.xl.DisplayAlerts = True  # 복원
             if "Subscript out of range" in str(e):
                 raise SheetNotFoundError(sheet_name)
             raise COMError(f"시트 삭제 실패: {str(e)}")
@@ -279,6 +455,7 @@ class WindowsEngine(ExcelEngineBase):
             # 이름 변경
             sheet = workbook.Sheets(old_name)
             sheet.Name = new_name
+            self.invalidate_object_index(workbook)
 
         except ValueError:
             raise
@@ -298,16 +475,7 @@ class WindowsEngine(ExcelEngineBase):
         """셀 범위 데이터 읽기"""
         try:
             ws = workbook.Sheets(sheet)
-            range_obj = ws.Range(range_str)
-
-            # 범위 확장
-            if expand:
-                if expand.lower() == "table":
-                    range_obj = range_obj.CurrentRegion
-                elif expand.lower() == "down":
-                    range_obj = ws.Range(range_obj, range_obj.End(self._constants.xlDown))
-                elif expand.lower() == "right":
-                    range_obj = ws.Range(range_obj, range_obj.End(self._constants.xlToRight))
+            range_obj = self._expand_range(ws, ws.Range(range_str), expand)
 
             # 값 읽기
             values = range_obj.Value
@@ -340,6 +508,51 @@ class WindowsEngine(ExcelEngineBase):
                 raise SheetNotFoundError(sheet)
             raise RangeError(range_str, str(e))
 
+    def read_range_iter(
+        self,
+        workbook: Any,
+        sheet: str,
+        range_str: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        expand: Optional[str] = None,
+    ) -> Iterator[List[List[Any]]]:
+        """셀 범위를 Offset/Resize 창 단위로 나누어 읽기 (COM 호출당 chunk_rows행)"""
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows는 1 이상이어야 합니다")
+
+        try:
+            ws = workbook.Sheets(sheet)
+            range_obj = self._expand_range(ws, ws.Range(range_str), expand)
+            total_rows = range_obj.Rows.Count
+            column_count = range_obj.Columns.Count
+        except Exception as e:
+            if "Subscript out of range" in str(e):
+                raise SheetNotFoundError(sheet)
+            raise RangeError(range_str, str(e))
+
+        for start in range(0, total_rows, chunk_rows):
+            row_count = min(chunk_rows, total_rows - start)
+            try:
+                window = range_obj.Offset(start, 0).Resize(row_count, column_count)
+                values = window.Value
+            except Exception as e:
+                raise RangeError(range_str, f"{start + 1}행부터 읽기 실패: {str(e)}")
+
+            yield to_2d_list(values)
+
+    def _expand_range(self, ws: Any, range_obj: Any, expand: Optional[str]) -> Any:
+        """범위 확장 모드(table, down, right)를 COM Range에 적용"""
+        if not expand:
+            return range_obj
+
+        if expand.lower() == "table":
+            return range_obj.CurrentRegion
+        elif expand.lower() == "down":
+            return ws.Range(range_obj, range_obj.End(self._constants.xlDown))
+        elif expand.lower() == "right":
+            return ws.Range(range_obj, range_obj.End(self._constants.xlToRight))
+        return range_obj
+
     def write_range(self, workbook: Any, sheet: str, range_str: str, data: Any, include_formulas: bool = False):
         """셀 범위에 데이터 쓰기"""
         try:
@@ -358,6 +571,18 @@ class WindowsEngine(ExcelEngineBase):
                 raise SheetNotFoundError(sheet)
             raise RangeError(range_str, str(e))
 
+    def _write_chunk(self, workbook: Any, sheet: str, start_cell: str, row_offset: int, chunk: List[List[Any]]):
+        """청크 1개 쓰기 (시작 셀에서 Offset/Resize한 블록에 한 번에 대입)"""
+        try:
+            ws = workbook.Sheets(sheet)
+            values = pad_rows(chunk)
+            ws.Range(start_cell).Offset(row_offset, 0).Resize(len(values), len(values[0])).Value = values
+
+        except Exception as e:
+            if "Subscript out of range" in str(e):
+                raise SheetNotFoundError(sheet)
+            raise RangeError(start_cell, str(e))
+
     # ===========================================
     # 테이블 (5개 명령어)
     # ===========================================
@@ -419,6 +644,50 @@ class WindowsEngine(ExcelEngineBase):
                 raise SheetNotFoundError(sheet)
             raise COMError(f"테이블 목록 조회 실패: {str(e)}")
 
+    def _find_table(self, workbook: Any, table_name: str) -> Any:
+        """이름으로 ListObject 찾기 (없으면 TableNotFoundError)"""
+        table = self._locate_object(workbook, TABLE, table_name, lambda ws: ws.ListObjects(table_name))
+        if table is None:
+            raise TableNotFoundError(table_name)
+        return table
+
+    def get_table_sheet_name(self, workbook: Any, table_name: str) -> str:
+        """테이블이 있는 시트 이름 (개체 이름 인덱스로 조회)"""
+        return self._find_table(workbook, table_name).Parent.Name
+
+    def _read_table_headers(self, table: Any) -> List[Any]:
+        if not table.HeaderRowRange:
+            return []
+        header_values = table.HeaderRowRange.Value
+        if isinstance(header_values, tuple):
+            return list(header_values[0])
+        return [header_values]
+
+    def _read_table_rows(self, table: Any, col_indices: Optional[List[int]], windows: List[tuple]) -> List[List[Any]]:
+        """
+        DataBodyRange에서 (시작 행, 행 수) 구간만 읽어 행 리스트로 반환
+
+        col_indices가 주어지면 해당 ListColumns의 DataBodyRange만 읽어 열 단위로 조립합니다.
+        """
+        body = table.DataBodyRange
+        if not body or not windows:
+            return []
+
+        rows: List[List[Any]] = []
+        if col_indices is None:
+            for start, count in windows:
+                rows.extend(to_2d_list(body.Offset(start, 0).Resize(count).Value))
+            return rows
+
+        if not col_indices:
+            return [[] for _, count in windows for _ in range(count)]
+
+        column_bodies = [table.ListColumns(index + 1).DataBodyRange for index in col_indices]
+        for start, count in windows:
+            column_values = [to_2d_list(column.Offset(start, 0).Resize(count).Value) for column in column_bodies]
+            rows.extend([[values[row][0] for values in column_values] for row in range(count)])
+        return rows
+
     def read_table(
         self,
         workbook: Any,
@@ -427,62 +696,78 @@ class WindowsEngine(ExcelEngineBase):
         limit: Optional[int] = None,
         offset: int = 0,
     ) -> Dict[str, Any]:
-        """테이블 데이터 읽기"""
-        try:
-            # 테이블 찾기
-            table = None
-            for ws in workbook.Sheets:
-                try:
-                    table = ws.ListObjects(table_name)
-                    break
-                except:
-                    continue
+        """
+        테이블 데이터 읽기
 
-            if not table:
-                raise TableNotFoundError(table_name)
+        offset/limit 구간과 선택한 컬럼만 Excel에서 가져옵니다
+        (DataBodyRange.Offset/Resize, ListColumns(n).DataBodyRange).
+        """
+        try:
+            table = self._find_table(workbook, table_name)
+            headers = self._read_table_headers(table)
 
-            # 헤더 추출
-            headers = []
-            if table.HeaderRowRange:
-                header_values = table.HeaderRowRange.Value
-                if isinstance(header_values, tuple):
-                    headers = list(header_values[0])
-                else:
-                    headers = [header_values]
+            col_indices = None
+            if columns:
+                col_indices = [headers.index(col) for col in columns if col in headers]
+                headers = [headers[i] for i in col_indices]
 
-            # 데이터 추출
-            data = []
+            windows = []
             if table.DataBodyRange:
-                data_values = table.DataBodyRange.Value
+                offset = max(0, offset or 0)
+                total_rows = table.DataBodyRange.Rows.Count
+                count = total_rows - offset
+                if limit:
+                    count = min(count, limit)
+                if count > 0:
+                    windows = [(offset, count)]
 
-                if isinstance(data_values, tuple):
-                    # 2차원 데이터
-                    data = [list(row) for row in data_values]
-                else:
-                    # 단일 행
-                    data = [[data_values]]
+            data = self._read_table_rows(table, col_indices, windows)
+
+            return {"table_name": table_name, "headers": headers, "data": data, "row_count": len(data)}
 
-                # 오프셋 적용
-                if offset > 0:
-                    data = data[offset:]
+        except TableNotFoundError:
+            raise
 
-                # 제한 적용
-                if limit:
-                    data = data[:limit]
+        except Exception as e:
+            raise COMError(f"테이블 읽기 실패: {str(e)}")
 
-            # 컬럼 필터링
+    def read_table_sample(
+        self,
+        workbook: Any,
+        table_name: str,
+        limit: int,
+        columns: Optional[List[str]] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """테이블 샘플링 (처음/중간/마지막 구간만 Excel에서 읽음)"""
+        try:
+            table = self._find_table(workbook, table_name)
+            headers = self._read_table_headers(table)
+
+            col_indices = None
             if columns:
                 col_indices = [headers.index(col) for col in columns if col in headers]
-                data = [[row[i] for i in col_indices] for row in data]
                 headers = [headers[i] for i in col_indices]
 
-            return {"table_name": table_name, "headers": headers, "data": data, "row_count": len(data)}
+            offset = max(0, offset or 0)
+            total_rows = max(0, table.DataBodyRange.Rows.Count - offset) if table.DataBodyRange else 0
+            windows = [(offset + start, count) for start, count in contiguous_windows(sample_row_indices(total_rows, limit))]
+
+            data = self._read_table_rows(table, col_indices, windows)
+
+            return {
+                "table_name": table_name,
+                "headers": headers,
+                "data": data,
+                "row_count": len(data),
+                "total_rows": total_rows,
+            }
 
         except TableNotFoundError:
             raise
 
         except Exception as e:
-            raise COMError(f"테이블 읽기 실패: {str(e)}")
+            raise COMError(f"테이블 샘플링 실패: {str(e)}")
 
     def write_table(self, workbook: Any, sheet: str, table_name: str, data: List[List[Any]], start_cell: str = "A1"):
         """테이블에 데이터 쓰기"""
@@ -498,7 +783,7 @@ class WindowsEngine(ExcelEngineBase):
                 start_range = ws.Range(start_cell)
                 end_range = start_range.Offset(rows - 1, cols - 1)
                 data_range = ws.Range(start_range, end_range)
-                data_range.Value = data
+                self.write_range_chunked(workbook, sheet, start_cell, data)
 
                 # 테이블로 변환
                 try:
@@ -521,6 +806,8 @@ class WindowsEngine(ExcelEngineBase):
                     # 테이블 생성 실패는 경고만
                     pass
 
+                self.invalidate_object_index(workbook)
+
         except Exception as e:
             if "Subscript out of range" in str(e):
                 raise SheetNotFoundError(sheet)
@@ -626,6 +913,7 @@ class WindowsEngine(ExcelEngineBase):
 
             # 차트 객체 생성
             chart_obj = ws.ChartObjects().Add(Left=left, Top=top, Width=width, Height=height)
+            self.invalidate_object_index(workbook)
 
             # 차트 설정
             chart = chart_obj.Chart
@@ -725,13 +1013,7 @@ class WindowsEngine(ExcelEngineBase):
         """차트 설정"""
         try:
             # 차트 찾기
-            chart_obj = None
-            for ws in workbook.Sheets:
-                try:
-                    chart_obj = ws.ChartObjects(chart_name)
-                    break
-                except:
-                    continue
+            chart_obj = self._locate_object(workbook, CHART, chart_name, lambda ws: ws.ChartObjects(chart_name))
 
             if not chart_obj:
                 raise ChartNotFoundError(chart_name)
@@ -824,6 +1106,7 @@ class WindowsEngine(ExcelEngineBase):
             ws = workbook.Sheets(sheet)
             chart_obj = ws.ChartObjects(chart_name)
             chart_obj.Delete()
+            self.invalidate_object_index(workbook)
 
         except Exception as e:
             if "Subscript out of range" in str(e):
@@ -857,6 +1140,7 @@ class WindowsEngine(ExcelEngineBase):
             pivot_table = pivot_cache.CreatePivotTable(
                 TableDestination=dest_ws.Range(dest_range), TableName=f"PivotTable_{dest_sheet}"
             )
+            self.invalidate_object_index(workbook)
 
             # 피벗 차트 생성
             chart_type_code = self.CHART_TYPE_MAP.get(chart_type.lower(), 51)
@@ -922,14 +1206,12 @@ class WindowsEngine(ExcelEngineBase):
     ) -> Dict[str, Any]:
         """피벗 테이블 생성 (COM API)"""
         try:
-            import win32com.client as win32
-
             # 소스 데이터 범위 가져오기
             src_sheet = workbook.Sheets(source_sheet)
             src_range = src_sheet.Range(source_range)
 
             # PivotCache 생성
-            pivot_cache = workbook.PivotCaches().Create(SourceType=win32.constants.xlDatabase, SourceData=src_range)
+            pivot_cache = workbook.PivotCaches().Create(SourceType=self._constants.xlDatabase, SourceData=src_range)
 
             # 대상 시트와 위치 지정
             dst_sheet = workbook.Sheets(dest_sheet)
@@ -940,6 +1222,7 @@ class WindowsEngine(ExcelEngineBase):
                 TableDestination=dst_range,
                 TableName=pivot_name or f"PivotTable{workbook.PivotTables().Count + 1}",
             )
+            self.invalidate_object_index(workbook)
 
             return {
                 "name": pivot_table.Name,
@@ -962,8 +1245,6 @@ class WindowsEngine(ExcelEngineBase):
     ):
         """피벗 테이블 설정 (행/열/값 필드)"""
         try:
-            import win32com.client as win32
-
             ws = workbook.Sheets(sheet)
             pivot_table = ws.PivotTables(pivot_name)
 
@@ -971,26 +1252,26 @@ class WindowsEngine(ExcelEngineBase):
             if row_fields:
                 for field_name in row_fields:
                     field = pivot_table.PivotFields(field_name)
-                    field.Orientation = win32.constants.xlRowField
+                    field.Orientation = self._constants.xlRowField
 
             # 열 필드 추가
             if column_fields:
                 for field_name in column_fields:
                     field = pivot_table.PivotFields(field_name)
-                    field.Orientation = win32.constants.xlColumnField
+                    field.Orientation = self._constants.xlColumnField
 
             # 값 필드 추가
             if value_fields:
                 for field_name, func in value_fields:
                     field = pivot_table.PivotFields(field_name)
-                    field.Orientation = win32.constants.xlDataField
+                    field.Orientation = self._constants.xlDataField
                     # 집계 함수 매핑
                     func_map = {
-                        "sum": win32.constants.xlSum,
-                        "count": win32.constants.xlCount,
-                        "average": win32.constants.xlAverage,
-                        "max": win32.constants.xlMax,
-                        "min": win32.constants.xlMin,
+                        "sum": self._constants.xlSum,
+                        "count": self._constants.xlCount,
+                        "average": self._constants.xlAverage,
+                        "max": self._constants.xlMax,
+                        "min": self._constants.xlMin,
                     }
                     if func.lower() in func_map:
                         field.Function = func_map[func.lower()]
@@ -999,11 +1280,25 @@ class WindowsEngine(ExcelEngineBase):
             if filter_fields:
                 for field_name in filter_fields:
                     field = pivot_table.PivotFields(field_name)
-                    field.Orientation = win32.constants.xlPageField
+                    field.Orientation = self._constants.xlPageField
 
         except Exception as e:
             raise COMError(f"피벗 테이블 설정 실패: {str(e)}")
 
+    def get_pivot_sheet_name(self, workbook: Any, pivot_name: str) -> str:
+        """피벗 테이블이 있는 시트 이름 (개체 이름 인덱스로 조회)"""
+        pivot_table = self._locate_object(workbook, PIVOT, pivot_name, lambda ws: ws.PivotTables(pivot_name))
+        if pivot_table is None:
+            raise PivotTableNotFoundError(pivot_name)
+        return pivot_table.Parent.Name
+
+    def list_pivot_table_names(self, workbook: Any) -> List[Tuple[str, str]]:
+        """피벗 테이블 (시트 이름, 이름) 목록 (시트를 한 번 순회해 인덱스도 갱신)"""
+        try:
+            return self._rebuild_object_index(workbook).objects(PIVOT)
+        except Exception as e:
+            raise COMError(f"피벗 테이블 목록 조회 실패: {str(e)}")
+
     def refresh_pivot_table(self, workbook: Any, sheet: str, pivot_name: str):
         """피벗 테이블 새로고침"""
         try:
@@ -1019,6 +1314,7 @@ class WindowsEngine(ExcelEngineBase):
             ws = workbook.Sheets(sheet)
             pivot_table = ws.PivotTables(pivot_name)
             pivot_table.TableRange2.Clear()
+            self.invalidate_object_index(workbook)
         except Exception as e:
             raise COMError(f"피벗 테이블 삭제 실패: {str(e)}")
 
@@ -1036,17 +1332,15 @@ class WindowsEngine(ExcelEngineBase):
                     value_fields = []
                     filter_fields = []
 
-                    import win32com.client as win32
-
                     for field in pt.PivotFields():
                         try:
-                            if field.Orientation == win32.constants.xlRowField:
+                            if field.Orientation == self._constants.xlRowField:
                                 row_fields.append(field.Name)
-                            elif field.Orientation == win32.constants.xlColumnField:
+                            elif field.Orientation == self._constants.xlColumnField:
                                 column_fields.append(field.Name)
-                            elif field.Orientation == win32.constants.xlDataField:
+                            elif field.Orientation == self._constants.xlDataField:
                                 value_fields.append(field.Name)
-                            elif field.Orientation == win32.constants.xlPageField:
+                            elif field.Orientation == self._constants.xlPageField:
                                 filter_fields.append(field.Name)
                         except:
                             continue
@@ -1101,6 +1395,7 @@ class WindowsEngine(ExcelEngineBase):
                 Width=width,
                 Height=height,
             )
+            self.invalidate_object_index(workbook)
 
             # 추가 옵션 적용
             if "caption" in kwargs:
@@ -1170,13 +1465,7 @@ class WindowsEngine(ExcelEngineBase):
         """슬라이서를 여러 피벗 테이블에 연결"""
         try:
             # 슬라이서 찾기
-            slicer = None
-            for ws in workbook.Sheets:
-                try:
-                    slicer = ws.Slicers(slicer_name)
-                    break
-                except:
-                    continue
+            slicer = self._locate_object(workbook, SLICER, slicer_name, lambda ws: ws.Slicers(slicer_name))
 
             if slicer is None:
                 raise ValueError(f"슬라이서 '{slicer_name}'을 찾을 수 없습니다")
@@ -1185,13 +1474,9 @@ class WindowsEngine(ExcelEngineBase):
             slicer_cache = slicer.SlicerCache
             for pivot_name in pivot_names:
                 # 피벗 테이블 찾기
-                for ws in workbook.Sheets:
-                    try:
-                        pivot_table = ws.PivotTables(pivot_name)
-                        slicer_cache.PivotTables.AddPivotTable(pivot_table)
-                        break
-                    except:
-                        continue
+                pivot_table = self._locate_object(workbook, PIVOT, pivot_name, lambda ws: ws.PivotTables(pivot_name))
+                if pivot_table is not None:
+                    slicer_cache.PivotTables.AddPivotTable(pivot_table)
 
         except Exception as e:
             raise COMError(f"슬라이서 연결 실패: {str(e)}")
@@ -1214,8 +1499,6 @@ class WindowsEngine(ExcelEngineBase):
     ) -> Dict[str, Any]:
         """도형 추가 (기본 기능만, 고급 기능은 xlwings 사용)"""
         try:
-            import win32com.client as win32
-
             ws = workbook.Sheets(sheet)
 
             # 도형 유형 매핑
@@ -1333,20 +1616,19 @@ class WindowsEngine(ExcelEngineBase):
     ) -> Dict[str, Any]:
         """Excel 테이블(ListObject) 생성"""
         try:
-            import win32com.client as win32
-
             ws = workbook.Sheets(sheet)
             range_obj = ws.Range(range_str)
 
             # 테이블 생성
             table = ws.ListObjects.Add(
-                SourceType=win32.constants.xlSrcRange,
+                SourceType=self._constants.xlSrcRange,
                 Source=range_obj,
-                XlListObjectHasHeaders=win32.constants.xlYes if has_headers else win32.constants.xlNo,
+                XlListObjectHasHeaders=self._constants.xlYes if has_headers else self._constants.xlNo,
             )
 
             if table_name:
                 table.Name = table_name
+            self.invalidate_object_index(workbook)
 
             # 테이블 스타일 적용
             if "table_style" in kwargs:
@@ -1363,8 +1645,6 @@ class WindowsEngine(ExcelEngineBase):
     def sort_table(self, workbook: Any, sheet: str, table_name: str, sort_fields: List[tuple]):
         """테이블 정렬"""
         try:
-            import win32com.client as win32
-
             ws = workbook.Sheets(sheet)
             table = ws.ListObjects(table_name)
 
@@ -1383,10 +1663,10 @@ class WindowsEngine(ExcelEngineBase):
                 if col_index is None:
                     continue
 
-                sort_order = win32.constants.xlAscending if order.lower() == "asc" else win32.constants.xlDescending
+                sort_order = self._constants.xlAscending if order.lower() == "asc" else self._constants.xlDescending
 
                 table.Sort.SortFields.Add(
-                    Key=table.ListColumns(col_index).Range, SortOn=win32.constants.xlSortOnValues, Order=sort_order
+                    Key=table.ListColumns(col_index).Range, SortOn=self._constants.xlSortOnValues, Order=sort_order
                 )
 
             # 정렬 실행
@@ -1407,15 +1687,13 @@ class WindowsEngine(ExcelEngineBase):
     def get_table_sort_info(self, workbook: Any, sheet: str, table_name: str) -> Dict[str, Any]:
         """테이블 정렬 정보 조회"""
         try:
-            import win32com.client as win32
-
             ws = workbook.Sheets(sheet)
             table = ws.ListObjects(table_name)
 
             sort_fields = []
             for sort_field in table.Sort.SortFields:
                 # 정렬 방향
-                order = "asc" if sort_field.Order == win32.constants.xlAscending else "desc"
+                order = "asc" if sort_field.Order == self._constants.xlAscending else "desc"
 
                 # 컬럼 이름 찾기
                 column_name = None
@@ -1501,8 +1779,6 @@ class WindowsEngine(ExcelEngineBase):
     def convert_range(self, workbook: Any, sheet: str, range_str: str, target_type: str, **kwargs):
         """셀 범위 데이터 형식 변환"""
         try:
-            import win32com.client as win32
-
             ws = workbook.Sheets(sheet)
             range_obj = ws.Range(range_str)
 
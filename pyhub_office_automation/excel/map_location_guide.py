@@ -4,13 +4,13 @@ Map Chart location name guidance command (Issue #72 Phase 2)
 Provides user-friendly guidance for Excel Map Chart location naming conventions.
 """
 
-import json
 from enum import Enum
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .location_converter import LocationConverter
@@ -70,7 +70,7 @@ def map_location_guide(
                     "supported_regions": guidance["supported_regions"],
                     "version": get_version(),
                 }
-                print(json.dumps(error_response, ensure_ascii=False, indent=2))
+                echo_json(error_response)
             else:
                 console.print(f"[red]Error: {guidance['error']}[/red]")
                 console.print(f"Supported regions: {', '.join(guidance['supported_regions'])}")
@@ -100,7 +100,7 @@ def map_location_guide(
                     "message": f"Tested {len(test_results)} location names",
                     "version": get_version(),
                 }
-                print(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 console.print("\n[bold cyan]Location Name Test Results[/bold cyan]\n")
                 for tr in test_results:
@@ -126,7 +126,7 @@ def map_location_guide(
                 "message": f"Location guidance for {region}",
                 "version": get_version(),
             }
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             # Rich text output
             console.print(f"\n[bold cyan]Excel Map Chart - {guidance['region']} Location Name Guide[/bold cyan]\n")
@@ -170,7 +170,7 @@ def map_location_guide(
                 "error": str(e),
                 "version": get_version(),
             }
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
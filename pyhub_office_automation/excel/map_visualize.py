@@ -12,6 +12,7 @@ import pandas as pd
 import typer
 from rich.console import Console
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .map_visualizer import MapVisualizer
@@ -91,7 +92,7 @@ def map_visualize(
             error_msg = f"Data file not found: {data_file}"
             if output_format == OutputFormat.JSON:
                 response = {"status": "error", "error": error_msg, "version": get_version()}
-                print(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 console.print(f"[red]Error: {error_msg}[/red]")
             raise typer.Exit(1)
@@ -129,7 +130,7 @@ def map_visualize(
                     "message": "Data validation completed",
                     "version": get_version(),
                 }
-                print(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 console.print("\n[bold cyan]Data Validation Results[/bold cyan]\n")
                 console.print(f"Total Locations: {validation_result['total_locations']}")
@@ -189,7 +190,7 @@ def map_visualize(
                 "message": f"Map created successfully: {output_path}",
                 "version": get_version(),
             }
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             console.print(f"\n[bold green]✓ Map created successfully![/bold green]")
             console.print(f"Output file: {output_path}")
@@ -200,7 +201,7 @@ def map_visualize(
     except Exception as e:
         if output_format == OutputFormat.JSON:
             error_response = {"status": "error", "error": str(e), "version": get_version()}
-            print(json.dumps(error_response, ensure_ascii=False, indent=2))
+            echo_json(error_response)
         else:
             console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -3,13 +3,13 @@ Excel 워크북 전체 메타데이터 자동 생성 명령어 (Issue #59)
 워크북의 모든 Excel Table에 대한 메타데이터를 일괄 생성 및 저장
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -161,7 +161,7 @@ def metadata_generate(
                 )
 
                 if output_format == "json":
-                    typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                    echo_json(response)
                 else:
                     typer.echo(f"ℹ️ {message}")
 
@@ -303,7 +303,7 @@ def metadata_generate(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"✅ {message}")
                 typer.echo()
@@ -338,7 +338,7 @@ def metadata_generate(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "metadata-generate")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다", err=True)
         raise typer.Exit(1)
@@ -346,7 +346,7 @@ def metadata_generate(
     except ValueError as e:
         error_response = create_error_response(e, "metadata-generate")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -354,7 +354,7 @@ def metadata_generate(
     except Exception as e:
         error_response = create_error_response(e, "metadata-generate")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo("💡 Excel이 설치되어 있는지 확인하고, 워크북에 Excel Table이 있는지 확인하세요.", err=True)
@@ -343,8 +343,9 @@ def auto_generate_table_metadata(
         # 시트 및 테이블 가져오기
         sheet = workbook.sheets[sheet_name]
 
-        # Excel Table 찾기
+        # Excel Table 찾기 (메타데이터에는 헤더와 행 수만 필요하므로 본문은 읽지 않음)
         table_range = None
+        header_values = None
         table_info = {}
 
         if platform.system() == "Windows":
@@ -352,6 +353,8 @@ def auto_generate_table_metadata(
                 for table in sheet.api.ListObjects():
                     if table.Name == table_name:
                         table_range = sheet.range(table.Range.Address)
+                        header_row = table.HeaderRowRange if table.HeaderRowRange is not None else table.Range.Rows(1)
+                        header_values = sheet.range(header_row.Address).value
                         table_info = {
                             "range": table.Range.Address,
                             "row_count": table.Range.Rows.Count - 1,  # 헤더 제외
@@ -375,8 +378,8 @@ def auto_generate_table_metadata(
             }
 
         # 데이터 분석
-        values = table_range.value
-        if not values or len(values) <= 1:
+        row_count = table_info.get("row_count", 0)
+        if header_values is None or row_count <= 0:
             return {
                 "description": f"{table_name} 테이블 (데이터 없음)",
                 "data_type": "empty",
@@ -387,9 +390,7 @@ def auto_generate_table_metadata(
                 "success": True,
             }
 
-        # 헤더와 데이터 분리
-        headers = values[0] if isinstance(values[0], list) else [values[0]]
-        data_rows = values[1:] if len(values) > 1 else []
+        headers = header_values if isinstance(header_values, list) else [header_values]
 
         # 컬럼 정보 생성
         column_info = ",".join([str(h) for h in headers if h is not None])
@@ -400,20 +401,20 @@ def auto_generate_table_metadata(
         # 설명 자동 생성
         description = f"{sheet_name} 시트의 {table_name} 테이블"
         if len(headers) > 0:
-            description += f" ({len(headers)}개 컬럼, {len(data_rows)}행)"
+            description += f" ({len(headers)}개 컬럼, {row_count}행)"
 
         # 태그 생성
         tags = ["auto-generated"]
         if data_type != "unknown":
             tags.append(data_type)
-        if len(data_rows) > 100:
+        if row_count > 100:
             tags.append("large-dataset")
 
         return {
             "description": description,
             "data_type": data_type,
             "column_info": column_info[:255],  # Excel 셀 길이 제한 고려
-            "row_count": len(data_rows),
+            "row_count": row_count,
             "tags": ",".join(tags),
             "notes": f"자동 생성 ({datetime.datetime.now().strftime('%Y-%m-%d %H:%M')})",
             "success": True,
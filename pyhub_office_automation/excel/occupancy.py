@@ -0,0 +1,119 @@
+"""
+시트 점유 영역 인덱스 (피벗 테이블/차트 자동 배치용)
+
+시트의 데이터 영역, 피벗 테이블, 차트가 차지한 셀 직사각형을 한 번 모아 두고
+"w×h 크기를 min_spacing 간격으로 놓을 수 있는 첫 빈 위치"를 계산합니다.
+
+각 점유 영역은 새 객체의 왼쪽 위 셀이 놓일 수 없는 직사각형(금지 영역)으로 바뀌며,
+빈 위치의 열은 1 또는 어떤 금지 영역의 끝 열 + 1 중 하나이고 행도 마찬가지입니다.
+따라서 후보 셀을 하나씩 검사하지 않고 이 경계들만 확인하므로 검색 범위 제한이 없습니다.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+# Excel 워크시트 크기
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLUMNS = 16_384
+
+# (start_row, start_col, end_row, end_col), 1-based, 양끝 포함
+Rect = Tuple[int, int, int, int]
+
+
+class SheetOccupancy:
+    """
+    시트에서 객체가 차지한 셀 직사각형 목록
+
+    preferred_position별 검색 순서:
+    - "right": 기존 객체들의 행 범위(1행 ~ 가장 아래 행) 안에 왼쪽 위가 오는 위치 중 가장 왼쪽 열, 그 열에서 가장 위 행
+    - "bottom": 기존 객체들의 열 범위(A열 ~ 가장 오른쪽 열) 안에 왼쪽 위가 오는 위치 중 가장 위 행, 그 행에서 가장 왼쪽 열
+    """
+
+    def __init__(self, rects: Iterable[Rect] = ()):
+        self._rects: List[Rect] = []
+        for rect in rects:
+            self.add(*rect)
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def add(self, start_row: int, start_col: int, end_row: int, end_col: int):
+        """점유 영역 추가 (시작/끝 순서는 상관없음)"""
+        self._rects.append(
+            (min(start_row, end_row), min(start_col, end_col), max(start_row, end_row), max(start_col, end_col))
+        )
+
+    @property
+    def bounds(self) -> Optional[Tuple[int, int]]:
+        """점유 영역 전체의 (가장 아래 행, 가장 오른쪽 열), 비어 있으면 None"""
+        if not self._rects:
+            return None
+        return max(rect[2] for rect in self._rects), max(rect[3] for rect in self._rects)
+
+    def overlaps(self, rect: Rect, spacing: int = 0) -> bool:
+        """rect가 spacing만큼 넓힌 점유 영역 중 하나와 겹치는지 여부"""
+        start_row, start_col, end_row, end_col = rect
+        return any(
+            start_row <= e_end_row + spacing
+            and end_row >= e_start_row - spacing
+            and start_col <= e_end_col + spacing
+            and end_col >= e_start_col - spacing
+            for e_start_row, e_start_col, e_end_row, e_end_col in self._rects
+        )
+
+    def find_free(self, width: int, height: int, spacing: int = 0, preferred_position: str = "right") -> Tuple[int, int]:
+        """
+        width열 × height행 객체를 놓을 수 있는 첫 빈 위치
+
+        Args:
+            width: 객체 열 수
+            height: 객체 행 수
+            spacing: 기존 객체와의 최소 간격 (행/열 단위)
+            preferred_position: "right" 또는 "bottom"
+
+        Returns:
+            왼쪽 위 셀의 (row, col) (1-based)
+
+        Raises:
+            ValueError: 크기나 간격이 잘못된 경우
+            RuntimeError: 빈 위치가 워크시트 크기를 넘는 경우
+        """
+        if width < 1 or height < 1:
+            raise ValueError(f"객체 크기는 1 이상이어야 합니다: {width}열 × {height}행")
+        if spacing < 0:
+            raise ValueError(f"간격은 0 이상이어야 합니다: {spacing}")
+
+        # 왼쪽 위 셀이 놓이면 (간격 포함) 겹치게 되는 행/열 구간
+        blocked_rows = [(sr - spacing - height + 1, er + spacing) for sr, _, er, _ in self._rects]
+        blocked_cols = [(sc - spacing - width + 1, ec + spacing) for _, sc, _, ec in self._rects]
+        bottom, right = self.bounds or (1, 1)
+
+        if preferred_position == "bottom":
+            row, col = _first_free(blocked_rows, blocked_cols, right)
+        else:
+            col, row = _first_free(blocked_cols, blocked_rows, bottom)
+
+        if row + height - 1 > EXCEL_MAX_ROWS or col + width - 1 > EXCEL_MAX_COLUMNS:
+            raise RuntimeError(
+                "시트에 충분한 빈 공간을 찾을 수 없습니다. 수동으로 위치를 지정하거나 기존 객체를 정리해주세요."
+            )
+        return row, col
+
+
+def _first_free(major: List[Tuple[int, int]], minor: List[Tuple[int, int]], minor_limit: int) -> Tuple[int, int]:
+    """
+    금지 영역 합집합 밖의 점 중 (major, minor) 사전순 최소인 점 (minor ≤ minor_limit)
+
+    major[i], minor[i]는 i번째 금지 영역의 두 축 구간입니다.
+    모든 금지 영역의 끝 다음 major 값에서는 minor=1이 비어 있으므로 항상 답이 있습니다.
+    """
+    candidates = sorted({1} | {end + 1 for _, end in major if end >= 1})
+    for position in candidates:
+        covering = sorted(minor[i] for i, (start, end) in enumerate(major) if start <= position <= end)
+        free = 1
+        for start, end in covering:
+            if start > free:
+                break
+            free = max(free, end + 1)
+        if free <= max(1, minor_limit):
+            return position, free
+    return candidates[-1], 1
@@ -12,9 +12,10 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
-from .engines import get_engine
+from .engines import PivotTableNotFoundError, get_engine
 from .utils import (
     create_error_response,
     create_success_response,
@@ -207,19 +208,10 @@ def pivot_configure(
         if sheet:
             target_sheet = get_sheet(book, sheet)
         else:
-            # 전체 워크북에서 피벗테이블 검색
-            found = False
-            for ws in book.sheets:
-                try:
-                    # Engine을 통해 확인
-                    ws.api.PivotTables(pivot_name)
-                    target_sheet = ws
-                    found = True
-                    break
-                except:
-                    continue
-
-            if not found:
+            # 전체 워크북에서 피벗테이블 검색 (엔진의 이름 인덱스로 시트 조회)
+            try:
+                target_sheet = get_sheet(book, engine.get_pivot_sheet_name(book.api, pivot_name))
+            except PivotTableNotFoundError:
                 raise ValueError(f"피벗테이블 '{pivot_name}'을 찾을 수 없습니다")
 
         # 구성 파라미터 준비
@@ -307,7 +299,7 @@ def pivot_configure(
 
         # 출력 형식에 따른 결과 반환
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:  # text 형식
             typer.echo(f"✅ 피벗테이블 구성 완료")
             typer.echo(f"📋 피벗테이블 이름: {pivot_name}")
@@ -348,7 +340,7 @@ def pivot_configure(
     except ValueError as e:
         error_response = create_error_response(e, "pivot-configure")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         sys.exit(1)
@@ -356,7 +348,7 @@ def pivot_configure(
     except RuntimeError as e:
         error_response = create_error_response(e, "pivot-configure")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             if "Windows" in str(e):
@@ -370,7 +362,7 @@ def pivot_configure(
     except Exception as e:
         error_response = create_error_response(e, "pivot-configure")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         sys.exit(1)
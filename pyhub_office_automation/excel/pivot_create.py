@@ -3,7 +3,6 @@
 Windows COM API를 활용한 Excel 피벗테이블 생성 기능
 """
 
-import json
 import platform
 import sys
 from pathlib import Path
@@ -12,6 +11,7 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -327,7 +327,7 @@ def pivot_create(
 
         # 출력 형식에 따른 결과 반환
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:  # text 형식
             typer.echo(f"✅ 피벗테이블 생성 성공")
             typer.echo(f"📋 피벗테이블 이름: {pivot_name}")
@@ -367,7 +367,7 @@ def pivot_create(
     except ValueError as e:
         error_response = create_error_response(e, "pivot-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -375,7 +375,7 @@ def pivot_create(
     except RuntimeError as e:
         error_response = create_error_response(e, "pivot-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             if "Windows" in str(e):
@@ -389,7 +389,7 @@ def pivot_create(
     except Exception as e:
         error_response = create_error_response(e, "pivot-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
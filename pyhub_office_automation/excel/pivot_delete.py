@@ -3,7 +3,6 @@
 워크북에서 특정 피벗테이블을 삭제
 """
 
-import json
 import platform
 import sys
 from pathlib import Path
@@ -12,9 +11,10 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
-from .engines import get_engine
+from .engines import PivotTableNotFoundError, get_engine
 from .utils import (
     create_error_response,
     create_success_response,
@@ -88,23 +88,19 @@ def pivot_delete(
             except:
                 raise ValueError(f"시트 '{sheet}'에서 피벗테이블 '{pivot_name}'을 찾을 수 없습니다")
         else:
-            # 전체 워크북에서 피벗테이블 검색
-            for ws in book.sheets:
-                try:
-                    pivot_table = ws.api.PivotTables(pivot_name)
-                    target_sheet = ws
-                    pivot_info = {
-                        "name": pivot_table.Name,
-                        "sheet": target_sheet.name,
-                        "location": pivot_table.TableRange1.Address if hasattr(pivot_table, "TableRange1") else "Unknown",
-                    }
-                    break
-                except:
-                    continue
-
-            if not target_sheet:
+            # 전체 워크북에서 피벗테이블 검색 (엔진의 이름 인덱스로 시트 조회)
+            try:
+                target_sheet = get_sheet(book, engine.get_pivot_sheet_name(book.api, pivot_name))
+            except PivotTableNotFoundError:
                 raise ValueError(f"피벗테이블 '{pivot_name}'을 찾을 수 없습니다")
 
+            pivot_table = target_sheet.api.PivotTables(pivot_name)
+            pivot_info = {
+                "name": pivot_table.Name,
+                "sheet": target_sheet.name,
+                "location": pivot_table.TableRange1.Address if hasattr(pivot_table, "TableRange1") else "Unknown",
+            }
+
         # 삭제 전 정보 수집 (Engine 사용 전 직접 수집)
         try:
             pivot_table = target_sheet.api.PivotTables(pivot_name)
@@ -179,18 +175,16 @@ def pivot_delete(
             try:
                 cache_index = cache_info["index"]
 
-                # 해당 캐시를 사용하는 다른 피벗테이블이 있는지 확인
+                # 해당 캐시를 사용하는 다른 피벗테이블이 있는지 확인 (엔진의 피벗테이블 목록 사용)
                 cache_in_use = False
-                for ws in book.sheets:
+                for sheet_name, name in engine.list_pivot_table_names(book.api):
                     try:
-                        for pt in ws.api.PivotTables():
-                            if hasattr(pt, "CacheIndex") and pt.CacheIndex == cache_index:
-                                cache_in_use = True
-                                break
+                        pt = book.api.Sheets(sheet_name).PivotTables(name)
+                        if hasattr(pt, "CacheIndex") and pt.CacheIndex == cache_index:
+                            cache_in_use = True
+                            break
                     except:
                         continue
-                    if cache_in_use:
-                        break
 
                 if not cache_in_use:
                     # 캐시를 사용하는 피벗테이블이 없으면 삭제
@@ -245,7 +239,7 @@ def pivot_delete(
 
         # 출력 형식에 따른 결과 반환
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:  # text 형식
             typer.echo(f"✅ 피벗테이블 삭제 완료")
             typer.echo(f"📋 피벗테이블 이름: {pivot_name}")
@@ -293,7 +287,7 @@ def pivot_delete(
     except ValueError as e:
         error_response = create_error_response(e, "pivot-delete")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             if "confirm" in str(e).lower():
@@ -303,7 +297,7 @@ def pivot_delete(
     except RuntimeError as e:
         error_response = create_error_response(e, "pivot-delete")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             if "Windows" in str(e):
@@ -319,7 +313,7 @@ def pivot_delete(
     except Exception as e:
         error_response = create_error_response(e, "pivot-delete")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -3,7 +3,6 @@
 워크북 내 모든 피벗테이블의 정보를 조회
 """
 
-import json
 import platform
 import sys
 from pathlib import Path
@@ -12,6 +11,8 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -27,6 +28,7 @@ from .utils import (
 )
 
 
+@cached_result("pivot-list")
 def pivot_list(
     file_path: Optional[str] = typer.Option(None, "--file-path", help="조회할 Excel 파일의 절대 경로"),
     workbook_name: Optional[str] = typer.Option(None, "--workbook-name", help='열린 워크북 이름으로 접근 (예: "Sales.xlsx")'),
@@ -246,7 +248,7 @@ def pivot_list(
 
         # 출력 형식에 따른 결과 반환
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:  # text 형식
             typer.echo(f"✅ 피벗테이블 목록 조회 완료")
             typer.echo(f"📄 파일: {data_content['file_info']['name']}")
@@ -296,7 +298,7 @@ def pivot_list(
     except ValueError as e:
         error_response = create_error_response(e, "pivot-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -304,7 +306,7 @@ def pivot_list(
     except RuntimeError as e:
         error_response = create_error_response(e, "pivot-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             typer.echo(
@@ -315,7 +317,7 @@ def pivot_list(
     except Exception as e:
         error_response = create_error_response(e, "pivot-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -3,7 +3,6 @@
 데이터 소스 변경 사항을 피벗테이블에 반영
 """
 
-import json
 import platform
 import sys
 from pathlib import Path
@@ -12,9 +11,10 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
-from .engines import get_engine
+from .engines import PivotTableNotFoundError, get_engine
 from .utils import (
     create_error_response,
     create_success_response,
@@ -76,34 +76,27 @@ def pivot_refresh(
             # Windows: Engine Layer 사용
 
             if refresh_all:
-                # 전체 워크북의 모든 피벗테이블 새로고침
-                for ws in book.sheets:
+                # 전체 워크북의 모든 피벗테이블 새로고침 (엔진의 피벗테이블 목록 사용)
+                for sheet_name, name in engine.list_pivot_table_names(book.api):
+                    pivot_info = {"name": name, "sheet": sheet_name, "status": "success"}
                     try:
-                        for pivot_table in ws.api.PivotTables():
-                            pivot_info = {"name": pivot_table.Name, "sheet": ws.name, "status": "success"}
-                            try:
-                                # Engine을 통한 새로고침
-                                result = engine.refresh_pivot_table(
-                                    workbook=book.api, sheet_name=ws.name, pivot_name=pivot_table.Name
-                                )
-                                if result.get("refreshed"):
-                                    refresh_results["refreshed_pivots"].append(pivot_info)
-                                    refresh_results["success_count"] += 1
-                                else:
-                                    pivot_info["status"] = "failed"
-                                    pivot_info["error"] = "Refresh failed"
-                                    refresh_results["failed_pivots"].append(pivot_info)
-                                    refresh_results["error_count"] += 1
-                            except Exception as e:
-                                pivot_info["status"] = "failed"
-                                pivot_info["error"] = str(e)
-                                refresh_results["failed_pivots"].append(pivot_info)
-                                refresh_results["error_count"] += 1
+                        # Engine을 통한 새로고침
+                        result = engine.refresh_pivot_table(workbook=book.api, sheet_name=sheet_name, pivot_name=name)
+                        if result.get("refreshed"):
+                            refresh_results["refreshed_pivots"].append(pivot_info)
+                            refresh_results["success_count"] += 1
+                        else:
+                            pivot_info["status"] = "failed"
+                            pivot_info["error"] = "Refresh failed"
+                            refresh_results["failed_pivots"].append(pivot_info)
+                            refresh_results["error_count"] += 1
+                    except Exception as e:
+                        pivot_info["status"] = "failed"
+                        pivot_info["error"] = str(e)
+                        refresh_results["failed_pivots"].append(pivot_info)
+                        refresh_results["error_count"] += 1
 
-                            refresh_results["total_processed"] += 1
-                    except:
-                        # 시트에 피벗테이블이 없거나 접근 불가
-                        continue
+                    refresh_results["total_processed"] += 1
 
             elif pivot_name:
                 # 특정 피벗테이블 새로고침
@@ -118,16 +111,10 @@ def pivot_refresh(
                     except:
                         raise ValueError(f"시트 '{sheet}'에서 피벗테이블 '{pivot_name}'을 찾을 수 없습니다")
                 else:
-                    # 전체 워크북에서 피벗테이블 검색
-                    for ws in book.sheets:
-                        try:
-                            ws.api.PivotTables(pivot_name)
-                            target_sheet = ws
-                            break
-                        except:
-                            continue
-
-                    if not target_sheet:
+                    # 전체 워크북에서 피벗테이블 검색 (엔진의 이름 인덱스로 시트 조회)
+                    try:
+                        target_sheet = get_sheet(book, engine.get_pivot_sheet_name(book.api, pivot_name))
+                    except PivotTableNotFoundError:
                         raise ValueError(f"피벗테이블 '{pivot_name}'을 찾을 수 없습니다")
 
                 # 피벗테이블 새로고침
@@ -252,7 +239,7 @@ def pivot_refresh(
 
         # 출력 형식에 따른 결과 반환
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:  # text 형식
             typer.echo(f"✅ 피벗테이블 새로고침 완료")
             typer.echo(f"📄 파일: {data_content['file_info']['name']}")
@@ -295,7 +282,7 @@ def pivot_refresh(
     except ValueError as e:
         error_response = create_error_response(e, "pivot-refresh")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -303,7 +290,7 @@ def pivot_refresh(
     except RuntimeError as e:
         error_response = create_error_response(e, "pivot-refresh")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             if "Windows" in str(e):
@@ -320,7 +307,7 @@ def pivot_refresh(
     except Exception as e:
         error_response = create_error_response(e, "pivot-refresh")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
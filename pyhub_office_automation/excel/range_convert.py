@@ -3,7 +3,6 @@ Excel 셀 범위 데이터 형식 변환 명령어 (Typer 버전)
 문자열에서 숫자로 변환하는 기능 제공
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Optional
@@ -11,6 +10,7 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -273,7 +273,7 @@ def range_convert(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 conv = conversion_info
                 wb = workbook_info
@@ -295,7 +295,7 @@ def range_convert(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "range-convert")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다", err=True)
         raise typer.Exit(1)
@@ -303,7 +303,7 @@ def range_convert(
     except ValueError as e:
         error_response = create_error_response(e, "range-convert")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -311,7 +311,7 @@ def range_convert(
     except Exception as e:
         error_response = create_error_response(e, "range-convert")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo(
@@ -2,19 +2,20 @@
 Excel 셀 범위 데이터 읽기 명령어 (Engine 기반)
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import ByteCounter, echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
+from .engines.columnar import COLUMNAR_FORMATS, stdout_binary, write_columnar
 from .utils import (
+    DataOutputFormat,
     ExecutionTimer,
     ExpandMode,
-    OutputFormat,
     create_error_response,
     create_success_response,
     normalize_path,
@@ -32,7 +33,13 @@ def range_read(
     include_formulas: bool = typer.Option(
         True, "--include-formulas/--no-include-formulas", help="공식 포함 여부 (기본: True)"
     ),
-    output_format: OutputFormat = typer.Option(OutputFormat.JSON, "--format", help="출력 형식 선택"),
+    output_format: DataOutputFormat = typer.Option(
+        DataOutputFormat.JSON, "--format", help="출력 형식 선택 (json, csv, text, arrow, parquet, npy)"
+    ),
+    header: bool = typer.Option(True, "--header/--no-header", help="첫 행을 열 이름으로 사용 (arrow/parquet/npy)"),
+    output_file: Optional[str] = typer.Option(
+        None, "--output-file", help="arrow/parquet/npy 결과를 저장할 파일 (미지정시 stdout)"
+    ),
     visible: bool = typer.Option(False, "--visible", help="Excel 애플리케이션을 화면에 표시할지 여부"),
 ):
     """
@@ -50,12 +57,18 @@ def range_read(
       • down: 아래쪽으로 데이터가 있는 곳까지 확장
       • right: 오른쪽으로 데이터가 있는 곳까지 확장
 
+    \b
+    열 단위 바이너리 형식 (arrow/parquet/npy):
+      • 열마다 타입이 정해진 배열로 출력 (첫 행은 열 이름, --no-header로 끔)
+      • --output-file을 지정하면 파일에 저장하고 JSON 요약을 출력
+
     \b
     사용 예제:
       oa excel range-read --range "A1:C10"
       oa excel range-read --file-path "data.xlsx" --range "A1:C10"
       oa excel range-read --range "Sheet1!A1:C10" --no-include-formulas
       oa excel range-read --range "A1" --expand table
+      oa excel range-read --range "A1" --expand table --format parquet --output-file data.parquet
     """
     try:
         # 실행 시간 측정 시작
@@ -95,14 +108,50 @@ def range_read(
             if expand:
                 expand_str = expand.value if hasattr(expand, "value") else str(expand)
 
+            # CSV 출력: 행 청크 단위로 스트리밍 (시트 크기와 무관하게 메모리 사용량 일정)
+            if output_format == DataOutputFormat.CSV:
+                import csv
+                import io
+
+                for chunk in engine.read_range_iter(book, sheet_name, parsed_range, expand=expand_str):
+                    output = io.StringIO()
+                    csv.writer(output).writerows(chunk)
+                    typer.echo(output.getvalue(), nl=False)
+                return
+
             # Engine을 통해 범위 읽기
             range_data = engine.read_range(
                 book, sheet_name, parsed_range, expand=expand_str, include_formulas=include_formulas
             )
 
-            # 데이터 구성
+            # 열 단위 바이너리 출력: 공식 없이 값만 읽어 열 배열로 변환
+            if output_format.value in COLUMNAR_FORMATS:
+                range_data = engine.read_range(book, sheet_name, parsed_range, expand=expand_str, include_formulas=False)
+                columnar = range_data.to_columnar(header=header)
+                written = write_columnar(columnar, output_format.value, output_file or stdout_binary())
+                if output_file:
+                    response = create_success_response(
+                        data={
+                            "output_file": output_file,
+                            "format": output_format.value,
+                            "range": range_data.address,
+                            "sheet": range_data.sheet_name,
+                            "columns": [str(name) for name in columnar.names],
+                            "row_count": columnar.row_count,
+                            "column_count": columnar.column_count,
+                        },
+                        command="range-read",
+                        message=f"범위 '{range_data.address}' 데이터를 '{output_file}'에 저장했습니다",
+                        execution_time_ms=timer.execution_time_ms,
+                        data_size=written,
+                    )
+                    echo_json(response)
+                return
+
+            # 데이터 구성 (values는 출력하면서 크기를 측정)
+            values_size = ByteCounter()
             data_content = {
-                "values": range_data.values,
+                "values": values_size.measure(range_data.values),
                 "range": range_data.address,
                 "sheet": range_data.sheet_name,
                 "range_info": {
@@ -124,42 +173,18 @@ def range_read(
                 "sheet_name": sheet_name,
             }
 
-            # 데이터 크기 계산
-            data_size = len(str(range_data.values).encode("utf-8"))
-
             # 성공 응답 생성
             response = create_success_response(
                 data=data_content,
                 command="range-read",
                 message=f"범위 '{range_data.address}' 데이터를 성공적으로 읽었습니다",
                 execution_time_ms=timer.execution_time_ms,
-                data_size=data_size,
+                data_size=values_size,
             )
 
             # 출력 형식에 따른 결과 반환
-            if output_format == OutputFormat.JSON:
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
-            elif output_format == OutputFormat.CSV:
-                # CSV 형식으로 값만 출력
-                import csv
-                import io
-
-                output = io.StringIO()
-                writer = csv.writer(output)
-
-                values = range_data.values
-                if isinstance(values, list):
-                    if values and isinstance(values[0], list):
-                        # 2차원 데이터
-                        writer.writerows(values)
-                    else:
-                        # 1차원 데이터
-                        writer.writerow(values)
-                else:
-                    # 단일 값
-                    writer.writerow([values])
-
-                typer.echo(output.getvalue().rstrip())
+            if output_format == DataOutputFormat.JSON:
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"📄 파일: {data_content['file_info']['name']}")
                 typer.echo(f"📋 시트: {sheet_name}")
@@ -181,24 +206,24 @@ def range_read(
 
     except FileNotFoundError as e:
         error_response = create_error_response(e, "range-read")
-        if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+        if output_format == DataOutputFormat.JSON:
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다: {file_path}", err=True)
         raise typer.Exit(1)
 
     except ValueError as e:
         error_response = create_error_response(e, "range-read")
-        if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+        if output_format == DataOutputFormat.JSON:
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
 
     except Exception as e:
         error_response = create_error_response(e, "range-read")
-        if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+        if output_format == DataOutputFormat.JSON:
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -2,12 +2,14 @@
 Excel 셀 범위 데이터 쓰기 명령어 (Engine 기반)
 """
 
+import csv
 import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -33,6 +35,12 @@ def range_write(
     output_format: str = typer.Option("json", "--format", help="출력 형식 선택"),
     visible: bool = typer.Option(False, "--visible", help="Excel 애플리케이션을 화면에 표시할지 여부"),
     create_sheet: bool = typer.Option(False, "--create-sheet", help="시트가 없으면 생성할지 여부"),
+    chunk_rows: Optional[int] = typer.Option(
+        None, "--chunk-rows", min=1, help="청크당 행 수 (미지정시 쓰기 속도에 맞춰 자동 조정)"
+    ),
+    resume_offset: int = typer.Option(0, "--resume-offset", min=0, help="이미 기록된 행 수 (중단된 쓰기 재개용)"),
+    progress_file: Optional[str] = typer.Option(None, "--progress-file", help="청크마다 재개 위치(offset)를 기록할 JSON 파일"),
+    progress: bool = typer.Option(False, "--progress", help="청크별 진행 상황을 stderr로 출력"),
 ):
     """
     Excel 셀 범위에 데이터를 씁니다.
@@ -54,8 +62,15 @@ def range_write(
       oa excel range-write --range "A1" --data '["Name", "Age"]'
       oa excel range-write --file-path "data.xlsx" --range "A1" --data-file "data.json"
       oa excel range-write --range "Sheet1!A1" --data '[[1,2,3],[4,5,6]]'
+
+    \b
+    대용량 데이터 (2차원 데이터는 행 청크 단위로 나누어 기록):
+      oa excel range-write --file-path "data.xlsx" --range "A1" --data-file "big.csv" --progress-file "big.progress.json"
+      oa excel range-write --file-path "data.xlsx" --range "A1" --data-file "big.csv" --resume-offset 120000
     """
     temp_file_path = None
+    csv_handle = None
+    last_progress = None
 
     try:
         # 데이터 입력 검증
@@ -78,7 +93,12 @@ def range_write(
                 if not data_file_path.exists():
                     raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {data_file_path}")
 
-                write_data, temp_file_path = load_data_from_file(str(data_file_path))
+                if data_file_path.suffix.lower() == ".csv":
+                    # CSV는 행 단위로 스트리밍 (청크 쓰기가 필요한 만큼만 읽음)
+                    csv_handle = open(data_file_path, "r", encoding="utf-8", newline="")
+                    write_data = csv.reader(csv_handle)
+                else:
+                    write_data = load_data_from_file(str(data_file_path))
             else:
                 # 직접 입력된 데이터 파싱
                 try:
@@ -115,23 +135,48 @@ def range_write(
                 else:
                     raise ValueError(f"시트 '{sheet_name}'을 찾을 수 없습니다. 사용 가능한 시트: {wb_info['sheets']}")
 
-            # Engine을 통해 데이터 쓰기
-            engine.write_range(book, sheet_name, start_cell, write_data, include_formulas=False)
+            # Engine을 통해 데이터 쓰기 (2차원 데이터는 청크 단위)
+            is_rows = csv_handle is not None or (
+                isinstance(write_data, list) and bool(write_data) and isinstance(write_data[0], list)
+            )
+            if is_rows:
+
+                def on_progress(state):
+                    nonlocal last_progress
+                    last_progress = state
+                    if progress_file:
+                        _write_progress_file(progress_file, state)
+                    if progress:
+                        typer.echo(
+                            f"⏳ {state.offset}행 기록 (청크 {state.chunk_rows}행, {state.rows_per_second:.0f}행/초)",
+                            err=True,
+                        )
+
+                result = engine.write_range_chunked(
+                    book,
+                    sheet_name,
+                    start_cell,
+                    write_data,
+                    chunk_rows=chunk_rows,
+                    start_offset=resume_offset,
+                    progress_callback=on_progress,
+                )
+
+                # 데이터 크기 계산 (이번 실행에서 기록한 행 기준)
+                row_count = result.offset - resume_offset
+                col_count = result.column_count
+            else:
+                engine.write_range(book, sheet_name, start_cell, write_data, include_formulas=False)
 
-            # 데이터 크기 계산
-            if isinstance(write_data, list):
-                if write_data and isinstance(write_data[0], list):
-                    # 2차원 데이터
-                    row_count = len(write_data)
-                    col_count = len(write_data[0]) if write_data else 1
-                else:
+                # 데이터 크기 계산
+                if isinstance(write_data, list):
                     # 1차원 데이터
                     row_count = 1
                     col_count = len(write_data)
-            else:
-                # 단일 값
-                row_count = 1
-                col_count = 1
+                else:
+                    # 단일 값
+                    row_count = 1
+                    col_count = 1
 
             # 쓰여진 데이터 정보 수집
             written_info = {
@@ -141,6 +186,9 @@ def range_write(
                 "column_count": col_count,
                 "cells_count": row_count * col_count,
             }
+            if is_rows:
+                written_info["chunk_count"] = result.chunk_count
+                written_info["resume_offset"] = result.offset
 
             # 저장 처리 (macOS의 경우 COM 객체가 아닐 수 있음)
             saved_successfully = False
@@ -180,7 +228,7 @@ def range_write(
 
             # 출력
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"✅ {message}")
                 typer.echo()
@@ -190,25 +238,25 @@ def range_write(
                 typer.echo(f"📊 크기: {row_count}행 × {col_count}열 ({row_count * col_count}개 셀)")
 
     except FileNotFoundError as e:
-        error_response = create_error_response(e, "range-write")
+        error_response = _with_resume_offset(create_error_response(e, "range-write"), last_progress)
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다: {str(e)}", err=True)
         raise typer.Exit(1)
 
     except ValueError as e:
-        error_response = create_error_response(e, "range-write")
+        error_response = _with_resume_offset(create_error_response(e, "range-write"), last_progress)
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
 
     except Exception as e:
-        error_response = create_error_response(e, "range-write")
+        error_response = _with_resume_offset(create_error_response(e, "range-write"), last_progress)
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -217,6 +265,36 @@ def range_write(
         # 임시 파일 정리
         if temp_file_path:
             cleanup_temp_file(temp_file_path)
+        if csv_handle:
+            csv_handle.close()
+
+
+def _write_progress_file(progress_file: str, state) -> None:
+    """청크 쓰기 진행 상황(재개 위치)을 JSON 파일에 기록"""
+    progress_path = Path(normalize_path(progress_file))
+    temp_path = progress_path.with_name(progress_path.name + ".tmp")
+    temp_path.write_text(
+        json.dumps(
+            {
+                "resume_offset": state.offset,
+                "chunk_rows": state.chunk_rows,
+                "chunk_count": state.chunk_count,
+                "rows_per_second": round(state.rows_per_second, 1),
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    # 중간에 중단되어도 이전 기록이 깨지지 않도록 원자적으로 교체
+    temp_path.replace(progress_path)
+
+
+def _with_resume_offset(error_response: dict, last_progress) -> dict:
+    """청크 쓰기 도중 실패한 경우 재개 위치를 오류 응답에 추가"""
+    if last_progress is not None:
+        error_response["resume_offset"] = last_progress.offset
+        error_response["suggestion"] = f"--resume-offset {last_progress.offset} 옵션으로 이어서 쓸 수 있습니다"
+    return error_response
 
 
 if __name__ == "__main__":
@@ -0,0 +1,131 @@
+"""
+Excel 대량 작업 세션 명령어 (Typer 버전)
+
+세션 동안 화면 갱신(ScreenUpdating), 자동 계산(Calculation), 이벤트(EnableEvents),
+경고 대화상자(DisplayAlerts)를 꺼서 연속된 쓰기 명령어마다 전체 재계산이 일어나지 않도록 합니다.
+세션을 종료하면 이전 설정을 복원하고 한 번만 재계산합니다.
+
+각 명령어는 별도 프로세스로 실행되므로, 복원할 이전 설정은 홈 디렉토리의 상태 파일에 보관합니다.
+"""
+
+import json
+from pathlib import Path
+
+import typer
+
+from pyhub_office_automation.utils.json_output import echo_json
+
+from .engines import get_engine
+from .utils import ExecutionTimer, create_error_response, create_success_response
+
+# 진행 중인 세션의 이전 Excel 설정을 보관하는 파일
+SESSION_STATE_FILE = Path.home() / ".oa_excel_bulk_session.json"
+
+session_app = typer.Typer(help="대량 작업 세션 (화면 갱신/자동 계산/이벤트 일시 중지)", no_args_is_help=True)
+
+
+def _echo_response(response: dict, output_format: str, message: str):
+    if output_format == "json":
+        echo_json(response)
+    else:
+        typer.echo(f"✅ {message}")
+
+
+def _echo_error(error: Exception, command: str, output_format: str):
+    error_response = create_error_response(error, command)
+    if output_format == "json":
+        echo_json(error_response, err=True)
+    else:
+        typer.echo(f"❌ {str(error)}", err=True)
+    raise typer.Exit(1)
+
+
+@session_app.command("begin")
+def session_begin(
+    output_format: str = typer.Option("json", "--format", help="출력 형식 선택"),
+):
+    """
+    대량 작업 세션을 시작합니다.
+
+    자동 계산을 수동으로 바꾸고 화면 갱신, 이벤트, 경고 대화상자를 끕니다.
+    작업이 끝나면 반드시 'oa excel session end'로 복원하세요.
+
+    \b
+    사용 예제:
+      oa excel session begin
+      oa excel range-write --range "A1" --data-file "part1.csv"
+      oa excel chart-add --data-range "A1:C100" --chart-type column
+      oa excel session end
+    """
+    try:
+        with ExecutionTimer() as timer:
+            if SESSION_STATE_FILE.exists():
+                raise RuntimeError("이미 진행 중인 세션이 있습니다. 'oa excel session end'로 먼저 종료하세요.")
+
+            state = get_engine().begin_bulk()
+            SESSION_STATE_FILE.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+
+        message = "대량 작업 세션을 시작했습니다 (자동 계산/화면 갱신/이벤트/경고 일시 중지)"
+        response = create_success_response(
+            data={"active": True, "saved_state": state},
+            command="session-begin",
+            message=message,
+            execution_time_ms=timer.execution_time_ms,
+        )
+        _echo_response(response, output_format, message)
+
+    except Exception as e:
+        _echo_error(e, "session-begin", output_format)
+
+
+@session_app.command("end")
+def session_end(
+    recalculate: bool = typer.Option(True, "--recalc/--no-recalc", help="복원 전 전체 재계산 실행 여부"),
+    output_format: str = typer.Option("json", "--format", help="출력 형식 선택"),
+):
+    """
+    대량 작업 세션을 종료하고 이전 설정을 복원합니다.
+
+    세션 동안 미뤄진 계산은 한 번의 재계산으로 처리합니다.
+    """
+    try:
+        with ExecutionTimer() as timer:
+            if not SESSION_STATE_FILE.exists():
+                raise RuntimeError("진행 중인 세션이 없습니다. 'oa excel session begin'으로 시작하세요.")
+
+            state = json.loads(SESSION_STATE_FILE.read_text(encoding="utf-8"))
+            get_engine().end_bulk(state, recalculate=recalculate)
+            SESSION_STATE_FILE.unlink()
+
+        message = "대량 작업 세션을 종료하고 이전 설정을 복원했습니다"
+        response = create_success_response(
+            data={"active": False, "restored_state": state, "recalculated": recalculate},
+            command="session-end",
+            message=message,
+            execution_time_ms=timer.execution_time_ms,
+        )
+        _echo_response(response, output_format, message)
+
+    except Exception as e:
+        _echo_error(e, "session-end", output_format)
+
+
+@session_app.command("status")
+def session_status(
+    output_format: str = typer.Option("json", "--format", help="출력 형식 선택"),
+):
+    """진행 중인 대량 작업 세션이 있는지 확인합니다."""
+    try:
+        active = SESSION_STATE_FILE.exists()
+        state = json.loads(SESSION_STATE_FILE.read_text(encoding="utf-8")) if active else None
+
+        message = "대량 작업 세션이 진행 중입니다" if active else "진행 중인 대량 작업 세션이 없습니다"
+        response = create_success_response(
+            data={"active": active, "saved_state": state},
+            command="session-status",
+            message=message,
+        )
+        _echo_response(response, output_format, message)
+
+    except Exception as e:
+        _echo_error(e, "session-status", output_format)
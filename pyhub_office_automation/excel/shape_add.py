@@ -4,13 +4,13 @@ xlwings를 활용한 Excel 도형 생성 기능
 뉴모피즘 스타일 대시보드 지원
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -247,11 +247,11 @@ def shape_add(
                 shape_count=len(target_sheet.shapes),
             )
 
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "shape-add")
-        typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
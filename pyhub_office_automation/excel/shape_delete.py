@@ -3,12 +3,12 @@
 xlwings를 활용한 Excel 도형 삭제 기능
 """
 
-import json
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -186,7 +186,7 @@ def shape_delete(
                     book=book,
                 )
 
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
                 raise typer.Exit(0)
 
             # 실제 삭제 수행
@@ -240,11 +240,11 @@ def shape_delete(
                 shapes_deleted=deleted_count,
             )
 
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "shape-delete")
-        typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+        echo_json(error_response, err=True)
         raise typer.Exit(1)
 
     finally:
@@ -4,13 +4,13 @@ xlwings를 활용한 Excel 도형 포맷팅 기능
 뉴모피즘 스타일 및 고급 그래픽 효과 지원
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -365,11 +365,11 @@ def shape_format(
                 styles_applied=len(applied_styles),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "shape-format")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
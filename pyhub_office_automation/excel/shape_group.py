@@ -3,13 +3,13 @@
 xlwings를 활용한 Excel 도형 그룹화 및 해제 기능
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -217,11 +217,11 @@ def shape_group(
                 affected_shapes=result.get("affected_shapes_count", 0),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "shape-group")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
@@ -3,13 +3,13 @@
 xlwings를 활용한 Excel 도형 정보 수집 기능
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -218,11 +218,11 @@ def shape_list(
                 shapes_count=len(shapes_info),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "shape-list")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
@@ -3,7 +3,6 @@ Excel 워크시트 활성화 명령어 (Typer 버전)
 AI 에이전트와의 연동을 위한 구조화된 출력 제공
 """
 
-import json
 import platform
 import sys
 from pathlib import Path
@@ -11,6 +10,7 @@ from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -147,7 +147,7 @@ def sheet_activate(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 activated = activated_sheet_info
                 wb = workbook_info
@@ -172,7 +172,7 @@ def sheet_activate(
     except ValueError as e:
         error_response = create_error_response(e, "sheet-activate")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -180,7 +180,7 @@ def sheet_activate(
     except Exception as e:
         error_response = create_error_response(e, "sheet-activate")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo("💡 Excel이 설치되어 있는지 확인하고, 워크북이 열려있는지 확인하세요.", err=True)
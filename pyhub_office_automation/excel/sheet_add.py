@@ -2,11 +2,11 @@
 Excel 워크시트 추가 명령어 (Engine 기반)
 """
 
-import json
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -85,14 +85,14 @@ def sheet_add(
             )
 
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 typer.echo(f"✅ 시트 '{name}'을(를) 추가했습니다")
 
     except Exception as e:
         error_response = create_error_response(e, "sheet-add")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
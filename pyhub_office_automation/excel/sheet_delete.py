@@ -2,11 +2,12 @@
 Excel 워크시트 삭제 명령어 (Engine 기반)
 """
 
-import json
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+
 from .engines import get_engine
 from .utils import ExecutionTimer, create_error_response, create_success_response
 
@@ -69,14 +70,14 @@ def sheet_delete(
             )
 
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 typer.echo(f"✅ 시트 '{sheet_name}'을(를) 삭제했습니다")
 
     except Exception as e:
         error_response = create_error_response(e, "sheet-delete")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
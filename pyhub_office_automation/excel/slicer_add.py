@@ -4,13 +4,13 @@ xlwings를 활용한 Excel 슬라이서 생성 기능
 대시보드 필터링 및 상호작용 구성
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -271,11 +271,11 @@ def slicer_add(
                 slicer_items=len(slicer_items),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "slicer-add")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
@@ -3,13 +3,13 @@
 xlwings를 활용한 Excel 슬라이서와 피벗테이블 연결 기능
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -222,11 +222,11 @@ def slicer_connect(
                 affected_connections=result.get("affected_connections", 0),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "slicer-connect")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
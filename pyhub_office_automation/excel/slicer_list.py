@@ -3,13 +3,14 @@
 xlwings를 활용한 Excel 슬라이서 정보 수집 기능
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -24,6 +25,7 @@ from .utils import (
 )
 
 
+@cached_result("slicer-list")
 def slicer_list(
     file_path: Optional[str] = typer.Option(None, "--file-path", help="슬라이서를 조회할 Excel 파일의 절대 경로"),
     workbook_name: Optional[str] = typer.Option(None, "--workbook-name", help='열린 워크북 이름으로 접근 (예: "Sales.xlsx")'),
@@ -246,11 +248,11 @@ def slicer_list(
                 slicers_count=len(slicers_info),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "slicer-list")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
@@ -3,13 +3,13 @@
 xlwings를 활용한 Excel 슬라이서 위치 및 크기 조정 기능
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -351,11 +351,11 @@ def slicer_position(
                 changes_count=len([c for c in changes_made if "→" in c]),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "slicer-position")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
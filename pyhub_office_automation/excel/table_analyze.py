@@ -3,13 +3,13 @@ Excel Table 분석 및 메타데이터 자동 생성 명령어 (Issue #59)
 특정 Table의 메타데이터를 자동 분석하고 Metadata 시트에 저장
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -209,7 +209,7 @@ def table_analyze(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"✅ {message}")
                 typer.echo()
@@ -235,7 +235,7 @@ def table_analyze(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "table-analyze")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다", err=True)
         raise typer.Exit(1)
@@ -243,7 +243,7 @@ def table_analyze(
     except ValueError as e:
         error_response = create_error_response(e, "table-analyze")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -251,7 +251,7 @@ def table_analyze(
     except Exception as e:
         error_response = create_error_response(e, "table-analyze")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo("💡 Excel이 설치되어 있는지 확인하고, 테이블 이름을 정확히 입력했는지 확인하세요.", err=True)
@@ -3,7 +3,6 @@ Excel 테이블 생성 명령어 (Typer 버전)
 기존 데이터 범위를 Excel Table(ListObject)로 변환
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
@@ -11,6 +10,7 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -208,7 +208,7 @@ def table_create(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 table = table_info
                 wb = workbook_info
@@ -233,7 +233,7 @@ def table_create(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "table-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다", err=True)
         raise typer.Exit(1)
@@ -241,7 +241,7 @@ def table_create(
     except ValueError as e:
         error_response = create_error_response(e, "table-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -249,7 +249,7 @@ def table_create(
     except Exception as e:
         error_response = create_error_response(e, "table-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo(
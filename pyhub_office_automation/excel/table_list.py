@@ -3,13 +3,14 @@ Excel 테이블 목록 조회 명령어 (Typer 버전)
 워크북의 모든 Excel Table(ListObject) 정보 조회
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -47,6 +48,7 @@ def truncate_sample_data(sample_data, max_length=50):
     return truncated_data
 
 
+@cached_result("table-list")
 def table_list(
     file_path: Optional[str] = typer.Option(None, "--file-path", help="Excel 파일의 절대 경로"),
     workbook_name: Optional[str] = typer.Option(None, "--workbook-name", help="열린 워크북 이름으로 접근"),
@@ -92,13 +94,13 @@ def table_list(
     book = None
     try:
         with ExecutionTimer() as timer:
-            # 플랫폼 확인
-            if platform.system() != "Windows":
-                raise ValueError("Excel Table 조회는 Windows에서만 지원됩니다.")
-
             # Engine 획득
             engine = get_engine()
 
+            # 플랫폼 확인 (macOS AppleScript 엔진은 테이블 조회 미지원)
+            if not engine.supports_tables:
+                raise ValueError("Excel Table 조회는 Windows에서만 지원됩니다.")
+
             # 워크북 연결
             if file_path:
                 book = engine.open_workbook(file_path, visible=visible)
@@ -205,7 +207,7 @@ def table_list(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 wb = workbook_info
                 sum_info = summary
@@ -285,7 +287,7 @@ def table_list(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "table-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다", err=True)
         raise typer.Exit(1)
@@ -293,7 +295,7 @@ def table_list(
     except ValueError as e:
         error_response = create_error_response(e, "table-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -301,7 +303,7 @@ def table_list(
     except Exception as e:
         error_response = create_error_response(e, "table-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo(
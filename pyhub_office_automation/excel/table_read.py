@@ -2,15 +2,79 @@
 Excel 테이블 읽기 명령어 (Typer 버전)
 """
 
-import json
 import platform
 from typing import Optional
 
 import pandas as pd
 import typer
 
-from .engines import get_engine
-from .utils import ExecutionTimer, create_error_response, create_success_response
+from pyhub_office_automation.utils.json_output import echo_json
+
+from .engines import TableNotFoundError, get_engine
+from .engines.base import to_2d_list
+from .engines.columnar import COLUMNAR_FORMATS, ColumnarData, stdout_binary, write_columnar
+from .utils import (
+    ExecutionTimer,
+    coords_to_excel_address,
+    create_error_response,
+    create_success_response,
+    parse_excel_range,
+)
+
+# 스트리밍 저장 시 응답에 포함할 미리보기 행 수
+STREAM_PREVIEW_ROWS = 10
+
+
+def _stream_table_to_csv(engine, book, table_name, columns, offset, limit, header, output_file):
+    """
+    테이블 데이터를 행 청크 단위로 읽어 CSV 파일에 바로 기록합니다.
+
+    전체 데이터를 DataFrame으로 만들지 않으므로 큰 테이블도 일정한 메모리로 저장할 수 있습니다.
+
+    Returns:
+        (table_info, headers, preview_rows, written_rows) 튜플
+    """
+    import csv
+
+    table_info = next((t for t in engine.list_tables(book) if t.name == table_name), None)
+    if table_info is None:
+        raise TableNotFoundError(table_name)
+
+    headers = list(table_info.headers)
+    if columns:
+        missing = [col for col in columns if col not in headers]
+        if missing:
+            raise ValueError(f"테이블에 없는 컬럼입니다: {', '.join(missing)}")
+        indices = [headers.index(col) for col in columns]
+        headers = list(columns)
+    else:
+        indices = None
+
+    # 데이터 본문 범위 계산 (헤더 1행 다음부터 row_count 행)
+    start_row, start_col, _, end_col = parse_excel_range(table_info.address.replace("$", "").split("!")[-1])
+    first_row = start_row + 1 + offset
+    last_row = start_row + table_info.row_count
+    if limit is not None:
+        last_row = min(last_row, first_row + limit - 1)
+
+    preview_rows = []
+    written_rows = 0
+    with open(output_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if header:
+            writer.writerow(headers)
+
+        if first_row <= last_row:
+            body_range = f"{coords_to_excel_address(first_row, start_col)}:{coords_to_excel_address(last_row, end_col)}"
+            for chunk in engine.read_range_iter(book, table_info.sheet_name, body_range):
+                if indices is not None:
+                    chunk = [[row[i] for i in indices] for row in chunk]
+                writer.writerows(chunk)
+                if len(preview_rows) < STREAM_PREVIEW_ROWS:
+                    preview_rows.extend(chunk[: STREAM_PREVIEW_ROWS - len(preview_rows)])
+                written_rows += len(chunk)
+
+    return table_info, headers, preview_rows, written_rows
 
 
 def table_read(
@@ -25,7 +89,7 @@ def table_read(
     sample_mode: bool = typer.Option(False, "--sample-mode", help="지능형 샘플링 모드 (첫/중간/마지막)"),
     columns: Optional[str] = typer.Option(None, "--columns", help="읽을 컬럼명 (쉼표로 구분)"),
     output_file: Optional[str] = typer.Option(None, "--output-file", help="결과를 저장할 CSV 파일"),
-    output_format: str = typer.Option("json", "--format", help="출력 형식 선택"),
+    output_format: str = typer.Option("json", "--format", help="출력 형식 선택 (json, csv, text, arrow, parquet, npy)"),
 ):
     """Excel 테이블 데이터를 pandas DataFrame으로 읽습니다."""
     book = None
@@ -42,76 +106,73 @@ def table_read(
             else:
                 book = engine.get_active_workbook()
 
-            # 대상 시트 결정 (COM API 직접 사용)
-            target_sheet = book.ActiveSheet if not sheet else book.Sheets(sheet)
+            # 테이블을 파일로 저장하는 경우: 청크 단위 스트리밍 (미리보기만 응답에 포함)
+            if table_name and output_file and not sample_mode and output_format not in ("csv",) + COLUMNAR_FORMATS:
+                col_list = [col.strip() for col in columns.split(",")] if columns else None
+                table_info, headers, preview_rows, written_rows = _stream_table_to_csv(
+                    engine, book, table_name, col_list, offset or 0, limit, header, output_file
+                )
+
+                data_content = {
+                    "dataframe_info": {"shape": (written_rows, len(headers)), "columns": headers},
+                    "data": [dict(zip(headers, row)) for row in preview_rows],
+                    "output_file": output_file,
+                    "streamed": True,
+                    "table_name": table_name,
+                    "sheet": table_info.sheet_name,
+                    "offset": offset if offset else 0,
+                    "limit": limit,
+                    "sample_mode": sample_mode,
+                    "selected_columns": col_list,
+                }
+                message = f"테이블 데이터를 '{output_file}'에 저장했습니다 ({written_rows}행 × {len(headers)}열)"
+                response = create_success_response(
+                    data=data_content,
+                    command="table-read",
+                    message=message,
+                    execution_time_ms=timer.execution_time_ms,
+                    book=book,
+                )
+
+                if output_format == "json":
+                    echo_json(response, default=str)
+                else:
+                    typer.echo(f"✅ {message}")
+                return
+
+            # 테이블 이름으로 읽을 때는 엔진 결과에서 바로 열 단위 데이터를 만듦
+            columnar = None
 
             if range_str:
-                # 지정된 범위에서 읽기 (COM API 직접 사용)
-                range_obj = target_sheet.Range(range_str)
-                values = range_obj.Value
-                # COM API는 단일 셀을 스칼라로 반환하므로 리스트로 변환
-                if not isinstance(values, (list, tuple)):
-                    values = [[values]]
-                elif values and not isinstance(values[0], (list, tuple)):
-                    values = [values]
+                # 지정된 범위에서 읽기 (대상 시트는 엔진으로 결정)
+                sheet_name = sheet or engine.get_workbook_info(book)["active_sheet"]
+                values = engine.read_range(book, sheet_name, range_str, include_formulas=False).values
             elif table_name:
                 # 테이블 이름으로 읽기 (Engine 메서드 사용)
                 col_list = [col.strip() for col in columns.split(",")] if columns else None
 
-                # Engine의 read_table()은 offset과 limit을 지원하지만 sample_mode는 지원하지 않음
-                # sample_mode인 경우 전체 데이터를 가져온 후 직접 샘플링
+                # offset/limit/컬럼 선택과 샘플링 구간은 엔진이 필요한 부분만 읽음
                 if sample_mode and limit:
-                    table_result = engine.read_table(book, table_name, columns=col_list, offset=offset or 0)
+                    table_result = engine.read_table_sample(book, table_name, limit, columns=col_list, offset=offset or 0)
+                    columnar = ColumnarData.from_rows(table_result["data"], names=table_result["headers"])
                 else:
-                    table_result = engine.read_table(book, table_name, columns=col_list, limit=limit, offset=offset or 0)
-
-                headers = table_result["headers"]
-                data = table_result["data"]
-
-                # 샘플링 모드 처리
-                if sample_mode and limit and len(data) > limit:
-                    # 지능형 샘플링: 첫 20%, 중간 60%, 마지막 20%
-                    first_count = max(1, int(limit * 0.2))
-                    last_count = max(1, int(limit * 0.2))
-                    middle_count = limit - first_count - last_count
-
-                    sampled_data = []
-                    # 첫 부분
-                    sampled_data.extend(data[:first_count])
-
-                    # 중간 부분
-                    total_rows = len(data)
-                    if middle_count > 0 and total_rows > first_count + last_count:
-                        middle_start = first_count
-                        middle_end = total_rows - last_count
-                        middle_indices = range(middle_start, middle_end, max(1, (middle_end - middle_start) // middle_count))
-                        sampled_data.extend([data[i] for i in middle_indices[:middle_count]])
-
-                    # 마지막 부분
-                    if last_count > 0 and total_rows > last_count:
-                        sampled_data.extend(data[-last_count:])
-
-                    data = sampled_data
-
-                # 최종 values 구성
-                if headers and header:
-                    values = [headers] + data
-                else:
-                    values = data
-
-                # 테이블이 있는 시트 이름 가져오기 (COM API 사용)
-                for ws in book.Sheets:
-                    try:
-                        ws.ListObjects(table_name)
-                        target_sheet = ws
-                        break
-                    except:
-                        continue
+                    columnar = engine.read_table_columnar(book, table_name, columns=col_list, limit=limit, offset=offset or 0)
+
+                # --no-header: 헤더 이름 대신 열 번호 사용
+                if not header:
+                    for i, column in enumerate(columnar.columns):
+                        column.name = i
+
+                # 테이블이 있는 시트 이름 (엔진의 이름 인덱스로 조회)
+                table_sheet_name = engine.get_table_sheet_name(book, table_name)
             else:
                 # table_name도 range_str도 없는 경우: Engine을 사용해 모든 테이블 정보 수집
                 all_table_infos = engine.list_tables(book)
                 all_tables = [f"'{t.name}' (시트: {t.sheet_name})" for t in all_table_infos]
 
+                # 대상 시트 결정 (COM API 직접 사용)
+                target_sheet = book.ActiveSheet if not sheet else book.Sheets(sheet)
+
                 if all_tables:
                     tables_str = ", ".join(all_tables)
                     # 현재 시트에 테이블이 있는지 확인
@@ -144,14 +205,41 @@ def table_read(
                 elif values and not isinstance(values[0], (list, tuple)):
                     values = [values]
 
-            # pandas DataFrame 생성
-            if isinstance(values, list) and len(values) > 0:
-                if header and len(values) > 1:
-                    df = pd.DataFrame(values[1:], columns=values[0])
+            # 범위/사용 영역으로 읽은 값은 열 단위로 한 번만 변환
+            if columnar is None:
+                rows = to_2d_list(values) if values is not None else []
+                if header and len(rows) > 1:
+                    columnar = ColumnarData.from_rows(rows[1:], names=rows[0])
                 else:
-                    df = pd.DataFrame(values)
-            else:
-                df = pd.DataFrame()
+                    columnar = ColumnarData.from_rows(rows, names=list(range(len(rows[0]))) if rows else None)
+
+            # 열 단위 바이너리 출력 (arrow/parquet/npy)
+            if output_format in COLUMNAR_FORMATS:
+                written = write_columnar(columnar, output_format, output_file or stdout_binary())
+                if output_file:
+                    message = (
+                        f"테이블 데이터를 '{output_file}'에 저장했습니다 ({columnar.row_count}행 × {columnar.column_count}열)"
+                    )
+                    response = create_success_response(
+                        data={
+                            "output_file": output_file,
+                            "format": output_format,
+                            "columns": [str(name) for name in columnar.names],
+                            "row_count": columnar.row_count,
+                            "column_count": columnar.column_count,
+                            "file_size": written,
+                            "table_name": table_name,
+                        },
+                        command="table-read",
+                        message=message,
+                        execution_time_ms=timer.execution_time_ms,
+                        book=book,
+                    )
+                    echo_json(response)
+                return
+
+            # pandas DataFrame 생성 (열 배열을 그대로 사용)
+            df = columnar.to_pandas() if columnar.column_count else pd.DataFrame()
 
             # 출력 파일 저장
             if output_file:
@@ -189,7 +277,7 @@ def table_read(
                 data_content.update(
                     {
                         "table_name": table_name,
-                        "sheet": target_sheet.Name,
+                        "sheet": table_sheet_name,
                         "offset": offset if offset else 0,
                         "limit": limit,
                         "sample_mode": sample_mode,
@@ -206,7 +294,7 @@ def table_read(
             )
 
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             elif output_format == "csv":
                 # CSV 형식으로 데이터 출력
                 if not df.empty:
@@ -221,7 +309,7 @@ def table_read(
     except Exception as e:
         error_response = create_error_response(e, "table-read")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -3,7 +3,6 @@ Excel 테이블 정렬 명령어 (Typer 버전)
 Excel Table(ListObject)에 단일 또는 다중 컬럼 정렬 적용
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
@@ -11,9 +10,10 @@ from typing import Optional
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
-from .engines import get_engine
+from .engines import TableNotFoundError, get_engine
 from .utils import (
     ExecutionTimer,
     create_error_response,
@@ -119,34 +119,20 @@ def table_sort(
             # 워크북 연결
             book = get_or_open_workbook(file_path=file_path, workbook_name=workbook_name, visible=visible)
 
-            # 테이블 찾기
-            target_table = None
-            target_sheet = None
-
-            if sheet:
-                # 특정 시트에서 테이블 찾기
-                target_sheet = get_sheet(book, sheet)
-                for table in target_sheet.tables:
-                    if table.name == table_name:
-                        target_table = table
-                        break
-            else:
-                # 모든 시트에서 테이블 찾기
-                for sheet_obj in book.sheets:
-                    for table in sheet_obj.tables:
-                        if table.name == table_name:
-                            target_table = table
-                            target_sheet = sheet_obj
-                            break
-                    if target_table:
-                        break
-
-            if not target_table:
+            # Engine 가져오기
+            engine = get_engine()
+
+            # 테이블이 있는 시트 찾기 (엔진의 이름 인덱스로 조회)
+            try:
+                table_sheet_name = engine.get_table_sheet_name(book.api, table_name)
+            except TableNotFoundError:
+                table_sheet_name = None
+
+            if table_sheet_name is None or (sheet and table_sheet_name != sheet):
                 sheet_msg = f"시트 '{sheet}'" if sheet else "워크북"
                 raise ValueError(f"{sheet_msg}에서 테이블 '{table_name}'을 찾을 수 없습니다.")
 
-            # Engine 가져오기
-            engine = get_engine()
+            target_sheet = get_sheet(book, table_sheet_name)
 
             # 정렬 필드를 Engine에 맞는 형식으로 준비
             engine_sort_fields = []
@@ -220,7 +206,7 @@ def table_sort(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 sort_result = sort_info
                 wb = workbook_info
@@ -246,7 +232,7 @@ def table_sort(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "table-sort")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다", err=True)
         raise typer.Exit(1)
@@ -254,7 +240,7 @@ def table_sort(
     except ValueError as e:
         error_response = create_error_response(e, "table-sort")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -262,7 +248,7 @@ def table_sort(
     except Exception as e:
         error_response = create_error_response(e, "table-sort")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo(
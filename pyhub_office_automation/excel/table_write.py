@@ -3,13 +3,14 @@ Excel 테이블 쓰기 명령어 (Typer 버전)
 pandas DataFrame을 Excel에 쓰고 선택적으로 Excel Table로 변환
 """
 
-import json
 import platform
 from typing import Optional
 
 import pandas as pd
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+
 from .engines import get_engine
 from .utils import ExecutionTimer, create_error_response, create_success_response
 
@@ -101,7 +102,8 @@ def table_write(
             end_col = start_range.Column + len(values[0]) - 1
 
             write_range = target_sheet.Range(start_range, target_sheet.Cells(end_row, end_col))
-            write_range.Value = values
+            # 대용량 데이터도 COM 마샬링 한도에 걸리지 않도록 행 청크 단위로 기록
+            engine.write_range_chunked(book, target_sheet.Name, range_str, values)
 
             # Excel Table 생성 (옵션이 활성화된 경우)
             table_info = None
@@ -205,7 +207,7 @@ def table_write(
             )
 
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 typer.echo(f"✅ {message}")
 
@@ -227,7 +229,7 @@ def table_write(
     except Exception as e:
         error_response = create_error_response(e, "table-write")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -3,13 +3,13 @@
 xlwings를 활용한 Excel 텍스트 박스 생성 및 스타일링 기능
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -380,11 +380,11 @@ def textbox_add(
                 styles_applied=len(applied_styles),
             )
 
-            print(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
 
     except Exception as e:
         error_response = create_error_response(e, "textbox-add")
-        print(json.dumps(error_response, ensure_ascii=False, indent=2))
+        echo_json(error_response)
         return 1
 
     finally:
@@ -38,8 +38,14 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import pandas as pd
 import xlwings as xw
 
+from pyhub_office_automation.utils.json_output import dumps, is_pretty
 from pyhub_office_automation.version import get_version
 
+from .addressing import check_range_overlap, coords_to_excel_address, excel_address_to_coords, parse_excel_range
+from .engines.columnar import ColumnarData
+from .engines.instrumentation import get_active_profiler
+from .occupancy import SheetOccupancy
+
 
 # CLI 명령어 인자를 위한 Enum 클래스들
 class OutputFormat(str, Enum):
@@ -51,6 +57,18 @@ class OutputFormat(str, Enum):
     MARKDOWN = "markdown"
 
 
+class DataOutputFormat(str, Enum):
+    """데이터 조회 명령어(range-read) 출력 형식 선택지 (열 단위 바이너리 형식 포함)"""
+
+    JSON = "json"
+    CSV = "csv"
+    TEXT = "text"
+    MARKDOWN = "markdown"
+    ARROW = "arrow"
+    PARQUET = "parquet"
+    NPY = "npy"
+
+
 class ExpandMode(str, Enum):
     """범위 확장 모드 선택지"""
 
@@ -382,7 +400,7 @@ def format_output(data: Union[str, list, dict], output_format: str = "json", inc
         data["version"] = get_version()
 
     if output_format == "json":
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        return dumps(data, pretty=is_pretty())
     elif output_format == "csv" and isinstance(data, list):
         output = io.StringIO()
         writer = csv.writer(output)
@@ -673,7 +691,12 @@ def create_success_response(
 
     except Exception:
         # 컨텍스트 수집 실패 시 기본 정보만 포함
-        response["current_context"] = {"total_open_workbooks": len(xw.books) if xw.books else 0, "collection_failed": True}
+        response["current_context"] = {"total_open_workbooks": _count_open_books(), "collection_failed": True}
+
+    # COM 호출 계측 결과 (oa --profile)
+    profiler = get_active_profiler()
+    if profiler is not None:
+        response["profile"] = profiler.summary()
 
     return response
 
@@ -1023,6 +1046,9 @@ COMMAND_CATEGORIES = {
     # Utility commands
     "shell": "utility",
     "list": "utility",
+    "session-begin": "utility",
+    "session-end": "utility",
+    "session-status": "utility",
 }
 
 # 작업 타입 정의
@@ -1088,9 +1114,24 @@ OPERATION_TYPES = {
     # Utility operations
     "shell": "read",
     "list": "read",
+    "session-begin": "modify",
+    "session-end": "modify",
+    "session-status": "read",
 }
 
 
+def _count_open_books() -> int:
+    """
+    xlwings로 열린 워크북 수를 반환합니다.
+
+    Linux 등 xlwings 대화형 모드를 지원하지 않는 환경(헤드리스 엔진)에서는 0을 반환합니다.
+    """
+    try:
+        return len(xw.books) if xw.books else 0
+    except Exception:
+        return 0
+
+
 def get_execution_context(book: Optional[xw.Book] = None) -> Dict[str, Union[str, int, float, list, dict]]:
     """
     현재 Excel 실행 컨텍스트 정보를 수집합니다.
@@ -1101,7 +1142,7 @@ def get_execution_context(book: Optional[xw.Book] = None) -> Dict[str, Union[str
     Returns:
         컨텍스트 정보 딕셔너리
     """
-    context = {"total_open_workbooks": len(xw.books) if xw.books else 0, "excel_app_visible": None, "current_workbook": None}
+    context = {"total_open_workbooks": _count_open_books(), "excel_app_visible": None, "current_workbook": None}
 
     try:
         if book is None and len(xw.books) > 0:
@@ -1654,113 +1695,6 @@ def apply_neumorphism_style(shape, style_name: str) -> bool:
 # =============================================================================
 
 
-def excel_address_to_coords(address: str) -> Tuple[int, int]:
-    """
-    Excel 주소(A1)를 좌표(row, col)로 변환합니다.
-
-    Args:
-        address: Excel 주소 (예: "A1", "BC123")
-
-    Returns:
-        (row, col) 튜플 (1-based index)
-
-    Raises:
-        ValueError: 잘못된 주소 형식
-    """
-    import re
-
-    # 주소 형식 검증
-    match = re.match(r"^([A-Z]+)(\d+)$", address.upper())
-    if not match:
-        raise ValueError(f"잘못된 Excel 주소 형식: {address}")
-
-    col_letters, row_str = match.groups()
-    row = int(row_str)
-
-    # 열 문자를 숫자로 변환 (A=1, B=2, ..., Z=26, AA=27, ...)
-    col = 0
-    for i, letter in enumerate(reversed(col_letters)):
-        col += (ord(letter) - ord("A") + 1) * (26**i)
-
-    return row, col
-
-
-def coords_to_excel_address(row: int, col: int) -> str:
-    """
-    좌표(row, col)를 Excel 주소로 변환합니다.
-
-    Args:
-        row: 행 번호 (1-based)
-        col: 열 번호 (1-based)
-
-    Returns:
-        Excel 주소 (예: "A1", "BC123")
-    """
-    if row < 1 or col < 1:
-        raise ValueError("행과 열 번호는 1 이상이어야 합니다")
-
-    # 열 번호를 문자로 변환
-    col_letters = ""
-    while col > 0:
-        col -= 1
-        col_letters = chr(ord("A") + col % 26) + col_letters
-        col //= 26
-
-    return f"{col_letters}{row}"
-
-
-def parse_excel_range(range_str: str) -> Tuple[int, int, int, int]:
-    """
-    Excel 범위(A1:C10)를 좌표로 파싱합니다.
-
-    Args:
-        range_str: Excel 범위 (예: "A1:C10", "A1" 단일 셀도 가능)
-
-    Returns:
-        (start_row, start_col, end_row, end_col) 튜플 (1-based)
-
-    Raises:
-        ValueError: 잘못된 범위 형식
-    """
-    range_str = range_str.strip()
-
-    if ":" in range_str:
-        # 범위 형식 (A1:C10)
-        start_addr, end_addr = range_str.split(":", 1)
-        start_row, start_col = excel_address_to_coords(start_addr.strip())
-        end_row, end_col = excel_address_to_coords(end_addr.strip())
-    else:
-        # 단일 셀 형식 (A1)
-        start_row, start_col = excel_address_to_coords(range_str)
-        end_row, end_col = start_row, start_col
-
-    return start_row, start_col, end_row, end_col
-
-
-def check_range_overlap(range1: str, range2: str) -> bool:
-    """
-    두 Excel 범위가 겹치는지 검사합니다.
-
-    Args:
-        range1: 첫 번째 범위 (예: "A1:C10")
-        range2: 두 번째 범위 (예: "B5:D15")
-
-    Returns:
-        겹치면 True, 겹치지 않으면 False
-    """
-    try:
-        r1_start_row, r1_start_col, r1_end_row, r1_end_col = parse_excel_range(range1)
-        r2_start_row, r2_start_col, r2_end_row, r2_end_col = parse_excel_range(range2)
-
-        # 겹침 검사: 한 범위가 다른 범위 완전히 벗어나지 않으면 겹침
-        return not (
-            r1_end_row < r2_start_row or r1_start_row > r2_end_row or r1_end_col < r2_start_col or r1_start_col > r2_end_col
-        )
-    except (ValueError, Exception):
-        # 파싱 실패 시 안전하게 겹친다고 가정
-        return True
-
-
 def get_all_pivot_ranges(sheet: xw.Sheet) -> List[str]:
     """
     시트의 모든 피벗 테이블 범위를 가져옵니다.
@@ -1837,98 +1771,68 @@ def get_all_chart_ranges(sheet: xw.Sheet) -> List[Tuple[str, int, int]]:
     return chart_info
 
 
-def find_available_position(
-    sheet: xw.Sheet, min_spacing: int = 2, preferred_position: str = "right", estimate_size: Tuple[int, int] = (10, 5)
-) -> str:
+def build_sheet_occupancy(sheet: xw.Sheet) -> SheetOccupancy:
     """
-    시트에서 피벗 테이블이나 차트 배치에 적합한 빈 위치를 찾습니다.
+    시트의 데이터 영역, 피벗 테이블, 차트가 차지한 범위로 점유 영역 인덱스를 만듭니다.
 
     Args:
         sheet: xlwings Sheet 객체
-        min_spacing: 기존 객체와의 최소 간격 (열 단위)
-        preferred_position: 선호 배치 방향 ("right" 또는 "bottom")
-        estimate_size: 예상 크기 (cols, rows) - 피벗 테이블용
 
     Returns:
-        추천 위치의 Excel 주소 (예: "F1")
-
-    Raises:
-        RuntimeError: 적절한 위치를 찾을 수 없는 경우
+        SheetOccupancy (파싱할 수 없는 범위는 제외)
     """
-    # 기존 객체들의 범위 수집
-    existing_ranges = []
-
-    # 피벗 테이블 범위 추가
-    pivot_ranges = get_all_pivot_ranges(sheet)
-    existing_ranges.extend(pivot_ranges)
-
-    # 차트 범위 추가 (차트는 범위만 사용)
-    chart_info = get_all_chart_ranges(sheet)
-    for chart_range, _, _ in chart_info:
-        existing_ranges.append(chart_range)
+    ranges = list(get_all_pivot_ranges(sheet))
+    ranges.extend(chart_range for chart_range, _, _ in get_all_chart_ranges(sheet))
 
     # 사용된 데이터 영역도 고려
     try:
         used_range = sheet.used_range
         if used_range:
-            data_range = used_range.address.replace("$", "")
-            existing_ranges.append(data_range)
+            ranges.append(used_range.address.replace("$", ""))
     except Exception:
         # used_range 접근 실패 시 무시
         pass
 
-    # 배치 후보 위치들 생성
-    candidates = []
-
-    if preferred_position == "right":
-        # 오른쪽 우선 배치
-        for start_col in range(1, 50):  # A~AX열까지 시도
-            for start_row in range(1, 100):  # 1~100행까지 시도
-                candidates.append((start_row, start_col))
-    else:  # "bottom"
-        # 아래쪽 우선 배치
-        for start_row in range(1, 100):  # 1~100행까지 시도
-            for start_col in range(1, 50):  # A~AX열까지 시도
-                candidates.append((start_row, start_col))
-
-    # 각 후보 위치에서 겹침 검사
-    for row, col in candidates:
-        # 예상 크기로 범위 생성
-        end_row = row + estimate_size[1] - 1
-        end_col = col + estimate_size[0] - 1
-
-        candidate_range = f"{coords_to_excel_address(row, col)}:{coords_to_excel_address(end_row, end_col)}"
-
-        # 기존 범위들과 겹침 검사 (간격 고려)
-        has_conflict = False
-        for existing_range in existing_ranges:
-            try:
-                # 간격을 고려한 확장 범위로 겹침 검사
-                e_start_row, e_start_col, e_end_row, e_end_col = parse_excel_range(existing_range)
+    occupancy = SheetOccupancy()
+    for range_str in ranges:
+        try:
+            occupancy.add(*parse_excel_range(range_str))
+        except ValueError:
+            continue
+    return occupancy
 
-                # 간격만큼 확장
-                e_start_row = max(1, e_start_row - min_spacing)
-                e_start_col = max(1, e_start_col - min_spacing)
-                e_end_row += min_spacing
-                e_end_col += min_spacing
 
-                expanded_existing = (
-                    f"{coords_to_excel_address(e_start_row, e_start_col)}:{coords_to_excel_address(e_end_row, e_end_col)}"
-                )
+def find_available_position(
+    sheet: xw.Sheet,
+    min_spacing: int = 2,
+    preferred_position: str = "right",
+    estimate_size: Tuple[int, int] = (10, 5),
+    occupancy: Optional[SheetOccupancy] = None,
+) -> str:
+    """
+    시트에서 피벗 테이블이나 차트 배치에 적합한 빈 위치를 찾습니다.
 
-                if check_range_overlap(candidate_range, expanded_existing):
-                    has_conflict = True
-                    break
-            except Exception:
-                # 파싱 실패 시 안전하게 충돌로 간주
-                has_conflict = True
-                break
+    Args:
+        sheet: xlwings Sheet 객체
+        min_spacing: 기존 객체와의 최소 간격 (행/열 단위)
+        preferred_position: 선호 배치 방향 ("right": 기존 객체 옆, "bottom": 기존 객체 아래)
+        estimate_size: 예상 크기 (cols, rows) - 피벗 테이블용
+        occupancy: 미리 만든 점유 영역 인덱스 (같은 시트에 여러 번 배치할 때 재사용, None이면 새로 만듦)
+
+    Returns:
+        추천 위치의 Excel 주소 (예: "F1")
 
-        if not has_conflict:
-            return coords_to_excel_address(row, col)
+    Raises:
+        RuntimeError: 적절한 위치를 찾을 수 없는 경우
+    """
+    if occupancy is None:
+        occupancy = build_sheet_occupancy(sheet)
 
-    # 적절한 위치를 찾지 못한 경우
-    raise RuntimeError("시트에 충분한 빈 공간을 찾을 수 없습니다. 수동으로 위치를 지정하거나 기존 객체를 정리해주세요.")
+    try:
+        row, col = occupancy.find_free(estimate_size[0], estimate_size[1], max(0, min_spacing), preferred_position)
+    except ValueError as e:
+        raise RuntimeError(f"자동 배치 위치를 계산할 수 없습니다: {str(e)}")
+    return coords_to_excel_address(row, col)
 
 
 def estimate_pivot_table_size(source_range: str, field_count: int = 3) -> Tuple[int, int]:
@@ -2019,9 +1923,9 @@ def analyze_data_structure(data_range: xw.Range) -> Dict[str, Union[str, bool, i
         elif not isinstance(values[0], list):
             values = [values]
 
-        df = pd.DataFrame(
-            values[1:], columns=values[0] if len(values) > 1 else [f"Column_{i+1}" for i in range(len(values[0]))]
-        )
+        df = ColumnarData.from_rows(
+            values[1:], names=values[0] if len(values) > 1 else [f"Column_{i+1}" for i in range(len(values[0]))]
+        ).to_pandas()
 
         issues = []
         recommendations = []
@@ -3058,663 +2962,3 @@ def analyze_slicer_conflicts(slicers_info: List[Dict]) -> dict:
         analysis["recommendations"].append("현재 SlicerCache 충돌이 감지되지 않았습니다")
 
     return analysis
-
-
-# =============================================================================
-# 범위 관리 및 자동 배치 유틸리티 함수들
-# =============================================================================
-
-
-def excel_address_to_coords(address: str) -> Tuple[int, int]:
-    """
-    Excel 주소(A1)를 좌표(row, col)로 변환합니다.
-
-    Args:
-        address: Excel 주소 (예: "A1", "BC123")
-
-    Returns:
-        (row, col) 튜플 (1-based index)
-
-    Raises:
-        ValueError: 잘못된 주소 형식
-    """
-    import re
-
-    # 주소 형식 검증
-    match = re.match(r"^([A-Z]+)(\d+)$", address.upper())
-    if not match:
-        raise ValueError(f"잘못된 Excel 주소 형식: {address}")
-
-    col_letters, row_str = match.groups()
-    row = int(row_str)
-
-    # 열 문자를 숫자로 변환 (A=1, B=2, ..., Z=26, AA=27, ...)
-    col = 0
-    for i, letter in enumerate(reversed(col_letters)):
-        col += (ord(letter) - ord("A") + 1) * (26**i)
-
-    return row, col
-
-
-def coords_to_excel_address(row: int, col: int) -> str:
-    """
-    좌표(row, col)를 Excel 주소로 변환합니다.
-
-    Args:
-        row: 행 번호 (1-based)
-        col: 열 번호 (1-based)
-
-    Returns:
-        Excel 주소 (예: "A1", "BC123")
-    """
-    if row < 1 or col < 1:
-        raise ValueError("행과 열 번호는 1 이상이어야 합니다")
-
-    # 열 번호를 문자로 변환
-    col_letters = ""
-    while col > 0:
-        col -= 1
-        col_letters = chr(ord("A") + col % 26) + col_letters
-        col //= 26
-
-    return f"{col_letters}{row}"
-
-
-def parse_excel_range(range_str: str) -> Tuple[int, int, int, int]:
-    """
-    Excel 범위(A1:C10)를 좌표로 파싱합니다.
-
-    Args:
-        range_str: Excel 범위 (예: "A1:C10", "A1" 단일 셀도 가능)
-
-    Returns:
-        (start_row, start_col, end_row, end_col) 튜플 (1-based)
-
-    Raises:
-        ValueError: 잘못된 범위 형식
-    """
-    range_str = range_str.strip()
-
-    if ":" in range_str:
-        # 범위 형식 (A1:C10)
-        start_addr, end_addr = range_str.split(":", 1)
-        start_row, start_col = excel_address_to_coords(start_addr.strip())
-        end_row, end_col = excel_address_to_coords(end_addr.strip())
-    else:
-        # 단일 셀 형식 (A1)
-        start_row, start_col = excel_address_to_coords(range_str)
-        end_row, end_col = start_row, start_col
-
-    return start_row, start_col, end_row, end_col
-
-
-def check_range_overlap(range1: str, range2: str) -> bool:
-    """
-    두 Excel 범위가 겹치는지 검사합니다.
-
-    Args:
-        range1: 첫 번째 범위 (예: "A1:C10")
-        range2: 두 번째 범위 (예: "B5:D15")
-
-    Returns:
-        겹치면 True, 겹치지 않으면 False
-    """
-    try:
-        r1_start_row, r1_start_col, r1_end_row, r1_end_col = parse_excel_range(range1)
-        r2_start_row, r2_start_col, r2_end_row, r2_end_col = parse_excel_range(range2)
-
-        # 겹침 검사: 한 범위가 다른 범위 완전히 벗어나지 않으면 겹침
-        return not (
-            r1_end_row < r2_start_row or r1_start_row > r2_end_row or r1_end_col < r2_start_col or r1_start_col > r2_end_col
-        )
-    except (ValueError, Exception):
-        # 파싱 실패 시 안전하게 겹친다고 가정
-        return True
-
-
-def get_all_pivot_ranges(sheet: xw.Sheet) -> List[str]:
-    """
-    시트의 모든 피벗 테이블 범위를 가져옵니다.
-
-    Args:
-        sheet: xlwings Sheet 객체
-
-    Returns:
-        피벗 테이블 범위 목록 (예: ["F1:H20", "K1:M15"])
-    """
-    ranges = []
-
-    try:
-        if platform.system() == "Windows":
-            # Windows에서는 COM API 사용
-            for pivot_table in sheet.api.PivotTables():
-                try:
-                    # TableRange2는 데이터 영역을 포함한 전체 범위
-                    if hasattr(pivot_table, "TableRange2") and pivot_table.TableRange2:
-                        table_range = pivot_table.TableRange2.Address.replace("$", "")
-                        ranges.append(table_range)
-                    elif hasattr(pivot_table, "TableRange1") and pivot_table.TableRange1:
-                        table_range = pivot_table.TableRange1.Address.replace("$", "")
-                        ranges.append(table_range)
-                except Exception:
-                    # 개별 피벗 테이블 처리 실패 시 무시
-                    continue
-    except Exception:
-        # 피벗 테이블 접근 실패 시 빈 목록 반환
-        pass
-
-    return ranges
-
-
-def get_all_chart_ranges(sheet: xw.Sheet) -> List[Tuple[str, int, int]]:
-    """
-    시트의 모든 차트 위치와 크기를 가져옵니다.
-
-    Args:
-        sheet: xlwings Sheet 객체
-
-    Returns:
-        차트 정보 목록 [(range_estimate, width, height), ...]
-        range_estimate는 차트가 차지하는 대략적인 셀 범위
-    """
-    chart_info = []
-
-    try:
-        for chart in sheet.charts:
-            try:
-                # 차트의 픽셀 위치와 크기
-                left = chart.left
-                top = chart.top
-                width = chart.width
-                height = chart.height
-
-                # 픽셀 좌표를 대략적인 셀 좌표로 변환
-                # (Excel 기본 열 너비 약 64픽셀, 행 높이 약 15픽셀)
-                start_col = max(1, int(left / 64) + 1)
-                start_row = max(1, int(top / 15) + 1)
-                end_col = start_col + max(1, int(width / 64))
-                end_row = start_row + max(1, int(height / 15))
-
-                range_estimate = f"{coords_to_excel_address(start_row, start_col)}:{coords_to_excel_address(end_row, end_col)}"
-                chart_info.append((range_estimate, width, height))
-
-            except Exception:
-                # 개별 차트 처리 실패 시 무시
-                continue
-    except Exception:
-        # 차트 접근 실패 시 빈 목록 반환
-        pass
-
-    return chart_info
-
-
-def find_available_position(
-    sheet: xw.Sheet, min_spacing: int = 2, preferred_position: str = "right", estimate_size: Tuple[int, int] = (10, 5)
-) -> str:
-    """
-    시트에서 피벗 테이블이나 차트 배치에 적합한 빈 위치를 찾습니다.
-
-    Args:
-        sheet: xlwings Sheet 객체
-        min_spacing: 기존 객체와의 최소 간격 (열 단위)
-        preferred_position: 선호 배치 방향 ("right" 또는 "bottom")
-        estimate_size: 예상 크기 (cols, rows) - 피벗 테이블용
-
-    Returns:
-        추천 위치의 Excel 주소 (예: "F1")
-
-    Raises:
-        RuntimeError: 적절한 위치를 찾을 수 없는 경우
-    """
-    # 기존 객체들의 범위 수집
-    existing_ranges = []
-
-    # 피벗 테이블 범위 추가
-    pivot_ranges = get_all_pivot_ranges(sheet)
-    existing_ranges.extend(pivot_ranges)
-
-    # 차트 범위 추가 (차트는 범위만 사용)
-    chart_info = get_all_chart_ranges(sheet)
-    for chart_range, _, _ in chart_info:
-        existing_ranges.append(chart_range)
-
-    # 사용된 데이터 영역도 고려
-    try:
-        used_range = sheet.used_range
-        if used_range:
-            data_range = used_range.address.replace("$", "")
-            existing_ranges.append(data_range)
-    except Exception:
-        # used_range 접근 실패 시 무시
-        pass
-
-    # 배치 후보 위치들 생성
-    candidates = []
-
-    if preferred_position == "right":
-        # 오른쪽 우선 배치
-        for start_col in range(1, 50):  # A~AX열까지 시도
-            for start_row in range(1, 100):  # 1~100행까지 시도
-                candidates.append((start_row, start_col))
-    else:  # "bottom"
-        # 아래쪽 우선 배치
-        for start_row in range(1, 100):  # 1~100행까지 시도
-            for start_col in range(1, 50):  # A~AX열까지 시도
-                candidates.append((start_row, start_col))
-
-    # 각 후보 위치에서 겹침 검사
-    for row, col in candidates:
-        # 예상 크기로 범위 생성
-        end_row = row + estimate_size[1] - 1
-        end_col = col + estimate_size[0] - 1
-
-        candidate_range = f"{coords_to_excel_address(row, col)}:{coords_to_excel_address(end_row, end_col)}"
-
-        # 기존 범위들과 겹침 검사 (간격 고려)
-        has_conflict = False
-        for existing_range in existing_ranges:
-            try:
-                # 간격을 고려한 확장 범위로 겹침 검사
-                e_start_row, e_start_col, e_end_row, e_end_col = parse_excel_range(existing_range)
-
-                # 간격만큼 확장
-                e_start_row = max(1, e_start_row - min_spacing)
-                e_start_col = max(1, e_start_col - min_spacing)
-                e_end_row += min_spacing
-                e_end_col += min_spacing
-
-                expanded_existing = (
-                    f"{coords_to_excel_address(e_start_row, e_start_col)}:{coords_to_excel_address(e_end_row, e_end_col)}"
-                )
-
-                if check_range_overlap(candidate_range, expanded_existing):
-                    has_conflict = True
-                    break
-            except Exception:
-                # 파싱 실패 시 안전하게 충돌로 간주
-                has_conflict = True
-                break
-
-        if not has_conflict:
-            return coords_to_excel_address(row, col)
-
-    # 적절한 위치를 찾지 못한 경우
-    raise RuntimeError("시트에 충분한 빈 공간을 찾을 수 없습니다. 수동으로 위치를 지정하거나 기존 객체를 정리해주세요.")
-
-
-def estimate_pivot_table_size(source_range: str, field_count: int = 3) -> Tuple[int, int]:
-    """
-    피벗 테이블의 예상 크기를 추정합니다.
-
-    Args:
-        source_range: 소스 데이터 범위
-        field_count: 필드 개수 (기본값: 3)
-
-    Returns:
-        (예상_열수, 예상_행수) 튜플
-    """
-    try:
-        # 소스 데이터 크기에 기반한 추정
-        start_row, start_col, end_row, end_col = parse_excel_range(source_range)
-        data_rows = end_row - start_row + 1
-        data_cols = end_col - start_col + 1
-
-        # 보수적인 추정: 필드 개수 + 여백, 데이터 행의 일부 + 헤더
-        estimated_cols = min(field_count + 3, 15)  # 최대 15열
-        estimated_rows = min(max(data_rows // 10, 10), 50)  # 최소 10행, 최대 50행
-
-        return estimated_cols, estimated_rows
-    except Exception:
-        # 추정 실패 시 기본값
-        return 10, 20
-
-
-def validate_auto_position_requirements(sheet: xw.Sheet) -> Tuple[bool, str]:
-    """
-    자동 배치 기능 사용 가능 여부를 검사합니다.
-
-    Args:
-        sheet: xlwings Sheet 객체
-
-    Returns:
-        (사용가능여부, 메시지) 튜플
-    """
-    try:
-        # Windows에서만 완전한 기능 지원
-        if platform.system() != "Windows":
-            return False, "자동 배치 기능은 Windows에서만 완전히 지원됩니다"
-
-        # 시트 접근 가능 여부 확인
-        sheet_name = sheet.name
-        if not sheet_name:
-            return False, "시트 정보에 접근할 수 없습니다"
-
-        return True, ""
-
-    except Exception as e:
-        return False, f"자동 배치 기능을 사용할 수 없습니다: {str(e)}"
-
-
-# =============================================================================
-# 데이터 분석 및 변환 유틸리티 함수들 (Issue #39)
-# =============================================================================
-
-
-def analyze_data_structure(data_range: xw.Range) -> Dict[str, Union[str, bool, int, float, List[str]]]:
-    """
-    Excel 데이터 구조를 분석하여 피벗테이블 준비 상태를 평가합니다.
-
-    Args:
-        data_range: 분석할 xlwings Range 객체
-
-    Returns:
-        분석 결과 딕셔너리
-    """
-    try:
-        # 데이터를 pandas DataFrame으로 변환
-        values = data_range.value
-        if not values:
-            return {
-                "format_type": DataFormat.UNKNOWN,
-                "issues": [],
-                "pivot_ready": False,
-                "transformation_needed": False,
-                "recommendations": ["데이터가 비어있습니다"],
-                "estimated_rows_after_transform": 0,
-                "confidence_score": 0.0,
-            }
-
-        # 데이터를 2차원 리스트로 정규화
-        if not isinstance(values, list):
-            values = [[values]]
-        elif not isinstance(values[0], list):
-            values = [values]
-
-        df = pd.DataFrame(
-            values[1:], columns=values[0] if len(values) > 1 else [f"Column_{i+1}" for i in range(len(values[0]))]
-        )
-
-        issues = []
-        recommendations = []
-        format_type = DataFormat.PIVOT_READY
-
-        # 1. 병합된 셀 감지 (빈 값이 많은 경우로 추정)
-        empty_ratio = df.isnull().sum().sum() / (df.shape[0] * df.shape[1])
-        if empty_ratio > 0.3:
-            issues.append("merged_cells")
-            recommendations.append("병합된 셀을 해제하고 값을 채워넣으세요")
-            format_type = DataFormat.MERGED_CELLS
-
-        # 2. 교차표 형식 감지 (숫자 열이 많고 첫 번째 열이 텍스트인 경우)
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-        if len(numeric_cols) > 3 and df.shape[1] > 5:
-            # 첫 번째 열이 카테고리이고 나머지가 수치인 경우
-            first_col_categorical = pd.api.types.is_string_dtype(df.iloc[:, 0]) or pd.api.types.is_object_dtype(df.iloc[:, 0])
-            if first_col_categorical and len(numeric_cols) / df.shape[1] > 0.6:
-                issues.append("cross_tab")
-                recommendations.append(f"{df.columns[1:][:5].tolist()}... 열들을 세로 형식으로 변환하세요")
-                format_type = DataFormat.CROSS_TAB
-
-        # 3. 다단계 헤더 감지 (열 이름에 패턴이 있는 경우)
-        header_patterns = [col for col in df.columns if isinstance(col, str) and ("." in col or "_" in col or " - " in col)]
-        if len(header_patterns) > df.shape[1] * 0.5:
-            issues.append("multi_level_headers")
-            recommendations.append("다단계 헤더를 단일 헤더로 결합하세요")
-            format_type = DataFormat.MULTI_LEVEL_HEADERS
-
-        # 4. 소계 행 감지 (행에서 "총계", "소계", "합계" 등이 포함된 경우)
-        subtotal_keywords = ["총계", "소계", "합계", "Total", "Subtotal", "Sum"]
-        subtotal_rows = 0
-        for _, row in df.iterrows():
-            row_str = " ".join([str(val) for val in row.values if pd.notna(val)])
-            if any(keyword in row_str for keyword in subtotal_keywords):
-                subtotal_rows += 1
-
-        if subtotal_rows > 0:
-            issues.append("subtotals_mixed")
-            recommendations.append(f"소계 행 {subtotal_rows}개를 제거하세요")
-            format_type = DataFormat.SUBTOTALS_MIXED
-
-        # 5. 넓은 형식 감지 (동일한 지표가 여러 열에 반복되는 경우)
-        if df.shape[1] > 10:
-            # 열 이름에서 연도, 월, 분기 패턴 감지
-            date_patterns = [r"\d{4}", r"Q[1-4]", r"[1-9][0-2]?월", r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"]
-            date_cols = []
-            for col in df.columns:
-                if isinstance(col, str) and any(re.search(pattern, col) for pattern in date_patterns):
-                    date_cols.append(col)
-
-            if len(date_cols) > 3:
-                issues.append("wide_format")
-                recommendations.append(f"날짜/기간 열들({len(date_cols)}개)을 하나의 기간 컬럼으로 변환하세요")
-                format_type = DataFormat.WIDE_FORMAT
-
-        # 피벗테이블 준비 상태 평가
-        pivot_ready = len(issues) == 0
-        transformation_needed = not pivot_ready
-
-        # 변환 후 예상 행 수 계산
-        estimated_rows = df.shape[0]
-        if "cross_tab" in issues or "wide_format" in issues:
-            # 교차표나 넓은 형식인 경우 행 수가 크게 증가
-            estimated_rows = df.shape[0] * max(len(numeric_cols), 1)
-
-        # 신뢰도 점수 계산 (문제가 적을수록 높음)
-        confidence_score = max(0.0, 1.0 - len(issues) * 0.2)
-
-        return {
-            "format_type": format_type.value,
-            "issues": issues,
-            "pivot_ready": pivot_ready,
-            "transformation_needed": transformation_needed,
-            "recommendations": recommendations,
-            "estimated_rows_after_transform": int(estimated_rows),
-            "confidence_score": round(confidence_score, 2),
-            "data_shape": {"rows": df.shape[0], "columns": df.shape[1]},
-            "ai_assistance_available": True,
-        }
-
-    except Exception as e:
-        return {
-            "format_type": DataFormat.UNKNOWN.value,
-            "issues": ["analysis_failed"],
-            "pivot_ready": False,
-            "transformation_needed": False,
-            "recommendations": [f"데이터 분석 중 오류 발생: {str(e)}"],
-            "estimated_rows_after_transform": 0,
-            "confidence_score": 0.0,
-            "ai_assistance_available": False,
-        }
-
-
-def transform_data_unpivot(df: pd.DataFrame, id_vars: Optional[List[str]] = None) -> pd.DataFrame:
-    """
-    교차표 형식 데이터를 세로 형식(unpivot)으로 변환합니다.
-
-    Args:
-        df: 변환할 pandas DataFrame
-        id_vars: 고정할 열 목록 (None이면 첫 번째 열 자동 선택)
-
-    Returns:
-        변환된 pandas DataFrame
-    """
-    try:
-        if id_vars is None:
-            # 첫 번째 열을 ID 변수로 사용
-            id_vars = [df.columns[0]]
-
-        # 수치형 열들을 찾아서 melt 대상으로 설정
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
-        value_vars = [col for col in numeric_cols if col not in id_vars]
-
-        if not value_vars:
-            # 수치형 열이 없으면 ID 변수 외의 모든 열 사용
-            value_vars = [col for col in df.columns if col not in id_vars]
-
-        # pandas melt를 사용하여 unpivot
-        melted_df = pd.melt(df, id_vars=id_vars, value_vars=value_vars, var_name="변수", value_name="값")
-
-        # 빈 값 제거
-        melted_df = melted_df.dropna(subset=["값"])
-
-        return melted_df.reset_index(drop=True)
-
-    except Exception as e:
-        raise ValueError(f"Unpivot 변환 실패: {str(e)}")
-
-
-def transform_data_unmerge(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    병합된 셀로 인한 빈 값들을 앞의 값으로 채웁니다.
-
-    Args:
-        df: 변환할 pandas DataFrame
-
-    Returns:
-        변환된 pandas DataFrame
-    """
-    try:
-        # 모든 열에 대해 forward fill 적용
-        filled_df = df.fillna(method="ffill")
-
-        # 문자열 열의 경우 빈 문자열도 채우기
-        for col in filled_df.columns:
-            if filled_df[col].dtype == "object":
-                filled_df[col] = filled_df[col].replace("", None)
-                filled_df[col] = filled_df[col].fillna(method="ffill")
-
-        return filled_df.reset_index(drop=True)
-
-    except Exception as e:
-        raise ValueError(f"Unmerge 변환 실패: {str(e)}")
-
-
-def transform_data_flatten_headers(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    다단계 헤더를 단일 헤더로 결합합니다.
-
-    Args:
-        df: 변환할 pandas DataFrame
-
-    Returns:
-        변환된 pandas DataFrame
-    """
-    try:
-        # 열 이름을 단순화
-        new_columns = []
-        for col in df.columns:
-            if isinstance(col, str):
-                # 특수 문자를 언더스코어로 대체하고 단순화
-                simplified = re.sub(r"[^\w\s]", "_", col)
-                simplified = re.sub(r"\s+", "_", simplified)
-                simplified = re.sub(r"_+", "_", simplified).strip("_")
-                new_columns.append(simplified)
-            else:
-                new_columns.append(f"Column_{len(new_columns)+1}")
-
-        df.columns = new_columns
-        return df.reset_index(drop=True)
-
-    except Exception as e:
-        raise ValueError(f"Header 평탄화 실패: {str(e)}")
-
-
-def transform_data_remove_subtotals(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    소계 행들을 제거합니다.
-
-    Args:
-        df: 변환할 pandas DataFrame
-
-    Returns:
-        변환된 pandas DataFrame
-    """
-    try:
-        subtotal_keywords = ["총계", "소계", "합계", "Total", "Subtotal", "Sum", "계"]
-
-        # 소계 행 인덱스 찾기
-        rows_to_drop = []
-        for idx, row in df.iterrows():
-            row_str = " ".join([str(val) for val in row.values if pd.notna(val)])
-            if any(keyword in row_str for keyword in subtotal_keywords):
-                rows_to_drop.append(idx)
-
-        # 소계 행 제거
-        cleaned_df = df.drop(rows_to_drop)
-
-        return cleaned_df.reset_index(drop=True)
-
-    except Exception as e:
-        raise ValueError(f"소계 제거 실패: {str(e)}")
-
-
-def transform_data_auto(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
-    """
-    자동으로 모든 필요한 변환을 적용합니다.
-
-    Args:
-        df: 변환할 pandas DataFrame
-
-    Returns:
-        (변환된 DataFrame, 적용된 변환 목록) 튜플
-    """
-    try:
-        applied_transforms = []
-        result_df = df.copy()
-
-        # 1. 소계 제거 (먼저 수행)
-        subtotal_keywords = ["총계", "소계", "합계", "Total", "Subtotal", "Sum"]
-        subtotal_rows = 0
-        for _, row in result_df.iterrows():
-            row_str = " ".join([str(val) for val in row.values if pd.notna(val)])
-            if any(keyword in row_str for keyword in subtotal_keywords):
-                subtotal_rows += 1
-
-        if subtotal_rows > 0:
-            result_df = transform_data_remove_subtotals(result_df)
-            applied_transforms.append("remove-subtotals")
-
-        # 2. 병합된 셀 처리 (빈 값 비율 확인)
-        empty_ratio = result_df.isnull().sum().sum() / (result_df.shape[0] * result_df.shape[1])
-        if empty_ratio > 0.3:
-            result_df = transform_data_unmerge(result_df)
-            applied_transforms.append("unmerge")
-
-        # 3. 헤더 평탄화 (복잡한 열 이름 확인)
-        header_patterns = [
-            col for col in result_df.columns if isinstance(col, str) and ("." in col or "_" in col or " - " in col)
-        ]
-        if len(header_patterns) > result_df.shape[1] * 0.5:
-            result_df = transform_data_flatten_headers(result_df)
-            applied_transforms.append("flatten-headers")
-
-        # 4. Unpivot 변환 (교차표 또는 넓은 형식 감지)
-        numeric_cols = result_df.select_dtypes(include=["number"]).columns
-        should_unpivot = False
-
-        # 교차표 감지
-        if len(numeric_cols) > 3 and result_df.shape[1] > 5:
-            first_col_categorical = pd.api.types.is_string_dtype(result_df.iloc[:, 0]) or pd.api.types.is_object_dtype(
-                result_df.iloc[:, 0]
-            )
-            if first_col_categorical and len(numeric_cols) / result_df.shape[1] > 0.6:
-                should_unpivot = True
-
-        # 넓은 형식 감지 (날짜/기간 열들)
-        if result_df.shape[1] > 10:
-            date_patterns = [r"\d{4}", r"Q[1-4]", r"[1-9][0-2]?월", r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"]
-            date_cols = []
-            for col in result_df.columns:
-                if isinstance(col, str) and any(re.search(pattern, col) for pattern in date_patterns):
-                    date_cols.append(col)
-            if len(date_cols) > 3:
-                should_unpivot = True
-
-        if should_unpivot:
-            result_df = transform_data_unpivot(result_df)
-            applied_transforms.append("unpivot")
-
-        return result_df, applied_transforms
-
-    except Exception as e:
-        raise ValueError(f"자동 변환 실패: {str(e)}")
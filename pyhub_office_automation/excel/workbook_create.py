@@ -2,13 +2,13 @@
 Excel 새 워크북 생성 명령어 (Engine 기반)
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -96,7 +96,7 @@ def workbook_create(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 wb = workbook_info
                 typer.echo(f"✅ {message}")
@@ -126,7 +126,7 @@ def workbook_create(
     except Exception as e:
         error_response = create_error_response(e, "workbook-create")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
             typer.echo("💡 Excel이 실행되고 있는지 확인하세요.", err=True)
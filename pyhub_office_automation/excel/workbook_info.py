@@ -4,7 +4,6 @@ Excel 워크북 상세 정보 조회 명령어 (Typer 버전)
 """
 
 import datetime
-import json
 import platform
 import sys
 from pathlib import Path
@@ -12,6 +11,8 @@ from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -27,6 +28,7 @@ from .utils import (
 )
 
 
+@cached_result("workbook-info")
 def workbook_info(
     file_path: Optional[str] = typer.Option(None, "--file-path", help="조회할 Excel 파일의 절대 경로"),
     workbook_name: Optional[str] = typer.Option(None, "--workbook-name", help="열린 워크북 이름으로 찾기"),
@@ -352,7 +354,7 @@ def workbook_info(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 wb = workbook_data
                 typer.echo(f"📊 {message}")
@@ -401,7 +403,7 @@ def workbook_info(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "workbook-info")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다: {file_path}", err=True)
         raise typer.Exit(1)
@@ -409,7 +411,7 @@ def workbook_info(
     except ValueError as e:
         error_response = create_error_response(e, "workbook-info")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -417,7 +419,7 @@ def workbook_info(
     except Exception as e:
         error_response = create_error_response(e, "workbook-info")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo("💡 Excel이 설치되어 있는지 확인하세요.", err=True)
@@ -3,11 +3,11 @@ Excel 워크북 목록 조회 명령어 (Engine 기반)
 현재 열려있는 모든 워크북들의 목록과 기본 정보 제공
 """
 
-import json
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -87,7 +87,7 @@ def workbook_list(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 typer.echo(f"📊 {message}")
                 typer.echo()
@@ -122,7 +122,7 @@ def workbook_list(
     except Exception as e:
         error_response = create_error_response(e, "workbook-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 오류 발생: {str(e)}", err=True)
             typer.echo("💡 Excel이 실행되고 있는지 확인하세요.", err=True)
@@ -3,7 +3,6 @@ Excel 워크북 열기 명령어 (Typer 버전)
 AI 에이전트와의 연동을 위한 구조화된 출력 제공
 """
 
-import json
 import platform
 import sys
 from pathlib import Path
@@ -11,6 +10,7 @@ from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .engines import get_engine
@@ -204,7 +204,7 @@ def workbook_open(
 
             # 출력 형식에 따른 결과 반환
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:  # text 형식
                 wb = workbook_info
                 typer.echo(f"📊 {message}")
@@ -236,7 +236,7 @@ def workbook_open(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "workbook-open")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 파일을 찾을 수 없습니다: {file_path}", err=True)
         raise typer.Exit(1)
@@ -244,7 +244,7 @@ def workbook_open(
     except ValueError as e:
         error_response = create_error_response(e, "workbook-open")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -252,7 +252,7 @@ def workbook_open(
     except Exception as e:
         error_response = create_error_response(e, "workbook-open")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
             typer.echo("💡 Excel이 설치되어 있는지 확인하세요.", err=True)
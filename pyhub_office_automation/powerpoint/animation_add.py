@@ -3,12 +3,12 @@ PowerPoint 애니메이션 효과 추가 명령어 (COM 전용)
 슬라이드 객체에 애니메이션 효과를 추가합니다.
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import PowerPointBackend, create_error_response, create_success_response, get_or_open_presentation
@@ -133,7 +133,7 @@ def animation_add(
                 ],
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 2. 효과 이름 검증
@@ -148,7 +148,7 @@ def animation_add(
                 "hint": "oa ppt animation-add --help 를 실행하여 지원 효과 목록을 확인하세요",
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 3. 트리거 검증
@@ -159,7 +159,7 @@ def animation_add(
             error=f"올바르지 않은 트리거: {trigger}. 유효한 값: {', '.join(ANIMATION_TRIGGERS.keys())}",
             error_type="ValueError",
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 4. 방향 검증 (선택적)
@@ -172,7 +172,7 @@ def animation_add(
                 error=f"올바르지 않은 방향: {direction}. 유효한 값: {', '.join(ANIMATION_DIRECTIONS.keys())}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
         direction_value = ANIMATION_DIRECTIONS[direction_lower]
 
@@ -192,7 +192,7 @@ def animation_add(
             error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 7. COM을 통해 애니메이션 추가
@@ -205,7 +205,7 @@ def animation_add(
                 error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         slide = prs.Slides(slide_number)
@@ -218,7 +218,7 @@ def animation_add(
                 error=f"도형 인덱스가 범위를 벗어났습니다: {shape_index} (1-{total_shapes})",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         shape = slide.Shapes(shape_index)
@@ -263,7 +263,7 @@ def animation_add(
             error=f"애니메이션 추가 실패: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 8. 성공 응답
@@ -275,7 +275,7 @@ def animation_add(
 
     # 출력
     if output_format == "json":
-        typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+        echo_json(response)
     else:
         typer.echo(f"✅ {message}")
         typer.echo(f"📍 슬라이드: {slide_number}")
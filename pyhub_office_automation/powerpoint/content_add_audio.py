@@ -3,12 +3,12 @@ PowerPoint 오디오 추가 명령어 (COM-First)
 슬라이드에 오디오 파일을 삽입합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -91,7 +91,7 @@ def content_add_audio(
                 error="--center를 사용하지 않는 경우 --left와 --top을 모두 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 오디오 파일 검증
@@ -104,7 +104,7 @@ def content_add_audio(
                 error=f"오디오 파일을 찾을 수 없습니다: {audio_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 오디오 형식 검증
@@ -116,7 +116,7 @@ def content_add_audio(
                 error=f"지원하지 않는 오디오 형식: {audio_ext}. 지원 형식: {supported_str}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드 결정
@@ -128,7 +128,7 @@ def content_add_audio(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 오디오 파일 크기
@@ -147,7 +147,7 @@ def content_add_audio(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -163,7 +163,7 @@ def content_add_audio(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -250,7 +250,7 @@ def content_add_audio(
                     error=f"오디오 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -261,7 +261,7 @@ def content_add_audio(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -328,7 +328,7 @@ def content_add_audio(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -353,7 +353,7 @@ def content_add_audio(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,12 +3,12 @@ PowerPoint 차트 추가 명령어 (COM-First)
 Excel 데이터 또는 CSV 파일로부터 차트를 생성합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -100,7 +100,7 @@ def content_add_chart(
                 error="--csv-data 또는 --excel-data 중 하나는 반드시 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if csv_data and excel_data:
@@ -109,7 +109,7 @@ def content_add_chart(
                 error="--csv-data와 --excel-data는 동시에 사용할 수 없습니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if not center and (left is None or top is None):
@@ -118,7 +118,7 @@ def content_add_chart(
                 error="--center를 사용하지 않는 경우 --left와 --top을 모두 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 차트 타입 검증
@@ -130,7 +130,7 @@ def content_add_chart(
                 error=f"지원하지 않는 차트 타입: {chart_type}\n사용 가능: {available_types}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 데이터 파일 검증
@@ -154,7 +154,7 @@ def content_add_chart(
                 error=f"데이터 파일을 찾을 수 없습니다: {data_source_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드 결정
@@ -166,7 +166,7 @@ def content_add_chart(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 데이터 로드 (pandas DataFrame)
@@ -189,7 +189,7 @@ def content_add_chart(
                 error="데이터가 비어있습니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if len(df.columns) < 2:
@@ -198,7 +198,7 @@ def content_add_chart(
                 error=f"차트를 생성하려면 최소 2개의 열이 필요합니다 (현재: {len(df.columns)}개)",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -214,7 +214,7 @@ def content_add_chart(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -230,7 +230,7 @@ def content_add_chart(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -334,7 +334,7 @@ def content_add_chart(
                     error=f"차트 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -345,7 +345,7 @@ def content_add_chart(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -451,7 +451,7 @@ def content_add_chart(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -473,7 +473,7 @@ def content_add_chart(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,13 +3,13 @@ PowerPoint 수식 추가 명령어 (COM 전용)
 슬라이드에 수학 수식을 추가합니다 (OMath 또는 LaTeX).
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import PowerPointBackend, create_error_response, create_success_response, get_or_open_presentation, normalize_path
@@ -73,7 +73,7 @@ def content_add_equation(
                 ],
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     try:
@@ -84,7 +84,7 @@ def content_add_equation(
                 error="--center를 사용하지 않는 경우 --left와 --top을 모두 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 3. 백엔드는 COM 고정
@@ -103,7 +103,7 @@ def content_add_equation(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 5. COM을 통해 수식 추가
@@ -117,7 +117,7 @@ def content_add_equation(
                     error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             slide = prs.Slides(slide_number)
@@ -205,7 +205,7 @@ def content_add_equation(
                 error=f"수식 추가 실패: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 6. 성공 응답
@@ -217,7 +217,7 @@ def content_add_equation(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -235,7 +235,7 @@ def content_add_equation(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # COM은 유지
@@ -3,13 +3,13 @@ PowerPoint Excel 차트 연동 명령어 (COM 전용)
 Excel 워크북의 기존 차트를 PowerPoint 슬라이드에 추가합니다.
 """
 
-import json
 import platform
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import PowerPointBackend, create_error_response, create_success_response, get_or_open_presentation, normalize_path
@@ -74,7 +74,7 @@ def content_add_excel_chart(
                 ],
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     try:
@@ -85,7 +85,7 @@ def content_add_excel_chart(
                 error="--center를 사용하지 않는 경우 --left와 --top을 모두 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # Excel 파일 경로 검증
@@ -98,7 +98,7 @@ def content_add_excel_chart(
                 error=f"Excel 파일을 찾을 수 없습니다: {excel_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 3. 백엔드는 COM 고정
@@ -117,7 +117,7 @@ def content_add_excel_chart(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 5. Excel 애플리케이션 열기
@@ -140,7 +140,7 @@ def content_add_excel_chart(
                         error=f"시트를 찾을 수 없습니다: {sheet_name}",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
             else:
                 excel_sheet = excel_workbook.ActiveSheet
@@ -155,7 +155,7 @@ def content_add_excel_chart(
                     error=f"시트 '{excel_sheet.Name}'에 차트가 없습니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 차트 선택
@@ -172,7 +172,7 @@ def content_add_excel_chart(
                         error=f"차트를 찾을 수 없습니다: {chart_name}",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
             elif chart_index is not None:
                 # 인덱스로 찾기
@@ -184,7 +184,7 @@ def content_add_excel_chart(
                         error=f"차트 인덱스가 범위를 벗어났습니다: {chart_index} (1-{chart_objects.Count})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
                 excel_chart = chart_objects(chart_index)
             else:
@@ -206,7 +206,7 @@ def content_add_excel_chart(
                     error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             slide = prs.Slides(slide_number)
@@ -291,7 +291,7 @@ def content_add_excel_chart(
                 error=f"Excel 차트 추가 실패: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 11. 성공 응답
@@ -303,7 +303,7 @@ def content_add_excel_chart(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -323,7 +323,7 @@ def content_add_excel_chart(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # COM 객체 정리는 try-except에서 처리됨
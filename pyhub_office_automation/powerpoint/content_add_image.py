@@ -3,13 +3,13 @@ PowerPoint 이미지 추가 명령어 (COM-First)
 슬라이드에 이미지를 추가합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 from PIL import Image
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -86,7 +86,7 @@ def content_add_image(
                 error="--center를 사용하지 않는 경우 --left와 --top을 모두 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드 결정
@@ -98,7 +98,7 @@ def content_add_image(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 이미지 경로 검증
@@ -111,7 +111,7 @@ def content_add_image(
                 error=f"이미지 파일을 찾을 수 없습니다: {image_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 이미지 정보 읽기 (PIL 사용)
@@ -133,7 +133,7 @@ def content_add_image(
                 error=f"이미지 파일을 읽을 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 크기 계산 (aspect ratio 유지)
@@ -163,7 +163,7 @@ def content_add_image(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -179,7 +179,7 @@ def content_add_image(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -251,7 +251,7 @@ def content_add_image(
                     error=f"이미지 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -262,7 +262,7 @@ def content_add_image(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -333,7 +333,7 @@ def content_add_image(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -352,7 +352,7 @@ def content_add_image(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
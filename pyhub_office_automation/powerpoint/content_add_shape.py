@@ -3,12 +3,12 @@ PowerPoint 도형 추가 명령어 (COM-First)
 슬라이드에 도형을 추가합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -103,7 +103,7 @@ def content_add_shape(
                 error=f"지원하지 않는 도형 유형: {shape_type}. 사용 가능: {', '.join(SHAPE_TYPE_MAP_COM.keys())}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드 결정
@@ -115,7 +115,7 @@ def content_add_shape(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -131,7 +131,7 @@ def content_add_shape(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -147,7 +147,7 @@ def content_add_shape(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -215,7 +215,7 @@ def content_add_shape(
                     error=f"도형 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -226,7 +226,7 @@ def content_add_shape(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # python-pptx 도형 타입 매핑
@@ -317,7 +317,7 @@ def content_add_shape(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -339,7 +339,7 @@ def content_add_shape(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
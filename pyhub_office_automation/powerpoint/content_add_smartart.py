@@ -13,6 +13,7 @@ from pptx import Presentation
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
 from pptx.util import Inches, Pt
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, normalize_path, parse_color, validate_slide_number
@@ -157,7 +158,7 @@ def content_add_smartart(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📄 파일: {pptx_path.name}")
@@ -172,7 +173,7 @@ def content_add_smartart(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "content-add-smartart")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -180,7 +181,7 @@ def content_add_smartart(
     except ValueError as e:
         error_response = create_error_response(e, "content-add-smartart")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -188,7 +189,7 @@ def content_add_smartart(
     except json.JSONDecodeError as e:
         error_response = create_error_response(f"JSON 파일 파싱 실패: {str(e)}", "content-add-smartart")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ JSON 파일 파싱 실패: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -196,7 +197,7 @@ def content_add_smartart(
     except Exception as e:
         error_response = create_error_response(e, "content-add-smartart")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
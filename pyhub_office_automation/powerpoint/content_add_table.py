@@ -10,6 +10,7 @@ from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -82,7 +83,7 @@ def content_add_table(
                 error="--data와 --data-file은 동시에 사용할 수 없습니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if rows < 1 or cols < 1:
@@ -91,7 +92,7 @@ def content_add_table(
                 error="행과 열은 최소 1 이상이어야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드 결정
@@ -103,7 +104,7 @@ def content_add_table(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 데이터 로드
@@ -121,7 +122,7 @@ def content_add_table(
                     error=f"JSON 데이터 형식이 잘못되었습니다: {str(e)}",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         elif data_file:
@@ -132,7 +133,7 @@ def content_add_table(
                     error=f"데이터 파일을 찾을 수 없습니다: {data_file}",
                     error_type="FileNotFoundError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             if data_file_path.suffix.lower() == ".csv":
@@ -152,7 +153,7 @@ def content_add_table(
                     error="데이터 파일은 .csv 또는 .json 형식이어야 합니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         # 데이터 크기 검증
@@ -166,7 +167,7 @@ def content_add_table(
                     error=f"데이터 행 수({data_rows})가 표 행 수({rows})보다 큽니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
             if data_cols > cols:
                 result = create_error_response(
@@ -174,7 +175,7 @@ def content_add_table(
                     error=f"데이터 열 수({data_cols})가 표 열 수({cols})보다 큽니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -190,7 +191,7 @@ def content_add_table(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -206,7 +207,7 @@ def content_add_table(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -268,7 +269,7 @@ def content_add_table(
                     error=f"테이블 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -279,7 +280,7 @@ def content_add_table(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -346,7 +347,7 @@ def content_add_table(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -366,7 +367,7 @@ def content_add_table(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
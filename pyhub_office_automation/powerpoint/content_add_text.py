@@ -3,12 +3,12 @@ PowerPoint 텍스트 추가 명령어 (COM-First)
 슬라이드에 텍스트를 추가합니다 (플레이스홀더 또는 자유 위치).
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -106,7 +106,7 @@ def content_add_text(
                 error="--text 또는 --text-file 중 하나는 반드시 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if text and text_file:
@@ -115,7 +115,7 @@ def content_add_text(
                 error="--text와 --text-file은 동시에 사용할 수 없습니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if placeholder and (left is not None or top is not None):
@@ -124,7 +124,7 @@ def content_add_text(
                 error="--placeholder와 --left/--top은 동시에 사용할 수 없습니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 스마트 자동 감지 모드: 옵션이 없으면 슬라이드 레이아웃의 플레이스홀더 자동 사용
@@ -138,7 +138,7 @@ def content_add_text(
                 error="--left와 --top은 함께 지정해야 합니다 (또는 --placeholder 사용, 또는 모두 생략하여 자동 감지)",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if placeholder and placeholder not in [PlaceholderType.TITLE, PlaceholderType.BODY, PlaceholderType.SUBTITLE]:
@@ -147,7 +147,7 @@ def content_add_text(
                 error=f"잘못된 플레이스홀더 유형: {placeholder}. 사용 가능: title, body, subtitle",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드 결정
@@ -159,7 +159,7 @@ def content_add_text(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 텍스트 로드
@@ -172,7 +172,7 @@ def content_add_text(
                     error=f"텍스트 파일을 찾을 수 없습니다: {text_file}",
                     error_type="FileNotFoundError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
             with open(text_file_path, "r", encoding="utf-8") as f:
                 text_content = f.read()
@@ -192,7 +192,7 @@ def content_add_text(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -211,7 +211,7 @@ def content_add_text(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -290,7 +290,7 @@ def content_add_text(
                             error=f"슬라이드 {slide_number}에 '{placeholder}' 플레이스홀더가 없습니다",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
                     # 플레이스홀더에 텍스트 설정
@@ -386,7 +386,7 @@ def content_add_text(
                     error=f"텍스트 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -397,7 +397,7 @@ def content_add_text(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -460,7 +460,7 @@ def content_add_text(
                         error=f"슬라이드 {slide_number}에 '{placeholder}' 플레이스홀더가 없습니다",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
                 text_frame = shape.text_frame
             else:
@@ -546,7 +546,7 @@ def content_add_text(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -566,7 +566,7 @@ def content_add_text(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,12 +3,12 @@ PowerPoint 비디오 추가 명령어 (COM-First)
 슬라이드에 비디오 파일을 삽입합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -88,7 +88,7 @@ def content_add_video(
                 error="--center를 사용하지 않는 경우 --left와 --top을 모두 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 비디오 파일 검증
@@ -101,7 +101,7 @@ def content_add_video(
                 error=f"비디오 파일을 찾을 수 없습니다: {video_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 비디오 형식 검증
@@ -113,7 +113,7 @@ def content_add_video(
                 error=f"지원하지 않는 비디오 형식: {video_ext}. 지원 형식: {supported_str}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 포스터 프레임 검증
@@ -127,7 +127,7 @@ def content_add_video(
                     error=f"포스터 프레임 이미지를 찾을 수 없습니다: {poster_frame}",
                     error_type="FileNotFoundError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 포스터 프레임은 python-pptx만 지원
@@ -137,7 +137,7 @@ def content_add_video(
                     error="포스터 프레임은 COM 백엔드에서 지원되지 않습니다. --backend python-pptx를 사용하세요.",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         # 백엔드 결정
@@ -149,7 +149,7 @@ def content_add_video(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 비디오 파일 크기
@@ -168,7 +168,7 @@ def content_add_video(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -184,7 +184,7 @@ def content_add_video(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -251,7 +251,7 @@ def content_add_video(
                     error=f"비디오 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -262,7 +262,7 @@ def content_add_video(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -342,7 +342,7 @@ def content_add_video(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -362,7 +362,7 @@ def content_add_video(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,12 +3,12 @@ PowerPoint 콘텐츠 업데이트 명령어 (COM-First)
 슬라이드의 기존 콘텐츠(텍스트, 이미지, 위치 등)를 수정합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -89,7 +89,7 @@ def content_update(
                 error="--shape-index 또는 --shape-name 중 하나는 반드시 지정해야 합니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if shape_index is not None and shape_name is not None:
@@ -98,7 +98,7 @@ def content_update(
                 error="--shape-index와 --shape-name은 동시에 사용할 수 없습니다",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if text is None and image_path is None and left is None and top is None and width is None and height is None:
@@ -107,7 +107,7 @@ def content_update(
                 error="업데이트할 내용을 지정해야 합니다 (--text, --image-path, --left, --top, --width, --height 중 하나 이상)",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 이미지 경로 검증
@@ -121,7 +121,7 @@ def content_update(
                     error=f"이미지 파일을 찾을 수 없습니다: {img_path}",
                     error_type="FileNotFoundError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         # 백엔드 결정
@@ -133,7 +133,7 @@ def content_update(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -149,7 +149,7 @@ def content_update(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -165,7 +165,7 @@ def content_update(
                         error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 slide = prs.Slides(slide_number)
@@ -179,7 +179,7 @@ def content_update(
                             error=f"Shape 인덱스가 범위를 벗어났습니다: {shape_index} (1-{slide.Shapes.Count})",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
                     shape = slide.Shapes(shape_index)
                     shape_identifier = f"index_{shape_index}"
@@ -194,7 +194,7 @@ def content_update(
                             error=f"Shape를 찾을 수 없습니다: {shape_name}",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
                 # 업데이트 내용 기록
@@ -208,7 +208,7 @@ def content_update(
                             error=f"이 Shape는 텍스트를 지원하지 않습니다 (Type: {shape.Type})",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
                     shape.TextFrame.TextRange.Text = text
@@ -223,7 +223,7 @@ def content_update(
                             error=f"이미지 교체는 picture shape만 가능합니다 (현재 Type: {shape.Type})",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
                     # 기존 이미지 정보 저장
@@ -295,7 +295,7 @@ def content_update(
                     error=f"콘텐츠 업데이트 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -306,7 +306,7 @@ def content_update(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -334,7 +334,7 @@ def content_update(
                         error=f"이 Shape는 텍스트를 지원하지 않습니다: {shape.shape_type}",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 shape.text_frame.clear()
@@ -354,7 +354,7 @@ def content_update(
                         error=f"이미지 교체는 picture shape만 가능합니다 (현재: {shape.shape_type})",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
                 # 기존 이미지 정보 저장
@@ -435,7 +435,7 @@ def content_update(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📍 슬라이드: {slide_number}")
@@ -457,7 +457,7 @@ def content_update(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
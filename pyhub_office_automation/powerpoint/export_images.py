@@ -3,12 +3,12 @@ PowerPoint 이미지 내보내기 명령어 (COM-First)
 슬라이드를 이미지 파일로 변환하여 저장합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -100,7 +100,7 @@ def export_images(
                 error=f"지원하지 않는 이미지 형식: {image_format}. 지원 형식: {', '.join(supported_formats)}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # JPEG 정규화
@@ -118,7 +118,7 @@ def export_images(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -134,7 +134,7 @@ def export_images(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -155,7 +155,7 @@ def export_images(
                             error=f"유효하지 않은 슬라이드 범위: {slides}",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
                 else:
                     slide_numbers = list(range(1, total_slides + 1))
@@ -232,7 +232,7 @@ def export_images(
                     error=f"이미지 내보내기 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -243,7 +243,7 @@ def export_images(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             result = create_error_response(
@@ -258,7 +258,7 @@ def export_images(
                     ]
                 },
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 성공 응답
@@ -270,7 +270,7 @@ def export_images(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📁 디렉토리: {output_path}")
@@ -289,7 +289,7 @@ def export_images(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
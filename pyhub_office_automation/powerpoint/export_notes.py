@@ -9,6 +9,7 @@ from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -85,7 +86,7 @@ def export_notes(
                 error=f"지원하지 않는 파일 형식: {file_ext}. .txt 또는 .json을 사용하세요.",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         export_format = "json" if file_ext == ".json" else "text"
@@ -99,7 +100,7 @@ def export_notes(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -115,7 +116,7 @@ def export_notes(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -136,7 +137,7 @@ def export_notes(
                             error=f"유효하지 않은 슬라이드 범위: {slides}",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
                 else:
                     slide_numbers = list(range(1, total_slides + 1))
@@ -252,7 +253,7 @@ def export_notes(
                     error=f"노트 내보내기 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -263,7 +264,7 @@ def export_notes(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             try:
@@ -281,7 +282,7 @@ def export_notes(
                             error=f"유효하지 않은 슬라이드 범위: {slides}",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
                     # python-pptx는 0-based 인덱싱
@@ -397,7 +398,7 @@ def export_notes(
                     error=f"노트 내보내기 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         # 성공 응답
@@ -409,7 +410,7 @@ def export_notes(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📄 파일: {notes_path}")
@@ -428,7 +429,7 @@ def export_notes(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
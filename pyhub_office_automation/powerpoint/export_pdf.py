@@ -3,12 +3,12 @@ PowerPoint PDF 내보내기 명령어 (COM-First)
 프레젠테이션을 PDF로 변환하여 저장합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -94,7 +94,7 @@ def export_pdf(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -110,7 +110,7 @@ def export_pdf(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -133,7 +133,7 @@ def export_pdf(
                             error=f"유효하지 않은 슬라이드 범위: {slides}",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
                 # ppSaveAsPDF = 32
@@ -239,7 +239,7 @@ def export_pdf(
                     error=f"PDF 내보내기 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -250,7 +250,7 @@ def export_pdf(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             result = create_error_response(
@@ -265,7 +265,7 @@ def export_pdf(
                     ]
                 },
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 성공 응답
@@ -277,7 +277,7 @@ def export_pdf(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📄 파일: {pdf_path}")
@@ -297,7 +297,7 @@ def export_pdf(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,12 +3,12 @@ PowerPoint 레이아웃 적용 명령어 (COM-First)
 슬라이드에 특정 레이아웃을 적용합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional, Union
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -72,7 +72,7 @@ def layout_apply(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -88,7 +88,7 @@ def layout_apply(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -103,7 +103,7 @@ def layout_apply(
                     error=f"슬라이드 번호가 범위를 벗어났습니다: {slide_number} (1-{total_slides})",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             slide = prs.Slides(slide_number)
@@ -129,7 +129,7 @@ def layout_apply(
                         error=f"레이아웃을 찾을 수 없습니다: {layout}",
                         error_type="ValueError",
                     )
-                    typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                    echo_json(result)
                     raise typer.Exit(1)
 
             # 레이아웃 실제 적용! (COM만 가능)
@@ -156,7 +156,7 @@ def layout_apply(
                     error=f"레이아웃 적용 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -167,7 +167,7 @@ def layout_apply(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 슬라이드 번호 검증
@@ -217,7 +217,7 @@ def layout_apply(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             if result_data.get("applied"):
                 typer.echo(f"✅ {message}")
@@ -241,7 +241,7 @@ def layout_apply(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,7 +3,6 @@ PowerPoint 레이아웃 목록 조회 명령어
 프레젠테이션의 사용 가능한 모든 레이아웃 정보를 제공합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -11,6 +10,7 @@ import typer
 from pptx import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER_TYPE
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, normalize_path
@@ -138,7 +138,7 @@ def layout_list(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"✅ {message}")
             typer.echo(f"📄 파일: {pptx_path.name}")
@@ -152,7 +152,7 @@ def layout_list(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "layout-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -160,7 +160,7 @@ def layout_list(
     except Exception as e:
         error_response = create_error_response(e, "layout-list")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
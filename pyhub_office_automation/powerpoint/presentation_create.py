@@ -3,13 +3,13 @@ PowerPoint 새 프레젠테이션 생성 명령어 (COM-First)
 새 PowerPoint 파일 생성 및 저장
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -64,7 +64,7 @@ def presentation_create(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 템플릿 검증
@@ -74,7 +74,7 @@ def presentation_create(
                 error=f"지원하지 않는 템플릿입니다: {template}. 사용 가능: blank, default",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 저장 경로 처리
@@ -101,7 +101,7 @@ def presentation_create(
                 error=f"프레젠테이션 생성 실패: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 정보 수집 (백엔드별 처리)
@@ -164,7 +164,7 @@ def presentation_create(
             message=message,
         )
 
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
 
     except typer.Exit:
         raise
@@ -174,7 +174,7 @@ def presentation_create(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -4,17 +4,19 @@ PowerPoint 프레젠테이션 정보 조회 명령어 (Typer 버전)
 """
 
 import datetime
-import json
 import sys
 from pathlib import Path
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, normalize_path
 
 
+@cached_result("presentation-info")
 def presentation_info(
     file_path: str = typer.Option(..., "--file-path", help="정보를 조회할 프레젠테이션 파일 경로"),
     output_format: str = typer.Option("json", "--format", help="출력 형식 선택"),
@@ -38,7 +40,7 @@ def presentation_info(
                 error="python-pptx 패키지가 설치되지 않았습니다",
                 error_type="ImportError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 경로 정규화 및 검증
@@ -51,7 +53,7 @@ def presentation_info(
                 error=f"프레젠테이션 파일을 찾을 수 없습니다: {file_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 열기
@@ -63,7 +65,7 @@ def presentation_info(
                 error=f"프레젠테이션 파일을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 슬라이드 정보
@@ -132,7 +134,7 @@ def presentation_info(
             message=f"프레젠테이션 정보: {file_path_obj.name}",
         )
 
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
 
     except typer.Exit:
         raise
@@ -142,5 +144,5 @@ def presentation_info(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
@@ -3,12 +3,12 @@ PowerPoint 프레젠테이션 목록 조회 명령어 (Typer 버전)
 열려있는 프레젠테이션 목록 조회 (Windows COM 전용)
 """
 
-import json
 import platform
 import sys
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response
@@ -81,7 +81,7 @@ def presentation_list(
                     ),
                 )
 
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 return
 
             except Exception as e:
@@ -91,7 +91,7 @@ def presentation_list(
                     error=f"PowerPoint 애플리케이션에 연결할 수 없습니다: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         except ImportError:
@@ -101,7 +101,7 @@ def presentation_list(
                 error="Windows COM 기능을 사용하려면 pywin32 패키지가 필요합니다. 'pip install pywin32'로 설치하세요",
                 error_type="ImportError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
     # 비-Windows 플랫폼
@@ -120,7 +120,7 @@ def presentation_list(
             message=f"{current_platform}에서는 presentation-list 기능이 제한됩니다. Windows COM 전용 기능입니다.",
         )
 
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
 
 
 if __name__ == "__main__":
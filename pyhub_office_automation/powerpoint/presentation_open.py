@@ -3,11 +3,11 @@ PowerPoint 프레젠테이션 열기 명령어 (COM-First)
 기존 PowerPoint 파일을 열고 기본 정보 제공
 """
 
-import json
 from pathlib import Path
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -61,7 +61,7 @@ def presentation_open(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 경로 정규화 및 검증
@@ -74,7 +74,7 @@ def presentation_open(
                 error=f"프레젠테이션 파일을 찾을 수 없습니다: {file_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         if not file_path_obj.is_file():
@@ -83,7 +83,7 @@ def presentation_open(
                 error=f"경로가 파일이 아닙니다: {file_path}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 열기 (백엔드 자동 선택)
@@ -95,7 +95,7 @@ def presentation_open(
                 error=f"프레젠테이션 파일을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 정보 수집 (백엔드별 처리)
@@ -153,7 +153,7 @@ def presentation_open(
             message=message,
         )
 
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
 
     except typer.Exit:
         raise
@@ -163,7 +163,7 @@ def presentation_open(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,13 +3,13 @@ PowerPoint 프레젠테이션 저장 명령어 (COM-First)
 열려있는 프레젠테이션을 파일로 저장
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -72,7 +72,7 @@ def presentation_save(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 저장 경로 정규화
@@ -118,7 +118,7 @@ def presentation_save(
                     error=f"프레젠테이션 저장 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -129,7 +129,7 @@ def presentation_save(
                     error="python-pptx 백엔드는 --source-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             try:
@@ -140,7 +140,7 @@ def presentation_save(
                     error="python-pptx 패키지가 설치되지 않았습니다",
                     error_type="ImportError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 원본 경로 검증
@@ -153,7 +153,7 @@ def presentation_save(
                     error=f"원본 프레젠테이션 파일을 찾을 수 없습니다: {source_path}",
                     error_type="FileNotFoundError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 프레젠테이션 열기 및 저장
@@ -178,7 +178,7 @@ def presentation_save(
                     error=f"프레젠테이션 저장 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         # 성공 응답
@@ -188,7 +188,7 @@ def presentation_save(
             message=message,
         )
 
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
 
     except typer.Exit:
         raise
@@ -198,7 +198,7 @@ def presentation_save(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -9,6 +9,7 @@ from typing import List, Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import PowerPointBackend, create_error_response, create_success_response, get_or_open_presentation
@@ -67,7 +68,7 @@ def run_macro(
                 ],
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 2. 인자 파싱 (JSON 배열)
@@ -84,7 +85,7 @@ def run_macro(
                 error=f"매크로 인자 JSON 파싱 실패: {str(e)}",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
     # 3. 백엔드는 COM 고정
@@ -103,7 +104,7 @@ def run_macro(
             error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 5. COM을 통해 매크로 실행
@@ -175,7 +176,7 @@ def run_macro(
                     "security_guide": "PowerPoint 옵션 > 보안 센터 > 매크로 설정에서 '모든 매크로 사용' 또는 '디지털 서명한 매크로만 사용' 선택",
                 },
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
     except Exception as e:
@@ -184,7 +185,7 @@ def run_macro(
             error=f"매크로 실행 중 예외 발생: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 6. 성공 응답
@@ -196,7 +197,7 @@ def run_macro(
 
     # 출력
     if output_format == "json":
-        typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+        echo_json(response)
     else:
         typer.echo(f"✅ {message}")
         typer.echo(f"📌 매크로: {full_macro_name}")
@@ -3,12 +3,12 @@ PowerPoint 슬라이드 추가 명령어 (COM-First)
 새 슬라이드를 지정된 레이아웃으로 추가
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import (
@@ -73,7 +73,7 @@ def slide_add(
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 가져오기
@@ -89,7 +89,7 @@ def slide_add(
                 error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 백엔드별 처리
@@ -121,7 +121,7 @@ def slide_add(
                             error=f"레이아웃을 찾을 수 없습니다: {layout}",
                             error_type="ValueError",
                         )
-                        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                        echo_json(result)
                         raise typer.Exit(1)
 
             # 위치 결정 (COM은 1-based)
@@ -152,7 +152,7 @@ def slide_add(
                     error=f"슬라이드 추가 실패: {str(e)}",
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
         else:
@@ -163,7 +163,7 @@ def slide_add(
                     error="python-pptx 백엔드는 --file-path 옵션이 필수입니다",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             total_slides = len(prs.slides)
@@ -188,7 +188,7 @@ def slide_add(
                     error=str(e),
                     error_type=type(e).__name__,
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             # 위치 검증 (끝에 추가 허용)
@@ -233,7 +233,7 @@ def slide_add(
         )
 
         if output_format == "json":
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
         else:
             typer.echo(f"슬라이드 추가 완료")
             typer.echo(f"  위치: {data['slide_number']}번")
@@ -248,7 +248,7 @@ def slide_add(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
     finally:
         # python-pptx는 자동 정리, COM은 유지
@@ -3,11 +3,11 @@ PowerPoint 슬라이드 복제 명령어 (Typer 버전)
 지정된 슬라이드를 바로 뒤에 복제 (Phase 1: 레이아웃만 복제)
 """
 
-import json
 from pathlib import Path
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, normalize_path, validate_slide_number
@@ -37,7 +37,7 @@ def slide_duplicate(
                 error="python-pptx 패키지가 설치되지 않았습니다",
                 error_type="ImportError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 경로 정규화 및 검증
@@ -50,7 +50,7 @@ def slide_duplicate(
                 error=f"프레젠테이션 파일을 찾을 수 없습니다: {file_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 열기
@@ -62,7 +62,7 @@ def slide_duplicate(
                 error=f"프레젠테이션 파일을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         total_slides = len(prs.slides)
@@ -107,7 +107,7 @@ def slide_duplicate(
         )
 
         if output_format == "json":
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
         else:
             typer.echo(f"✓ 슬라이드 복제 완료")
             typer.echo(f"  원본: {slide_number}번")
@@ -124,7 +124,7 @@ def slide_duplicate(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
 
@@ -3,16 +3,18 @@ PowerPoint 슬라이드 목록 조회 명령어 (Typer 버전)
 프레젠테이션의 모든 슬라이드 정보 제공
 """
 
-import json
 from pathlib import Path
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
+from pyhub_office_automation.utils.result_cache import cached_result
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, get_slide_content_summary, get_slide_title, normalize_path
 
 
+@cached_result("slide-list")
 def slide_list(
     file_path: str = typer.Option(..., "--file-path", help="정보를 조회할 프레젠테이션 파일 경로"),
     output_format: str = typer.Option("json", "--format", help="출력 형식 선택 (json/text)"),
@@ -36,7 +38,7 @@ def slide_list(
                 error="python-pptx 패키지가 설치되지 않았습니다",
                 error_type="ImportError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 경로 정규화 및 검증
@@ -49,7 +51,7 @@ def slide_list(
                 error=f"프레젠테이션 파일을 찾을 수 없습니다: {file_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 열기
@@ -61,7 +63,7 @@ def slide_list(
                 error=f"프레젠테이션 파일을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 슬라이드 정보 수집
@@ -105,7 +107,7 @@ def slide_list(
         )
 
         if output_format == "json":
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
         else:
             # Text 형식 출력
             typer.echo(f"📊 프레젠테이션: {file_path_obj.name}")
@@ -129,7 +131,7 @@ def slide_list(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
 
@@ -3,11 +3,11 @@ PowerPoint 슬라이드 순서 변경 명령어 (Typer 버전)
 슬라이드를 다른 위치로 이동
 """
 
-import json
 from pathlib import Path
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, normalize_path, validate_slide_number
@@ -38,7 +38,7 @@ def slide_reorder(
                 error="python-pptx 패키지가 설치되지 않았습니다",
                 error_type="ImportError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 경로 정규화 및 검증
@@ -51,7 +51,7 @@ def slide_reorder(
                 error=f"프레젠테이션 파일을 찾을 수 없습니다: {file_path}",
                 error_type="FileNotFoundError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 프레젠테이션 열기
@@ -63,7 +63,7 @@ def slide_reorder(
                 error=f"프레젠테이션 파일을 열 수 없습니다: {str(e)}",
                 error_type=type(e).__name__,
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         total_slides = len(prs.slides)
@@ -85,7 +85,7 @@ def slide_reorder(
                 message=f"슬라이드가 이미 위치 {from_position}에 있습니다 (변경 없음)",
             )
             if output_format == "json":
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
             else:
                 typer.echo(f"✓ 슬라이드가 이미 위치 {from_position}에 있습니다")
             return
@@ -116,7 +116,7 @@ def slide_reorder(
         )
 
         if output_format == "json":
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
         else:
             typer.echo(f"✓ 슬라이드 이동 완료: {from_position}번 → {to_position}번")
 
@@ -128,7 +128,7 @@ def slide_reorder(
             error=str(e),
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
 
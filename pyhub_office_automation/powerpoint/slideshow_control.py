@@ -3,12 +3,12 @@ PowerPoint 슬라이드쇼 제어 명령어 (COM 전용)
 실행 중인 슬라이드쇼를 프로그래밍 방식으로 제어합니다.
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response
@@ -62,7 +62,7 @@ def slideshow_control(
                 ],
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 2. 액션 검증
@@ -73,7 +73,7 @@ def slideshow_control(
             error=f"올바르지 않은 액션: {action}. 유효한 값: {', '.join(valid_actions)}",
             error_type="ValueError",
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 3. goto 액션 시 slide 옵션 필수 검증
@@ -83,7 +83,7 @@ def slideshow_control(
             error="goto 액션을 사용하려면 --slide 옵션이 필요합니다",
             error_type="ValueError",
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 4. COM 초기화 및 슬라이드쇼 윈도우 찾기
@@ -100,7 +100,7 @@ def slideshow_control(
                 error="PowerPoint가 실행 중이지 않습니다",
                 error_type="RuntimeError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 슬라이드쇼 윈도우 확인
@@ -110,7 +110,7 @@ def slideshow_control(
                 error="실행 중인 슬라이드쇼가 없습니다. slideshow-start 명령으로 먼저 슬라이드쇼를 시작하세요.",
                 error_type="RuntimeError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 첫 번째 슬라이드쇼 윈도우 가져오기
@@ -123,7 +123,7 @@ def slideshow_control(
             error="pywin32 패키지가 설치되지 않았습니다. 'pip install pywin32'로 설치하세요",
             error_type="ImportError",
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 5. 액션 실행
@@ -145,7 +145,7 @@ def slideshow_control(
                     error=f"슬라이드 번호가 범위를 벗어났습니다: {slide} (1-{total_slides})",
                     error_type="ValueError",
                 )
-                typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+                echo_json(result)
                 raise typer.Exit(1)
 
             view.GotoSlide(slide)
@@ -168,7 +168,7 @@ def slideshow_control(
             )
 
             if output_format == "json":
-                typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+                echo_json(response)
             else:
                 typer.echo(f"✅ {message}")
             return
@@ -193,7 +193,7 @@ def slideshow_control(
             error=f"슬라이드쇼 제어 실패: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 6. 성공 응답
@@ -205,7 +205,7 @@ def slideshow_control(
 
     # 출력
     if output_format == "json":
-        typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+        echo_json(response)
     else:
         typer.echo(f"✅ {message}")
         if action != "end":
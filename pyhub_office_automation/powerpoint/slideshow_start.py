@@ -3,12 +3,12 @@ PowerPoint 슬라이드쇼 시작 명령어 (COM 전용)
 프로그래밍 방식으로 슬라이드쇼를 시작합니다.
 """
 
-import json
 import platform
 from typing import Optional
 
 import typer
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import PowerPointBackend, create_error_response, create_success_response, get_or_open_presentation
@@ -71,7 +71,7 @@ def slideshow_start(
                 ],
             },
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 2. 쇼 타입 검증
@@ -82,7 +82,7 @@ def slideshow_start(
             error=f"올바르지 않은 쇼 타입: {show_type}. 유효한 값: {', '.join(valid_show_types)}",
             error_type="ValueError",
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 3. 백엔드는 COM 고정
@@ -101,7 +101,7 @@ def slideshow_start(
             error=f"프레젠테이션을 열 수 없습니다: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 5. COM 슬라이드쇼 설정 및 시작
@@ -116,7 +116,7 @@ def slideshow_start(
                 error=f"시작 슬라이드 번호가 범위를 벗어났습니다: {from_slide} (1-{total_slides})",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # 종료 슬라이드 기본값 처리 및 검증
@@ -128,7 +128,7 @@ def slideshow_start(
                 error=f"종료 슬라이드 번호가 잘못되었습니다: {end_slide} (범위: {from_slide}-{total_slides})",
                 error_type="ValueError",
             )
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            echo_json(result)
             raise typer.Exit(1)
 
         # SlideShowSettings 가져오기
@@ -179,7 +179,7 @@ def slideshow_start(
             error=f"슬라이드쇼 시작 실패: {str(e)}",
             error_type=type(e).__name__,
         )
-        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        echo_json(result)
         raise typer.Exit(1)
 
     # 6. 성공 응답
@@ -191,7 +191,7 @@ def slideshow_start(
 
     # 출력
     if output_format == "json":
-        typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+        echo_json(response)
     else:
         typer.echo(f"✅ {message}")
         typer.echo(f"📊 총 슬라이드: {total_slides}")
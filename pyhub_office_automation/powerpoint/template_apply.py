@@ -3,13 +3,13 @@ PowerPoint 템플릿 적용 명령어
 템플릿 프레젠테이션의 디자인을 현재 프레젠테이션에 적용합니다.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 from pptx import Presentation
 
+from pyhub_office_automation.utils.json_output import echo_json
 from pyhub_office_automation.version import get_version
 
 from .utils import create_error_response, create_success_response, normalize_path
@@ -145,7 +145,7 @@ def template_apply(
 
         # 출력
         if output_format == "json":
-            typer.echo(json.dumps(response, ensure_ascii=False, indent=2))
+            echo_json(response)
         else:
             typer.echo(f"⚠️  {message}")
             typer.echo(f"📄 대상 파일: {target_path.name}")
@@ -156,7 +156,7 @@ def template_apply(
     except FileNotFoundError as e:
         error_response = create_error_response(e, "template-apply")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ {str(e)}", err=True)
         raise typer.Exit(1)
@@ -164,7 +164,7 @@ def template_apply(
     except Exception as e:
         error_response = create_error_response(e, "template-apply")
         if output_format == "json":
-            typer.echo(json.dumps(error_response, ensure_ascii=False, indent=2), err=True)
+            echo_json(error_response, err=True)
         else:
             typer.echo(f"❌ 예기치 않은 오류: {str(e)}", err=True)
         raise typer.Exit(1)
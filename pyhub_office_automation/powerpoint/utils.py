@@ -11,6 +11,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+from pyhub_office_automation.utils.json_output import dumps, is_pretty
 from pyhub_office_automation.version import get_version
 
 
@@ -339,7 +340,7 @@ def output_result(result: Dict[str, Any], output_format: str = "json") -> None:
     if output_format == OutputFormat.JSON.value:
         try:
             # UTF-8 인코딩으로 JSON 출력
-            json_output = json.dumps(result, ensure_ascii=False, indent=2)
+            json_output = dumps(result, pretty=is_pretty())
             print(json_output)
         except UnicodeEncodeError:
             # 인코딩 실패 시 ASCII로 폴백
@@ -779,6 +780,9 @@ def load_data_from_excel(file_path: str, sheet_name: Optional[str] = None, range
     try:
         import pandas as pd
         import xlwings as xw
+
+        from pyhub_office_automation.excel.engines.base import to_2d_list
+        from pyhub_office_automation.excel.engines.columnar import ColumnarData
     except ImportError as e:
         raise ImportError(f"필요한 패키지가 없습니다: {str(e)}\n'pip install xlwings pandas'로 설치하세요.")
 
@@ -799,14 +803,14 @@ def load_data_from_excel(file_path: str, sheet_name: Optional[str] = None, range
                 else:
                     sheet = wb.sheets[0]
 
-                # 데이터 읽기
-                if range_addr:
-                    data = sheet.range(range_addr).options(pd.DataFrame, header=True, index=False).value
-                else:
-                    # 사용된 범위 전체 읽기
-                    data = sheet.used_range.options(pd.DataFrame, header=True, index=False).value
+                # 데이터 읽기 (지정하지 않으면 사용된 범위 전체)
+                data_range = sheet.range(range_addr) if range_addr else sheet.used_range
+                rows = to_2d_list(data_range.value)
+                if not rows:
+                    return pd.DataFrame()
 
-                return data
+                # 첫 행을 헤더로 사용하여 열 단위로 한 번만 변환
+                return ColumnarData.from_rows(rows[1:], names=rows[0]).to_pandas()
             finally:
                 wb.close()
 
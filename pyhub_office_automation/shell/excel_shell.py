@@ -84,6 +84,7 @@ from pyhub_office_automation.excel.workbook_create import workbook_create
 from pyhub_office_automation.excel.workbook_info import workbook_info
 from pyhub_office_automation.excel.workbook_list import workbook_list
 from pyhub_office_automation.excel.workbook_open import workbook_open
+from pyhub_office_automation.utils.result_cache import invalidate_for_command
 
 console = Console()
 
@@ -396,6 +397,7 @@ def execute_excel_command(ctx: ExcelShellContext, cmd: str, args: list) -> bool:
         temp_app = typer_module.Typer()
         temp_app.command()(command_func)
 
+        invalidate_for_command(cmd, injected_args)
         runner = CliRunner(mix_stderr=False)
         result = runner.invoke(temp_app, injected_args)
 
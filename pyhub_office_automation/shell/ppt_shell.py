@@ -65,6 +65,7 @@ from pyhub_office_automation.powerpoint.slideshow_control import slideshow_contr
 from pyhub_office_automation.powerpoint.slideshow_start import slideshow_start
 from pyhub_office_automation.powerpoint.template_apply import template_apply
 from pyhub_office_automation.powerpoint.theme_apply import theme_apply
+from pyhub_office_automation.utils.result_cache import invalidate_for_command
 
 console = Console()
 
@@ -318,6 +319,7 @@ def execute_ppt_command(ctx: PptShellContext, command: str, args: list[str]) ->
         app = typer.Typer()
         app.command()(func)
 
+        invalidate_for_command(command, injected_args)
         result = runner.invoke(app, injected_args)
 
         if result.exit_code == 0:
@@ -0,0 +1,211 @@
+"""
+명령어 JSON 응답 출력
+
+명령어마다 `json.dumps(response, ensure_ascii=False, indent=2)`로 응답 전체를 한 문자열로 만든 뒤 출력하면
+큰 범위를 읽을 때 응답 크기만큼의 문자열이 추가로 생기고, 들여쓰기 때문에 출력 크기도 몇 배로 커집니다.
+
+- orjson이 설치되어 있으면 사용하고, 없거나 orjson이 처리하지 못하는 값이면 표준 json으로 처리
+- 출력이 터미널이 아니면(AI 에이전트, 파이프, oa pipe/데몬) 들여쓰기 없는 compact 형식
+  (OA_JSON_FORMAT=pretty/compact로 강제)
+- 응답은 dict/list를 따라가며 조각 단위로 출력하므로, 2차원 values는 한 행씩 인코딩되어 바로 출력됨
+- ByteCounter로 감싼 값은 실제로 출력된 바이트 수를 세어, 응답의 뒤쪽(operation_stats 등)에 기록할 수 있음
+- capture_json() 블록 안에서는 응답을 출력하지 않고 객체 그대로 모음 (배치 실행의 직접 호출, cli/dispatch 참고)
+
+이 모듈은 데몬 클라이언트에서도 import하므로 click은 출력할 때만 import합니다.
+"""
+
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pretty/compact 강제 설정
+JSON_FORMAT_ENV = "OA_JSON_FORMAT"
+
+# 이 크기만큼 모이면 스트림에 씀
+_FLUSH_CHARS = 64 * 1024
+
+_INDENT = "  "
+
+# 스레드별 capture_json() 응답 목록 (None이면 출력)
+_capture = threading.local()
+
+
+def is_pretty(stream: Optional[TextIO] = None) -> bool:
+    """들여쓰기 출력 여부 (OA_JSON_FORMAT 우선, 없으면 stream이 터미널인지로 결정)"""
+    mode = os.environ.get(JSON_FORMAT_ENV, "").lower()
+    if mode in ("pretty", "indent"):
+        return True
+    if mode == "compact":
+        return False
+
+    stream = stream if stream is not None else sys.stdout
+    try:
+        return bool(stream.isatty())
+    except (AttributeError, ValueError):
+        return False
+
+
+def dumps(obj: Any, pretty: bool = True, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """json.dumps(obj, ensure_ascii=False, indent=2)와 같은 결과 (pretty=False면 공백 없는 한 줄)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # 64비트를 넘는 정수 등은 표준 json으로 처리
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+class ByteCounter:
+    """
+    응답 안의 한 값이 출력된 UTF-8 바이트 수
+
+    measure()로 감싼 값이 출력되면 크기가 기록되고, ByteCounter 자체는 그 크기(정수)로 출력됩니다.
+    따라서 측정 대상보다 뒤에 나오는 키에 넣어야 합니다 (아직 측정 전이면 null).
+    """
+
+    def __init__(self):
+        self.size: Optional[int] = None
+
+    def measure(self, value: Any) -> "_Measured":
+        return _Measured(value, self)
+
+
+class _Measured:
+    def __init__(self, value: Any, counter: ByteCounter):
+        self.value = value
+        self.counter = counter
+
+
+def _reindent(text: str, level: int) -> str:
+    if level == 0 or "\n" not in text:
+        return text
+    return text.replace("\n", "\n" + _INDENT * level)
+
+
+def iter_json(obj: Any, pretty: bool = True, level: int = 0, default: Optional[Callable[[Any], Any]] = None) -> Iterator[str]:
+    """obj를 JSON 문자열 조각으로 인코딩 (dict와 list는 항목마다 조각을 만듦)"""
+    if isinstance(obj, _Measured):
+        size = 0
+        for chunk in iter_json(obj.value, pretty, level, default):
+            size += len(chunk.encode("utf-8"))
+            yield chunk
+        obj.counter.size = size
+        return
+
+    if isinstance(obj, ByteCounter):
+        yield dumps(obj.size, pretty)
+        return
+
+    if isinstance(obj, dict) and obj:
+        separator = ": " if pretty else ":"
+        opening = "\n" + _INDENT * (level + 1) if pretty else ""
+        closing = "\n" + _INDENT * level if pretty else ""
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            yield ("," if i else "") + opening + dumps(key if isinstance(key, str) else str(key), pretty) + separator
+            yield from iter_json(value, pretty, level + 1, default)
+        yield closing + "}"
+        return
+
+    if isinstance(obj, (list, tuple)) and obj:
+        opening = "\n" + _INDENT * (level + 1) if pretty else ""
+        closing = "\n" + _INDENT * level if pretty else ""
+        yield "["
+        for i, item in enumerate(obj):
+            yield ("," if i else "") + opening
+            if isinstance(item, (dict, _Measured)):
+                yield from iter_json(item, pretty, level + 1, default)
+            else:
+                # 행(list)이나 스칼라는 한 번에 인코딩
+                yield _reindent(dumps(item, pretty, default), level + 1)
+        yield closing + "]"
+        return
+
+    yield _reindent(dumps(obj, pretty, default), level)
+
+
+def write_json(
+    obj: Any,
+    stream: Optional[TextIO] = None,
+    pretty: Optional[bool] = None,
+    err: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> int:
+    """
+    obj를 JSON으로 조각 단위로 출력하고 출력한 UTF-8 바이트 수를 반환 (끝에 줄바꿈 추가)
+
+    stream을 지정하지 않으면 typer.echo와 같이 stdout(err=True면 stderr)으로 출력합니다.
+    """
+    import click
+
+    if stream is None:
+        stream = sys.stderr if err else sys.stdout
+    if pretty is None:
+        pretty = is_pretty(stream)
+
+    written = 0
+    pending = []
+    pending_chars = 0
+    for chunk in iter_json(obj, pretty, default=default):
+        pending.append(chunk)
+        pending_chars += len(chunk)
+        if pending_chars >= _FLUSH_CHARS:
+            text = "".join(pending)
+            click.echo(text, file=stream, nl=False)
+            written += len(text.encode("utf-8"))
+            pending, pending_chars = [], 0
+
+    text = "".join(pending) + "\n"
+    click.echo(text, file=stream, nl=False)
+    return written + len(text.encode("utf-8"))
+
+
+def _materialize(obj: Any) -> Any:
+    """ByteCounter.measure()로 감싼 값을 풀고 ByteCounter를 compact JSON 기준 크기로 바꾼 객체"""
+    if isinstance(obj, _Measured):
+        obj.counter.size = len(dumps(obj.value, pretty=False, default=str).encode("utf-8"))
+        return obj.value
+    if isinstance(obj, ByteCounter):
+        return obj.size
+    if isinstance(obj, dict):
+        return {key: _materialize(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)) and any(isinstance(item, (dict, _Measured)) for item in obj):
+        return [_materialize(item) for item in obj]
+    return obj
+
+
+@contextmanager
+def capture_json(active: bool = True) -> Iterator[List[Any]]:
+    """
+    블록 동안 현재 스레드의 echo_json(stdout) 응답을 출력하지 않고 목록에 모음
+
+    active=False면 바깥 블록의 캡처를 잠시 해제합니다 (출력 텍스트 자체를 저장하는 결과 캐시 등).
+    """
+    responses: List[Any] = []
+    previous = getattr(_capture, "responses", None)
+    _capture.responses = responses if active else None
+    try:
+        yield responses
+    finally:
+        _capture.responses = previous
+
+
+def echo_json(obj: Any, err: bool = False, default: Optional[Callable[[Any], Any]] = None) -> int:
+    """명령어 응답 출력 (typer.echo(json.dumps(obj, ensure_ascii=False, indent=2)) 대체)"""
+    responses = None if err else getattr(_capture, "responses", None)
+    if responses is not None:
+        responses.append(_materialize(obj))
+        return 0
+    return write_json(obj, err=err, default=default)
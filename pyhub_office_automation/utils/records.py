@@ -0,0 +1,28 @@
+"""
+__slots__ 데이터 클래스 공통 기능
+
+엔진 결과(ShapeInfo, ChartInfo 등)와 배치 실행 결과(LineResult 등)는 워크북 인벤토리나
+큰 배치 스크립트에서 수십만 개까지 만들어지므로 `@dataclass(slots=True)`로 인스턴스 __dict__를 없앱니다.
+SlotsRecord를 상속하면 dataclasses.asdict보다 가벼운 to_dict()를 쓸 수 있습니다.
+"""
+
+from typing import Any, Dict
+
+
+class SlotsRecord:
+    """
+    `@dataclass(slots=True)` 클래스의 기반 클래스
+
+    자신은 빈 __slots__를 가지므로 하위 클래스 인스턴스에 __dict__가 생기지 않습니다.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        필드 이름 → 값 dict (선언 순서 유지)
+
+        dataclasses.asdict와 달리 값을 재귀적으로 deepcopy하지 않으므로,
+        리스트 등 가변 값은 인스턴스와 공유됩니다.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
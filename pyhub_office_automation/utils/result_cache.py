@@ -0,0 +1,332 @@
+"""
+읽기 전용 조회 명령어 결과 디스크 캐시
+
+workbook-info, table-list, chart-list 등은 같은 파일에 대해 항상 같은 결과를 내지만
+호출할 때마다 파일을 다시 열고 개체 모델 전체를 순회합니다.
+--file-path로 호출된 결과를 (명령어, 인자, 경로, 크기, 수정 시각[, 내용 해시]) 키로 저장해 두고,
+파일이 바뀌지 않았으면 저장된 출력을 그대로 돌려줍니다.
+
+- 저장 위치: ~/.oa_cache/results/<경로 해시>/<키 해시>.json (OA_CACHE_DIR로 변경)
+- 크기 제한: OA_RESULT_CACHE_MAX_MB (기본 32MB), 초과 시 가장 오래 사용되지 않은 항목부터 삭제(LRU)
+- 무효화: 같은 파일을 대상으로 하는 쓰기 명령어가 실행되면 해당 파일의 항목 전체 삭제
+  (--workbook-name이면 같은 파일 이름, 대상이 없으면(활성 워크북) 전체 삭제)
+- OA_RESULT_CACHE=0: 캐시 사용 안 함, OA_RESULT_CACHE_HASH=1: 키에 파일 내용 해시 포함
+
+Excel에서 열어 둔 채 저장하지 않은 변경은 파일 지문에 나타나지 않으므로,
+oa 쓰기 명령어를 거친 변경만 무효화로 반영됩니다.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .json_output import capture_json, is_pretty
+
+# 결과를 캐시하는 조회 명령어
+CACHED_COMMANDS = {
+    "workbook-info",
+    "table-list",
+    "chart-list",
+    "pivot-list",
+    "slicer-list",
+    "slide-list",
+    "presentation-info",
+}
+
+# 캐시를 무효화하지 않는 그 밖의 읽기 전용 명령어
+READ_ONLY_COMMANDS = CACHED_COMMANDS | {
+    "list",
+    "workbook-list",
+    "range-read",
+    "table-read",
+    "table-sort-info",
+    "shape-list",
+    "data-analyze",
+    "chart-export",
+    "presentation-list",
+    "layout-list",
+    "export-pdf",
+    "export-images",
+    "export-notes",
+    "map-location-guide",
+}
+
+# 파일을 대상으로 하지 않거나 하위 명령어를 실행하는 명령어 (하위 명령어에서 따로 무효화)
+NON_FILE_COMMANDS = {
+    "shell",
+    "serve",
+    "pipe",
+    "ai-setup",
+    "send",
+    "accounts",
+}
+
+DEFAULT_CACHE_DIR = Path.home() / ".oa_cache"
+DEFAULT_MAX_MB = 32
+
+_PATH_FILE = "path.txt"
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def _normalize(file_path: str) -> str:
+    return os.path.normcase(os.path.abspath(os.path.expanduser(file_path)))
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """파일 지문 기반 명령어 출력 캐시"""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, hash_contents: bool = False):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hash_contents = hash_contents
+
+    def _path_dir(self, file_path: str) -> Path:
+        return self.root / _digest(_normalize(file_path))
+
+    def make_key(self, command: str, file_path: str, params: Dict[str, Any]) -> Optional[str]:
+        """캐시 키 (파일이 없으면 None)"""
+        path = _normalize(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        parts = {
+            "command": command,
+            "params": {name: value for name, value in sorted(params.items()) if name != "file_path"},
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if self.hash_contents:
+            parts["sha256"] = _file_sha256(path)
+        return _digest(json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str))
+
+    def get(self, file_path: str, key: str) -> Optional[str]:
+        entry = self._path_dir(file_path) / f"{key}.json"
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                output = json.load(f)["output"]
+        except (OSError, ValueError, KeyError):
+            return None
+        # LRU: 사용 시각 갱신
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return output
+
+    def put(self, file_path: str, key: str, output: str):
+        path_dir = self._path_dir(file_path)
+        try:
+            path_dir.mkdir(parents=True, exist_ok=True)
+            path_file = path_dir / _PATH_FILE
+            if not path_file.exists():
+                path_file.write_text(_normalize(file_path), encoding="utf-8")
+
+            # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            entry = path_dir / f"{key}.json"
+            temp = path_dir / f".{key}.{os.getpid()}.tmp"
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump({"output": output, "created_at": time.time()}, f, ensure_ascii=False)
+            os.replace(temp, entry)
+        except OSError:
+            return
+        self.evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        entries = []
+        try:
+            path_dirs = list(os.scandir(self.root))
+        except OSError:
+            return entries
+        for path_dir in path_dirs:
+            if not path_dir.is_dir():
+                continue
+            try:
+                entries.extend(e for e in os.scandir(path_dir.path) if e.name.endswith(".json"))
+            except OSError:
+                continue
+        return entries
+
+    def evict(self):
+        """전체 크기가 제한을 넘으면 오래 사용되지 않은 항목부터 삭제"""
+        entries = []
+        total = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+    def invalidate_path(self, file_path: str):
+        """파일의 캐시 항목 전체 삭제"""
+        shutil.rmtree(self._path_dir(file_path), ignore_errors=True)
+
+    def invalidate_name(self, workbook_name: str):
+        """파일 이름이 같은 모든 경로의 캐시 항목 삭제 (--workbook-name 대상 쓰기)"""
+        name = os.path.normcase(workbook_name)
+        try:
+            path_dirs = list(os.scandir(self.root))
+        except OSError:
+            return
+        for path_dir in path_dirs:
+            try:
+                cached_path = Path(path_dir.path, _PATH_FILE).read_text(encoding="utf-8")
+            except OSError:
+                continue
+            if os.path.basename(cached_path) == name:
+                shutil.rmtree(path_dir.path, ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """환경 변수 설정에 따른 캐시 (비활성화된 경우 None)"""
+    if os.environ.get("OA_RESULT_CACHE", "1").lower() in ("0", "false", "off", "no"):
+        return None
+    root = Path(os.environ.get("OA_CACHE_DIR") or DEFAULT_CACHE_DIR) / "results"
+    try:
+        max_mb = float(os.environ.get("OA_RESULT_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    hash_contents = os.environ.get("OA_RESULT_CACHE_HASH", "").lower() in ("1", "true", "on", "yes")
+    return ResultCache(root, max_bytes=int(max_mb * 1024 * 1024), hash_contents=hash_contents)
+
+
+def _option_value(args: List[str], option: str) -> Optional[str]:
+    for i, arg in enumerate(args):
+        if arg == option and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(option + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def invalidate_for_command(command_name: str, args: Iterable[str]):
+    """쓰기 명령어 실행 전 대상 파일의 캐시 무효화 (읽기 전용 명령어는 무시)"""
+    if command_name in READ_ONLY_COMMANDS or command_name in NON_FILE_COMMANDS:
+        return
+    cache = get_result_cache()
+    if cache is None or not cache.root.exists():
+        return
+
+    args = list(args)
+    if "--help" in args:
+        return
+    file_path = _option_value(args, "--file-path")
+    workbook_name = _option_value(args, "--workbook-name")
+    if file_path:
+        cache.invalidate_path(file_path)
+    elif workbook_name:
+        cache.invalidate_name(workbook_name)
+    else:
+        # 활성 워크북 대상: 어느 파일인지 알 수 없으므로 전체 삭제
+        cache.clear()
+
+
+class _CaptureBuffer(io.StringIO):
+    """캡처 중에도 원래 스트림의 터미널 여부를 유지 (JSON pretty/compact 결정용)"""
+
+    def __init__(self, tty: bool):
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+@contextmanager
+def _captured_stdout():
+    """
+    블록 동안의 stdout 출력을 모아 블록이 끝난 뒤 원래 스트림으로 내보냄
+
+    oa pipe/데몬의 스레드별 출력 스트림 안에서는 그 스레드의 출력만 캡처합니다.
+    """
+    from pyhub_office_automation.cli.inprocess import ThreadLocalOutput
+
+    stream = sys.stdout
+    buffer = io.StringIO()
+    try:
+        if isinstance(stream, ThreadLocalOutput):
+            with stream.capture() as buffer:
+                yield buffer
+        else:
+            buffer = _CaptureBuffer(stream.isatty())
+            sys.stdout = buffer
+            try:
+                yield buffer
+            finally:
+                sys.stdout = stream
+    finally:
+        stream.write(buffer.getvalue())
+        stream.flush()
+
+
+def cached_result(command_name: str) -> Callable:
+    """
+    --file-path로 호출된 조회 명령어의 출력을 캐시하는 데코레이터
+
+    정상 종료한 실행의 stdout만 저장하며, 오류(typer.Exit 등 예외)는 저장하지 않습니다.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if args:
+                return func(*args, **kwargs)
+
+            file_path = kwargs.get("file_path")
+            cache = get_result_cache() if file_path else None
+            # 터미널 여부에 따라 JSON 들여쓰기가 달라지므로 출력 형식도 키에 포함
+            params = dict(kwargs, json_pretty=is_pretty())
+            key = cache.make_key(command_name, file_path, params) if cache is not None else None
+            if key is None:
+                return func(**kwargs)
+
+            output = cache.get(file_path, key)
+            if output is not None:
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                return None
+
+            # 저장할 출력 텍스트가 필요하므로 응답 객체 캡처(capture_json)는 잠시 해제
+            with _captured_stdout() as buffer, capture_json(active=False):
+                result = func(**kwargs)
+            cache.put(file_path, key, buffer.getvalue())
+            return result
+
+        return wrapper
+
+    return decorator
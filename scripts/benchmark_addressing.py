@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+셀 주소 변환 벤치마크
+
+excel/addressing의 스칼라 함수(정규식 사전 컴파일 + 열 문자 테이블 + LRU 캐시)와
+*_batch 함수(NumPy)를 이전 구현(호출마다 정규식/문자열 조립)과 비교합니다.
+기본은 작업별 100만 건입니다.
+
+사용법:
+    python scripts/benchmark_addressing.py [--count 1000000] [--json]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Windows 콘솔 UTF-8 출력 설정
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyhub_office_automation.excel import addressing
+
+
+def legacy_address_to_coords(address):
+    """이전 excel_address_to_coords (비교용)"""
+    match = re.match(r"^([A-Z]+)(\d+)$", address.upper())
+    if not match:
+        raise ValueError(address)
+    col_letters, row_str = match.groups()
+    col = 0
+    for i, letter in enumerate(reversed(col_letters)):
+        col += (ord(letter) - ord("A") + 1) * (26**i)
+    return int(row_str), col
+
+
+def legacy_coords_to_address(row, col):
+    """이전 coords_to_excel_address (비교용)"""
+    col_letters = ""
+    while col > 0:
+        col -= 1
+        col_letters = chr(ord("A") + col % 26) + col_letters
+        col //= 26
+    return f"{col_letters}{row}"
+
+
+def legacy_overlap(range1, range2):
+    """이전 check_range_overlap (비교용)"""
+    r1 = [legacy_address_to_coords(a) for a in range1.split(":")]
+    r2 = [legacy_address_to_coords(a) for a in range2.split(":")]
+    return not (r1[1][0] < r2[0][0] or r1[0][0] > r2[1][0] or r1[1][1] < r2[0][1] or r1[0][1] > r2[1][1])
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def run_benchmark(count: int, seed: int = 0):
+    """
+    작업별 (이전 구현, 캐시 없는 첫 호출, 캐시 적중, 배열) 소요 시간 (ms)
+
+    주소 변환 작업은 서로 다른 좌표 count개, 겹침 검사는 sqrt(count)개 범위끼리의 모든 쌍입니다.
+    """
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(1, 1_048_577, count)
+    cols = rng.integers(1, addressing.MAX_COLUMNS + 1, count)
+    row_list, col_list = rows.tolist(), cols.tolist()
+    addresses = [legacy_coords_to_address(r, c) for r, c in zip(row_list, col_list)]
+    address_array = np.array(addresses)
+
+    # 배치 작업(자동 배치 등)처럼 같은 주소가 반복되는 경우의 캐시 적중
+    repeated = addresses[: min(count, 50_000)] * max(1, count // 50_000)
+
+    side = max(2, int(count**0.5))
+    starts = np.stack([rng.integers(1, 500, side), rng.integers(1, 50, side)], axis=1)
+    ends = starts + rng.integers(0, 30, (side, 2))
+    range_strings = [
+        f"{legacy_coords_to_address(r1, c1)}:{legacy_coords_to_address(r2, c2)}" for (r1, c1), (r2, c2) in zip(starts, ends)
+    ]
+
+    addressing.excel_address_to_coords.cache_clear()
+    addressing.parse_excel_range.cache_clear()
+    addressing.coords_to_excel_address(1, 1)  # 열 문자 테이블 생성
+
+    def overlap_batch():
+        parsed = addressing.parse_ranges_batch(range_strings)
+        addressing.ranges_overlap_batch(parsed[:, None, :], parsed[None, :, :])
+
+    results = [
+        {
+            "workload": f"address→coords x{count}",
+            "legacy_ms": timed(lambda: [legacy_address_to_coords(a) for a in addresses]),
+            "scalar_cold_ms": timed(lambda: [addressing.excel_address_to_coords(a) for a in addresses]),
+            "scalar_cached_ms": timed(lambda: [addressing.excel_address_to_coords(a) for a in repeated]),
+            "batch_ms": timed(lambda: addressing.addresses_to_coords_batch(address_array)),
+        },
+        {
+            "workload": f"coords→address x{count}",
+            "legacy_ms": timed(lambda: [legacy_coords_to_address(r, c) for r, c in zip(row_list, col_list)]),
+            "scalar_cold_ms": timed(lambda: [addressing.coords_to_excel_address(r, c) for r, c in zip(row_list, col_list)]),
+            "scalar_cached_ms": None,
+            "batch_ms": timed(lambda: addressing.coords_to_addresses_batch(rows, cols)),
+        },
+        {
+            "workload": f"range overlap {side}x{side}",
+            "legacy_ms": timed(lambda: [legacy_overlap(a, b) for a in range_strings for b in range_strings]),
+            "scalar_cold_ms": None,
+            "scalar_cached_ms": timed(
+                lambda: [addressing.check_range_overlap(a, b) for a in range_strings for b in range_strings]
+            ),
+            "batch_ms": timed(overlap_batch),
+        },
+    ]
+    for result in results:
+        for key, value in result.items():
+            if isinstance(value, float):
+                result[key] = round(value, 1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="셀 주소 변환 벤치마크 (이전 구현 / 캐시 / NumPy 배열)")
+    parser.add_argument("--count", type=int, default=1_000_000, help="작업별 변환 횟수 (기본: 1000000)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.count)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    def cell(value):
+        return f"{value:>12.1f}" if value is not None else f"{'-':>12}"
+
+    print(f"{'workload':<28} {'legacy ms':>12} {'cold ms':>12} {'cached ms':>12} {'batch ms':>12}")
+    for result in results:
+        print(
+            f"{result['workload']:<28} {cell(result['legacy_ms'])} {cell(result['scalar_cold_ms'])} "
+            f"{cell(result['scalar_cached_ms'])} {cell(result['batch_ms'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배치 명령어 실행 경로 벤치마크
+
+`oa batch run`의 한 줄 실행을 이전 경로(CliRunner.invoke로 전체 CLI 실행 후 출력 텍스트를 JSON으로 파싱)와
+직접 호출(cli/dispatch: 명령어별 옵션 표 + 응답 객체 캡처)로 비교합니다.
+headless 엔진으로 작은 통합 문서에서 excel range-read를 N번 실행합니다.
+
+사용법:
+    python scripts/benchmark_batch_dispatch.py [--lines 1000] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ["OA_EXCEL_ENGINE"] = "headless"
+# 개발 환경의 버전 계산(git 하위 프로세스)이 응답마다 실행되지 않도록 빌드 번호 고정 (설치 빌드와 같은 조건)
+os.environ.setdefault("BUILD_NUMBER", "0")
+
+
+def run_benchmark(lines: int):
+    """
+    경로별 총 소요 시간과 줄당 평균 (ms)
+
+    "command only"는 변환이 끝난 매개변수로 명령어 함수만 호출한 시간이며, 나머지 경로와의 차이가 줄당 실행 경로 비용입니다.
+    """
+    import openpyxl
+    from typer.testing import CliRunner
+
+    from pyhub_office_automation.cli.dispatch import dispatch, get_spec
+    from pyhub_office_automation.cli.main import app
+    from pyhub_office_automation.utils.json_output import capture_json
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xlsx")
+        workbook = openpyxl.Workbook()
+        for row in range(1, 21):
+            workbook.active.append([row, row * 2, f"item{row}"])
+        workbook.save(path)
+
+        argv = ["excel", "range-read", "--file-path", path, "--range", "A1:C20"]
+        runner = CliRunner()
+
+        def cli_runner():
+            result = runner.invoke(app, argv)
+            return json.loads(result.stdout)
+
+        def direct():
+            return dispatch(argv).data
+
+        spec = get_spec("excel", "range-read")
+        with spec.command.context_class(spec.command, info_name=spec.name) as ctx:
+            for param in spec.params:
+                param.handle_parse_result(ctx, spec.parse(argv[2:]), [])
+            params = dict(ctx.params)
+
+        def command_only():
+            with capture_json():
+                spec.command.callback(**params)
+
+        # 명령어 모듈 import와 옵션 표 생성은 측정에서 제외
+        assert cli_runner()["data"]["values"] == direct()["data"]["values"]
+
+        results = []
+        for name, func in (("CliRunner.invoke", cli_runner), ("dispatch", direct), ("command only", command_only)):
+            started = time.perf_counter()
+            for _ in range(lines):
+                func()
+            total_ms = (time.perf_counter() - started) * 1000
+            results.append(
+                {"path": name, "lines": lines, "total_ms": round(total_ms, 1), "per_line_ms": round(total_ms / lines, 3)}
+            )
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 명령어 실행 경로 벤치마크 (CliRunner / 직접 호출)")
+    parser.add_argument("--lines", type=int, default=1000, help="실행할 줄 수 (기본: 1000)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.lines)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'path':<20} {'lines':>8} {'total ms':>12} {'ms/line':>10}")
+    for result in results:
+        print(f"{result['path']:<20} {result['lines']:>8} {result['total_ms']:>12.1f} {result['per_line_ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배치 변수 치환 벤치마크
+
+`@foreach` 반복마다 명령어 한 줄의 명령/인자 토큰에서 변수를 치환하는 비용을 비교합니다.
+- re.sub: 이전 방식 (토큰마다 패턴 문자열 + Python 콜백으로 re.sub)
+- resolve: VariableManager.resolve (텍스트별 템플릿 캐시)
+- line templates: BatchLine.command_templates (줄마다 한 번 나눈 템플릿 + format 한 번)
+
+사용법:
+    python scripts/benchmark_batch_resolve.py [--iterations 10000] [--json]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# 반복 본문의 명령어 한 줄
+LINE = 'excel range-write --file-path "${DIR}/${name}.xlsx" --sheet Data --range "A${__LOOP_INDEX__}" --data "[[${name}, 1]]"'
+OLD_PATTERN = r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)"
+
+
+def run_benchmark(iterations: int):
+    """경로별 총 소요 시간과 반복당 평균 (μs)"""
+    import shlex
+
+    from pyhub_office_automation.batch.executor import BatchLine
+    from pyhub_office_automation.batch.variables import VariableManager
+
+    tokens = shlex.split(LINE)
+    line = BatchLine(line_number=1, content=LINE, command=tokens[0], args=tokens[1:])
+    var_manager = VariableManager(initial_vars={"DIR": "C:/reports"})
+
+    def old_resolve(text):
+        def replacer(match):
+            return var_manager.get(match.group(1) or match.group(2))
+
+        return re.sub(OLD_PATTERN, replacer, text)
+
+    def substitute_re():
+        return [old_resolve(token) for token in [line.command] + line.args]
+
+    def substitute_resolve():
+        return [var_manager.resolve(token) for token in [line.command] + line.args]
+
+    def substitute_templates():
+        lookup = var_manager.get
+        return [template.render(lookup) for template in line.command_templates()]
+
+    results = []
+    outputs = []
+    for name, func in (("re.sub", substitute_re), ("resolve", substitute_resolve), ("line templates", substitute_templates)):
+        last = None
+        started = time.perf_counter()
+        for loop_idx in range(iterations):
+            var_manager.set("name", f"file{loop_idx}")
+            var_manager.set("__LOOP_INDEX__", str(loop_idx))
+            last = func()
+        total_ms = (time.perf_counter() - started) * 1000
+        outputs.append(last)
+        results.append(
+            {
+                "path": name,
+                "iterations": iterations,
+                "total_ms": round(total_ms, 1),
+                "per_iteration_us": round(total_ms * 1000 / iterations, 2),
+            }
+        )
+
+    assert outputs[0] == outputs[1] == outputs[2]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 변수 치환 벤치마크 (re.sub / 템플릿)")
+    parser.add_argument("--iterations", type=int, default=10000, help="@foreach 반복 횟수 (기본: 10000)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'path':<16} {'iterations':>10} {'total ms':>10} {'us/iter':>10}")
+    for result in results:
+        print(
+            f"{result['path']:<16} {result['iterations']:>10} {result['total_ms']:>10.1f} {result['per_iteration_us']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
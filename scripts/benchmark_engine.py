@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WindowsEngine 오프라인 벤치마크
+
+가짜 Excel 객체 모델(fake_excel.FakeApplication)로 WindowsEngine을 실행하여
+명령어별 COM 호출 수와 소요 시간을 측정합니다. Excel이 없는 Linux CI에서도 실행됩니다.
+--latency로 COM 멤버 접근 1회당 지연을 주면 실제 Excel의 프로세스 간 호출 비용을 흉내 낼 수 있습니다.
+
+사용법:
+    python scripts/benchmark_engine.py [--rows 2000] [--sheets 10] [--latency 0.0002] [--json]
+
+예시:
+    python scripts/benchmark_engine.py
+    python scripts/benchmark_engine.py --rows 20000 --latency 0.0005
+    python scripts/benchmark_engine.py --record traces/   # Windows + Excel 필요
+    python scripts/benchmark_engine.py --replay traces/
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyhub_office_automation.excel.engines.fake_excel import CallTrace, FakeApplication, ReplayApplication
+from pyhub_office_automation.excel.engines.instrumentation import ComProfiler
+from pyhub_office_automation.excel.engines.windows import WindowsEngine
+
+
+def build_workbook(path: Path, rows: int, sheets: int):
+    """Data 시트(Sales 테이블)와 빈 시트 여러 개를 가진 벤치마크용 워크북 생성"""
+    import openpyxl
+    from openpyxl.worksheet.table import Table
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Id", "Region", "Product", "Amount"])
+    for i in range(rows):
+        ws.append([i + 1, f"R{i % 7}", f"P{i % 13}", (i * 37) % 1000])
+    ws.add_table(Table(displayName="Sales", ref=f"A1:D{rows + 1}"))
+
+    # 테이블이 마지막 시트에 있어야 시트별 탐색(N+1) 비용이 드러남
+    for index in range(sheets - 1):
+        wb.create_sheet(f"Empty{index + 1}", index)
+
+    wb.save(path)
+
+
+def scenarios(rows: int):
+    """(이름, 함수) 목록 - 함수는 (engine, workbook)을 받음"""
+    write_rows = [[i, i * 2, i * 3] for i in range(rows)]
+    return [
+        ("get_workbook_info", lambda engine, book: engine.get_workbook_info(book)),
+        ("list_tables", lambda engine, book: engine.list_tables(book)),
+        ("read_table", lambda engine, book: engine.read_table(book, "Sales")),
+        ("read_table_window", lambda engine, book: engine.read_table(book, "Sales", columns=["Amount"], limit=10)),
+        ("read_range", lambda engine, book: engine.read_range(book, "Data", "A1:D100")),
+        ("read_range_iter", lambda engine, book: sum(1 for _ in engine.read_range_iter(book, "Data", "A1", expand="table"))),
+        ("write_range_chunked", lambda engine, book: engine.write_range_chunked(book, "Empty1", "A1", write_rows)),
+        ("generate_metadata", lambda engine, book: engine.generate_metadata(book)),
+    ]
+
+
+def run_benchmark(rows: int, sheets: int, latency: float, record_dir: str = None, replay_dir: str = None):
+    """
+    모든 시나리오를 새 애플리케이션에서 한 번씩 실행
+
+    기본은 FakeApplication, record_dir 지정 시 실제 Excel(Windows)의 호출을 녹화,
+    replay_dir 지정 시 녹화 파일을 재생합니다.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "benchmark.xlsx"
+        build_workbook(path, rows, sheets)
+
+        for name, func in scenarios(rows):
+            trace = None
+            if replay_dir:
+                trace_path = Path(replay_dir) / f"{name}.trace.json"
+                if not trace_path.exists():
+                    continue
+                engine = WindowsEngine(application=ReplayApplication(CallTrace.load(str(trace_path)), realtime=True))
+            elif record_dir:
+                real = WindowsEngine()
+                trace = CallTrace()
+                engine = WindowsEngine(application=trace.wrap(real.xl), constants=real._constants)
+            else:
+                engine = WindowsEngine(application=FakeApplication(latency=latency))
+
+            profiler = ComProfiler()
+            engine.attach_profiler(profiler)
+            book = engine.open_workbook(str(path))
+            profiler.stats.clear()
+            profiler.started = time.perf_counter()
+
+            func(engine, book)
+            summary = profiler.summary(top_n=3)
+            results.append(
+                {
+                    "scenario": name,
+                    "com_calls": summary["com_calls"],
+                    "wall_time_ms": summary["wall_time_ms"],
+                    "most_called": [f"{m['member']} x{m['count']}" for m in summary["most_called_members"]],
+                }
+            )
+
+            if trace is not None:
+                book.Close(False)
+                Path(record_dir).mkdir(parents=True, exist_ok=True)
+                trace.save(str(Path(record_dir) / f"{name}.trace.json"))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WindowsEngine 오프라인 벤치마크 (가짜 Excel 객체 모델)")
+    parser.add_argument("--rows", type=int, default=2000, help="Sales 테이블 행 수 (기본: 2000)")
+    parser.add_argument("--sheets", type=int, default=10, help="시트 수 (기본: 10)")
+    parser.add_argument("--latency", type=float, default=0.0, help="COM 멤버 접근당 지연 초 (기본: 0)")
+    parser.add_argument("--record", metavar="DIR", help="실제 Excel(Windows)의 호출을 시나리오별로 녹화할 디렉토리")
+    parser.add_argument("--replay", metavar="DIR", help="녹화 파일을 녹화 당시 호출 시간대로 재생할 디렉토리")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.sheets, args.latency, record_dir=args.record, replay_dir=args.replay)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"rows={args.rows} sheets={args.sheets} latency={args.latency * 1000:.3f}ms")
+    print(f"{'scenario':<22} {'com_calls':>10} {'wall_ms':>10}  most called")
+    for result in results:
+        print(
+            f"{result['scenario']:<22} {result['com_calls']:>10} {result['wall_time_ms']:>10.1f}  "
+            f"{', '.join(result['most_called'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
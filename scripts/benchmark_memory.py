@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결과 객체 메모리 벤치마크
+
+엔진 결과(ShapeInfo 등)와 배치 실행 결과(LineResult 등)의 __slots__ 데이터 클래스를
+같은 필드를 가진 일반 데이터 클래스(인스턴스 __dict__ 사용)와 비교합니다.
+tracemalloc으로 객체 N개를 만들 때 늘어난 메모리를 재어 객체당 바이트로 나누고,
+to_dict()와 dataclasses.asdict()의 직렬화 시간도 함께 측정합니다.
+
+사용법:
+    python scripts/benchmark_memory.py [--count 100000] [--json]
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyhub_office_automation.batch.executor import BatchLine, LineResult
+from pyhub_office_automation.excel.engines.base import ChartInfo, RangeData, ShapeInfo, SlicerInfo, TableInfo
+
+
+def samples():
+    """(클래스, 인스턴스 i를 만드는 인자 함수) 목록 - 필드 값은 인스턴스마다 공유해 객체 자체 크기만 잼"""
+    headers = ["Id", "Name"]
+    args = ["--file-path", "data.xlsx"]
+    return [
+        (RangeData, lambda i: dict(values=None, formulas=None, address="A1:B2", sheet_name="Data")),
+        (
+            TableInfo,
+            lambda i: dict(name="Sales", sheet_name="Data", address="A1:B2", row_count=2, column_count=2, headers=headers),
+        ),
+        (
+            ChartInfo,
+            lambda i: dict(
+                name="Chart",
+                chart_type="bar",
+                source_data="A1:B2",
+                sheet_name="Data",
+                left=1.0,
+                top=2.0,
+                width=3.0,
+                height=4.0,
+            ),
+        ),
+        (
+            SlicerInfo,
+            lambda i: dict(
+                name="Slicer",
+                sheet_name="Data",
+                caption="Region",
+                source_field="Region",
+                left=1.0,
+                top=2.0,
+                width=3.0,
+                height=4.0,
+            ),
+        ),
+        (
+            ShapeInfo,
+            lambda i: dict(name="Shape", sheet_name="Data", shape_type="rect", left=1.0, top=2.0, width=3.0, height=4.0),
+        ),
+        (BatchLine, lambda i: dict(line_number=i, content="excel range-read", command="excel", args=args)),
+        (LineResult, lambda i: dict(line_number=i, command="excel range-read", success=True, output="{}", duration_ms=3)),
+    ]
+
+
+def unslotted(cls):
+    """cls와 같은 필드를 가진 일반 데이터 클래스 (slots 적용 전 모습)"""
+    fields = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default=f.default)))
+        elif f.default_factory is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        else:
+            fields.append((f.name, f.type))
+    return dataclasses.make_dataclass(f"{cls.__name__}Dict", fields)
+
+
+def bytes_per_object(cls, make_kwargs, count: int) -> float:
+    """cls 인스턴스 count개가 차지하는 객체당 메모리 (리스트 자체 크기 제외)"""
+    kwargs = [make_kwargs(i) for i in range(count)]
+    holder = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            holder[i] = cls(**kwargs[i])
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def serialize_ms(objects, func) -> float:
+    started = time.perf_counter()
+    for obj in objects:
+        func(obj)
+    return (time.perf_counter() - started) * 1000
+
+
+def run_benchmark(count: int):
+    results = []
+    for cls, make_kwargs in samples():
+        plain = unslotted(cls)
+        slotted_bytes = bytes_per_object(cls, make_kwargs, count)
+        plain_bytes = bytes_per_object(plain, make_kwargs, count)
+
+        objects = [cls(**make_kwargs(i)) for i in range(min(count, 20000))]
+        results.append(
+            {
+                "type": cls.__name__,
+                "fields": len(dataclasses.fields(cls)),
+                "dict_bytes": round(plain_bytes, 1),
+                "slots_bytes": round(slotted_bytes, 1),
+                "saved_percent": round((1 - slotted_bytes / plain_bytes) * 100, 1) if plain_bytes else 0.0,
+                "asdict_ms": round(serialize_ms(objects, dataclasses.asdict), 2),
+                "to_dict_ms": round(serialize_ms(objects, lambda obj: obj.to_dict()), 2),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결과 객체 메모리 벤치마크 (__slots__ vs __dict__)")
+    parser.add_argument("--count", type=int, default=100000, help="타입별 생성할 객체 수 (기본: 100000)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.count)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"count={args.count} python={sys.version.split()[0]}")
+    print(f"{'type':<12} {'fields':>6} {'dict B':>8} {'slots B':>8} {'saved':>7} {'asdict ms':>10} {'to_dict ms':>11}")
+    for result in results:
+        print(
+            f"{result['type']:<12} {result['fields']:>6} {result['dict_bytes']:>8.1f} {result['slots_bytes']:>8.1f} "
+            f"{result['saved_percent']:>6.1f}% {result['asdict_ms']:>10.2f} {result['to_dict_ms']:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+oa 명령어 콜드 스타트 벤치마크
+
+명령어마다 새 Python 프로세스로 `oa ...`를 실행하여 다음을 측정합니다.
+    - wall_ms: 프로세스 시작부터 종료까지
+    - first_output_ms: 프로세스 시작부터 stdout 첫 바이트까지
+    - import_ms: `-X importtime` 기준 import 누적 시간 (최상위 import 합계)
+    - top_imports: 누적 import 시간이 큰 최상위 모듈
+
+엔진은 OA_EXCEL_ENGINE=headless(openpyxl)로 고정하므로 Office 없는 Linux CI에서도 실행됩니다.
+측정값은 인터프리터 자체 시작 시간(`python -c pass`)으로 보정하여 기준값과 비교하고,
+기준값 대비 허용치를 넘으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/benchmark_startup.py [--repeat 3] [--only table-] [--json]
+    python scripts/benchmark_startup.py --check                # 기준값과 비교 (회귀 시 exit 1)
+    python scripts/benchmark_startup.py --update-baseline      # 기준값 갱신
+
+예시:
+    python scripts/benchmark_startup.py --only "excel --help" --repeat 5
+    python scripts/benchmark_startup.py --check --threshold 0.3 --slack-ms 30
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Windows 콘솔 UTF-8 출력 설정
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pyhub_office_automation.cli.command_manifest import EMAIL_COMMANDS, EXCEL_COMMANDS, PPT_COMMANDS, ROOT_COMMANDS
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "startup_baseline.json"
+
+# 회귀 판정: 현재 > 기준 × 보정 비율 × (1 + threshold) + slack_ms
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_SLACK_MS = 50.0
+
+# 회귀 판정에 사용하는 지표
+CHECKED_METRICS = ("wall_ms", "import_ms")
+
+CLI_MODULE = "pyhub_office_automation.cli.main"
+
+
+def command_cases(workbook_path: str) -> List[Tuple[str, List[str]]]:
+    """(케이스 이름, oa 인자) 목록"""
+    cases = [
+        ("--version", ["--version"]),
+        ("--help", ["--help"]),
+    ]
+    for group in ("excel", "ppt", "email", "hwp", "batch"):
+        cases.append((f"{group} --help", [group, "--help"]))
+
+    groups = [("", ROOT_COMMANDS), ("excel ", EXCEL_COMMANDS), ("ppt ", PPT_COMMANDS), ("email ", EMAIL_COMMANDS)]
+    for prefix, entries in groups:
+        for name, _, _ in entries:
+            args = prefix.split() + [name, "--help"]
+            cases.append((" ".join(args), args))
+
+    # headless 엔진으로 실제 실행까지 측정하는 명령어
+    cases.extend(
+        [
+            ("excel list", ["excel", "list"]),
+            ("excel workbook-list", ["excel", "workbook-list"]),
+            ("excel workbook-info", ["excel", "workbook-info", "--file-path", workbook_path]),
+            ("excel range-read", ["excel", "range-read", "--file-path", workbook_path, "--range", "A1:C10"]),
+            ("excel table-list", ["excel", "table-list", "--file-path", workbook_path]),
+        ]
+    )
+    return cases
+
+
+def build_workbook(path: Path):
+    """실행 케이스용 작은 워크북 (People 테이블 20행)"""
+    import openpyxl
+    from openpyxl.worksheet.table import Table
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Age", "City"])
+    for i in range(20):
+        ws.append([f"n{i}", 20 + i, "Seoul" if i % 2 else "Busan"])
+    ws.add_table(Table(displayName="People", ref="A1:C21"))
+    wb.save(path)
+
+
+def _environment() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["OA_EXCEL_ENGINE"] = "headless"
+    env["PYTHONIOENCODING"] = "utf-8"
+    # 실행 중인 `oa serve` 데몬이 있어도 콜드 스타트를 측정
+    env["OA_DAEMON"] = "0"
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def parse_importtime(stderr: str, top_n: int = 10) -> Tuple[float, Dict[str, float]]:
+    """
+    `-X importtime` 출력에서 최상위 import의 누적 시간 합계와 상위 모듈을 추출합니다.
+
+    출력 형식: "import time: self [us] | cumulative | imported package"
+    들여쓰기가 없는(공백 1칸) 모듈이 최상위 import입니다.
+
+    Returns:
+        (import_ms, {모듈: 누적 ms}) - 모듈은 누적 시간 내림차순 top_n개
+    """
+    top_level: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        if name.startswith("  "):
+            continue
+        top_level[name.strip()] = top_level.get(name.strip(), 0.0) + int(parts[1]) / 1000
+
+    top = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:top_n]
+    return round(sum(top_level.values()), 1), {name: round(ms, 1) for name, ms in top}
+
+
+def run_once(args: List[str], importtime: bool = False) -> Dict[str, object]:
+    """새 프로세스에서 oa를 한 번 실행하여 시간 측정"""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-m", CLI_MODULE] + args
+
+    # stderr(importtime 출력)는 파이프가 차서 멈추지 않도록 임시 파일로 받음
+    with tempfile.TemporaryFile() as stderr_file:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=stderr_file, env=_environment(), cwd=str(ROOT), bufsize=0
+        )
+        first = process.stdout.read(1)
+        first_output = time.perf_counter()
+        process.communicate()
+        finished = time.perf_counter()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    return {
+        "returncode": process.returncode,
+        "wall_ms": (finished - started) * 1000,
+        "first_output_ms": (first_output - started) * 1000 if first else None,
+        "stderr": stderr.decode("utf-8", errors="replace"),
+    }
+
+
+def measure_python_startup(repeat: int) -> float:
+    """인터프리터 자체 시작 시간 (보정 기준)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 1)
+
+
+def measure_case(args: List[str], repeat: int) -> Dict[str, object]:
+    """케이스 하나를 repeat회 측정한 중앙값"""
+    walls, firsts, imports = [], [], []
+    top_imports: Dict[str, float] = {}
+    returncode = 0
+    for _ in range(repeat):
+        plain = run_once(args)
+        returncode = returncode or plain["returncode"]
+        walls.append(plain["wall_ms"])
+        if plain["first_output_ms"] is not None:
+            firsts.append(plain["first_output_ms"])
+
+        traced = run_once(args, importtime=True)
+        import_ms, top = parse_importtime(traced["stderr"])
+        imports.append(import_ms)
+        if import_ms >= max(imports):
+            top_imports = top
+
+    return {
+        "wall_ms": round(statistics.median(walls), 1),
+        "first_output_ms": round(statistics.median(firsts), 1) if firsts else None,
+        "import_ms": round(statistics.median(imports), 1),
+        "top_imports": top_imports,
+        "returncode": returncode,
+    }
+
+
+def run_benchmark(repeat: int, only: Optional[str] = None, progress: bool = True) -> Dict[str, object]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = Path(tmp_dir) / "startup.xlsx"
+        build_workbook(workbook_path)
+
+        results: Dict[str, object] = {}
+        for name, args in command_cases(str(workbook_path)):
+            if only and only not in name:
+                continue
+            if progress:
+                print(f"  {name} ...", file=sys.stderr, flush=True)
+            results[name] = measure_case(args, repeat)
+
+    return {
+        "python_startup_ms": measure_python_startup(max(3, repeat)),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commands": results,
+    }
+
+
+def find_regressions(
+    current: Dict[str, object],
+    baseline: Dict[str, object],
+    threshold: float = DEFAULT_THRESHOLD,
+    slack_ms: float = DEFAULT_SLACK_MS,
+) -> List[Dict[str, object]]:
+    """
+    기준값 대비 허용치를 넘은 (명령어, 지표) 목록
+
+    기준값이 없는 명령어는 비교하지 않습니다. 인터프리터 시작 시간 비율로 기준값을 보정하여
+    다른 머신에서 만든 기준값과도 비교할 수 있게 합니다.
+    """
+    scale = 1.0
+    if baseline.get("python_startup_ms") and current.get("python_startup_ms"):
+        scale = current["python_startup_ms"] / baseline["python_startup_ms"]
+
+    regressions = []
+    for name, result in current["commands"].items():
+        base = baseline.get("commands", {}).get(name)
+        if not base:
+            continue
+        for metric in CHECKED_METRICS:
+            if result.get(metric) is None or base.get(metric) is None:
+                continue
+            limit = base[metric] * scale * (1 + threshold) + slack_ms
+            if result[metric] > limit:
+                regressions.append(
+                    {
+                        "command": name,
+                        "metric": metric,
+                        "baseline": base[metric],
+                        "current": result[metric],
+                        "limit": round(limit, 1),
+                    }
+                )
+    return regressions
+
+
+def print_table(results: Dict[str, object]):
+    print(f"python startup: {results['python_startup_ms']}ms ({results['python']}, {results['platform']})")
+    print(f"{'command':<36} {'wall_ms':>9} {'first_ms':>9} {'import_ms':>10}  top imports")
+    for name, result in results["commands"].items():
+        first = f"{result['first_output_ms']:.1f}" if result["first_output_ms"] is not None else "-"
+        top = ", ".join(f"{module} {ms:.0f}" for module, ms in list(result["top_imports"].items())[:3])
+        failed = "" if result["returncode"] == 0 else f"  (exit {result['returncode']})"
+        print(f"{name:<36} {result['wall_ms']:>9.1f} {first:>9} {result['import_ms']:>10.1f}  {top}{failed}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="oa 명령어 콜드 스타트/import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수, 중앙값 사용 (기본: 3)")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="기준값 파일 경로")
+    parser.add_argument("--check", action="store_true", help="기준값과 비교하여 회귀 시 exit 1")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과로 기준값 파일 갱신")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 증가 비율 (기본: 0.5)")
+    parser.add_argument("--slack-ms", type=float, default=DEFAULT_SLACK_MS, help="허용 증가 절대값 ms (기본: 50)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat, only=args.only)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_table(results)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() and args.only else {}
+        baseline.update({key: value for key, value in results.items() if key != "commands"})
+        baseline.setdefault("commands", {}).update(
+            {
+                name: {key: value for key, value in result.items() if key != "returncode"}
+                for name, result in results["commands"].items()
+            }
+        )
+        baseline_path.write_text(json.dumps(baseline, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n기준값 저장: {baseline_path}", file=sys.stderr)
+
+    failed = [name for name, result in results["commands"].items() if result["returncode"] != 0]
+    if failed:
+        print(f"\n실행 실패: {', '.join(failed)}", file=sys.stderr)
+
+    if args.check:
+        if not baseline_path.exists():
+            print(f"기준값 파일이 없습니다: {baseline_path}", file=sys.stderr)
+            sys.exit(2)
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = find_regressions(results, baseline, args.threshold, args.slack_ms)
+        for regression in regressions:
+            print(
+                f"회귀: {regression['command']} {regression['metric']} "
+                f"{regression['baseline']} → {regression['current']}ms (허용 {regression['limit']}ms)",
+                file=sys.stderr,
+            )
+        if regressions or failed:
+            sys.exit(1)
+        print("\n기준값 대비 회귀 없음", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+상주 AppleScript 호스트 및 값 전송 형식 테스트
+
+osascript 대신 같은 줄 단위 JSON 프로토콜을 말하는 가짜 호스트(Python 스크립트)를 사용하므로
+모든 플랫폼에서 실행됩니다.
+"""
+
+import datetime
+import sys
+import textwrap
+
+import pytest
+
+from pyhub_office_automation.excel.engines.applescript_host import (
+    ERROR_MARKER,
+    RESULT_SEPARATOR,
+    AppleScriptHost,
+    combine_scripts,
+    split_combined_output,
+)
+from pyhub_office_automation.excel.engines.applescript_values import (
+    ROW_SEPARATOR,
+    SECTION_SEPARATOR,
+    decode_cell,
+    decode_grid,
+    encode_grid,
+)
+from pyhub_office_automation.excel.engines.exceptions import AppleScriptError
+from pyhub_office_automation.excel.engines.macos import MacOSEngine
+
+FAKE_HOST = textwrap.dedent("""
+    import json, os, sys, time
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        results = []
+        for script in request["scripts"]:
+            if script.startswith("SLEEP"):
+                time.sleep(float(script.split()[1]))
+            if script == "EXIT":
+                sys.exit(3)
+            if script.startswith("FAIL"):
+                results.append({"ok": False, "error": "execution error: " + script + " (-1728)"})
+                break
+            results.append({"ok": True, "result": "%d:%s\\n" % (os.getpid(), script)})
+        print(json.dumps({"id": request["id"], "results": results}), flush=True)
+    """)
+
+
+@pytest.fixture
+def host(tmp_path):
+    script = tmp_path / "fake_host.py"
+    script.write_text(FAKE_HOST, encoding="utf-8")
+    host = AppleScriptHost(command=[sys.executable, str(script)])
+    yield host
+    host.close()
+
+
+def _pid(result):
+    return result.split(":", 1)[0]
+
+
+class TestAppleScriptHost:
+    def test_reuses_single_process(self, host):
+        first = host.run("return 1")
+        second = host.run("return 2")
+
+        assert first.endswith(":return 1")  # 앞뒤 공백 제거
+        assert _pid(first) == _pid(second)
+        assert host.starts == 1
+
+    def test_batch_runs_in_order(self, host):
+        results = host.run_batch(["a", "b", "c"])
+
+        assert [r.split(":", 1)[1] for r in results] == ["a", "b", "c"]
+
+    def test_error_stops_batch(self, host):
+        with pytest.raises(AppleScriptError) as exc_info:
+            host.run_batch(["a", "FAIL here", "c"])
+
+        assert exc_info.value.script == "FAIL here"
+        assert "-1728" in exc_info.value.stderr
+        assert host.is_running  # 스크립트 오류는 호스트를 종료하지 않음
+
+    def test_timeout_kills_and_restarts(self, host):
+        with pytest.raises(AppleScriptError, match="Timeout"):
+            host.run("SLEEP 5", timeout=0.3)
+
+        assert not host.is_running
+        assert host.run("after").endswith(":after")
+        assert host.starts == 2
+
+    def test_host_exit_restarts_on_next_call(self, host):
+        with pytest.raises(AppleScriptError, match="종료"):
+            host.run("EXIT")
+
+        assert host.run("again").endswith(":again")
+        assert host.starts == 2
+
+
+class TestCombineScripts:
+    def test_combined_script_has_one_handler_per_step(self):
+        combined = combine_scripts(["return 1", "return 2"])
+
+        assert "on oa_step_1()\nreturn 1\nend oa_step_1" in combined
+        assert "on oa_step_2()" in combined
+        assert combined.rstrip().endswith("return oaJoin(oaResults)")
+
+    def test_split_output(self):
+        output = RESULT_SEPARATOR.join(["one", "", "three "])
+
+        assert split_combined_output(output, ["a", "b", "c"]) == ["one", "", "three"]
+
+    def test_split_output_raises_failed_step(self):
+        output = "one" + RESULT_SEPARATOR + ERROR_MARKER + "Microsoft Excel got an error (-1728)"
+
+        with pytest.raises(AppleScriptError) as exc_info:
+            split_combined_output(output, ["a", "b", "c"])
+
+        assert exc_info.value.script == "b"
+        assert "Microsoft Excel got an error" in str(exc_info.value)
+
+
+class _TransportOnly:
+    """macOS가 아닌 환경에서 MacOSEngine의 전송 계층 메서드만 빌려 검증"""
+
+    _run_applescript = MacOSEngine._run_applescript
+    run_applescript_batch = MacOSEngine.run_applescript_batch
+    read_range = MacOSEngine.read_range
+    _escape_applescript_string = MacOSEngine._escape_applescript_string
+    _EXPAND_SCRIPTS = MacOSEngine._EXPAND_SCRIPTS
+
+    def __init__(self, host):
+        self._script_host = host
+
+
+class TestMacOSEngineTransport:
+    def _engine(self, host):
+        return _TransportOnly(host)
+
+    def test_run_applescript_uses_host(self, host):
+        engine = self._engine(host)
+
+        assert engine._run_applescript("x").endswith(":x")
+        assert engine._run_applescript("y").endswith(":y")
+        assert host.starts == 1
+
+    def test_batch_sends_one_combined_script(self, host):
+        engine = self._engine(host)
+        sent = []
+        original = host.run
+        host.run = lambda script, timeout=30: sent.append(script) or RESULT_SEPARATOR.join(["1", "2"])
+
+        assert engine.run_applescript_batch(["return 1", "return 2"]) == ["1", "2"]
+        assert len(sent) == 1 and "oa_step_2" in sent[0]
+        host.run = original
+
+    def test_falls_back_when_host_cannot_start(self, tmp_path, monkeypatch):
+        engine = self._engine(AppleScriptHost(command=[str(tmp_path / "missing-host")]))
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return type("Result", (), {"returncode": 0, "stdout": "ok\n", "stderr": ""})()
+
+        monkeypatch.setattr("pyhub_office_automation.excel.engines.macos.subprocess.run", fake_run)
+
+        assert engine._run_applescript("return 1") == "ok"
+        assert engine._script_host is None
+        assert calls == [["osascript", "-e", "return 1"]]
+
+
+class TestTypedValues:
+    def test_roundtrip_types_and_delimiters(self):
+        rows = [
+            ["Name", 3, 2.5, True, None],
+            ["a, {b}", -1, 1e20, False, datetime.datetime(2024, 1, 5, 1, 2, 3)],
+            ["tab\tline\nrow" + chr(30) + "cell" + chr(31) + "esc" + chr(16), 0, 0.0, True, ""],
+        ]
+
+        decoded = decode_grid(encode_grid(rows), 3, 5)
+
+        assert decoded[0] == ["Name", 3, 2.5, True, None]
+        assert decoded[1] == ["a, {b}", -1, 1e20, False, datetime.datetime(2024, 1, 5, 1, 2, 3)]
+        assert decoded[2][0] == rows[2][0]
+        assert decoded[2][4] is None
+
+    def test_locale_decimal_and_flat_row(self):
+        assert decode_cell("n3,5") == 3.5
+        # 한 행 범위가 1차원 리스트로 온 경우 (셀마다 한 행)
+        assert decode_grid(ROW_SEPARATOR.join(["i1", "i2", "i3"]), 1, 3) == [[1, 2, 3]]
+
+    def test_read_range_parses_sections(self):
+        engine = _TransportOnly(None)
+        output = SECTION_SEPARATOR.join(["$A$1:$B$2", "2", "2", encode_grid([["x", 1.0], [None, 2.0]]), "", "."])
+        scripts = []
+        engine._run_applescript = lambda script, timeout=30: scripts.append(script) or output
+
+        data = engine.read_range("Book1", "Sheet1", "A1", expand="table")
+
+        assert data.values == [["x", 1.0], [None, 2.0]]
+        assert data.formulas is None
+        assert (data.address, data.row_count, data.column_count) == ("$A$1:$B$2", 2, 2)
+        assert "current region of rangeObj" in scripts[0]
@@ -0,0 +1,50 @@
+"""
+청크 쓰기 유틸리티 테스트 (AdaptiveChunkSizer, offset_cell)
+"""
+
+import pytest
+
+from pyhub_office_automation.excel.engines.chunking import (
+    DEFAULT_WRITE_CHUNK_ROWS,
+    AdaptiveChunkSizer,
+    offset_cell,
+    pad_rows,
+)
+
+
+class TestAdaptiveChunkSizer:
+    def test_fixed_size_is_not_tuned(self):
+        sizer = AdaptiveChunkSizer(chunk_rows=10)
+        sizer.record(10, 5.0)
+
+        assert sizer.chunk_rows == 10
+        assert [len(c) for c in sizer.split(([i] for i in range(25)))] == [10, 10, 5]
+
+    def test_grows_when_fast_and_shrinks_when_slow(self):
+        sizer = AdaptiveChunkSizer(target_seconds=0.5)
+
+        sizer.record(DEFAULT_WRITE_CHUNK_ROWS, 0.01)
+        assert sizer.chunk_rows == DEFAULT_WRITE_CHUNK_ROWS * 2  # 최대 2배까지만 증가
+
+        sizer.record(sizer.chunk_rows, 10.0)
+        assert sizer.chunk_rows == DEFAULT_WRITE_CHUNK_ROWS  # 최대 절반까지만 감소
+
+    def test_respects_cell_limit(self):
+        sizer = AdaptiveChunkSizer(max_cells=1000)
+
+        assert sizer.rows_for(100) == 10
+
+    def test_invalid_chunk_rows(self):
+        with pytest.raises(ValueError):
+            AdaptiveChunkSizer(chunk_rows=0)
+
+
+def test_offset_cell():
+    assert offset_cell("B2", 3) == "B5"
+    assert offset_cell("$aa$10", 0) == "AA10"
+    with pytest.raises(ValueError):
+        offset_cell("A1:B2", 1)
+
+
+def test_pad_rows():
+    assert pad_rows([[1], [1, 2, 3]]) == [[1, None, None], [1, 2, 3]]
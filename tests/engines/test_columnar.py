@@ -0,0 +1,145 @@
+"""
+열 단위 데이터(ColumnarData) 테스트
+"""
+
+import datetime
+import io
+import json
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from openpyxl.worksheet.table import Table
+
+from pyhub_office_automation.excel.engines import RangeData, reset_engine
+from pyhub_office_automation.excel.engines.columnar import ColumnarData, write_columnar
+from pyhub_office_automation.excel.engines.headless import HeadlessEngine
+
+ROWS = [
+    ["a", 1, 1.5, True, datetime.datetime(2024, 1, 1)],
+    ["b", None, 2, False, None],
+    [None, 3, None, None, datetime.date(2024, 2, 1)],
+]
+NAMES = ["text", "int", "float", "flag", "when"]
+
+
+@pytest.fixture
+def table_file(tmp_path):
+    path = tmp_path / "table.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Age"])
+    for i in range(10):
+        ws.append([f"n{i}", 20 + i])
+    ws.add_table(Table(displayName="People", ref="A1:B11"))
+    wb.save(path)
+    return path
+
+
+def test_column_types_and_masks():
+    data = ColumnarData.from_rows(ROWS, names=NAMES)
+
+    kinds = {column.name: column.kind for column in data.columns}
+    assert kinds == {"text": "object", "int": "int", "float": "float", "flag": "bool", "when": "datetime"}
+    assert data.row_count == 3
+    assert [column.null_count for column in data.columns] == [1, 1, 1, 1, 1]
+    assert data.columns[1].values.dtype == np.int64
+
+
+def test_to_pandas_matches_list_conversion():
+    import pandas as pd
+
+    df = ColumnarData.from_rows(ROWS, names=NAMES).to_pandas()
+    expected = pd.DataFrame(ROWS, columns=NAMES)
+
+    assert list(df.columns) == NAMES
+    assert df.shape == expected.shape
+    assert df.isna().sum().tolist() == expected.isna().sum().tolist()
+    assert df["int"].tolist()[::2] == [1.0, 3.0]
+
+
+def test_ragged_rows_and_missing_names():
+    data = ColumnarData.from_rows([[1], [2, "x"]], names=["n"])
+
+    assert data.column_count == 2
+    assert data.names == ["n", None]
+    assert data.columns[1].mask.tolist() == [True, False]
+
+
+def test_range_data_to_columnar_uses_header_row():
+    range_data = RangeData(values=[["Name", "Age"], ["a", 1], ["b", 2]], formulas=None, address="A1:B3", sheet_name="S")
+
+    data = range_data.to_columnar(header=True)
+
+    assert data.names == ["Name", "Age"]
+    assert data.columns[1].values.tolist() == [1, 2]
+
+
+def test_npy_round_trip():
+    buffer = io.BytesIO()
+    written = write_columnar(ColumnarData.from_rows(ROWS, names=NAMES), "npy", buffer)
+
+    assert written == len(buffer.getvalue())
+    buffer.seek(0)
+    array = np.load(buffer)
+    assert array.dtype.names == tuple(NAMES)
+    assert array["text"].tolist() == ["a", "b", ""]
+    assert np.isnan(array["int"][1])
+
+
+def test_arrow_round_trip():
+    pa = pytest.importorskip("pyarrow")
+
+    buffer = io.BytesIO()
+    write_columnar(ColumnarData.from_rows(ROWS, names=NAMES), "arrow", buffer)
+    table = pa.ipc.open_stream(buffer.getvalue()).read_all()
+
+    assert table.column_names == NAMES
+    assert table.column("int").to_pylist() == [1, None, 3]
+    assert table.column("text").null_count == 1
+
+
+def test_read_table_columnar(table_file):
+    engine = HeadlessEngine()
+    book = engine.open_workbook(str(table_file))
+
+    data = engine.read_table_columnar(book, "People", columns=["Age"], limit=3, offset=2)
+
+    assert data.names == ["Age"]
+    assert data.columns[0].values.tolist() == [22, 23, 24]
+
+
+def test_range_read_writes_npy_file(table_file, tmp_path, monkeypatch):
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    reset_engine()
+    output = tmp_path / "out.npy"
+    try:
+        from pyhub_office_automation.cli.main import app
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "excel",
+                "range-read",
+                "--file-path",
+                str(table_file),
+                "--range",
+                "A1:B11",
+                "--format",
+                "npy",
+                "--output-file",
+                str(output),
+            ],
+        )
+    finally:
+        reset_engine()
+
+    assert result.exit_code == 0, result.output
+    response = json.loads(result.stdout)
+    assert response["data"]["row_count"] == 10
+    assert response["operation_stats"]["data_size_bytes"] == output.stat().st_size
+    assert np.load(output)["Age"].tolist() == list(range(20, 30))
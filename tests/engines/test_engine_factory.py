@@ -77,15 +77,28 @@ class TestEngineFactory:
 
         assert isinstance(engine, WindowsEngine)
 
-    @pytest.mark.skipif(platform.system() == "Windows", reason="Non-Windows only")
-    def test_unsupported_platform_error(self):
-        """지원되지 않는 플랫폼 오류"""
-        from pyhub_office_automation.excel.engines import PlatformNotSupportedError, get_engine, reset_engine
+    def test_linux_uses_headless_engine(self):
+        """Windows/macOS 외 플랫폼은 헤드리스 엔진 사용"""
+        from pyhub_office_automation.excel.engines import get_engine, reset_engine
+        from pyhub_office_automation.excel.engines.headless import HeadlessEngine
+
+        reset_engine()
+        engine = get_engine(force_platform="Linux")
+        reset_engine()
+
+        assert isinstance(engine, HeadlessEngine)
 
+    def test_engine_env_override(self, monkeypatch):
+        """OA_EXCEL_ENGINE 환경 변수로 엔진 강제 지정"""
+        from pyhub_office_automation.excel.engines import get_engine, reset_engine
+        from pyhub_office_automation.excel.engines.headless import HeadlessEngine
+
+        monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+        reset_engine()
+        engine = get_engine()
         reset_engine()
 
-        with pytest.raises(PlatformNotSupportedError):
-            get_engine(force_platform="Linux")
+        assert isinstance(engine, HeadlessEngine)
 
 
 class TestEngineInterface:
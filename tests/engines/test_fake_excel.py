@@ -0,0 +1,254 @@
+"""
+가짜 Excel 객체 모델 테스트
+
+WindowsEngine을 fake_excel.FakeApplication 위에서 실행하여
+Excel 없이 COM 코드 경로와 호출 수를 검증합니다.
+"""
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from openpyxl.worksheet.table import Table
+
+from pyhub_office_automation.excel.engines import PivotTableNotFoundError, SheetNotFoundError, TableNotFoundError
+from pyhub_office_automation.excel.engines.base import ExcelEngineBase, contiguous_windows, sample_row_indices
+from pyhub_office_automation.excel.engines.fake_excel import CallTrace, FakeApplication, FakeComError, ReplayApplication
+from pyhub_office_automation.excel.engines.instrumentation import ComProfiler
+from pyhub_office_automation.excel.engines.windows import WindowsEngine
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """빈 시트 3개와 마지막 Data 시트(People 테이블 20행)를 가진 워크북"""
+    path = tmp_path / "sample.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Age", "City"])
+    for i in range(20):
+        ws.append([f"n{i}", 20 + i, "Seoul" if i % 2 else "Busan"])
+    ws.add_table(Table(displayName="People", ref="A1:C21"))
+    for index in range(3):
+        wb.create_sheet(f"Empty{index + 1}", index)
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def xl():
+    return FakeApplication()
+
+
+@pytest.fixture
+def engine(xl):
+    return WindowsEngine(application=xl)
+
+
+class TestObjectModel:
+    def test_range_value_semantics(self, xl):
+        ws = xl.Workbooks.Add().Sheets(1)
+
+        ws.Range("A1:B2").Value = [[1, 2], [3, 4]]
+        assert ws.Range("A1:B2").Value == ((1, 2), (3, 4))
+        assert ws.Range("B2").Value == 4
+
+        # 범위보다 작은 배열은 #N/A, 스칼라는 전체 채움
+        ws.Range("D1:E2").Value = [[1]]
+        assert ws.Range("D1:E2").Value == ((1, "#N/A"), ("#N/A", "#N/A"))
+        ws.Range("G1:G3").Value = 0
+        assert ws.Range("G1:G3").Value == ((0,), (0,), (0,))
+
+    def test_navigation(self, xl):
+        ws = xl.Workbooks.Add().Sheets(1)
+        ws.Range("B2:D5").Value = [[1, 2, 3]] * 4
+
+        assert ws.Range("B2").End(xl.constants.xlDown).Address == "$B$5"
+        assert ws.Range("B2").End(xl.constants.xlToRight).Address == "$D$2"
+        assert ws.Range("C3").CurrentRegion.Address == "$B$2:$D$5"
+        assert ws.UsedRange.Address == "$B$2:$D$5"
+        assert ws.Range("B2").Offset(1, 1).Resize(2, 2).Address == "$C$3:$D$4"
+
+    def test_missing_item_raises_subscript_error(self, xl):
+        workbook = xl.Workbooks.Add()
+
+        with pytest.raises(FakeComError, match="Subscript out of range"):
+            workbook.Sheets("Nope")
+
+    def test_latency_counts_member_access(self, xl):
+        ws = xl.Workbooks.Add().Sheets(1)
+        xl.com_calls = 0
+
+        ws.Range("A1").Value = 1
+
+        # Range 조회 + Value 대입
+        assert xl.com_calls == 2
+
+
+class TestWindowsEngine:
+    def test_workbook_and_sheets(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        info = engine.get_workbook_info(book)
+        assert info["sheets"] == ["Empty1", "Empty2", "Empty3", "Data"]
+
+        engine.rename_sheet(book, "Empty1", "First")
+        engine.delete_sheet(book, "Empty2")
+        assert [ws.Name for ws in book.Sheets] == ["First", "Empty3", "Data"]
+
+        with pytest.raises(SheetNotFoundError):
+            engine.rename_sheet(book, "Nope", "X")
+
+    def test_range_roundtrip(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        engine.write_range(book, "Empty1", "B2", [[1, 2], [3, 4]])
+
+        assert engine.read_range(book, "Empty1", "B2:C3").address == "$B$2:$C$3"
+        assert [len(c) for c in engine.read_range_iter(book, "Data", "A1", expand="table", chunk_rows=8)] == [8, 8, 5]
+
+    def test_tables(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        assert [t.name for t in engine.list_tables(book)] == ["People"]
+        result = engine.read_table(book, "People", columns=["City"], offset=2, limit=2)
+        assert result["data"] == [["Busan"], ["Seoul"]]
+
+        engine.write_table(book, "Empty1", "Scores", [["Id", "Score"], [1, 90]], start_cell="B2")
+        assert engine.read_table(book, "Scores")["data"] == [[1, 90]]
+
+        with pytest.raises(TableNotFoundError):
+            engine.read_table(book, "Missing")
+
+    def test_charts_and_pivots(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        name = engine.add_chart(book, "Data", "A1:B5", "column", "H1")
+        assert [c.name for c in engine.list_charts(book, "Data")] == [name]
+
+        engine.create_pivot_table(book, "Data", "A1:C21", "Empty1", "A3", "Pivot1")
+        assert [p.name for p in engine.list_pivot_tables(book)] == ["Pivot1"]
+        engine.delete_pivot_table(book, "Empty1", "Pivot1")
+        assert engine.list_pivot_tables(book) == []
+
+    def test_table_lookup_uses_object_index(self, xl, engine, sample_file):
+        profiler = ComProfiler()
+        engine.attach_profiler(profiler)
+        book = engine.open_workbook(str(sample_file))
+        engine.read_table(book, "People")
+        profiler.stats.clear()
+
+        engine.read_table(book, "people")
+
+        # 두 번째 조회부터는 시트를 순회하지 않고 인덱스의 시트에서 바로 가져옴
+        assert profiler.stats["ListObjects()"][1] == 1
+        assert "Sheets.__iter__" not in profiler.stats
+
+    def test_table_sheet_name_uses_object_index(self, engine, sample_file):
+        profiler = ComProfiler()
+        engine.attach_profiler(profiler)
+        book = engine.open_workbook(str(sample_file))
+        engine.read_table(book, "People")
+        profiler.stats.clear()
+
+        assert engine.get_table_sheet_name(book, "People") == "Data"
+        assert profiler.stats["ListObjects()"][1] == 1
+        assert "Sheets.__iter__" not in profiler.stats
+
+        with pytest.raises(TableNotFoundError):
+            engine.get_table_sheet_name(book, "Missing")
+
+    def test_object_index_follows_structural_changes(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        engine.read_table(book, "People")
+
+        engine.rename_sheet(book, "Data", "Renamed")
+        engine.write_table(book, "Empty1", "Scores", [["Id", "Score"], [1, 90]])
+        assert engine.read_table(book, "People")["row_count"] == 20
+        assert engine.read_table(book, "Scores")["data"] == [[1, 90]]
+
+        # 엔진을 거치지 않은 변경은 조회 실패 시 인덱스를 다시 만들어 복구
+        book.Sheets("Empty2").ListObjects.Add(Source=book.Sheets("Empty2").Range("A1:A2")).Name = "Outside"
+        assert engine.read_table(book, "Outside")["table_name"] == "Outside"
+
+    def test_object_index_prefers_first_sheet_for_duplicate_names(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        # Excel은 시트마다 "Chart 1" 같은 기본 이름을 붙임
+        assert engine.add_chart(book, "Empty1", "A1:B5", "column", "H1") == "Chart 1"
+        assert engine.add_chart(book, "Data", "A1:B5", "column", "H1") == "Chart 1"
+
+        engine.configure_chart(book, "Chart 1", title="First")
+
+        assert book.Sheets("Empty1").ChartObjects(1).Chart.HasTitle
+        assert not book.Sheets("Data").ChartObjects(1).Chart.HasTitle
+
+    def test_pivot_lookups_use_object_index(self, engine, sample_file):
+        profiler = ComProfiler()
+        engine.attach_profiler(profiler)
+        book = engine.open_workbook(str(sample_file))
+        engine.create_pivot_table(book, "Data", "A1:C21", "Empty2", "A3", "Pivot1")
+        engine.create_pivot_table(book, "Data", "A1:C21", "Empty1", "A3", "Pivot2")
+
+        assert engine.list_pivot_table_names(book) == [("Empty1", "Pivot2"), ("Empty2", "Pivot1")]
+        profiler.stats.clear()
+
+        assert engine.get_pivot_sheet_name(book, "pivot1") == "Empty2"
+        assert profiler.stats["Sheets()"][1] == 1
+        assert "Sheets.__iter__" not in profiler.stats
+
+        with pytest.raises(PivotTableNotFoundError):
+            engine.get_pivot_sheet_name(book, "Missing")
+
+    def test_read_table_reads_only_requested_window(self, xl, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        full = engine.read_table(book, "People")["data"]
+        xl.com_calls = 0
+
+        result = engine.read_table(book, "People", columns=["Name", "City"], offset=5, limit=3)
+
+        assert result["data"] == [[row[0], row[2]] for row in full[5:8]]
+        assert result["headers"] == ["Name", "City"]
+        # 선택한 2개 컬럼 구간만 읽으므로 전체 행 수와 무관하게 호출 수가 작음
+        assert xl.com_calls < 40
+
+    def test_read_table_sample_matches_default(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        sampled = engine.read_table_sample(book, "People", 5, columns=["Age"], offset=2)
+        expected = ExcelEngineBase.read_table_sample(engine, book, "People", 5, columns=["Age"], offset=2)
+
+        assert sampled == expected
+        assert sampled["total_rows"] == 18
+        assert [row[0] for row in sampled["data"]] == [22, 23, 28, 33, 39]
+
+
+def test_sample_row_indices_windows():
+    indices = sample_row_indices(20, 5)
+
+    assert indices == [0, 1, 7, 13, 19]
+    assert contiguous_windows(indices) == [(0, 2), (7, 1), (13, 1), (19, 1)]
+    assert sample_row_indices(3, 5) == [0, 1, 2]
+
+
+class TestRecordReplay:
+    def test_replay_reproduces_engine_result(self, sample_file, tmp_path):
+        trace = CallTrace()
+        recorder = WindowsEngine(application=trace.wrap(FakeApplication()))
+        book = recorder.open_workbook(str(sample_file))
+        recorded = recorder.list_tables(book)
+        trace.save(str(tmp_path / "list_tables.trace.json"))
+
+        application = ReplayApplication(CallTrace.load(str(tmp_path / "list_tables.trace.json")))
+        replayer = WindowsEngine(application=application)
+        book = replayer.open_workbook(str(sample_file))
+
+        assert replayer.list_tables(book) == recorded
+        assert application.remaining == 0
+
+    def test_replay_mismatch_raises(self, sample_file):
+        trace = CallTrace()
+        recorder = WindowsEngine(application=trace.wrap(FakeApplication()))
+        recorder.open_workbook(str(sample_file))
+
+        application = ReplayApplication(trace)
+        with pytest.raises(FakeComError, match="재생 불일치"):
+            application.ActiveWorkbook
@@ -0,0 +1,281 @@
+"""
+HeadlessEngine 테스트
+
+openpyxl 기반 헤드리스 엔진은 Excel 없이 동작하므로 모든 플랫폼에서 실행됩니다.
+"""
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from openpyxl.worksheet.table import Table
+
+from pyhub_office_automation.excel.engines import (
+    PlatformNotSupportedError,
+    SheetNotFoundError,
+    TableNotFoundError,
+    WorkbookNotFoundError,
+)
+from pyhub_office_automation.excel.engines.headless import HeadlessEngine
+
+
+@pytest.fixture
+def engine():
+    return HeadlessEngine()
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Data 시트(People 테이블 20행)와 빈 Other 시트를 가진 워크북"""
+    path = tmp_path / "sample.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Age", "City"])
+    for i in range(20):
+        ws.append([f"n{i}", 20 + i, "Seoul" if i % 2 else "Busan"])
+    ws["E1"] = "=SUM(B2:B21)"
+    ws.add_table(Table(displayName="People", ref="A1:C21"))
+    wb.create_sheet("Other")
+    wb.save(path)
+    return path
+
+
+class TestWorkbook:
+    def test_open_and_info(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        info = engine.get_workbook_info(book)
+
+        assert info["name"] == "sample.xlsx"
+        assert info["sheets"] == ["Data", "Other"]
+        assert info["active_sheet"] == "Data"
+        assert info["saved"] is True
+        assert engine.get_active_workbook() is book
+        assert engine.get_workbook_by_name("sample.xlsx") is book
+
+    def test_open_missing_file(self, engine, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            engine.open_workbook(str(tmp_path / "missing.xlsx"))
+
+    def test_no_active_workbook(self, engine):
+        with pytest.raises(WorkbookNotFoundError):
+            engine.get_active_workbook()
+
+    def test_create_workbook(self, engine, tmp_path):
+        path = tmp_path / "new.xlsx"
+        book = engine.create_workbook(save_path=str(path))
+
+        assert path.exists()
+        assert engine.get_workbook_info(book)["sheets"] == ["Sheet1"]
+
+
+class TestSheets:
+    def test_add_rename_delete_persist(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        assert engine.add_sheet(book, "First", before="Data") == "First"
+        engine.rename_sheet(book, "Other", "Renamed")
+        engine.delete_sheet(book, "First")
+
+        # autosave: 파일에 즉시 반영
+        assert openpyxl.load_workbook(sample_file).sheetnames == ["Data", "Renamed"]
+
+    def test_duplicate_and_missing(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        with pytest.raises(ValueError):
+            engine.add_sheet(book, "Data")
+        with pytest.raises(SheetNotFoundError):
+            engine.rename_sheet(book, "Nope", "X")
+
+    def test_delete_last_sheet(self, engine, tmp_path):
+        book = engine.create_workbook(save_path=str(tmp_path / "one.xlsx"))
+
+        with pytest.raises(RuntimeError):
+            engine.delete_sheet(book, "Sheet1")
+
+
+class TestRange:
+    def test_read_range(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        data = engine.read_range(book, "Data", "A1:C3", include_formulas=False)
+
+        assert data.values == [["Name", "Age", "City"], ["n0", 20, "Busan"], ["n1", 21, "Seoul"]]
+        assert data.address == "$A$1:$C$3"
+        assert (data.row_count, data.column_count, data.cells_count) == (3, 3, 9)
+
+    def test_read_single_cell_formula(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        data = engine.read_range(book, "Data", "E1")
+
+        assert data.formulas == "=SUM(B2:B21)"
+        assert data.address == "$E$1"
+
+    def test_read_expand(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        assert engine.read_range(book, "Data", "A1", expand="table").address == "$A$1:$C$21"
+        assert engine.read_range(book, "Data", "B1", expand="down").address == "$B$1:$B$21"
+        assert engine.read_range(book, "Data", "A1", expand="right").address == "$A$1:$C$1"
+
+    def test_read_range_iter_chunks(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        chunks = list(engine.read_range_iter(book, "Data", "A2:C21", chunk_rows=8))
+
+        assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+        assert chunks[0][0] == ["n0", 20, "Busan"]
+        assert sum(chunks, []) == engine.read_range(book, "Data", "A2:C21", include_formulas=False).values
+
+    def test_read_range_iter_expand_and_single_cell(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        assert sum(len(c) for c in engine.read_range_iter(book, "Data", "A1", expand="table")) == 21
+        assert list(engine.read_range_iter(book, "Data", "B2")) == [[[20]]]
+
+    def test_write_range_roundtrip(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        engine.write_range(book, "Other", "B2", [[1, 2], [3, 4]])
+
+        assert engine.read_range(book, "Other", "B2:C3").values == [[1, 2], [3, 4]]
+        assert openpyxl.load_workbook(sample_file)["Other"]["C3"].value == 4
+
+    def test_write_range_chunked_resume(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        rows = ([i, i * 10] for i in range(10))
+        states = []
+
+        result = engine.write_range_chunked(
+            book, "Other", "B2", rows, chunk_rows=4, start_offset=3, progress_callback=lambda p: states.append(p.offset)
+        )
+
+        assert states == [7, 10]
+        assert (result.offset, result.chunk_count, result.column_count) == (10, 2, 2)
+        ws = openpyxl.load_workbook(sample_file)["Other"]
+        assert ws["B4"].value is None  # 재개 이전 행은 건너뜀
+        assert (ws["B5"].value, ws["C11"].value) == (3, 90)
+
+    def test_missing_sheet(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        with pytest.raises(SheetNotFoundError):
+            engine.read_range(book, "Nope", "A1")
+
+
+class TestTables:
+    def test_list_tables(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        tables = engine.list_tables(book)
+
+        assert len(tables) == 1
+        assert tables[0].name == "People"
+        assert tables[0].sheet_name == "Data"
+        assert tables[0].headers == ["Name", "Age", "City"]
+        assert tables[0].row_count == 20
+        assert len(tables[0].sample_data) == 5
+
+    def test_read_table_window_and_columns(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        result = engine.read_table(book, "People", columns=["City", "Name"], offset=2, limit=3)
+
+        assert result["headers"] == ["City", "Name"]
+        assert result["data"] == [["Busan", "n2"], ["Seoul", "n3"], ["Busan", "n4"]]
+        assert result["row_count"] == 3
+
+    def test_read_table_not_found(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        with pytest.raises(TableNotFoundError):
+            engine.read_table(book, "Missing")
+
+    def test_write_table(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        engine.write_table(book, "Other", "Scores", [["Id", "Score"], [1, 90], [2, 80]], start_cell="B2")
+
+        result = engine.read_table(book, "Scores")
+        assert result["headers"] == ["Id", "Score"]
+        assert result["data"] == [[1, 90], [2, 80]]
+
+        # 파일을 다시 열어도(zip 파서 경로) 테이블이 보여야 함
+        reopened = HeadlessEngine().open_workbook(str(sample_file))
+        assert {t.name for t in HeadlessEngine().list_tables(reopened)} == {"People", "Scores"}
+
+    def test_generate_metadata(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+        metadata = engine.generate_metadata(book)
+
+        assert metadata["sheet_count"] == 2
+        assert metadata["sheets"][0]["tables"] == [{"name": "People", "address": "A1:C21"}]
+        assert metadata["sheets"][0]["used_range"] == "$A$1:$E$21"
+
+
+class TestBulkSession:
+    def test_nested_session_restores_once(self, engine, monkeypatch):
+        calls = []
+        monkeypatch.setattr(engine, "begin_bulk", lambda: calls.append("begin") or {"saved": True})
+        monkeypatch.setattr(engine, "end_bulk", lambda state, recalculate=True: calls.append(("end", state, recalculate)))
+
+        with engine.bulk_session():
+            with engine.bulk_session(recalculate=False):
+                pass
+            assert calls == ["begin"]
+
+        assert calls == ["begin", ("end", {"saved": True}, True)]
+
+    def test_session_restores_on_error(self, engine, monkeypatch):
+        calls = []
+        monkeypatch.setattr(engine, "end_bulk", lambda state, recalculate=True: calls.append(state))
+
+        with pytest.raises(RuntimeError):
+            with engine.bulk_session():
+                raise RuntimeError("boom")
+
+        assert calls == [{}]
+        assert engine._bulk_depth == 0
+
+
+class TestUnsupported:
+    def test_chart_raises(self, engine, sample_file):
+        book = engine.open_workbook(str(sample_file))
+
+        with pytest.raises(PlatformNotSupportedError):
+            engine.add_chart(book, "Data", "A1:B5", "column", "H1")
+
+
+class TestTableReadCommand:
+    """OA_EXCEL_ENGINE=headless에서 oa excel table-read 전체 경로"""
+
+    @pytest.fixture(autouse=True)
+    def headless_engine(self, monkeypatch):
+        from pyhub_office_automation.excel.engines import reset_engine
+
+        monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+        monkeypatch.setenv("OA_RESULT_CACHE", "0")
+        reset_engine()
+        yield
+        reset_engine()
+
+    def _invoke(self, *args):
+        import json
+
+        from typer.testing import CliRunner
+
+        from pyhub_office_automation.cli.main import app
+
+        result = CliRunner().invoke(app, ["excel", "table-read", *args])
+        assert result.exit_code == 0, result.output
+        return json.loads(result.stdout)
+
+    def test_read_by_table_name(self, sample_file):
+        response = self._invoke("--file-path", str(sample_file), "--table-name", "People", "--limit", "2")
+
+        assert response["data"]["sheet"] == "Data"
+        assert response["data"]["data"] == [
+            {"Name": "n0", "Age": 20, "City": "Busan"},
+            {"Name": "n1", "Age": 21, "City": "Seoul"},
+        ]
+
+    def test_read_by_range(self, sample_file):
+        response = self._invoke("--file-path", str(sample_file), "--sheet", "Data", "--range", "A1:B3")
+
+        assert response["data"]["dataframe_info"]["columns"] == ["Name", "Age"]
+        assert response["data"]["data"] == [{"Name": "n0", "Age": 20}, {"Name": "n1", "Age": 21}]
@@ -0,0 +1,96 @@
+"""
+COM 호출 계측 프록시 테스트
+
+실제 COM 대신 _oleobj_ 속성을 가진 가짜 디스패치 객체를 사용합니다.
+"""
+
+from pyhub_office_automation.excel.engines.instrumentation import ComProfiler, ComProxy
+
+
+class FakeDispatch:
+    _oleobj_ = object()
+
+
+class FakeListObjects(FakeDispatch):
+    def __init__(self, names):
+        self.names = names
+        self.Count = len(names)
+
+    def __call__(self, name):
+        if name not in self.names:
+            raise Exception("Subscript out of range")
+        table = FakeDispatch()
+        table.Name = name
+        return table
+
+
+class FakeSheet(FakeDispatch):
+    def __init__(self, name, tables):
+        self.Name = name
+        self.ListObjects = FakeListObjects(tables)
+
+
+class FakeSheets(FakeDispatch):
+    def __init__(self, sheets):
+        self.sheets = sheets
+
+    def __iter__(self):
+        return iter(self.sheets)
+
+
+class FakeApplication(FakeDispatch):
+    def __init__(self):
+        self.Sheets = FakeSheets([FakeSheet("A", []), FakeSheet("B", []), FakeSheet("C", ["Sales"])])
+        self.ScreenUpdating = True
+
+    def Calculate(self):
+        return None
+
+
+def _stats(profiler):
+    return {member: (kind, count) for member, (kind, count, _, _) in profiler.stats.items()}
+
+
+def test_records_n_plus_one_probing():
+    profiler = ComProfiler()
+    xl = ComProxy(FakeApplication(), profiler)
+
+    # WindowsEngine.read_table과 같은 시트별 테이블 탐색
+    for ws in xl.Sheets:
+        try:
+            ws.ListObjects("Sales")
+            break
+        except Exception:
+            continue
+
+    stats = _stats(profiler)
+    assert stats["Sheets.__iter__"] == ("call", 3)
+    assert stats["Sheets[].ListObjects"] == ("get", 3)
+    assert stats["ListObjects()"] == ("call", 3)
+
+
+def test_records_get_set_and_method_calls():
+    profiler = ComProfiler()
+    xl = ComProxy(FakeApplication(), profiler)
+
+    xl.ScreenUpdating = False
+    assert xl.ScreenUpdating is False
+    xl.Calculate()
+
+    stats = _stats(profiler)
+    assert stats["Application.ScreenUpdating"][1] == 2
+    assert stats["Application.Calculate"] == ("call", 1)
+
+
+def test_summary_shape():
+    profiler = ComProfiler()
+    xl = ComProxy(FakeApplication(), profiler)
+    for _ in range(5):
+        xl.Calculate()
+
+    summary = profiler.summary(top_n=1)
+
+    assert summary["com_calls"] == 5
+    assert summary["most_called_members"][0]["member"] == "Application.Calculate"
+    assert len(summary["slowest_members"]) == 1
+    assert summary["wall_time_ms"] >= summary["com_time_ms"]
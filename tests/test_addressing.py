@@ -0,0 +1,112 @@
+"""
+셀 주소 변환 테스트 (excel/addressing, scripts/benchmark_addressing.py)
+"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyhub_office_automation.excel import addressing
+from pyhub_office_automation.excel.addressing import (
+    addresses_to_coords_batch,
+    check_range_overlap,
+    column_letter,
+    coords_to_addresses_batch,
+    coords_to_excel_address,
+    excel_address_to_coords,
+    parse_excel_range,
+    parse_ranges_batch,
+    ranges_overlap_batch,
+)
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_addressing.py"
+
+
+def test_utils_reexports_canonical_functions():
+    from pyhub_office_automation.excel import utils
+
+    assert utils.parse_excel_range is parse_excel_range
+    assert utils.coords_to_excel_address is coords_to_excel_address
+
+
+@pytest.mark.parametrize(
+    "address,coords",
+    [
+        ("A1", (1, 1)),
+        ("Z1", (1, 26)),
+        ("AA1", (1, 27)),
+        ("az100", (100, 52)),
+        ("$B$2", (2, 2)),
+        ("XFD1048576", (1048576, 16384)),
+    ],
+)
+def test_scalar_conversion(address, coords):
+    assert excel_address_to_coords(address) == coords
+    assert coords_to_excel_address(*coords) == address.replace("$", "").upper()
+
+
+def test_column_letter_beyond_table():
+    assert column_letter(16384) == "XFD"
+    assert column_letter(16385) == "XFE"
+    with pytest.raises(ValueError):
+        column_letter(0)
+
+
+@pytest.mark.parametrize("address", ["1A", "A", "A1B", "$$A1", "A1$", "가1", "A 1", ""])
+def test_invalid_addresses(address):
+    with pytest.raises(ValueError):
+        excel_address_to_coords(address)
+    with pytest.raises(ValueError, match="잘못된 Excel 주소 형식"):
+        addresses_to_coords_batch(["A1", address])
+
+
+def test_parse_range_and_overlap():
+    assert parse_excel_range("A1:C10") == (1, 1, 10, 3)
+    assert parse_excel_range(" B5 ") == (5, 2, 5, 2)
+    assert check_range_overlap("A1:C10", "B5:D15") is True
+    assert check_range_overlap("A1:C10", "D1:F10") is False
+    assert check_range_overlap("A1:C10", "잘못된 범위") is True
+
+
+def test_batch_round_trip_matches_scalar():
+    rng = np.random.default_rng(1)
+    rows = rng.integers(1, 1_048_577, 5000)
+    cols = rng.integers(1, 16385, 5000)
+
+    addresses = coords_to_addresses_batch(rows, cols)
+    assert addresses.tolist()[:100] == [coords_to_excel_address(r, c) for r, c in zip(rows[:100], cols[:100])]
+
+    coords = addresses_to_coords_batch(addresses)
+    assert coords.dtype == np.int64
+    assert (coords[:, 0] == rows).all() and (coords[:, 1] == cols).all()
+    assert addresses_to_coords_batch(["$b$7", "c3"]).tolist() == [[7, 2], [3, 3]]
+    assert addresses_to_coords_batch([]).shape == (0, 2)
+
+
+def test_parse_ranges_batch_and_overlap_matrix():
+    ranges = ["A1:C10", "B5:D15", "F1:H10", "A20"]
+    parsed = parse_ranges_batch(ranges)
+
+    assert parsed.tolist() == [list(parse_excel_range(r)) for r in ranges]
+    matrix = ranges_overlap_batch(parsed[:, None, :], parsed[None, :, :])
+    expected = [[check_range_overlap(a, b) for b in ranges] for a in ranges]
+    assert matrix.tolist() == expected
+
+
+def test_scalar_results_are_memoized():
+    addressing.excel_address_to_coords.cache_clear()
+    excel_address_to_coords("C3")
+    excel_address_to_coords("C3")
+    assert addressing.excel_address_to_coords.cache_info().hits == 1
+
+
+def test_benchmark_runs():
+    spec = importlib.util.spec_from_file_location("benchmark_addressing", SCRIPT)
+    bench = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bench)
+
+    results = bench.run_benchmark(count=2000)
+    assert [r["batch_ms"] is not None for r in results] == [True, True, True]
+    assert bench.legacy_address_to_coords("AB12") == excel_address_to_coords("AB12")
@@ -0,0 +1,216 @@
+"""
+배치 스크립트 블록 트리 컴파일/실행 테스트 (batch/compiler, batch/executor)
+"""
+
+import time
+
+import pytest
+
+from pyhub_office_automation.batch import executor
+from pyhub_office_automation.batch.compiler import (
+    BulkNode,
+    CommandNode,
+    DirectiveNode,
+    ForeachNode,
+    IfNode,
+    TryNode,
+    compile_script,
+    directive_kind,
+)
+from pyhub_office_automation.batch.control_flow import ConditionEvaluator
+from pyhub_office_automation.batch.executor import LineResult, execute_lines, execute_nodes, parse_script
+from pyhub_office_automation.batch.variables import VariableManager
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    """실행된 명령 기록 (명령 이름이 fail이면 실패)"""
+    executed = []
+
+    def fake_shell_command(line, var_manager, mode="unified"):
+        resolved = " ".join(var_manager.resolve(token) for token in [line.command] + line.args)
+        executed.append(resolved)
+        return LineResult(line_number=line.line_number, command=line.content, success=line.command != "fail")
+
+    monkeypatch.setattr(executor, "execute_shell_command", fake_shell_command)
+    return executed
+
+
+def _compile(tmp_path, text):
+    path = tmp_path / "script.oas"
+    path.write_text(text, encoding="utf-8")
+    return compile_script(parse_script(str(path)))
+
+
+def _run(tmp_path, text, continue_on_error=False, variables=None):
+    var_manager = VariableManager(initial_vars=variables or {})
+    nodes = _compile(tmp_path, text)
+    return execute_nodes(nodes, var_manager, ConditionEvaluator(var_manager), continue_on_error=continue_on_error)
+
+
+def test_tree_structure(tmp_path):
+    nodes = _compile(
+        tmp_path,
+        "# comment\n"
+        "@set X = 1\n"
+        "@if ${X} == 1\n"
+        "  cmd a\n"
+        "@elif ${X} == 2\n"
+        "  @foreach f in a b\n"
+        "    cmd ${f}\n"
+        "  @endforeach\n"
+        "@else\n"
+        "  cmd c\n"
+        "@endif\n"
+        "@try\n"
+        "  cmd d\n"
+        "@catch\n"
+        "  cmd e\n"
+        "@finally\n"
+        "  @bulk\n"
+        "    cmd f\n"
+        "  @endbulk\n"
+        "@endtry\n",
+    )
+
+    assert [type(node) for node in nodes] == [DirectiveNode, IfNode, TryNode]
+    assert nodes[0].kind == "set"
+
+    if_node = nodes[1]
+    assert [branch.condition for branch in if_node.branches] == ["${X} == 1", "${X} == 2", None]
+    assert if_node.end_line.line_number == 11
+    loop = if_node.branches[1].body[0]
+    assert isinstance(loop, ForeachNode) and (loop.var_name, loop.list_expr) == ("f", "a b")
+    assert isinstance(loop.body[0], CommandNode)
+
+    try_node = nodes[2]
+    assert len(try_node.body) == len(try_node.catch_body) == 1
+    assert isinstance(try_node.finally_body[0], BulkNode)
+
+
+@pytest.mark.parametrize(
+    "content,kind",
+    [("@set X = 1", "set"), ("@unset X", "unset"), ("@echo hi", "echo"), ("@export X = 1", "export"), ("@while x", None)],
+)
+def test_directive_kind(content, kind):
+    assert directive_kind(content) == kind
+
+
+@pytest.mark.parametrize(
+    "text,message",
+    [
+        ("@if true\ncmd a\n", "No matching @endif found for @if at line 1"),
+        ("@foreach x in a\n@if true\n@endforeach\n@endif\n", "@endforeach closes @foreach at line 1"),
+        ("@if true\n@else\n@elif false\n@endif\n", "@elif after @else"),
+        ("@try\n@finally\n@catch\n@endtry\n", "unexpected @catch"),
+        ("@foreach x\n@endforeach\n", "Invalid @foreach directive"),
+    ],
+)
+def test_compile_errors(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        _compile(tmp_path, text)
+
+
+def test_validate_command_reports_compile_errors(tmp_path):
+    from typer.testing import CliRunner
+
+    from pyhub_office_automation.cli.main import app
+
+    path = tmp_path / "script.oas"
+    path.write_text("@if true\ncmd a\n", encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["batch", "validate", str(path)])
+
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Validation failed" in result.stderr
+    assert "No matching @endif found for @if at line 1" in result.stderr
+
+
+def test_stray_block_keywords_are_ignored(tmp_path):
+    nodes = _compile(tmp_path, "@endif\n@else\n@catch\ncmd a\n@endforeach\n")
+    assert [type(node) for node in nodes] == [CommandNode]
+
+
+def test_if_elif_else_execution(tmp_path, commands):
+    script = "@if ${X} == 1\ncmd one\n@elif ${X} == 2\ncmd two\n@else\ncmd other\n@endif\ncmd after\n"
+    for value, expected in (("1", "cmd one"), ("2", "cmd two"), ("3", "cmd other")):
+        commands.clear()
+        _run(tmp_path, script, variables={"X": value})
+        assert commands == [expected, "cmd after"]
+
+
+def test_nested_foreach_sets_and_clears_loop_variables(tmp_path, commands):
+    var_manager = VariableManager()
+    lines_path = tmp_path / "loop.oas"
+    lines_path.write_text(
+        "@foreach a in x y\n@foreach b in 1 2\ncmd ${a}${b} ${__LOOP_INDEX__}\n@endforeach\n@endforeach\n",
+        encoding="utf-8",
+    )
+
+    results, end = execute_lines(parse_script(str(lines_path)), var_manager)
+
+    assert commands == ["cmd x1 0", "cmd x2 1", "cmd y1 0", "cmd y2 1"]
+    assert len(results) == 4 and end == 5
+    assert "a" not in var_manager.variables and "__LOOP_INDEX__" not in var_manager.variables
+
+
+def test_failure_stops_current_body_only(tmp_path, commands):
+    # 실패하면 현재 블록(반복 본문)의 나머지만 건너뛰고 바깥 실행은 계속됨
+    results = _run(tmp_path, "@foreach i in 1 2\nfail ${i}\ncmd ${i}\n@endforeach\ncmd end\n")
+    assert commands == ["fail 1", "fail 2", "cmd end"]
+    assert [r.success for r in results] == [False, False, True]
+
+    commands.clear()
+    _run(tmp_path, "fail\ncmd never\n")
+    assert commands == ["fail"]
+
+    commands.clear()
+    _run(tmp_path, "fail\ncmd next\n", continue_on_error=True)
+    assert commands == ["fail", "cmd next"]
+
+
+def test_bulk_failure_stops_parent(tmp_path, commands, monkeypatch):
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    from pyhub_office_automation.excel.engines import reset_engine
+
+    reset_engine()
+    try:
+        _run(tmp_path, "@bulk\nfail\ncmd skipped\n@endbulk\ncmd after\n")
+    finally:
+        reset_engine()
+    assert commands == ["fail"]
+
+
+def test_try_catch_finally(tmp_path, commands):
+    script = "@try\n{first}\ncmd second\n@catch\ncmd caught\n@finally\ncmd cleanup\n@endtry\n"
+
+    _run(tmp_path, script.format(first="fail"))
+    assert commands == ["fail", "cmd second", "cmd caught", "cmd cleanup"]
+
+    commands.clear()
+    _run(tmp_path, script.format(first="cmd first"))
+    assert commands == ["cmd first", "cmd second", "cmd cleanup"]
+
+
+def test_directives_and_unknown_directive(tmp_path, commands):
+    results = _run(tmp_path, "@set NAME = world\n@while true\ncmd hello ${NAME}\n@unset NAME\n")
+
+    assert commands == ["cmd hello world"]
+    assert all(r.success for r in results)
+    assert results[1].output.startswith("Unknown directive")
+
+
+def test_large_generated_script_is_linear(tmp_path, commands):
+    # 반복 본문에 중첩 블록이 많은 10,000줄 이상 스크립트
+    body = "".join(f"@if ${{i}} == {n}\ncmd hit {n}\n@else\ncmd miss\n@endif\n" for n in range(2500))
+    script = "@foreach i in 0 1 2 3\n" + body + "@endforeach\n"
+
+    started = time.perf_counter()
+    nodes = _compile(tmp_path, script)
+    assert time.perf_counter() - started < 1.0
+    assert len(nodes[0].body) == 2500
+
+    results = _run(tmp_path, script)
+    assert len(results) == 4 * 2500
+    assert commands.count("cmd miss") == 4 * 2499
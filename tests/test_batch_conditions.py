@@ -0,0 +1,104 @@
+"""
+배치 조건식 컴파일/평가 테스트 (batch/control_flow.compile_condition, ConditionEvaluator)
+"""
+
+import pytest
+
+from pyhub_office_automation.batch.compiler import compile_script
+from pyhub_office_automation.batch.control_flow import ConditionEvaluator, compile_condition
+from pyhub_office_automation.batch.executor import parse_script
+from pyhub_office_automation.batch.variables import VariableManager
+
+
+@pytest.fixture
+def evaluator(tmp_path):
+    existing = tmp_path / "input.xlsx"
+    existing.write_bytes(b"")
+    var_manager = VariableManager(
+        initial_vars={"AGE": "25", "LICENSE": "true", "EMPTY": "", "PHRASE": "a and b", "OP": "==", "FILE": str(existing)}
+    )
+    return ConditionEvaluator(var_manager)
+
+
+@pytest.mark.parametrize(
+    "condition,expected",
+    [
+        ("true", True),
+        ("FALSE", False),
+        ("0", False),
+        ("${EMPTY}", False),
+        ("${AGE}", True),
+        ('${AGE} >= 18 and ${LICENSE} == "true"', True),
+        ("${AGE} == 25.0", True),
+        ("${AGE} < 3", False),
+        ("'x' != \"x\"", False),
+        ("hello world == hello world", True),
+        ('exists("${FILE}")', True),
+        ("exists(${FILE})", True),
+        ('not exists("${FILE}.missing")', True),
+        # 우선순위: not > and > or
+        ("true or false and false", True),
+        ("(true or false) and false", False),
+        ("not false and false", False),
+        ("not (false and false)", True),
+    ],
+)
+def test_evaluate(evaluator, condition, expected):
+    assert evaluator.evaluate(condition) is expected
+
+
+def test_variable_values_are_not_parsed(evaluator):
+    # 값에 포함된 연산자/키워드는 조건식 구조가 아니라 값으로 비교됨
+    assert evaluator.evaluate('${PHRASE} == "a and b"')
+    assert not evaluator.evaluate("${PHRASE} == a")
+    assert evaluator.evaluate("${OP} == ${OP}")
+    assert evaluator.evaluate("${OP}")
+
+
+def test_short_circuit(evaluator):
+    # 오른쪽 식은 평가되지 않음 (문자열 > 비교는 평가되면 ValueError)
+    assert evaluator.evaluate("true or abc > x")
+    assert not evaluator.evaluate("false and abc > x")
+    with pytest.raises(ValueError, match="String comparison only supports"):
+        evaluator.evaluate("abc > x")
+
+
+def test_compiled_condition_binds_variables_lazily():
+    condition = compile_condition("${i} == 2")
+    assert compile_condition("${i} == 2") is condition
+
+    var_manager = VariableManager()
+    evaluator = ConditionEvaluator(var_manager)
+    results = []
+    for i in range(4):
+        var_manager.set("i", str(i))
+        results.append(evaluator.evaluate(condition))
+    assert results == [False, False, True, False]
+
+
+@pytest.mark.parametrize(
+    "condition,message",
+    [
+        ("(true", "Expected '\\)', found end of condition"),
+        ("true)", "Unexpected '\\)'"),
+        ("${A} ==", "Expected a value"),
+        ('a == "b', "Unterminated string"),
+        ("and", "Expected a value, found 'and'"),
+        ("()", "Expected a value, found '\\)'"),
+    ],
+)
+def test_invalid_conditions(condition, message):
+    with pytest.raises(ValueError, match=message):
+        compile_condition(condition)
+
+
+def test_conditions_are_compiled_with_the_script(tmp_path):
+    path = tmp_path / "script.oas"
+    path.write_text("@if true\ncmd a\n@elif (x\ncmd b\n@endif\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid condition: \\(x"):
+        compile_script(parse_script(str(path)))
+
+    path.write_text("@if ${X} == 1\ncmd a\n@else\ncmd b\n@endif\n", encoding="utf-8")
+    branches = compile_script(parse_script(str(path)))[0].branches
+    assert branches[0].test is compile_condition("${X} == 1") and branches[1].test is None
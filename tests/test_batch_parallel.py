@@ -0,0 +1,196 @@
+"""
+배치 스크립트 병렬 실행 테스트 (@parallel, @foreach ... parallel=N, batch/parallel)
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from pyhub_office_automation.batch import executor
+from pyhub_office_automation.batch.compiler import ForeachNode, ParallelNode, compile_script
+from pyhub_office_automation.batch.control_flow import ConditionEvaluator, split_parallel_option
+from pyhub_office_automation.batch.executor import LineResult, execute_nodes, parse_script
+from pyhub_office_automation.batch.parallel import WorkerPool, current_pool
+from pyhub_office_automation.batch.variables import VariableManager
+from pyhub_office_automation.excel.engines import reset_engine
+
+
+@pytest.fixture(autouse=True)
+def headless_engine(monkeypatch):
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    monkeypatch.setenv("OA_RESULT_CACHE", "0")
+    reset_engine()
+    yield
+    reset_engine()
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    """실행된 명령 기록 (명령 이름이 fail이면 실패, sleep이면 첫 인자(ms)만큼 대기)"""
+    executed = []
+    lock = threading.Lock()
+
+    def fake_shell_command(line, var_manager, mode="unified"):
+        tokens = [var_manager.resolve(token) for token in [line.command] + line.args]
+        if tokens[0] == "sleep":
+            time.sleep(int(tokens[1]) / 1000)
+        with lock:
+            executed.append(" ".join(tokens))
+        return LineResult(line_number=line.line_number, command=" ".join(tokens), success=tokens[0] != "fail")
+
+    monkeypatch.setattr(executor, "execute_shell_command", fake_shell_command)
+    return executed
+
+
+def _compile(tmp_path, text):
+    path = tmp_path / "script.oas"
+    path.write_text(text, encoding="utf-8")
+    return compile_script(parse_script(str(path)))
+
+
+def _run(tmp_path, text, continue_on_error=False, var_manager=None):
+    var_manager = var_manager or VariableManager()
+    nodes = _compile(tmp_path, text)
+    return execute_nodes(nodes, var_manager, ConditionEvaluator(var_manager), continue_on_error=continue_on_error)
+
+
+def test_compile_parallel_blocks(tmp_path):
+    nodes = _compile(
+        tmp_path,
+        "@foreach f in a b c parallel=3\ncmd ${f}\n@endforeach\n"
+        "@parallel\ncmd x\n@if true\ncmd y\n@endif\n@endparallel\n"
+        "@parallel 2\ncmd z\n@endparallel\n",
+    )
+
+    assert isinstance(nodes[0], ForeachNode) and (nodes[0].list_expr, nodes[0].parallel) == ("a b c", 3)
+    assert isinstance(nodes[1], ParallelNode) and nodes[1].workers is None and len(nodes[1].body) == 2
+    assert nodes[2].workers == 2
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["@parallel 0\n@endparallel\n", "@parallel two\n@endparallel\n", "@foreach f in a parallel=-1\n@endforeach\n"],
+)
+def test_invalid_worker_count(tmp_path, text):
+    with pytest.raises(ValueError, match="Invalid worker count"):
+        _compile(tmp_path, text)
+
+
+def test_split_parallel_option():
+    assert split_parallel_option('["a b", "c"] parallel=4') == ('["a b", "c"]', 4)
+    assert split_parallel_option("a b c") == ("a b c", 1)
+
+
+def test_results_follow_script_order(tmp_path, commands):
+    # 늦게 시작한 항목이 먼저 끝나도 결과는 항목 순서
+    results = _run(tmp_path, "@foreach ms in 200 100 0 parallel=3\nsleep ${ms} ${__LOOP_INDEX__}\n@endforeach\ncmd after\n")
+
+    assert [r.command for r in results] == ["sleep 200 0", "sleep 100 1", "sleep 0 2", "cmd after"]
+    assert commands[:3] == ["sleep 0 2", "sleep 100 1", "sleep 200 0"]
+
+
+def test_units_use_variable_copies(tmp_path, commands):
+    var_manager = VariableManager(initial_vars={"X": "outer"})
+    script = "@parallel 2\n@set X = one\n@foreach i in 1 2\n@set X = ${X}${i}\n@endforeach\n@endparallel\ncmd ${X}\n"
+
+    _run(tmp_path, script, var_manager=var_manager)
+
+    assert commands == ["cmd outer"]
+    assert var_manager.variables == {"X": "outer"}
+
+
+def test_parallel_failure_stops_parent(tmp_path, commands):
+    _run(tmp_path, "@parallel 2\nfail\ncmd sibling\n@endparallel\ncmd after\n")
+    assert sorted(commands) == ["cmd sibling", "fail"]
+
+    commands.clear()
+    _run(tmp_path, "@parallel 2\nfail\n@endparallel\ncmd after\n", continue_on_error=True)
+    assert commands[-1] == "cmd after"
+
+    # 병렬 @foreach는 순차 @foreach처럼 반복마다 본문만 중단
+    commands.clear()
+    _run(tmp_path, "@foreach i in 1 2 parallel=2\nfail ${i}\ncmd ${i}\n@endforeach\ncmd after\n")
+    assert sorted(commands) == ["cmd after", "fail 1", "fail 2"]
+
+
+def test_resource_keys(tmp_path):
+    pool = WorkerPool(2)
+    path = str(tmp_path / "a.xlsx")
+
+    key, file_based = pool.resource_key(["excel", "range-read", "--file-path", path, "--range", "A1"])
+    assert file_based and key == os.path.normcase(os.path.abspath(path))
+    assert pool.resource_key(["excel", "range-read", "--workbook-name", "a.xlsx"]) == ("app:excel", False)
+    assert pool.resource_key(["ppt", "slide-list", "--file-path", "a.pptx", "--backend", "com"]) == ("app:ppt", False)
+    assert pool.resource_key(["version"]) == (None, False)
+    assert pool.resource_key(["excel", "no-such-command"]) == (None, False)
+
+
+def test_app_bound_commands_run_on_owner_thread(tmp_path):
+    owner = threading.get_ident()
+    threads = []
+
+    def run_local(argv):
+        threads.append(threading.get_ident())
+        return 0, "", None
+
+    # 실행 중인 Office 앱을 쓰는 명령어는 블록을 시작한 스레드에서 하나씩 실행
+    with WorkerPool(3) as pool:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=3) as unit_threads:
+            futures = [
+                unit_threads.submit(pool.run, ["excel", "range-read", "--workbook-name", f"{n}.xlsx"], run_local)
+                for n in range(3)
+            ]
+            pool.wait(futures)
+
+    assert [future.result() for future in futures] == [(0, "", None)] * 3
+    assert threads == [owner] * 3
+    assert current_pool() is None
+
+
+def test_file_commands_run_in_worker_processes(tmp_path):
+    import openpyxl
+
+    files = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.xlsx"
+        openpyxl.Workbook().save(path)
+        files.append(str(path))
+
+    var_manager = VariableManager(initial_vars={"A": files[0], "B": files[1]})
+    script = (
+        "@foreach f in ${A} ${B} parallel=2\n"
+        "excel range-write --file-path ${f} --range A1 --data [[${__LOOP_INDEX__}]]\n"
+        "excel range-read --file-path ${f} --range A1\n"
+        "@endforeach\n"
+        "excel range-read --file-path ${B} --range A1\n"
+    )
+
+    results = _run(tmp_path, script, var_manager=var_manager)
+
+    assert all(r.success for r in results), [r.error or r.output for r in results]
+    assert [r.data["data"]["values"] for r in results[1::2]] == [0, 1]
+    # 블록이 끝나면 작업 프로세스가 바꾼 파일을 현재 프로세스에서 다시 읽음
+    assert results[-1].data["data"]["values"] == 1
+    assert [openpyxl.load_workbook(path).active["A1"].value for path in files] == [0, 1]
+
+
+def test_bulk_session_in_unit_runs_on_owner_thread(tmp_path, commands, monkeypatch):
+    from pyhub_office_automation.excel.engines.headless import HeadlessEngine
+
+    owner = threading.get_ident()
+    calls = []
+    monkeypatch.setattr(HeadlessEngine, "begin_bulk", lambda self: calls.append(("begin", threading.get_ident())) or {})
+    monkeypatch.setattr(
+        HeadlessEngine, "end_bulk", lambda self, state, recalculate=True: calls.append(("end", threading.get_ident()))
+    )
+
+    results = _run(tmp_path, "@foreach f in a b parallel=2\n@bulk\ncmd ${f}\n@endbulk\n@endforeach\n")
+
+    assert [r.command for r in results] == ["cmd a", "cmd b"]
+    kinds = [kind for kind, _ in calls]
+    assert kinds and kinds.count("begin") == kinds.count("end")
+    assert {thread for _, thread in calls} == {owner}
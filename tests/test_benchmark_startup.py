@@ -0,0 +1,46 @@
+"""
+scripts/benchmark_startup.py 테스트
+importtime 출력 파싱과 기준값 대비 회귀 판정 검증
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_startup.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("benchmark_startup", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | _io
+import time:       200 |       1500 |   typer.core
+import time:      1000 |       2500 | typer
+import time:       300 |      30000 | pandas
+noise line
+"""
+
+
+def test_parse_importtime_sums_top_level(bench):
+    import_ms, top = bench.parse_importtime(IMPORTTIME_OUTPUT, top_n=2)
+
+    assert import_ms == 32.6
+    assert top == {"pandas": 30.0, "typer": 2.5}
+
+
+def test_find_regressions_scales_by_python_startup(bench):
+    baseline = {"python_startup_ms": 50, "commands": {"--help": {"wall_ms": 200, "import_ms": 100}}}
+    current = {"python_startup_ms": 100, "commands": {"--help": {"wall_ms": 500, "import_ms": 400}, "new": {"wall_ms": 1}}}
+
+    regressions = bench.find_regressions(current, baseline, threshold=0.5, slack_ms=50)
+
+    # 인터프리터가 2배 느린 머신: wall 허용치 200×2×1.5+50=650, import 허용치 100×2×1.5+50=350
+    assert [(r["command"], r["metric"]) for r in regressions] == [("--help", "import_ms")]
@@ -0,0 +1,63 @@
+"""
+CLI 명령어 지연 로딩 테스트
+command_manifest 항목과 실제 명령어의 일치 여부, --help가 명령어 모듈을 import하지 않는지 검증
+"""
+
+import importlib
+import inspect
+import subprocess
+import sys
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from pyhub_office_automation.cli.command_manifest import EMAIL_COMMANDS, EXCEL_COMMANDS, PPT_COMMANDS, ROOT_COMMANDS
+from pyhub_office_automation.cli.main import app
+
+ALL_ENTRIES = ROOT_COMMANDS + EXCEL_COMMANDS + PPT_COMMANDS + EMAIL_COMMANDS
+
+HEAVY_MODULES = ["pandas", "xlwings", "folium", "keyring", "pptx", "prompt_toolkit"]
+
+
+def _loaded_modules_after(args):
+    """새 프로세스에서 CLI를 실행한 뒤 로드된 무거운 모듈 목록"""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from pyhub_office_automation.cli.main import app\n"
+        f"result = CliRunner().invoke(app, {args!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 0, result.stderr
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+@pytest.mark.parametrize("name,target,help_text", ALL_ENTRIES, ids=[entry[1] for entry in ALL_ENTRIES])
+def test_manifest_matches_command(name, target, help_text):
+    """매니페스트 도움말이 실제 명령어 docstring 첫 단락과 같아야 함"""
+    module_name, _, attr = target.partition(":")
+    obj = getattr(importlib.import_module(module_name), attr)
+
+    if isinstance(obj, typer.Typer):
+        actual = obj.info.help
+    else:
+        actual = (inspect.getdoc(obj) or "").split("\n\n")[0].strip()
+
+    assert help_text == actual
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--version"], ["excel", "--help"], ["ppt", "--help"]])
+def test_help_does_not_import_command_modules(args):
+    assert _loaded_modules_after(args) == []
+
+
+def test_command_is_loaded_on_invocation():
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["excel", "session", "--help"])
+
+    assert result.exit_code == 0
+    assert "begin" in result.output
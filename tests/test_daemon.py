@@ -0,0 +1,197 @@
+"""
+oa 데몬(`oa serve`) 테스트
+headless 엔진으로 Linux에서도 실제 소켓/JSON-RPC 경로를 검증
+"""
+
+import json
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from pyhub_office_automation.cli.main import app
+from pyhub_office_automation.daemon import client as daemon_client
+from pyhub_office_automation.daemon.client import DaemonClient, forward_to_daemon, should_forward
+from pyhub_office_automation.daemon.server import DaemonServer
+from pyhub_office_automation.daemon.state import read_state
+from pyhub_office_automation.excel.engines import reset_engine
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix 소켓 기반 테스트")
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    path = tmp_path / "daemon.json"
+    monkeypatch.setenv("OA_DAEMON_STATE", str(path))
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    return path
+
+
+@pytest.fixture
+def server(state_file):
+    server = DaemonServer(state_file=state_file, idle_timeout=0)
+    server.start()
+    yield server
+    server.shutdown()
+    reset_engine()
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["이름", "값"])
+    ws.append(["가", 1])
+    ws.append(["나", 2])
+    path = tmp_path / "sample.xlsx"
+    wb.save(path)
+    return path
+
+
+def test_health_reports_state(server, state_file):
+    state = read_state(state_file)
+
+    with DaemonClient.connect(state) as client:
+        health = client.call("health")
+
+    assert health["status"] == "ok"
+    assert health["pid"] == state.pid
+    assert health["active_requests"] == 0
+    assert oct(state_file.stat().st_mode & 0o777) == "0o600"
+
+
+def test_run_matches_local_execution(server, workbook_path):
+    argv = ["excel", "range-read", "--file-path", str(workbook_path), "--range", "A1:B3"]
+
+    with DaemonClient.connect() as client:
+        first = client.run(argv)
+        second = client.run(argv)
+        health = client.call("health")
+    local = CliRunner().invoke(app, argv)
+
+    assert first["exit_code"] == 0, first["stderr"]
+    assert json.loads(first["stdout"])["data"] == json.loads(local.stdout)["data"]
+    assert json.loads(second["stdout"])["data"] == json.loads(first["stdout"])["data"]
+    assert health["engine"] == "HeadlessEngine"
+
+
+def test_run_uses_client_cwd(server, workbook_path, tmp_path):
+    with DaemonClient.connect() as client:
+        result = client.run(["excel", "range-read", "--file-path", workbook_path.name, "--range", "A2"], cwd=str(tmp_path))
+
+    assert result["exit_code"] == 0, result["stderr"]
+
+
+def test_run_replaces_engine_after_excel_disconnects(state_file):
+    from pyhub_office_automation.daemon.server import run_cli
+    from pyhub_office_automation.excel import engines
+    from pyhub_office_automation.excel.engines.windows import WindowsEngine
+
+    class DisconnectedApplication:
+        """Excel이 종료된 뒤의 COM 객체 (모든 호출이 RPC_S_SERVER_UNAVAILABLE)"""
+
+        constants = None
+
+        def __getattr__(self, name):
+            raise OSError(-2147023174, "The RPC server is unavailable.")
+
+    engines.reset_engine()
+    engines.get_engine()
+    alive = engines._engine_instance
+    assert not engines.release_stale_engine()
+
+    engines._engine_instance = WindowsEngine(application=DisconnectedApplication())
+    try:
+        result = run_cli(["version"], env={"OA_EXCEL_ENGINE": "headless"})
+
+        assert result["exit_code"] == 0
+        assert engines._engine_instance is None
+        assert type(engines.get_engine()) is type(alive)
+    finally:
+        engines.reset_engine()
+
+
+def test_run_replaces_engine_when_engine_env_changes(state_file, monkeypatch):
+    from pyhub_office_automation.daemon.server import run_cli
+    from pyhub_office_automation.excel import engines
+
+    monkeypatch.delenv("OA_EXCEL_ENGINE")
+    engines.reset_engine()
+    engines.get_engine(force_platform="Headless")
+    try:
+        run_cli(["version"], env={"OA_EXCEL_ENGINE": "headless"})
+        assert engines._engine_instance is not None
+
+        run_cli(["version"], env={"OA_EXCEL_ENGINE": "macos"})
+        assert engines._engine_instance is None
+    finally:
+        engines.reset_engine()
+
+
+def test_wrong_authkey_is_rejected(server, state_file):
+    state = read_state(state_file)
+    state.authkey = "00" * 32
+
+    with pytest.raises(ConnectionError):
+        DaemonClient.connect(state)
+
+
+def test_unknown_method_returns_error(server):
+    with DaemonClient.connect() as client:
+        with pytest.raises(daemon_client.DaemonError) as exc_info:
+            client.call("missing")
+
+    assert exc_info.value.code == -32601
+
+
+def test_idle_timeout_stops_server(state_file):
+    server = DaemonServer(state_file=state_file, idle_timeout=0.2)
+    server.start()
+
+    assert server.wait(5)
+    assert not state_file.exists()
+
+
+def test_forward_to_daemon_writes_output(server, capsys):
+    exit_code = forward_to_daemon(["version"])
+
+    assert exit_code == 0
+    assert "pyhub-office-automation version" in capsys.readouterr().out
+
+
+def test_forward_skips_daemon_of_other_version(server, state_file):
+    from dataclasses import asdict
+
+    state = read_state(state_file)
+    state.version = "0.0.0"
+    state_file.write_text(json.dumps(asdict(state)), encoding="utf-8")
+
+    assert forward_to_daemon(["version"]) is None
+    assert server.wait(5)
+
+
+def test_forward_falls_back_without_daemon(state_file):
+    assert forward_to_daemon(["version"]) is None
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        (["excel", "range-read"], True),
+        (["--version"], False),
+        (["serve"], False),
+        (["excel", "shell"], False),
+        (["email", "accounts"], False),
+    ],
+)
+def test_should_forward(argv, expected, monkeypatch):
+    monkeypatch.delenv("OA_DAEMON", raising=False)
+    assert should_forward(argv) is expected
+
+
+def test_daemon_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("OA_DAEMON", "0")
+    assert should_forward(["excel", "range-read"]) is False
@@ -0,0 +1,132 @@
+"""
+배치 명령어 직접 호출 테스트 (cli/dispatch, utils/json_output.capture_json, scripts/benchmark_batch_dispatch.py)
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from pyhub_office_automation.batch.executor import BatchLine, execute_shell_command, format_output
+from pyhub_office_automation.batch.variables import VariableManager
+from pyhub_office_automation.cli.dispatch import dispatch, get_spec
+from pyhub_office_automation.cli.main import app
+from pyhub_office_automation.excel.engines import reset_engine
+from pyhub_office_automation.utils.json_output import ByteCounter, capture_json, echo_json
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_batch_dispatch.py"
+
+
+@pytest.fixture(autouse=True)
+def headless_engine(monkeypatch):
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    monkeypatch.setenv("OA_RESULT_CACHE", "0")
+    reset_engine()
+    yield
+    reset_engine()
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    import openpyxl
+
+    path = tmp_path / "data.xlsx"
+    wb = openpyxl.Workbook()
+    for row in range(1, 6):
+        wb.active.append([row, row * 10, f"item{row}"])
+    wb.save(path)
+    return str(path)
+
+
+def test_spec_parses_options_flags_and_inline_values():
+    spec = get_spec("excel", "range-read")
+
+    opts = spec.parse(["--file-path", "a.xlsx", "--range=A1:B2", "--no-header"])
+    assert opts == {"file_path": "a.xlsx", "range_str": "A1:B2", "header": False}
+    assert spec.parse(["--range", "A1", "--range", "B2"])["range_str"] == "B2"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--help"], ["--unknown", "x"], ["--range"], ["--no-header=1"], ["extra"]],
+)
+def test_spec_declines_unsupported_argv(args):
+    assert get_spec("excel", "range-read").parse(args) is None
+
+
+def test_unknown_commands_are_not_dispatched():
+    assert dispatch(["version"]) is None
+    assert dispatch(["batch", "run", "x.oas"]) is None
+    assert dispatch(["excel", "no-such-command"]) is None
+    assert dispatch(["excel", "range-read", "--help"]) is None
+
+
+def test_dispatch_returns_response_object(workbook):
+    argv = ["excel", "range-read", "--file-path", workbook, "--range", "A1:C2"]
+
+    result = dispatch(argv)
+
+    assert result.exit_code == 0
+    assert result.stdout == ""
+    assert result.data["data"]["values"] == [[1, 10, "item1"], [2, 20, "item2"]]
+    # ByteCounter 값은 compact JSON 기준 크기로 채워짐
+    assert result.data["operation_stats"]["data_size_bytes"] == len(
+        json.dumps(result.data["data"]["values"], separators=(",", ":"))
+    )
+
+    cli = CliRunner().invoke(app, argv)
+    expected = json.loads(cli.stdout)
+    assert result.data["data"]["values"] == expected["data"]["values"]
+
+
+def test_dispatch_reports_errors(tmp_path):
+    result = dispatch(["excel", "range-read", "--file-path", str(tmp_path / "missing.xlsx"), "--range", "A1"])
+    assert result.exit_code == 1
+    assert "FileNotFoundError" in result.stderr
+
+    # 필수 옵션 누락은 click 매개변수 처리에서 검사
+    result = dispatch(["excel", "range-read", "--file-path", str(tmp_path / "missing.xlsx")])
+    assert result.exit_code == 2
+    assert "range" in result.stderr
+
+
+def test_capture_json_collects_responses(capsys):
+    counter = ByteCounter()
+    with capture_json() as responses:
+        echo_json({"values": counter.measure([[1, 2]]), "size": counter})
+        with capture_json(active=False):
+            echo_json({"printed": True})
+        echo_json({"error": True}, err=True)
+
+    assert responses == [{"values": [[1, 2]], "size": 7}]
+    captured = capsys.readouterr()
+    assert '"printed"' in captured.out and '"error"' in captured.err
+
+
+def test_batch_line_uses_dispatch_and_falls_back(workbook):
+    var_manager = VariableManager(initial_vars={"FILE": workbook})
+    line = BatchLine(
+        line_number=1, content="", command="excel", args=["range-read", "--file-path", "${FILE}", "--range", "A1"]
+    )
+
+    result = execute_shell_command(line, var_manager)
+    assert result.success
+    assert result.data["data"]["values"] == 1
+    assert '"range-read"' in format_output(result)
+
+    fallback = execute_shell_command(BatchLine(line_number=2, content="version", command="version"), var_manager)
+    assert fallback.success and fallback.data is None
+    assert "version" in fallback.output
+
+
+def test_benchmark_runs(monkeypatch):
+    # 스크립트가 import 시 설정하는 환경 변수를 테스트 후 되돌림
+    monkeypatch.setenv("BUILD_NUMBER", "0")
+    spec = importlib.util.spec_from_file_location("benchmark_batch_dispatch", SCRIPT)
+    bench = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bench)
+
+    results = bench.run_benchmark(lines=3)
+    assert [r["path"] for r in results] == ["CliRunner.invoke", "dispatch", "command only"]
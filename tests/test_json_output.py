@@ -0,0 +1,88 @@
+"""
+JSON 응답 출력 테스트 (utils/json_output)
+"""
+
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from pyhub_office_automation.cli.main import app
+from pyhub_office_automation.excel.engines import reset_engine
+from pyhub_office_automation.utils import json_output
+from pyhub_office_automation.utils.json_output import ByteCounter, dumps, is_pretty, iter_json, write_json
+
+SAMPLES = [
+    {},
+    [],
+    {"success": True, "data": {"values": [[1, "가"], [None, 2.5]], "empty": [], "nested": {"a": {}}}},
+    [[["deep"]], {"k": [1, 2]}, "줄\n바꿈"],
+    "scalar",
+]
+
+
+class _TTY(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+def test_chunks_match_json_dumps(obj):
+    assert "".join(iter_json(obj, pretty=True)) == json.dumps(obj, ensure_ascii=False, indent=2)
+    assert "".join(iter_json(obj, pretty=False)) == json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_stdlib_backend_when_orjson_missing(monkeypatch):
+    monkeypatch.setattr(json_output, "orjson", None)
+    assert dumps({"a": [1]}, pretty=False) == '{"a":[1]}'
+
+
+def test_compact_unless_terminal(monkeypatch):
+    monkeypatch.delenv("OA_JSON_FORMAT", raising=False)
+    assert is_pretty(io.StringIO()) is False
+    assert is_pretty(_TTY()) is True
+
+    monkeypatch.setenv("OA_JSON_FORMAT", "pretty")
+    assert is_pretty(io.StringIO()) is True
+    monkeypatch.setenv("OA_JSON_FORMAT", "compact")
+    assert is_pretty(_TTY()) is False
+
+
+def test_byte_counter_records_written_size():
+    values = [["이름", 1], ["b", 2]]
+    counter = ByteCounter()
+    stream = io.StringIO()
+    written = write_json({"data": {"values": counter.measure(values)}, "stats": {"size": counter}}, stream, pretty=False)
+
+    output = stream.getvalue()
+    assert written == len(output.encode("utf-8"))
+    assert json.loads(output)["stats"]["size"] == len(json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def test_range_read_reports_streamed_size(tmp_path, monkeypatch):
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    for i in range(50):
+        wb.active.append([f"행{i}", i, i * 0.5])
+    path = tmp_path / "book.xlsx"
+    wb.save(path)
+
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    monkeypatch.setenv("OA_RESULT_CACHE", "0")
+    monkeypatch.delenv("OA_JSON_FORMAT", raising=False)
+    reset_engine()
+    try:
+        result = CliRunner().invoke(app, ["excel", "range-read", "--file-path", str(path), "--range", "A1:C50"])
+    finally:
+        reset_engine()
+
+    assert result.exit_code == 0
+    assert result.stdout.count("\n") == 1  # 터미널이 아니면 compact
+    response = json.loads(result.stdout)
+    values = response["data"]["values"]
+    assert len(values) == 50
+    assert response["operation_stats"]["data_size_bytes"] == len(
+        json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
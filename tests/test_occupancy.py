@@ -0,0 +1,90 @@
+"""
+시트 점유 영역 인덱스 테스트 (excel/occupancy, find_available_position)
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pyhub_office_automation.excel.occupancy import SheetOccupancy
+from pyhub_office_automation.excel.utils import find_available_position
+
+
+def _brute_force(occupancy, width, height, spacing, preferred_position, limit=80):
+    """모든 후보 셀을 검색 순서대로 검사하는 기준 구현"""
+    bottom, right = occupancy.bounds or (1, 1)
+    if preferred_position == "bottom":
+        order = ((row, col) for row in range(1, limit) for col in range(1, right + 1))
+    else:
+        order = ((row, col) for col in range(1, limit) for row in range(1, bottom + 1))
+    for row, col in order:
+        if not occupancy.overlaps((row, col, row + height - 1, col + width - 1), spacing):
+            return row, col
+
+
+def test_empty_sheet_uses_a1():
+    assert SheetOccupancy().find_free(10, 5, spacing=2) == (1, 1)
+
+
+def test_right_and_bottom_of_data():
+    occupancy = SheetOccupancy([(1, 1, 100, 4)])
+
+    assert occupancy.find_free(10, 5, spacing=2, preferred_position="right") == (1, 7)
+    assert occupancy.find_free(3, 5, spacing=2, preferred_position="bottom") == (103, 1)
+
+
+def test_fills_gap_between_objects():
+    # 데이터 A1:D20, 차트 H1:L10 → 높이 5 객체는 차트 아래(H13)보다 사이 열(F~ 불가)을 먼저 확인
+    occupancy = SheetOccupancy([(1, 1, 20, 4), (1, 8, 10, 12)])
+
+    assert occupancy.find_free(2, 5, spacing=1, preferred_position="right") == (12, 6)
+    assert occupancy.find_free(2, 5, spacing=1, preferred_position="bottom") == (12, 6)
+
+
+@pytest.mark.parametrize("preferred_position", ["right", "bottom"])
+def test_matches_brute_force(preferred_position):
+    rects = [(1, 1, 30, 5), (3, 9, 12, 14), (20, 8, 26, 20), (40, 2, 44, 6), (5, 25, 9, 28)]
+    occupancy = SheetOccupancy(rects)
+
+    for width in (1, 3, 7):
+        for height in (1, 4, 12):
+            for spacing in (0, 2):
+                expected = _brute_force(occupancy, width, height, spacing, preferred_position)
+                assert occupancy.find_free(width, height, spacing, preferred_position) == expected
+
+
+def test_no_search_window_limit():
+    # 예전 구현의 검색 범위(AX열, 100행)를 넘는 데이터
+    occupancy = SheetOccupancy([(1, 1, 5000, 80)])
+
+    assert occupancy.find_free(10, 20, spacing=2) == (1, 83)
+    assert occupancy.find_free(10, 20, spacing=2, preferred_position="bottom") == (5003, 1)
+
+
+def test_query_is_fast_with_many_objects():
+    occupancy = SheetOccupancy(
+        (row * 12 + 1, col * 8 + 1, row * 12 + 10, col * 8 + 6) for row in range(10) for col in range(10)
+    )
+
+    started = time.perf_counter()
+    occupancy.find_free(10, 20, spacing=2)
+    assert time.perf_counter() - started < 0.05
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        SheetOccupancy().find_free(0, 5)
+
+
+def test_find_available_position_reads_sheet_objects():
+    chart = SimpleNamespace(left=64 * 6, top=0, width=64 * 4, height=15 * 10)
+    sheet = SimpleNamespace(
+        api=None,
+        charts=[chart],
+        used_range=SimpleNamespace(address="$A$1:$D$30"),
+    )
+
+    # 데이터 A1:D30, 차트 약 G1:K11 → 데이터와 차트 사이 열, 차트 아래
+    assert find_available_position(sheet, min_spacing=1, estimate_size=(4, 10)) == "F13"
+    assert find_available_position(sheet, min_spacing=1, preferred_position="bottom", estimate_size=(4, 10)) == "F13"
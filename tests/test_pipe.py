@@ -0,0 +1,155 @@
+"""
+`oa pipe` NDJSON 파이프 모드 테스트 (headless 엔진)
+"""
+
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from pyhub_office_automation.cli.main import app
+from pyhub_office_automation.cli.pipe import TargetScheduler, build_argv, run_pipe, target_key
+from pyhub_office_automation.excel.engines import reset_engine
+
+
+@pytest.fixture(autouse=True)
+def headless_engine(monkeypatch):
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    reset_engine()
+    yield
+    reset_engine()
+
+
+@pytest.fixture
+def workbooks(tmp_path):
+    import openpyxl
+
+    paths = []
+    for i in range(3):
+        wb = openpyxl.Workbook()
+        wb.active.append([f"book{i}", i])
+        path = tmp_path / f"book{i}.xlsx"
+        wb.save(path)
+        paths.append(path)
+    return paths
+
+
+def _lines(*requests):
+    return "".join(json.dumps(request, ensure_ascii=False) + "\n" for request in requests)
+
+
+def test_build_argv_from_object_args():
+    argv = build_argv(
+        {"command": "excel range-read", "args": {"file-path": "a.xlsx", "expand": True, "sheet": None, "x": [1, 2]}}
+    )
+
+    assert argv == ["excel", "range-read", "--file-path", "a.xlsx", "--expand", "--x", "1", "--x", "2"]
+
+
+def test_target_key_identifies_file():
+    assert target_key(["excel", "range-read", "--file-path", "a.xlsx"]) == target_key(["--file-path=./a.xlsx"])
+    assert target_key(["excel", "workbook-list"]) is None
+
+
+def test_pipe_streams_one_result_per_line(workbooks):
+    stdin = _lines(
+        {"id": "a", "command": "excel range-read", "args": {"file-path": str(workbooks[0]), "range": "A1:B1"}},
+        {"id": "b", "command": ["excel", "range-read"], "args": ["--file-path", str(workbooks[1]), "--range", "A1"]},
+        {"id": "c", "command": "version"},
+    )
+
+    result = CliRunner().invoke(app, ["pipe"], input=stdin)
+
+    assert result.exit_code == 0, result.output
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["id"] for r in responses] == ["a", "b", "c"]
+    assert responses[0]["output"]["data"]["values"] == [["book0", 0]]
+    assert responses[2]["output"].startswith("pyhub-office-automation version")
+    assert all(r["success"] and r["elapsed_ms"] >= 0 for r in responses)
+
+
+def test_pipe_reports_invalid_and_failed_commands():
+    stdin = "not json\n" + _lines(
+        {"id": 2, "command": "excel range-read", "args": {"file-path": "missing.xlsx", "range": "A1"}}
+    )
+    output = io.StringIO()
+
+    failures = run_pipe(io.StringIO(stdin), output)
+
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failures == 2
+    assert responses[0]["exit_code"] == 2 and "잘못된 입력" in responses[0]["error"]
+    assert responses[1]["id"] == 2 and not responses[1]["success"]
+
+
+def test_pipe_concurrent_jobs_return_every_result(workbooks):
+    requests = [
+        {"id": i, "command": "excel range-read", "args": {"file-path": str(workbooks[i % 3]), "range": "A1:B1"}}
+        for i in range(9)
+    ]
+    output = io.StringIO()
+
+    failures = run_pipe(io.StringIO(_lines(*requests)), output, jobs=3)
+
+    responses = {json.loads(line)["id"]: json.loads(line) for line in output.getvalue().splitlines()}
+    assert failures == 0
+    assert sorted(responses) == list(range(9))
+    for i, response in responses.items():
+        assert response["output"]["data"]["values"] == [[f"book{i % 3}", i % 3]]
+
+
+def test_scheduler_serializes_same_target():
+    scheduler = TargetScheduler()
+    scheduler.acquire("a")
+    scheduler.acquire("b")
+
+    assert scheduler._busy == {"a", "b"}
+    scheduler.release("a")
+    scheduler.acquire("a")
+    assert scheduler._busy == {"a", "b"}
+
+
+def test_pipe_profile_applies_to_one_command(workbooks):
+    args = {"file-path": str(workbooks[0]), "range": "A1:B1"}
+    stdin = _lines(
+        {"id": 1, "command": ["--profile", "excel", "range-read"], "args": args},
+        {"id": 2, "command": "excel range-read", "args": args},
+    )
+    output = io.StringIO()
+
+    run_pipe(io.StringIO(stdin), output)
+
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert "profile" in responses[0]["output"]
+    assert "profile" not in responses[1]["output"]
+
+
+def test_pipe_rejects_profile_with_jobs(workbooks):
+    stdin = _lines({"id": 1, "command": ["--profile", "excel", "range-read"], "args": {"file-path": str(workbooks[0])}})
+    output = io.StringIO()
+
+    failures = run_pipe(io.StringIO(stdin), output, jobs=2)
+
+    response = json.loads(output.getvalue())
+    assert failures == 1
+    assert response["id"] == 1 and "--profile" in response["error"]
+
+
+def test_pipe_detaches_profiler_from_engine():
+    from pyhub_office_automation.excel import engines
+    from pyhub_office_automation.excel.engines.fake_excel import FakeApplication
+    from pyhub_office_automation.excel.engines.instrumentation import ComProxy, enable_profiling
+    from pyhub_office_automation.excel.engines.windows import WindowsEngine
+
+    xl = FakeApplication()
+    engines._engine_instance = WindowsEngine(application=xl)
+    enable_profiling()
+    engine = engines.get_engine()
+    assert isinstance(engine.xl, ComProxy)
+
+    # --profile을 켠 명령어가 끝나면 엔진의 Excel 객체는 계측 프록시가 아님
+    run_pipe(io.StringIO(_lines({"id": 1, "command": "version"})), io.StringIO())
+
+    assert engine.xl is xl
+    assert engines.get_engine().xl is xl
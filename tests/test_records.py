@@ -0,0 +1,80 @@
+"""
+__slots__ 결과 객체 테스트 (utils/records, scripts/benchmark_memory.py)
+"""
+
+import dataclasses
+import importlib.util
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from pyhub_office_automation.batch.executor import BatchLine, BatchResult, LineResult
+from pyhub_office_automation.excel.engines.base import ChartInfo, ShapeInfo, TableInfo, WorkbookInfo
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_memory.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("benchmark_memory", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_result_types_have_no_instance_dict():
+    shape = ShapeInfo(name="s", sheet_name="Data", shape_type="rect", left=0, top=0, width=1, height=1)
+
+    assert not hasattr(shape, "__dict__")
+    with pytest.raises(AttributeError):
+        shape.extra = 1
+    assert not hasattr(BatchLine(line_number=1, content=""), "__dict__")
+
+
+def test_to_dict_matches_asdict_in_field_order():
+    chart = ChartInfo(name="c", chart_type="bar", source_data="A1:B2", sheet_name="S", left=1, top=2, width=3, height=4)
+    table = TableInfo(name="t", sheet_name="S", address="A1:B2", row_count=2, column_count=2, headers=["a", "b"])
+
+    assert list(chart.to_dict().items()) == list(dataclasses.asdict(chart).items())
+    assert table.to_dict() == dataclasses.asdict(table)
+    assert (
+        WorkbookInfo(name="b", saved=True, full_name="b", sheet_count=1, active_sheet="S").to_dict()["file_size_bytes"] is None
+    )
+
+
+def test_batch_result_to_dict_is_json_ready():
+    started = datetime(2024, 1, 1, 9, 0, 0)
+    result = BatchResult(
+        success=True,
+        executed_lines=1,
+        skipped_lines=0,
+        failed_lines=0,
+        total_duration_ms=5,
+        log=[LineResult(line_number=1, command="excel range-read", success=True)],
+        start_time=started,
+        end_time=started,
+    )
+
+    data = json.loads(json.dumps(result.to_dict()))
+    assert data["log"] == [
+        {
+            "line_number": 1,
+            "command": "excel range-read",
+            "success": True,
+            "output": "",
+            "error": None,
+            "duration_ms": 0,
+            "data": None,
+        }
+    ]
+    assert data["start_time"] == "2024-01-01T09:00:00"
+
+
+def test_memory_benchmark_reports_savings(bench):
+    results = bench.run_benchmark(count=2000)
+
+    assert {r["type"] for r in results} >= {"ShapeInfo", "LineResult", "BatchLine"}
+    for result in results:
+        assert result["slots_bytes"] < result["dict_bytes"], result
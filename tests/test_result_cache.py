@@ -0,0 +1,150 @@
+"""
+조회 명령어 결과 캐시 테스트 (utils/result_cache)
+"""
+
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from pyhub_office_automation.cli.main import app
+from pyhub_office_automation.excel.engines import reset_engine
+from pyhub_office_automation.utils.result_cache import (
+    ResultCache,
+    cached_result,
+    get_result_cache,
+    invalidate_for_command,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    root = tmp_path / "cache"
+    monkeypatch.setenv("OA_CACHE_DIR", str(root))
+    monkeypatch.delenv("OA_RESULT_CACHE", raising=False)
+    monkeypatch.delenv("OA_RESULT_CACHE_HASH", raising=False)
+    return root
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    wb.active.append(["name", "value"])
+    wb.active.append(["a", 1])
+    path = tmp_path / "book.xlsx"
+    wb.save(path)
+    return path
+
+
+def _entries(cache):
+    return [e for _, _, files in os.walk(cache.root) for e in files if e.endswith(".json")]
+
+
+def test_key_changes_with_file_and_params(workbook):
+    cache = get_result_cache()
+    key = cache.make_key("workbook-info", str(workbook), {"file_path": str(workbook), "include_sheets": True})
+
+    assert key == cache.make_key("workbook-info", str(workbook), {"include_sheets": True})
+    assert key != cache.make_key("workbook-info", str(workbook), {"include_sheets": False})
+    assert key != cache.make_key("table-list", str(workbook), {"include_sheets": True})
+
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert key != cache.make_key("workbook-info", str(workbook), {"include_sheets": True})
+
+    assert cache.make_key("workbook-info", str(workbook.with_name("missing.xlsx")), {}) is None
+
+
+def test_decorator_replays_output(workbook, capsys):
+    calls = []
+
+    @cached_result("workbook-info")
+    def command(file_path=None, output_format="json"):
+        calls.append(file_path)
+        print(json.dumps({"file": file_path, "format": output_format}))
+
+    command(file_path=str(workbook), output_format="json")
+    first = capsys.readouterr().out
+    command(file_path=str(workbook), output_format="json")
+    second = capsys.readouterr().out
+
+    assert first == second
+    assert len(calls) == 1
+
+    # 활성 워크북 대상 호출은 캐시하지 않음
+    command(file_path=None)
+    command(file_path=None)
+    assert len(calls) == 3
+
+
+def test_failed_runs_are_not_cached(workbook):
+    calls = []
+
+    @cached_result("table-list")
+    def command(file_path=None):
+        calls.append(file_path)
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            command(file_path=str(workbook))
+
+    assert len(calls) == 2
+    assert _entries(get_result_cache()) == []
+
+
+def test_disabled_by_environment(workbook, monkeypatch):
+    monkeypatch.setenv("OA_RESULT_CACHE", "0")
+    assert get_result_cache() is None
+
+
+def test_lru_eviction_keeps_size_cap(tmp_path, workbook):
+    cache = ResultCache(tmp_path / "lru", max_bytes=600)
+    for i in range(5):
+        cache.put(str(workbook), f"key{i}", "x" * 200)
+        os.utime(cache._path_dir(str(workbook)) / f"key{i}.json", (i, i))
+
+    # 가장 최근 항목은 남고 오래된 항목부터 삭제됨
+    assert cache.get(str(workbook), "key4") is not None
+    assert cache.get(str(workbook), "key0") is None
+    total = sum(
+        os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(cache.root) for f in files if f.endswith(".json")
+    )
+    assert total <= 600
+
+
+def test_write_command_invalidates_same_file(tmp_path, workbook):
+    other = tmp_path / "other.xlsx"
+    other.write_bytes(workbook.read_bytes())
+    cache = get_result_cache()
+    for path in (workbook, other):
+        cache.put(str(path), "k", "output")
+
+    invalidate_for_command("range-read", ["--file-path", str(workbook)])
+    assert cache.get(str(workbook), "k") == "output"
+
+    invalidate_for_command("range-write", ["--file-path", str(workbook), "--range", "A1"])
+    assert cache.get(str(workbook), "k") is None
+    assert cache.get(str(other), "k") == "output"
+
+    invalidate_for_command("table-write", ["--workbook-name", "other.xlsx"])
+    assert cache.get(str(other), "k") is None
+
+
+def test_cli_write_invalidates_workbook_info(workbook, monkeypatch):
+    monkeypatch.setenv("OA_EXCEL_ENGINE", "headless")
+    reset_engine()
+    runner = CliRunner()
+    try:
+        result = runner.invoke(app, ["excel", "workbook-info", "--file-path", str(workbook)])
+        assert result.exit_code == 0
+        cache = get_result_cache()
+        assert len(_entries(cache)) == 1
+
+        result = runner.invoke(app, ["excel", "range-write", "--file-path", str(workbook), "--range", "C1", "--data", '"x"'])
+        assert _entries(cache) == []
+    finally:
+        reset_engine()